@@ -0,0 +1,113 @@
+"""メタデータ書き込みの耐久性モード（fast / atomic / durable）ごとの書き込み時間を計測する。
+
+各モードで ``atomic_write`` による置き換えを繰り返し、1 回あたりの時間を表示する。
+あわせて ``durability_batch()`` の中で複数ファイルをまとめて書き込む場合
+（ヘルスチェックの更新バッチ相当）の 1 バッチあたりの時間も表示する。
+fsync の費用は書き込み先のファイルシステムに依存する（tmpfs ではほぼ 0 になる）ため、
+実際のセッションディレクトリと同じディスク上のディレクトリを --dir で指定して計測する。
+
+使い方:
+    uv run python scripts/bench_durability.py
+    uv run python scripts/bench_durability.py --dir ~/work/bench --writes 500 --size 16384
+    # 別のツリー（例: 変更前のコミットを展開した worktree）と比較する
+    uv run python scripts/bench_durability.py --tree /path/to/other/checkout
+
+計測モード:
+    single: atomic_write を 1 ファイルずつ呼び出す
+    batch:  durability_batch() の中で --batch 個のファイルを書き込む（durable のみ差が出る）
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--writes", type=int, default=200, help="モードごとの書き込み回数")
+    parser.add_argument("--size", type=int, default=4096, help="1 回の書き込みサイズ（バイト）")
+    parser.add_argument("--batch", type=int, default=8, help="batch で 1 回にまとめるファイル数")
+    parser.add_argument("--repeat", type=int, default=3, help="計測の繰り返し回数（最小値を採用）")
+    parser.add_argument(
+        "--dir",
+        type=Path,
+        default=None,
+        help="書き込み先の親ディレクトリ（既定: システムの一時ディレクトリ）",
+    )
+    parser.add_argument(
+        "--tree",
+        type=Path,
+        default=Path(__file__).resolve().parent.parent,
+        help="src パッケージを読み込むリポジトリのルート（既定: このスクリプトのリポジトリ）",
+    )
+    return parser.parse_args()
+
+
+def _measure(func: Callable[[], None], calls: int, repeat: int) -> float:
+    """1 回あたりの最小時間 [us] を返す。"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(calls):
+            func()
+        best = min(best, time.perf_counter() - started)
+    return best / calls * 1_000_000
+
+
+def main() -> int:
+    args = _parse_args()
+    tree = args.tree.resolve()
+    if not (tree / "src" / "managers" / "durable_io.py").is_file():
+        print(f"src/managers/durable_io.py が見つかりません: {tree}", file=sys.stderr)
+        return 1
+    parent = None
+    if args.dir is not None:
+        args.dir.expanduser().mkdir(parents=True, exist_ok=True)
+        parent = str(args.dir.expanduser())
+
+    with tempfile.TemporaryDirectory(prefix="bench-durability-", dir=parent) as tmp:
+        tmp_path = Path(tmp)
+        sys.path.insert(0, str(tree))
+        durable_io = importlib.import_module("src.managers.durable_io")
+
+        payload = b"x" * args.size
+        single_path = tmp_path / "single.json"
+        batch_paths = [tmp_path / f"batch-{index}.json" for index in range(args.batch)]
+
+        def write_single() -> None:
+            durable_io.atomic_write(single_path, payload)
+
+        def write_batch() -> None:
+            with durable_io.durability_batch():
+                for path in batch_paths:
+                    durable_io.atomic_write(path, payload)
+
+        print(f"tree:   {tree}")
+        print(f"dir:    {tmp_path}")
+        print(
+            f"writes: {args.writes} x {args.repeat} "
+            f"(size: {args.size} B, batch: {args.batch} files)"
+        )
+        batch_calls = max(args.writes // max(args.batch, 1), 1)
+        for mode in durable_io.DURABILITY_MODES:
+            durable_io.set_durability(mode)
+            write_single()  # 初回のファイル作成は計測しない
+            write_batch()
+            single_us = _measure(write_single, args.writes, args.repeat)
+            batch_us = _measure(write_batch, batch_calls, args.repeat)
+            print(
+                f"{mode:<8} single {single_us:9.1f} us/write  "
+                f"batch {batch_us:9.1f} us/batch ({batch_us / max(args.batch, 1):8.1f} us/write)"
+            )
+        durable_io.set_durability(durable_io.DURABILITY_FAST)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
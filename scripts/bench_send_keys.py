@@ -0,0 +1,174 @@
+"""tmux ペインへの送信（send-keys -l と load-buffer + paste-buffer）の所要時間を計測する。
+
+専用ソケットで一時的な tmux サーバーを起動し、``cat`` を実行するペインへ
+サイズ別のペイロードを送信して、末尾のマーカー行がペインに表示されるまでの時間を表示する。
+送信には対象ツリーの TmuxManager（``_run`` / ``_paste_to_pane``）をそのまま使う。
+既定の tmux サーバーや実環境のセッションには触れない。
+
+使い方:
+    uv run python scripts/bench_send_keys.py
+    uv run python scripts/bench_send_keys.py --sizes 1024,4096,65536 --repeat 9
+    # 別のツリー（例: 変更前のコミットを展開した worktree）と比較する
+    uv run python scripts/bench_send_keys.py --tree /path/to/other/checkout
+
+計測モード:
+    send-keys: send-keys -t <pane> -l <payload>（1 文字ずつのキー入力として処理される）
+    paste:     load-buffer -b <name> - と paste-buffer -d -p（_paste_to_pane が無いツリーでは省略）
+    send-keys は tmux のコマンド長上限を超えると失敗するため、その場合は failed と表示する。
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+SESSION_NAME = "bench"
+LINE_WIDTH = 79
+WAIT_TIMEOUT_SECONDS = 10.0
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        default="1024,10240,51200",
+        help="ペイロードサイズ（バイト、カンマ区切り）",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="サイズごとの計測回数（中央値を採用）"
+    )
+    parser.add_argument(
+        "--tree",
+        type=Path,
+        default=Path(__file__).resolve().parent.parent,
+        help="src パッケージを読み込むリポジトリのルート（既定: このスクリプトのリポジトリ）",
+    )
+    return parser.parse_args()
+
+
+def _build_payload(size: int, marker: str) -> str:
+    """LINE_WIDTH 文字の行を並べ、最終行をマーカーにしたペイロードを返す。"""
+    line = "x" * (LINE_WIDTH - 1) + "\n"
+    body_size = max(size - len(marker) - 1, 0)
+    body = line * (body_size // len(line)) + "x" * (body_size % len(line))
+    if body and not body.endswith("\n"):
+        body += "\n"
+    return f"{body}{marker}\n"
+
+
+async def _wait_for_marker(tmux, target: str, marker: str) -> bool:
+    """マーカー行がペインの表示領域に現れるまで待つ。"""
+    deadline = time.perf_counter() + WAIT_TIMEOUT_SECONDS
+    while time.perf_counter() < deadline:
+        code, stdout, _ = await tmux._run("capture-pane", "-p", "-t", target)
+        if code == 0 and marker in stdout:
+            return True
+        await asyncio.sleep(0.001)
+    return False
+
+
+async def _measure(
+    send: Callable[[str], Awaitable[tuple[int, str]]],
+    tmux,
+    target: str,
+    size: int,
+    repeat: int,
+) -> tuple[float | None, str]:
+    """(表示までの時間の中央値 [ms] または None, 失敗理由) を返す。"""
+    samples: list[float] = []
+    for _ in range(repeat):
+        marker = f"END-{uuid.uuid4().hex[:12]}"
+        payload = _build_payload(size, marker)
+        started = time.perf_counter()
+        code, stderr = await send(payload)
+        if code != 0:
+            return None, stderr.strip() or f"exit {code}"
+        if not await _wait_for_marker(tmux, target, marker):
+            return None, "timeout"
+        samples.append(time.perf_counter() - started)
+        await tmux._run("clear-history", "-t", target)
+    return statistics.median(samples) * 1000, ""
+
+
+async def _run_bench(args: argparse.Namespace, tree: Path, socket: str) -> None:
+    from src.config.settings import Settings
+
+    tmux_shared = importlib.import_module("src.managers.tmux_shared")
+    tmux_manager = importlib.import_module("src.managers.tmux_manager")
+    tmux = tmux_manager.TmuxManager(Settings(_env_file=None))
+    target = f"{SESSION_NAME}:0.0"
+
+    async def send_keys(payload: str) -> tuple[int, str]:
+        code, _, stderr = await tmux._run("send-keys", "-t", target, "-l", payload)
+        return code, stderr
+
+    modes: list[tuple[str, Callable[[str], Awaitable[tuple[int, str]]]]] = [
+        ("send-keys", send_keys)
+    ]
+    paste_to_pane = getattr(tmux, "_paste_to_pane", None)
+    if paste_to_pane is not None:
+        modes.append(("paste", lambda payload: paste_to_pane(target, payload)))
+
+    sizes = [int(value) for value in args.sizes.split(",") if value.strip()]
+    version = subprocess.run(["tmux", "-V"], capture_output=True, text=True).stdout.strip()
+    print(f"tree:   {tree}")
+    print(f"tmux:   {version}")
+    print(f"repeat: {args.repeat} (median)")
+    if paste_to_pane is None:
+        print("note:   _paste_to_pane なし（paste は計測しない）")
+    with tmux_shared.use_tmux_socket(socket):
+        for size in sizes:
+            for name, send in modes:
+                elapsed_ms, error = await _measure(send, tmux, target, size, args.repeat)
+                label = f"{size:>8} B  {name:<10}"
+                if elapsed_ms is None:
+                    print(f"{label} failed ({error})")
+                else:
+                    print(f"{label} {elapsed_ms:8.1f} ms")
+
+
+def main() -> int:
+    args = _parse_args()
+    tree = args.tree.resolve()
+    if not (tree / "src" / "managers" / "tmux_manager.py").is_file():
+        print(f"src/managers/tmux_manager.py が見つかりません: {tree}", file=sys.stderr)
+        return 1
+
+    socket = f"mcp-bench-{os.getpid()}"
+    with tempfile.TemporaryDirectory(prefix="bench-send-keys-") as tmp:
+        tmp_path = Path(tmp)
+        # 実環境の HOME・.env・MCP_* 設定を持ち込まない
+        os.environ["HOME"] = str(tmp_path / "home")
+        for key in [k for k in os.environ if k.upper().startswith("MCP_")]:
+            del os.environ[key]
+        os.chdir(tmp_path)
+        sys.path.insert(0, str(tree))
+
+        # エコーを止めた cat をペインで動かし、受信したペイロードをそのまま表示させる
+        subprocess.run(
+            [
+                "tmux", "-L", socket, "-f", os.devnull,
+                "new-session", "-d", "-s", SESSION_NAME, "-x", "200", "-y", "50",
+                "sh -c 'stty -echo; exec cat'",
+            ],
+            check=True,
+        )  # fmt: skip
+        try:
+            asyncio.run(_run_bench(args, tree, socket))
+        finally:
+            subprocess.run(["tmux", "-L", socket, "kill-server"], check=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""ツール呼び出しごとの権限チェック（check_tool_permission）のオーバーヘッドを計測する。
+
+一時ディレクトリに git リポジトリ・agents.json・グローバルレジストリを用意し、
+Owner からの check_tool_permission を繰り返し呼び出して 1 回あたりの時間と
+ファイルオープン数（builtins.open / sqlite3.connect）を表示する。
+HOME は一時ディレクトリに差し替えるため、実環境のレジストリには触れない。
+
+使い方:
+    uv run python scripts/bench_tool_overhead.py
+    uv run python scripts/bench_tool_overhead.py --calls 5000 --agents 20
+    # 別のツリー（例: 変更前のコミットを展開した worktree）と比較する
+    uv run python scripts/bench_tool_overhead.py --tree /path/to/other/checkout
+
+計測モード:
+    ttl-expired: 同期キャッシュの TTL が毎回切れている状態（最悪ケース）
+    within-ttl:  TTL 内で連続して呼び出す状態
+    同期 TTL を持たないツリーでは両モードは同じ条件になる。
+"""
+
+from __future__ import annotations
+
+import argparse
+import builtins
+import importlib
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import patch
+
+OWNER_ID = "owner-001"
+SESSION_ID = "bench-session"
+TOOL_NAME = "get_dashboard"
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2000, help="モードごとの呼び出し回数")
+    parser.add_argument(
+        "--agents", type=int, default=9, help="agents.json に登録するエージェント数（Owner 含む）"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="計測の繰り返し回数（最小値を採用）")
+    parser.add_argument(
+        "--tree",
+        type=Path,
+        default=Path(__file__).resolve().parent.parent,
+        help="src パッケージを読み込むリポジトリのルート（既定: このスクリプトのリポジトリ）",
+    )
+    return parser.parse_args()
+
+
+def _init_git_repo(repo: Path) -> None:
+    repo.mkdir()
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": "bench",
+        "GIT_AUTHOR_EMAIL": "bench@example.com",
+        "GIT_COMMITTER_NAME": "bench",
+        "GIT_COMMITTER_EMAIL": "bench@example.com",
+    }
+    subprocess.run(["git", "init", "-q"], cwd=repo, check=True, env=env)
+    subprocess.run(
+        ["git", "commit", "-q", "--allow-empty", "-m", "init"], cwd=repo, check=True, env=env
+    )
+
+
+def _build_context(repo: Path, agent_count: int):
+    """Owner + Worker を登録した AppContext を作成する。"""
+    from datetime import datetime
+
+    from src.config.settings import Settings
+    from src.context import AppContext
+    from src.managers.ai_cli_manager import AiCliManager
+    from src.managers.tmux_manager import TmuxManager
+    from src.models.agent import Agent, AgentRole, AgentStatus
+    from src.tools.helpers_persistence import save_agent_to_file
+    from src.tools.helpers_registry import save_agent_to_registry
+
+    settings = Settings(_env_file=None)
+    ctx = AppContext(
+        settings=settings,
+        tmux=TmuxManager(settings),
+        ai_cli=AiCliManager(settings),
+        project_root=str(repo),
+        session_id=SESSION_ID,
+    )
+    now = datetime.now()
+    for index in range(agent_count):
+        agent_id = OWNER_ID if index == 0 else f"worker-{index:03d}"
+        agent = Agent(
+            id=agent_id,
+            role=AgentRole.OWNER if index == 0 else AgentRole.WORKER,
+            status=AgentStatus.IDLE,
+            working_dir=str(repo),
+            created_at=now,
+            last_activity=now,
+        )
+        ctx.agents[agent_id] = agent
+        save_agent_to_file(ctx, agent)
+    save_agent_to_registry(OWNER_ID, OWNER_ID, str(repo), SESSION_ID)
+    return ctx
+
+
+def _measure(
+    func: Callable[[], object], before_each: Callable[[], None], calls: int, repeat: int
+) -> tuple[float, float]:
+    """(1 回あたりの最小時間 [us], 1 回あたりのファイルオープン数) を返す。"""
+    best = float("inf")
+    for _ in range(repeat):
+        elapsed = 0.0
+        for _ in range(calls):
+            before_each()
+            started = time.perf_counter()
+            func()
+            elapsed += time.perf_counter() - started
+        best = min(best, elapsed)
+
+    opens = 0
+    real_open = builtins.open
+    real_connect = sqlite3.connect
+
+    def counting_open(*args, **kwargs):
+        nonlocal opens
+        opens += 1
+        return real_open(*args, **kwargs)
+
+    def counting_connect(*args, **kwargs):
+        nonlocal opens
+        opens += 1
+        return real_connect(*args, **kwargs)
+
+    with (
+        patch("builtins.open", counting_open),
+        patch("sqlite3.connect", counting_connect),
+    ):
+        for _ in range(calls):
+            before_each()
+            func()
+    return best / calls * 1_000_000, opens / calls
+
+
+def main() -> int:
+    args = _parse_args()
+    tree = args.tree.resolve()
+    if not (tree / "src" / "tools" / "helpers.py").is_file():
+        print(f"src/tools/helpers.py が見つかりません: {tree}", file=sys.stderr)
+        return 1
+
+    with tempfile.TemporaryDirectory(prefix="bench-tool-overhead-") as tmp:
+        tmp_path = Path(tmp)
+        # 実環境の HOME（グローバルレジストリ）・.env・MCP_* 設定を持ち込まない
+        os.environ["HOME"] = str(tmp_path / "home")
+        for key in [k for k in os.environ if k.upper().startswith("MCP_")]:
+            del os.environ[key]
+        os.chdir(tmp_path)
+        sys.path.insert(0, str(tree))
+
+        repo = tmp_path / "repo"
+        _init_git_repo(repo)
+        ctx = _build_context(repo, args.agents)
+
+        helpers = importlib.import_module("src.tools.helpers")
+        persistence = importlib.import_module("src.tools.helpers_persistence")
+        # 同期 TTL を持たないツリー（agents.json のフィンガープリントで判定する版）では
+        # ttl-expired は within-ttl と同じ条件になる
+        last_sync_times = getattr(persistence, "_last_sync_times", None)
+        expire_ttl = last_sync_times.clear if last_sync_times is not None else lambda: None
+
+        def call() -> None:
+            result = helpers.check_tool_permission(ctx, TOOL_NAME, OWNER_ID)
+            if result is not None:
+                raise RuntimeError(f"権限チェックが失敗しました: {result}")
+
+        call()  # 初回のキャッシュ構築は計測しない
+        modes: list[tuple[str, Callable[[], None]]] = [
+            ("ttl-expired", expire_ttl),
+            ("within-ttl", lambda: None),
+        ]
+        print(f"tree:   {tree}")
+        print(f"calls:  {args.calls} x {args.repeat} (agents: {args.agents})")
+        if last_sync_times is None:
+            print("note:   同期 TTL なし（ttl-expired は within-ttl と同条件）")
+        for name, before_each in modes:
+            per_call_us, opens_per_call = _measure(call, before_each, args.calls, args.repeat)
+            print(f"{name:<12} {per_call_us:8.1f} us/call  {opens_per_call:5.2f} opens/call")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -32,6 +32,9 @@ TOOL_PERMISSIONS: dict[str, list[str]] = {
     "healthcheck_all": ["owner", "admin"],
     "get_unhealthy_agents": ["owner", "admin"],
     "monitor_and_recover_workers": ["owner", "admin"],
+    "get_healthcheck_schedule": ["owner", "admin"],
+    "get_healthcheck_metrics": ["owner", "admin"],
+    "get_background_jobs": ["owner", "admin"],
     "attempt_recovery": ["owner", "admin"],
     "full_recovery": ["admin"],
     "initialize_agent": ["owner", "admin"],
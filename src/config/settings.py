@@ -2,9 +2,11 @@
 
 import json
 import os
+import threading
+from collections.abc import Callable
 from enum import Enum
 from pathlib import Path
-from typing import ClassVar
+from typing import Any, ClassVar
 
 from pydantic import ConfigDict, Field, field_validator
 from pydantic_settings import BaseSettings
@@ -102,6 +104,19 @@ class WorkerCliMode(str, Enum):
     PER_WORKER = "per-worker"
 
 
+class Durability(str, Enum):
+    """メタデータ書き込み（agents.json・IPC・ダッシュボード等）の耐久性モード。"""
+
+    FAST = "fast"
+    """一時ファイル + rename のみ（fsync しない）"""
+
+    ATOMIC = "atomic"
+    """rename 前にファイル内容を fsync する（電源断後も旧版か新版のどちらか）"""
+
+    DURABLE = "durable"
+    """さらに rename 後にディレクトリを fsync する（書き込み完了後は電源断でも失われない）"""
+
+
 # モデル定数（重複を避けるため一元管理）
 class ModelDefaults:
     """デフォルトモデル名の定数。"""
@@ -248,6 +263,11 @@ class Settings(BaseSettings):
     workers_per_extra_window: int = 10
     """追加ウィンドウのWorker数（extra_worker_rows × extra_worker_cols）"""
 
+    tmux_server_count: int = 1
+    """Worker を分散配置する tmux サーバー数（1 = 単一サーバー）。
+    2 以上の場合、追加ウィンドウ（Worker 7 以降）を `-L` ソケットで分けた
+    別サーバーへラウンドロビンで配置する。メインウィンドウは既定サーバーに残る。"""
+
     # コスト設定
     cost_warning_threshold_usd: float = 10.0
     """コスト警告の閾値（USD）"""
@@ -270,6 +290,40 @@ class Settings(BaseSettings):
     healthcheck_idle_stop_consecutive: int = 3
     """実作業なし状態を連続検出した際に daemon を停止する閾値。"""
 
+    healthcheck_fast_interval_seconds: int = 10
+    """復旧直後・タスク送信直後・異常の疑いがある Worker の確認間隔（秒）。"""
+
+    healthcheck_idle_max_interval_seconds: int = 300
+    """タスクのない idle Worker の確認間隔の上限（秒）。
+    idle Worker は確認のたびに間隔を倍にし、この値で頭打ちにする。"""
+
+    healthcheck_recovery_concurrency: int = 2
+    """監視サイクル内で同時に実行する Worker 復旧の上限数。"""
+
+    healthcheck_diagnosis_timeout_seconds: float = 15.0
+    """Worker 1 件あたりの診断（tmux 確認等）のタイムアウト秒数。"""
+
+    healthcheck_recovery_timeout_seconds: float = 180.0
+    """監視サイクルが復旧完了を待つ上限秒数。
+    超過した復旧は中断せず継続させ、次回サイクルで結果を回収する。"""
+
+    healthcheck_process_probe_enabled: bool = True
+    """Linux で /proc を辿って AI CLI プロセスの生存・CPU 時間を確認するか。
+    無効時（および /proc のない環境）は pane_current_command のみで判定する。"""
+
+    healthcheck_cpu_active_min_percent: float = 2.0
+    """AI CLI プロセスが処理中とみなす CPU 使用率の下限（1 コア比の %）。
+    前回確認からの CPU 時間の増分を経過時間で割った値がこれ未満の場合、
+    アイドル時のタイマー処理等とみなして停滞判定を抑止しない。"""
+
+    healthcheck_state_max_age_seconds: int = 3600
+    """保存済みヘルスチェック状態（停滞判定の基準・復旧試行回数）の有効期間（秒）。
+    再起動時、保存からこれ以上経過した状態は破棄して初期状態から監視する。"""
+
+    healthcheck_metrics_textfile_enabled: bool = False
+    """監視サイクルの計測値を Prometheus テキスト形式でセッションディレクトリへ書き出すか。
+    出力先は {mcp_dir}/{session_id}/healthcheck_metrics.prom。"""
+
     codex_enter_retry_max: int = 3
     """Codex ペイン送信時に Enter 再送する最大回数。"""
 
@@ -279,6 +333,19 @@ class Settings(BaseSettings):
     send_cooldown_seconds: float = 2.0
     """tmux への連続送信時に挟む最小待機秒数（全CLI共通）。"""
 
+    paste_buffer_threshold_bytes: int = 4096
+    """この長さ（UTF-8 バイト数）以上の送信は load-buffer + paste-buffer で行う（0 で無効）。"""
+
+    capture_cache_ttl_ms: int = 500
+    """capture-pane 結果を共有キャッシュする有効期間（ミリ秒、0 で無効）。"""
+
+    # ペインログ設定
+    pane_log_enabled: bool = False
+    """tmux pipe-pane で各エージェントの出力をセッション配下のログへ追記するか。"""
+
+    pane_log_max_bytes: int = 5_000_000
+    """ペインログ 1 ファイルあたりの上限バイト数（超過時は .1 へローテーション）。"""
+
     # ターミナル設定
     default_terminal: TerminalApp = Field(
         default=TerminalApp.AUTO, description="デフォルトのターミナルアプリ"
@@ -470,6 +537,13 @@ class Settings(BaseSettings):
     )
     """品質ゲートの厳格モード（デフォルト: true）"""
 
+    # スケジューラー設定
+    scheduler_event_auto_assign_enabled: bool = Field(
+        default=False,
+        description="タスク終了時にキューのタスクを空き Worker へ即時に自動割り当てするか",
+    )
+    """タスク終了（completed/failed/cancelled）を契機に自動割り当てを行うか（デフォルト: false）"""
+
     # メモリ設定
     memory_max_entries: int = Field(
         default=1000,
@@ -483,6 +557,42 @@ class Settings(BaseSettings):
     )
     """メモリエントリの保持期間（デフォルト: 90日）"""
 
+    memory_prune_interval_seconds: int = Field(
+        default=3600,
+        description="メモリの定期整理（TTL 超過・上限超過のアーカイブ）の間隔（秒、0 で無効）",
+    )
+    """メモリの定期整理の間隔（デフォルト: 3600秒、0 で無効）"""
+
+    registry_gc_interval_seconds: int = Field(
+        default=86400,
+        description=(
+            "グローバルレジストリから project_root が存在しないエージェントを削除する間隔"
+            "（秒、0 で無効）"
+        ),
+    )
+    """グローバルレジストリの定期 GC の間隔（デフォルト: 86400秒、0 で無効）"""
+
+    durability: Durability = Field(
+        default=Durability.FAST,
+        description="メタデータ書き込みの耐久性モード（fast / atomic / durable）",
+    )
+    """メタデータ書き込みの耐久性モード（デフォルト: fast）"""
+
+    io_executor_max_workers: int = Field(
+        default=8,
+        description="git・ファイル I/O をイベントループ外で実行する共有スレッドプールのスレッド数",
+    )
+    """ブロッキング I/O 用共有スレッドプールのスレッド数（デフォルト: 8）"""
+
+    debug_slow_callback_ms: int = Field(
+        default=0,
+        description=(
+            "イベントループをこの時間（ミリ秒）以上ブロックしたコールバックを警告する"
+            "（asyncio デバッグモード、0 で無効）"
+        ),
+    )
+    """遅いコールバック検出の閾値（デフォルト: 0 = 無効）"""
+
     # コスト推定設定
     estimated_tokens_per_call: int = Field(
         default=2000,
@@ -531,6 +641,76 @@ class Settings(BaseSettings):
             )
         return value
 
+    @field_validator("healthcheck_fast_interval_seconds")
+    @classmethod
+    def validate_healthcheck_fast_interval(cls, value: int) -> int:
+        """healthcheck_fast_interval_seconds の範囲を検証する（1〜600）。"""
+        if not 1 <= value <= 600:
+            raise ValueError(
+                "MCP_HEALTHCHECK_FAST_INTERVAL_SECONDS は 1〜600 の範囲で指定してください"
+            )
+        return value
+
+    @field_validator("healthcheck_idle_max_interval_seconds")
+    @classmethod
+    def validate_healthcheck_idle_max_interval(cls, value: int) -> int:
+        """healthcheck_idle_max_interval_seconds の範囲を検証する（5〜3600）。"""
+        if not 5 <= value <= 3600:
+            raise ValueError(
+                "MCP_HEALTHCHECK_IDLE_MAX_INTERVAL_SECONDS は 5〜3600 の範囲で指定してください"
+            )
+        return value
+
+    @field_validator("healthcheck_cpu_active_min_percent")
+    @classmethod
+    def validate_healthcheck_cpu_active_min_percent(cls, value: float) -> float:
+        """healthcheck_cpu_active_min_percent の範囲を検証する（0.1〜100）。"""
+        if not 0.1 <= value <= 100:
+            raise ValueError(
+                "MCP_HEALTHCHECK_CPU_ACTIVE_MIN_PERCENT は 0.1〜100 の範囲で指定してください"
+            )
+        return value
+
+    @field_validator("healthcheck_recovery_concurrency")
+    @classmethod
+    def validate_healthcheck_recovery_concurrency(cls, value: int) -> int:
+        """healthcheck_recovery_concurrency の範囲を検証する（1〜16）。"""
+        if not 1 <= value <= 16:
+            raise ValueError(
+                "MCP_HEALTHCHECK_RECOVERY_CONCURRENCY は 1〜16 の範囲で指定してください"
+            )
+        return value
+
+    @field_validator("healthcheck_diagnosis_timeout_seconds")
+    @classmethod
+    def validate_healthcheck_diagnosis_timeout(cls, value: float) -> float:
+        """healthcheck_diagnosis_timeout_seconds の範囲を検証する（1.0〜300.0）。"""
+        if not 1.0 <= value <= 300.0:
+            raise ValueError(
+                "MCP_HEALTHCHECK_DIAGNOSIS_TIMEOUT_SECONDS は 1.0〜300.0 の範囲で指定してください"
+            )
+        return value
+
+    @field_validator("healthcheck_recovery_timeout_seconds")
+    @classmethod
+    def validate_healthcheck_recovery_timeout(cls, value: float) -> float:
+        """healthcheck_recovery_timeout_seconds の範囲を検証する（1.0〜3600.0）。"""
+        if not 1.0 <= value <= 3600.0:
+            raise ValueError(
+                "MCP_HEALTHCHECK_RECOVERY_TIMEOUT_SECONDS は 1.0〜3600.0 の範囲で指定してください"
+            )
+        return value
+
+    @field_validator("healthcheck_state_max_age_seconds")
+    @classmethod
+    def validate_healthcheck_state_max_age(cls, value: int) -> int:
+        """healthcheck_state_max_age_seconds の範囲を検証する（60〜86400）。"""
+        if not 60 <= value <= 86400:
+            raise ValueError(
+                "MCP_HEALTHCHECK_STATE_MAX_AGE_SECONDS は 60〜86400 の範囲で指定してください"
+            )
+        return value
+
     @field_validator("send_cooldown_seconds")
     @classmethod
     def validate_send_cooldown(cls, value: float) -> float:
@@ -539,6 +719,42 @@ class Settings(BaseSettings):
             raise ValueError("MCP_SEND_COOLDOWN_SECONDS は 0.0〜60.0 の範囲で指定してください")
         return value
 
+    @field_validator("tmux_server_count")
+    @classmethod
+    def validate_tmux_server_count(cls, value: int) -> int:
+        """tmux_server_count の範囲を検証する（1〜8）。"""
+        if not 1 <= value <= 8:
+            raise ValueError("MCP_TMUX_SERVER_COUNT は 1〜8 の範囲で指定してください")
+        return value
+
+    @field_validator("paste_buffer_threshold_bytes")
+    @classmethod
+    def validate_paste_buffer_threshold(cls, value: int) -> int:
+        """paste_buffer_threshold_bytes の範囲を検証する（0〜1MB）。"""
+        if not 0 <= value <= 1_048_576:
+            raise ValueError(
+                "MCP_PASTE_BUFFER_THRESHOLD_BYTES は 0〜1048576 の範囲で指定してください"
+            )
+        return value
+
+    @field_validator("capture_cache_ttl_ms")
+    @classmethod
+    def validate_capture_cache_ttl(cls, value: int) -> int:
+        """capture_cache_ttl_ms の範囲を検証する（0〜1000ms）。"""
+        if not 0 <= value <= 1000:
+            raise ValueError("MCP_CAPTURE_CACHE_TTL_MS は 0〜1000 の範囲で指定してください")
+        return value
+
+    @field_validator("pane_log_max_bytes")
+    @classmethod
+    def validate_pane_log_max_bytes(cls, value: int) -> int:
+        """pane_log_max_bytes の範囲を検証する（64KB〜1GB）。"""
+        if not 65_536 <= value <= 1_073_741_824:
+            raise ValueError(
+                "MCP_PANE_LOG_MAX_BYTES は 65536〜1073741824 の範囲で指定してください"
+            )
+        return value
+
     @field_validator("cost_warning_threshold_usd")
     @classmethod
     def validate_cost_warning_threshold(cls, value: float) -> float:
@@ -555,6 +771,44 @@ class Settings(BaseSettings):
             raise ValueError("MCP_MEMORY_MAX_ENTRIES は 1〜100000 の範囲で指定してください")
         return value
 
+    @field_validator("memory_prune_interval_seconds")
+    @classmethod
+    def validate_memory_prune_interval(cls, value: int) -> int:
+        """memory_prune_interval_seconds の範囲を検証する（0 または 60〜86400）。"""
+        if value != 0 and not 60 <= value <= 86400:
+            raise ValueError(
+                "MCP_MEMORY_PRUNE_INTERVAL_SECONDS は 0 または 60〜86400 の範囲で指定してください"
+            )
+        return value
+
+    @field_validator("registry_gc_interval_seconds")
+    @classmethod
+    def validate_registry_gc_interval(cls, value: int) -> int:
+        """registry_gc_interval_seconds の範囲を検証する（0 または 60〜604800）。"""
+        if value != 0 and not 60 <= value <= 604800:
+            raise ValueError(
+                "MCP_REGISTRY_GC_INTERVAL_SECONDS は 0 または 60〜604800 の範囲で指定してください"
+            )
+        return value
+
+    @field_validator("io_executor_max_workers")
+    @classmethod
+    def validate_io_executor_max_workers(cls, value: int) -> int:
+        """io_executor_max_workers の範囲を検証する（1〜64）。"""
+        if not 1 <= value <= 64:
+            raise ValueError("MCP_IO_EXECUTOR_MAX_WORKERS は 1〜64 の範囲で指定してください")
+        return value
+
+    @field_validator("debug_slow_callback_ms")
+    @classmethod
+    def validate_debug_slow_callback_ms(cls, value: int) -> int:
+        """debug_slow_callback_ms の範囲を検証する（0 または 10〜60000）。"""
+        if value != 0 and not 10 <= value <= 60000:
+            raise ValueError(
+                "MCP_DEBUG_SLOW_CALLBACK_MS は 0 または 10〜60000 の範囲で指定してください"
+            )
+        return value
+
     @field_validator("memory_ttl_days")
     @classmethod
     def validate_memory_ttl_days(cls, value: int) -> int:
@@ -665,15 +919,93 @@ class Settings(BaseSettings):
         return bool(self.enable_git and self.enable_worktree)
 
 
+# ========== Settings キャッシュ ==========
+#
+# Settings の構築は環境変数と .env の読み込み・検証を伴うため、パス解決のたびに
+# 行うと重い。入力（MCP_* 環境変数、.env と config.json の stat）の指紋をキーに
+# 構築済みインスタンスを再利用し、入力が変わったときだけ作り直す。
+# キャッシュ上のインスタンスは共有されるため変更してはならない。呼び出し側が
+# 変更しうる load_*_for_project はコピーを返す。
+
+_SETTINGS_CACHE_MAX_ENTRIES = 32
+_settings_cache: dict[tuple[Any, ...], Settings] = {}
+_settings_cache_lock = threading.Lock()
+
+
+def _env_fingerprint() -> int:
+    """Settings が参照する MCP_* 環境変数のスナップショットのハッシュ。"""
+    items = [(k, v) for k, v in os.environ.items() if k[:4].upper() == "MCP_"]
+    return hash(tuple(sorted(items)))
+
+
+def _file_fingerprint(path: str | os.PathLike[str] | None) -> tuple[int, int, int] | None:
+    """ファイルの (inode, mtime_ns, size)。存在しなければ None。"""
+    if not path:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _cached_settings(key: tuple[Any, ...], factory: Callable[[], Settings]) -> Settings:
+    """key に対応する構築済み Settings を返す（なければ factory で構築して保持する）。"""
+    with _settings_cache_lock:
+        cached = _settings_cache.get(key)
+    if cached is not None:
+        return cached
+    settings = factory()
+    with _settings_cache_lock:
+        if len(_settings_cache) >= _SETTINGS_CACHE_MAX_ENTRIES:
+            _settings_cache.clear()
+        _settings_cache[key] = settings
+    return settings
+
+
+def clear_settings_cache() -> None:
+    """Settings のキャッシュを破棄する。"""
+    with _settings_cache_lock:
+        _settings_cache.clear()
+
+
+def _default_settings() -> Settings:
+    """``Settings()`` 相当の共有インスタンス（変更禁止）。"""
+    env_file = Settings.model_config.get("env_file")
+    key = ("default", env_file, _env_fingerprint(), _file_fingerprint(env_file))
+    return _cached_settings(key, Settings)
+
+
+def _project_settings(
+    project_root: str | os.PathLike[str] | None,
+) -> tuple[Settings, tuple[Any, ...]]:
+    """load_settings_for_project の共有インスタンス（変更禁止）とキャッシュキーを返す。"""
+    env_file = resolve_project_env_file(project_root)
+    key = ("project", env_file, _env_fingerprint(), _file_fingerprint(env_file))
+    return _cached_project_settings(key, env_file), key
+
+
+def _cached_project_settings(key: tuple[Any, ...], env_file: str | None) -> Settings:
+    if env_file:
+        return _cached_settings(key, lambda: Settings(_env_file=env_file))
+    # model_config 側の env_file を使わず、環境変数 + デフォルトのみで構築
+    return _cached_settings(key, lambda: Settings(_env_file=None))
+
+
 def get_mcp_dir() -> str:
     """MCP ディレクトリ名を取得する。
 
-    実行時点の環境変数と .env を常に反映する。
+    実行時点の環境変数と .env を反映する（入力が変わらない間は構築済みの設定を再利用する）。
 
     Returns:
         MCP ディレクトリ名（デフォルト: .multi-agent-mcp）
     """
-    return Settings().mcp_dir
+    return _default_settings().mcp_dir
+
+
+def get_default_settings() -> Settings:
+    """``Settings()`` 相当の設定を返す（キャッシュ済みのインスタンスのコピー）。"""
+    return _default_settings().model_copy()
 
 
 def load_settings_for_project(project_root: str | os.PathLike[str] | None) -> Settings:
@@ -688,13 +1020,10 @@ def load_settings_for_project(project_root: str | os.PathLike[str] | None) -> Se
         project_root: プロジェクトルートパス
 
     Returns:
-        読み込み済み Settings インスタンス
+        読み込み済み Settings インスタンス（呼び出し側で変更してよいコピー）
     """
-    env_file = resolve_project_env_file(project_root)
-    if env_file:
-        return Settings(_env_file=env_file)
-    # model_config 側の env_file を使わず、環境変数 + デフォルトのみで構築
-    return Settings(_env_file=None)
+    settings, _ = _project_settings(project_root)
+    return settings.model_copy()
 
 
 def load_effective_settings_for_project(
@@ -713,13 +1042,21 @@ def load_effective_settings_for_project(
         strict_config: True の場合、config.json 破損時に例外を送出する
 
     Returns:
-        runtime override 適用済み Settings
+        runtime override 適用済み Settings（呼び出し側で変更してよいコピー）
     """
-    settings = load_settings_for_project(project_root)
+    base, base_key = _project_settings(project_root)
     if not project_root:
-        return settings
+        return base.model_copy()
+
+    config_file = Path(project_root) / base.mcp_dir / "config.json"
+    key = ("effective", base_key, str(config_file), _file_fingerprint(config_file), strict_config)
+    return _cached_settings(
+        key, lambda: _apply_config_overrides(base.model_copy(), config_file, strict_config)
+    ).model_copy()
+
 
-    config_file = Path(project_root) / settings.mcp_dir / "config.json"
+def _apply_config_overrides(settings: Settings, config_file: Path, strict_config: bool) -> Settings:
+    """config.json の runtime override を settings に適用する。"""
     if not config_file.exists():
         return settings
 
@@ -3,7 +3,7 @@
 マネージャーフィールドは機能ごとにグループ化されている:
 - core: コアマネージャー (settings, tmux, ai_cli, agents)
 - workflow: ワークフローマネージャー (ipc, dashboard, scheduler)
-- monitoring: 監視マネージャー (healthcheck, daemon関連)
+- monitoring: 監視マネージャー (healthcheck, daemon関連, バックグラウンドジョブ)
 - optional: オプショナルマネージャー (persona, memory)
 
 後方互換性のため、全フィールドは AppContext から直接アクセス可能。
@@ -21,9 +21,11 @@ from typing import Any
 
 from src.config.settings import Settings
 from src.managers.ai_cli_manager import AiCliManager
+from src.managers.background_supervisor import BackgroundSupervisor
 from src.managers.dashboard_manager import DashboardManager
 from src.managers.gtrconfig_manager import GtrconfigManager
 from src.managers.healthcheck_manager import HealthcheckManager
+from src.managers.healthcheck_scheduler import HealthcheckScheduler
 from src.managers.ipc_manager import IPCManager
 from src.managers.memory_manager import MemoryManager
 from src.managers.persona_manager import PersonaManager
@@ -54,13 +56,15 @@ class WorkflowManagers:
 
 @dataclass
 class MonitoringManagers:
-    """監視マネージャーグループ: ヘルスチェック・デーモン関連。"""
+    """監視マネージャーグループ: ヘルスチェック・デーモン・バックグラウンドジョブ関連。"""
 
     healthcheck_manager: HealthcheckManager | None = None
     healthcheck_daemon_task: asyncio.Task | None = None
     healthcheck_daemon_stop_event: asyncio.Event | None = None
     healthcheck_daemon_lock: asyncio.Lock | None = None
     healthcheck_idle_cycles: int = 0
+    healthcheck_scheduler: HealthcheckScheduler | None = None
+    background_supervisor: BackgroundSupervisor | None = None
 
 
 @dataclass
@@ -103,6 +107,8 @@ class AppContext:
     healthcheck_daemon_stop_event: asyncio.Event | None = None
     healthcheck_daemon_lock: asyncio.Lock | None = None
     healthcheck_idle_cycles: int = 0
+    healthcheck_scheduler: HealthcheckScheduler | None = None
+    background_supervisor: BackgroundSupervisor | None = None
 
     # --- オプショナルマネージャー ---
     persona_manager: PersonaManager | None = None
@@ -122,6 +128,8 @@ class AppContext:
     """Owner ごとの待機ロック状態"""
     _admin_last_healthcheck_at: dict[str, datetime] = field(default_factory=dict)
     """Admin ごとの最終ヘルスチェック実行時刻"""
+    _manager_identities: dict[str, tuple[Any, ...]] = field(default_factory=dict)
+    """マネージャー名 -> (生成時の識別キー, インスタンス, settings)（ensure_*_manager 用）"""
 
     def __post_init__(self) -> None:
         """マネージャーグループを初期化する。
@@ -158,6 +166,8 @@ class AppContext:
                 healthcheck_daemon_stop_event=self.healthcheck_daemon_stop_event,
                 healthcheck_daemon_lock=self.healthcheck_daemon_lock,
                 healthcheck_idle_cycles=self.healthcheck_idle_cycles,
+                healthcheck_scheduler=self.healthcheck_scheduler,
+                background_supervisor=self.background_supervisor,
             ),
         )
         object.__setattr__(
@@ -0,0 +1,368 @@
+"""agents.json のスナップショット + 追記ジャーナルによる永続化。
+
+エージェント 1 件の更新ごとに agents.json 全体を読み直して書き換えると、更新件数 N に
+対して N 回の全体書き換えがグローバルロック下で発生する。本モジュールでは更新を
+``agents.journal`` への追記（1 回の ``write``）として記録し、読み込み側は
+スナップショット（agents.json）にジャーナルを順に適用して最新状態を得る。
+ジャーナルが ``_JOURNAL_COMPACT_BYTES`` を超えたら、追記したプロセスが
+スナップショットへ畳み込む（コンパクション）。
+
+ジャーナルの 1 行目は基準にしたスナップショットの (inode, mtime_ns, size) を持つ
+ヘッダーで、以降の行は ``{"id": ..., "agent": {...}}``（削除は ``"agent": null``）。
+agents.json がコンパクション以外で置き換えられた場合（外部からの編集など）は
+ヘッダーが一致しなくなるため、そのジャーナルは無視・破棄される。
+
+読み込みはロックを取らない。スナップショットを開いたままジャーナルのヘッダーと
+照合するので、読み込み中にコンパクションが走っても古いジャーナルを新しい
+スナップショットへ適用することはない（不一致なら読み直す）。読み込んだ状態は
+パスごとに保持し、次回はジャーナルの追記分だけを読む。
+"""
+
+import fcntl
+import json
+import logging
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from src.managers.durable_io import atomic_write, sync_file
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_FILE_NAME = "agents.journal"
+"""agents.json と同じディレクトリに置く追記ジャーナルのファイル名"""
+
+_JOURNAL_COMPACT_BYTES = 256 * 1024
+"""ジャーナルがこのサイズを超えたら追記後にスナップショットへ畳み込む"""
+
+_READ_RETRIES = 3
+"""コンパクションと競合した場合にロックなしで読み直す回数（超えたらロックを取る）"""
+
+Signature = tuple[int, int, int]
+
+
+def get_journal_path(agents_file: Path) -> Path:
+    """agents.json に対応するジャーナルのパスを返す。"""
+    return agents_file.with_name(JOURNAL_FILE_NAME)
+
+
+def get_agents_lock_path(agents_file: Path) -> Path:
+    """agents.json 用の排他ロックファイルパスを返す。"""
+    return agents_file.with_name(f"{agents_file.stem}.lock")
+
+
+@contextmanager
+def agents_file_lock(agents_file: Path) -> Iterator[None]:
+    """agents.json / ジャーナルの更新時に排他ロックを取得する。"""
+    lock_path = get_agents_lock_path(agents_file)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(lock_path, "a+", encoding="utf-8") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def atomic_write_json(file_path: Path, payload: dict[str, Any]) -> None:
+    """JSON payload をアトミックに書き込む（耐久性モードに従う）。"""
+    atomic_write(file_path, json.dumps(payload, ensure_ascii=False, indent=2, default=str))
+
+
+def _stat_signature(stat: os.stat_result) -> Signature:
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _file_signature(path: Path) -> Signature | None:
+    try:
+        return _stat_signature(path.stat())
+    except OSError:
+        return None
+
+
+def get_agents_store_signature(agents_file: Path) -> tuple[Signature | None, Signature | None]:
+    """スナップショットとジャーナルの (inode, mtime_ns, size) を返す（変更検知用）。"""
+    return (_file_signature(agents_file), _file_signature(get_journal_path(agents_file)))
+
+
+def _parse_header(line: bytes) -> Signature | None:
+    """ジャーナルのヘッダー行から基準シグネチャを取り出す（壊れている場合は None）。"""
+    try:
+        base = tuple(json.loads(line)["base"])
+    except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError):
+        return None
+    return base if len(base) == 3 else None  # type: ignore[return-value]
+
+
+def _complete_lines(content: bytes) -> bytes:
+    """改行で終わる部分だけを返す（追記途中の末尾行は次回に読む）。"""
+    return content[: content.rfind(b"\n") + 1]
+
+
+def _apply_records(agents_data: dict[str, Any], chunk: bytes) -> None:
+    """ジャーナルのレコード行を agents_data に順に適用する（壊れた行は無視する）。
+
+    エントリは置き換えのみで変更しないため、以前に返した dict の浅いコピーには影響しない。
+    """
+    for line in chunk.split(b"\n"):
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+            agent_id = record["id"]
+            agent_data = record.get("agent")
+        except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError, AttributeError):
+            logger.warning("agents ジャーナルの壊れた行を無視します")
+            continue
+        if not isinstance(agent_id, str):
+            continue
+        if agent_data is None:
+            agents_data.pop(agent_id, None)
+        elif isinstance(agent_data, dict):
+            agents_data[agent_id] = agent_data
+
+
+@dataclass
+class _ReadState:
+    """読み込み済みの状態。次回はジャーナルの続き（offset 以降）だけを読む。"""
+
+    snapshot_signature: Signature
+    journal_ino: int | None
+    """適用したジャーナルの inode（ジャーナルが無い場合は None）"""
+    offset: int
+    """適用済みのジャーナルのバイト数"""
+    agents_data: dict[str, Any]
+
+
+# agents.json のパス -> 読み込み済みの状態
+_read_states: dict[str, _ReadState] = {}
+_read_states_lock = threading.Lock()
+_MAX_READ_STATES = 64
+
+
+def _read_once(agents_file: Path) -> _ReadState | None:
+    """スナップショットとジャーナルを 1 回読む。
+
+    Returns:
+        読み込んだ状態。ジャーナルがスナップショットと対応していない場合は None
+
+    Raises:
+        FileNotFoundError: agents.json が存在しない場合
+        OSError, json.JSONDecodeError: 読み込み・パースに失敗した場合
+    """
+    with open(agents_file, "rb") as snapshot:
+        agents_data = json.loads(snapshot.read())
+        snapshot_signature = _stat_signature(os.fstat(snapshot.fileno()))
+        # スナップショットを開いたまま照合する（inode が再利用されないように）
+        try:
+            with open(get_journal_path(agents_file), "rb") as journal:
+                journal_ino = os.fstat(journal.fileno()).st_ino
+                content = _complete_lines(journal.read())
+        except FileNotFoundError:
+            journal_ino = None
+            content = b""
+    if not isinstance(agents_data, dict):
+        raise json.JSONDecodeError("agents.json がオブジェクトではありません", "", 0)
+    if journal_ino is None:
+        return _ReadState(snapshot_signature, None, 0, agents_data)
+
+    header_end = content.find(b"\n")
+    if header_end < 0 or _parse_header(content[:header_end]) != snapshot_signature:
+        return None
+    _apply_records(agents_data, content[header_end + 1 :])
+    return _ReadState(snapshot_signature, journal_ino, len(content), agents_data)
+
+
+def _read_tail(agents_file: Path, state: _ReadState) -> bool:
+    """前回の続きからジャーナルを読んで state を更新する。
+
+    Returns:
+        最新状態にできた場合 True（ジャーナルが置き換えられていれば False）
+    """
+    try:
+        with open(get_journal_path(agents_file), "rb") as journal:
+            stat = os.fstat(journal.fileno())
+            if stat.st_ino != state.journal_ino or stat.st_size < state.offset:
+                return False
+            if stat.st_size == state.offset:
+                return True
+            journal.seek(state.offset)
+            content = _complete_lines(journal.read())
+    except FileNotFoundError:
+        return state.journal_ino is None
+    _apply_records(state.agents_data, content)
+    state.offset += len(content)
+    return True
+
+
+def read_agents_data(agents_file: Path) -> dict[str, Any]:
+    """スナップショットにジャーナルを適用した全エージェントの dict を返す。
+
+    前回の読み込みからスナップショットが変わっていなければ、ジャーナルの
+    追記分だけを読んで適用する。
+
+    Raises:
+        FileNotFoundError: agents.json が存在しない場合
+        OSError, json.JSONDecodeError: 読み込み・パースに失敗した場合
+    """
+    key = str(agents_file)
+    snapshot_signature = _file_signature(agents_file)
+    with _read_states_lock:
+        state = _read_states.get(key)
+        if snapshot_signature is None:
+            _read_states.pop(key, None)
+        elif (
+            state is not None
+            and state.snapshot_signature == snapshot_signature
+            and _read_tail(agents_file, state)
+        ):
+            return dict(state.agents_data)
+
+    for _ in range(_READ_RETRIES):
+        state = _read_once(agents_file)
+        if state is not None:
+            break
+    else:
+        # コンパクションと競合し続ける、または agents.json が外部で置き換えられた場合
+        with agents_file_lock(agents_file):
+            state = _read_locked_state(agents_file)
+        if state is None:
+            raise FileNotFoundError(str(agents_file))
+
+    with _read_states_lock:
+        if len(_read_states) >= _MAX_READ_STATES:
+            _read_states.clear()
+        _read_states[key] = state
+    return dict(state.agents_data)
+
+
+def clear_read_cache() -> None:
+    """読み込み済みの状態を破棄する（テスト用）。"""
+    with _read_states_lock:
+        _read_states.clear()
+
+
+def _read_locked_state(agents_file: Path) -> _ReadState | None:
+    """ロック保持中に読み込む（基準が一致しないジャーナルは破棄する）。
+
+    Returns:
+        読み込んだ状態。agents.json が存在しない場合は None
+    """
+    journal_path = get_journal_path(agents_file)
+    if not agents_file.exists():
+        journal_path.unlink(missing_ok=True)
+        return None
+    state = _read_once(agents_file)
+    if state is None:
+        logger.info(f"agents.json が置き換えられたため古いジャーナルを破棄します: {agents_file}")
+        journal_path.unlink(missing_ok=True)
+        state = _read_once(agents_file)
+    return state
+
+
+def _read_locked(agents_file: Path) -> dict[str, Any]:
+    """ロック保持中に全エージェントの dict を読み込む（agents.json が無ければ空）。"""
+    state = _read_locked_state(agents_file)
+    return state.agents_data if state is not None else {}
+
+
+def _compact_locked(agents_file: Path, agents_data: dict[str, Any]) -> None:
+    """ロック保持中にスナップショットを書き出し、新しいジャーナルを開始する。"""
+    atomic_write_json(agents_file, agents_data)
+    _start_journal_locked(agents_file)
+
+
+def _start_journal_locked(agents_file: Path) -> None:
+    """現在のスナップショットを基準にした空のジャーナルを作成する（アトミックに置換）。"""
+    signature = _file_signature(agents_file)
+    atomic_write(
+        get_journal_path(agents_file),
+        json.dumps({"base": list(signature or (0, 0, 0))}) + "\n",
+    )
+
+
+def append_agent_records(agents_file: Path, records: dict[str, dict | None]) -> None:
+    """エージェントの更新（None は削除）をジャーナルへまとめて追記する。
+
+    ロック保持中の処理は原則としてジャーナルのヘッダー確認と 1 回の追記だけで、
+    エージェント数には比例しない。ジャーナルが閾値を超えた場合のみ畳み込む。
+
+    Raises:
+        OSError, json.JSONDecodeError: 読み書きに失敗した場合
+    """
+    if not records:
+        return
+    payload = "".join(
+        json.dumps({"id": agent_id, "agent": data}, ensure_ascii=False, default=str) + "\n"
+        for agent_id, data in records.items()
+    )
+    journal_path = get_journal_path(agents_file)
+    with agents_file_lock(agents_file):
+        snapshot_signature = _file_signature(agents_file)
+        if snapshot_signature is None:
+            atomic_write_json(agents_file, {})
+            _start_journal_locked(agents_file)
+        elif _journal_base(journal_path) != snapshot_signature:
+            # 初回、または agents.json が外部で置き換えられた: 現在の状態で畳み込み直す
+            _compact_locked(agents_file, _read_locked(agents_file))
+
+        fd = os.open(str(journal_path), os.O_WRONLY | os.O_APPEND)
+        try:
+            os.write(fd, payload.encode("utf-8"))
+            sync_file(fd)
+            journal_size = os.fstat(fd).st_size
+        finally:
+            os.close(fd)
+
+        if journal_size > _JOURNAL_COMPACT_BYTES:
+            _compact_locked(agents_file, _read_locked(agents_file))
+            logger.debug(f"agents ジャーナルをスナップショットへ畳み込みました: {agents_file}")
+
+
+def _journal_base(journal_path: Path) -> Signature | None:
+    """ジャーナルのヘッダーが示す基準シグネチャ（無い・壊れている場合は None）。"""
+    try:
+        with open(journal_path, "rb") as f:
+            header_line = f.readline()
+    except OSError:
+        return None
+    if not header_line.endswith(b"\n"):
+        return None
+    return _parse_header(header_line)
+
+
+def compact_agents_journal(agents_file: Path) -> bool:
+    """ジャーナルをスナップショットへ畳み込む。
+
+    Returns:
+        畳み込みを行った場合 True（ジャーナルが無い場合は False）
+    """
+    if not get_journal_path(agents_file).exists():
+        return False
+    with agents_file_lock(agents_file):
+        if not agents_file.exists():
+            get_journal_path(agents_file).unlink(missing_ok=True)
+            return False
+        _compact_locked(agents_file, _read_locked(agents_file))
+    return True
+
+
+def delete_agents_store(agents_file: Path) -> bool:
+    """agents.json とジャーナルを削除する。
+
+    Returns:
+        agents.json を削除した場合 True
+
+    Raises:
+        OSError: 削除に失敗した場合
+    """
+    get_journal_path(agents_file).unlink(missing_ok=True)
+    if not agents_file.exists():
+        return False
+    agents_file.unlink()
+    return True
@@ -0,0 +1,190 @@
+"""app_lifespan で BackgroundSupervisor に登録する既定のジョブ。"""
+
+import asyncio
+import logging
+from pathlib import Path
+
+from src.managers.background_supervisor import BackgroundSupervisor
+
+logger = logging.getLogger(__name__)
+
+# ロック待ちのため遅延させたタスク終了の反映（完了前に GC されないよう参照を保持する）
+_deferred_releases: set[asyncio.Task[None]] = set()
+
+MEMORY_PRUNE_JOB = "memory_prune"
+REGISTRY_GC_JOB = "registry_gc"
+SCHEDULER_AUTO_ASSIGN_JOB = "scheduler_auto_assign"
+
+
+async def _prune_memory(app_ctx) -> None:
+    """初期化済みの MemoryManager について TTL 超過・上限超過エントリをアーカイブする。
+
+    プロジェクトが確定していない段階で MemoryManager を生成しないよう、
+    未初期化の場合は何もしない。
+    """
+    memory = app_ctx.memory_manager
+    if memory is None:
+        return
+    archived = memory.prune()
+    if archived:
+        logger.info("メモリの定期整理で %d 件をアーカイブしました", archived)
+
+
+async def _gc_registry() -> None:
+    """グローバルレジストリから project_root が存在しないエージェントを削除する。"""
+    from src.tools.helpers_registry import prune_registry
+
+    removed = prune_registry()
+    if removed:
+        logger.info("レジストリの定期 GC で %d 件を削除しました", removed)
+
+
+def notify_task_terminal(
+    app_ctx,
+    task_id: str,
+    worker_id: str | None = None,
+    completed: bool = True,
+) -> bool:
+    """タスクの終了をスケジューラーへ反映し、イベント起点の自動割り当てを要求する。
+
+    スケジューラー未使用（キュー未初期化）の場合は何もしない。完了の反映
+    （依存待ちタスクの解放）は常に行い、自動割り当ては設定で有効な場合のみ要求する。
+
+    Args:
+        completed: completed での終了なら True（failed/cancelled は False）
+
+    他プロセスがキューのロックを保持している場合、イベントループ上では待たずに
+    ロック解放後の反映（と自動割り当ての要求）をバックグラウンドで行う。
+
+    Returns:
+        自動割り当てを要求した（遅延した反映の後に要求する場合を含む）場合 True
+    """
+    scheduler = app_ctx.scheduler_manager
+    if scheduler is None:
+        return False
+    if scheduler.release_task_nowait(task_id, worker_id, completed=completed):
+        return _request_auto_assign(app_ctx)
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        scheduler.release_task(task_id, worker_id, completed=completed)
+        return _request_auto_assign(app_ctx)
+
+    async def _release_when_unlocked() -> None:
+        await scheduler.run_locked(scheduler.release_task, task_id, worker_id, completed=completed)
+        _request_auto_assign(app_ctx)
+
+    logger.debug("キューのロック待ちのため、タスク %s の終了を遅延して反映します", task_id)
+    task = loop.create_task(_release_when_unlocked())
+    _deferred_releases.add(task)
+    task.add_done_callback(_deferred_releases.discard)
+    return _auto_assign_supervisor(app_ctx) is not None
+
+
+def _auto_assign_supervisor(app_ctx) -> BackgroundSupervisor | None:
+    """イベント起点の自動割り当てが有効なら BackgroundSupervisor を返す。"""
+    if not app_ctx.settings.scheduler_event_auto_assign_enabled:
+        return None
+    return app_ctx.background_supervisor
+
+
+def _request_auto_assign(app_ctx) -> bool:
+    """イベント起点の自動割り当てを要求する（無効な場合は何もしない）。"""
+    supervisor = _auto_assign_supervisor(app_ctx)
+    if supervisor is None:
+        return False
+    return supervisor.trigger(SCHEDULER_AUTO_ASSIGN_JOB)
+
+
+async def _notify_admins_of_assignments(app_ctx, assignments: list[tuple[str, str]]) -> None:
+    """自動割り当ての結果を Admin に IPC で通知し、tmux 経由で即時に知らせる。
+
+    タスク本文・ブランチ・worktree は Admin が決めるため、実際の送信は
+    通知を受けた Admin の send_task で行う。
+    """
+    from src.models.agent import AgentRole
+    from src.models.message import MessagePriority, MessageType
+    from src.tools.helpers import find_agents_by_role, notify_agent_via_tmux
+    from src.tools.helpers_managers import ensure_ipc_manager
+
+    lines = [f"- {task_id} → {worker_id}" for task_id, worker_id in assignments]
+    content = (
+        "タスク終了を受けてキューのタスクを空き Worker に自動割り当てしました。"
+        "send_task で各 Worker にタスクを送信してください。\n" + "\n".join(lines)
+    )
+    ipc = ensure_ipc_manager(app_ctx)
+    for admin_id in find_agents_by_role(app_ctx, AgentRole.ADMIN.value):
+        if admin_id not in ipc.get_all_agent_ids():
+            ipc.register_agent(admin_id)
+        ipc.send_message(
+            sender_id="scheduler",
+            receiver_id=admin_id,
+            message_type=MessageType.TASK_ASSIGN,
+            subject=f"auto-assigned {len(assignments)} task(s)",
+            content=content,
+            priority=MessagePriority.HIGH,
+            metadata={
+                "assignments": [
+                    {"task_id": task_id, "worker_id": worker_id}
+                    for task_id, worker_id in assignments
+                ]
+            },
+        )
+        await notify_agent_via_tmux(
+            app_ctx,
+            app_ctx.agents.get(admin_id),
+            MessageType.TASK_ASSIGN.value,
+            "scheduler",
+        )
+
+
+async def _auto_assign_queued_tasks(app_ctx) -> None:
+    """キューの実行可能タスクを空き Worker に割り当て、Admin に送信を促す。
+
+    設定はプロジェクトの .env で後から有効化されうるため、実行時に確認する。
+    """
+    if not app_ctx.settings.scheduler_event_auto_assign_enabled:
+        return
+    scheduler = app_ctx.scheduler_manager
+    if scheduler is None:
+        return
+    assignments = await scheduler.run_locked(scheduler.run_auto_assign_loop)
+    if not assignments:
+        return
+    scheduler.record_event_assignments(
+        assignments, baseline_seconds=app_ctx.settings.healthcheck_interval_seconds
+    )
+    logger.info("タスク終了を受けて %d 件を自動割り当てしました", len(assignments))
+    if app_ctx.project_root and app_ctx.session_id:
+        scheduler.dashboard_manager.save_markdown_dashboard(
+            Path(app_ctx.project_root), app_ctx.session_id
+        )
+    await _notify_admins_of_assignments(app_ctx, assignments)
+
+
+def register_default_jobs(app_ctx, supervisor: BackgroundSupervisor) -> None:
+    """設定に応じて既定のジョブを登録する。
+
+    scheduler_auto_assign はトリガー起動のみのジョブのため常に登録し、
+    有効かどうかは実行時の設定で判定する。
+    """
+    supervisor.register(
+        SCHEDULER_AUTO_ASSIGN_JOB,
+        lambda: _auto_assign_queued_tasks(app_ctx),
+        restart_delay_seconds=10.0,
+    )
+    prune_interval = app_ctx.settings.memory_prune_interval_seconds
+    if prune_interval > 0:
+        supervisor.register(
+            MEMORY_PRUNE_JOB,
+            lambda: _prune_memory(app_ctx),
+            interval_seconds=prune_interval,
+        )
+    gc_interval = app_ctx.settings.registry_gc_interval_seconds
+    if gc_interval > 0:
+        supervisor.register(
+            REGISTRY_GC_JOB,
+            _gc_registry,
+            interval_seconds=gc_interval,
+            run_on_start=True,
+        )
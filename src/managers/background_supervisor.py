@@ -0,0 +1,326 @@
+"""サーバーのライフサイクルに紐づくバックグラウンドジョブの監督。
+
+``app_lifespan`` が 1 つの BackgroundSupervisor を所有し、名前付きのジョブを
+登録する。ジョブは次のいずれか（または両方）で実行される。
+
+- 周期実行: ``interval_seconds`` ごと。複数ジョブの実行が重ならないよう、
+  間隔には ``jitter_ratio`` の範囲でゆらぎを加える
+- イベント実行: ``trigger(name)`` が呼ばれたとき。実行中に届いた trigger は
+  1 回分にまとめて実行後に再実行する
+
+連続失敗が ``error_budget`` に達したジョブは ``restart_policy`` に従い、
+``"restart"`` なら ``restart_delay_seconds`` 待機して再開し、``"stop"`` なら停止する。
+各ジョブの実行回数・所要時間・失敗は ``snapshot()`` で参照できる。
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+RESTART_POLICIES = ("restart", "stop")
+"""連続失敗が上限に達したときの方針"""
+
+
+@dataclass
+class JobStats:
+    """ジョブの実行統計。"""
+
+    state: str = "pending"
+    """pending / idle / running / backoff / stopped"""
+    runs: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    restarts: int = 0
+    triggers: int = 0
+    last_started_at: datetime | None = None
+    last_duration_seconds: float | None = None
+    max_duration_seconds: float = 0.0
+    total_duration_seconds: float = 0.0
+    last_error: str | None = None
+
+
+@dataclass
+class BackgroundJob:
+    """登録済みジョブ。"""
+
+    name: str
+    func: Callable[[], Awaitable[Any]]
+    interval_seconds: float | None
+    """周期実行の間隔（秒）。None はイベント実行のみ"""
+    jitter_ratio: float
+    error_budget: int
+    """restart_policy を適用するまでに許容する連続失敗回数"""
+    restart_policy: str
+    restart_delay_seconds: float
+    run_on_start: bool
+    stats: JobStats = field(default_factory=JobStats)
+    wake: asyncio.Event = field(default_factory=asyncio.Event)
+    triggered: bool = False
+    task: asyncio.Task | None = None
+
+
+class BackgroundSupervisor:
+    """名前付きバックグラウンドジョブを協調的に実行・停止する。"""
+
+    def __init__(self, rng: random.Random | None = None) -> None:
+        """BackgroundSupervisor を初期化する。
+
+        Args:
+            rng: 間隔のゆらぎに使う乱数生成器（テスト用）
+        """
+        self._jobs: dict[str, BackgroundJob] = {}
+        self._rng = rng or random.Random()
+        self._running = False
+        self._stopping = False
+        self._stop_event = asyncio.Event()
+
+    @property
+    def running(self) -> bool:
+        """start 済みで stop されていなければ True。"""
+        return self._running
+
+    def register(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[Any]],
+        *,
+        interval_seconds: float | None = None,
+        jitter_ratio: float = 0.1,
+        error_budget: int = 3,
+        restart_policy: str = "restart",
+        restart_delay_seconds: float = 60.0,
+        run_on_start: bool = False,
+    ) -> BackgroundJob:
+        """ジョブを登録する。start 済みの場合はすぐに実行を開始する。
+
+        Raises:
+            ValueError: 名前の重複、または不正なパラメータの場合
+        """
+        if name in self._jobs:
+            raise ValueError(f"ジョブ {name} は既に登録されています")
+        if interval_seconds is not None and interval_seconds <= 0:
+            raise ValueError("interval_seconds は正の値で指定してください")
+        if not 0.0 <= jitter_ratio < 1.0:
+            raise ValueError("jitter_ratio は 0.0 以上 1.0 未満で指定してください")
+        if error_budget < 1:
+            raise ValueError("error_budget は 1 以上で指定してください")
+        if restart_policy not in RESTART_POLICIES:
+            raise ValueError(f"restart_policy は {RESTART_POLICIES} のいずれかで指定してください")
+
+        job = BackgroundJob(
+            name=name,
+            func=func,
+            interval_seconds=interval_seconds,
+            jitter_ratio=jitter_ratio,
+            error_budget=error_budget,
+            restart_policy=restart_policy,
+            restart_delay_seconds=max(0.0, restart_delay_seconds),
+            run_on_start=run_on_start,
+        )
+        self._jobs[name] = job
+        if self._running:
+            self._start_job(job)
+        return job
+
+    def trigger(self, name: str) -> bool:
+        """ジョブの即時実行を要求する。
+
+        Returns:
+            要求を受け付けた場合 True（未登録・停止済みのジョブは False）
+        """
+        job = self._jobs.get(name)
+        if job is None or job.stats.state == "stopped" or self._stopping:
+            return False
+        job.triggered = True
+        job.stats.triggers += 1
+        job.wake.set()
+        return True
+
+    def clear_triggers(self) -> int:
+        """未実行の trigger 要求を破棄する（セッション終了時に次のセッションへ持ち越さない）。
+
+        Returns:
+            破棄した要求の件数
+        """
+        cleared = 0
+        for job in self._jobs.values():
+            if job.triggered:
+                cleared += 1
+            job.triggered = False
+            if not self._stopping:
+                job.wake.clear()
+        return cleared
+
+    async def start(self) -> None:
+        """登録済みの全ジョブを開始する（二重起動は無視）。"""
+        if self._running:
+            return
+        self._running = True
+        self._stopping = False
+        self._stop_event.clear()
+        for job in self._jobs.values():
+            self._start_job(job)
+
+    async def stop(self, timeout_seconds: float = 5.0) -> None:
+        """全ジョブに停止を要求し、実行中の処理の完了を待つ。
+
+        timeout_seconds 以内に終わらないジョブはキャンセルする。
+        """
+        self._stopping = True
+        self._stop_event.set()
+        tasks = [job.task for job in self._jobs.values() if job.task is not None]
+        for job in self._jobs.values():
+            job.wake.set()
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=timeout_seconds)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for job in self._jobs.values():
+            job.task = None
+            job.stats.state = "stopped"
+        self._running = False
+        logger.info("バックグラウンドジョブを停止しました（%d 件）", len(tasks))
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """全ジョブの状態と実行統計を登録順に返す。"""
+        result = []
+        for job in self._jobs.values():
+            stats = job.stats
+            result.append(
+                {
+                    "name": job.name,
+                    "state": stats.state,
+                    "interval_seconds": job.interval_seconds,
+                    "restart_policy": job.restart_policy,
+                    "error_budget": job.error_budget,
+                    "runs": stats.runs,
+                    "failures": stats.failures,
+                    "consecutive_failures": stats.consecutive_failures,
+                    "restarts": stats.restarts,
+                    "triggers": stats.triggers,
+                    "last_started_at": (
+                        stats.last_started_at.isoformat() if stats.last_started_at else None
+                    ),
+                    "last_duration_seconds": (
+                        round(stats.last_duration_seconds, 4)
+                        if stats.last_duration_seconds is not None
+                        else None
+                    ),
+                    "avg_duration_seconds": (
+                        round(stats.total_duration_seconds / stats.runs, 4)
+                        if stats.runs
+                        else None
+                    ),
+                    "max_duration_seconds": round(stats.max_duration_seconds, 4),
+                    "last_error": stats.last_error,
+                }
+            )
+        return result
+
+    def _start_job(self, job: BackgroundJob) -> None:
+        job.stats.state = "idle"
+        job.task = asyncio.create_task(
+            self._run_job(job), name=f"multi-agent-mcp-job-{job.name}"
+        )
+
+    def _next_delay(self, job: BackgroundJob) -> float | None:
+        """次回周期実行までの秒数（ゆらぎ込み）。イベント実行のみのジョブは None。"""
+        if job.interval_seconds is None:
+            return None
+        spread = job.interval_seconds * job.jitter_ratio
+        return job.interval_seconds + self._rng.uniform(-spread, spread)
+
+    async def _sleep(self, job: BackgroundJob, timeout: float | None) -> None:
+        """timeout 秒経過・trigger・停止要求のいずれかまで待機する。"""
+        try:
+            await asyncio.wait_for(job.wake.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        job.wake.clear()
+
+    async def _backoff(self, job: BackgroundJob) -> None:
+        """再開まで待機する（trigger では起床せず、停止要求でのみ中断する）。"""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=job.restart_delay_seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _execute(self, job: BackgroundJob) -> None:
+        """ジョブを 1 回実行して統計を更新する。"""
+        stats = job.stats
+        stats.state = "running"
+        stats.last_started_at = datetime.now()
+        started = time.perf_counter()
+        try:
+            await job.func()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            stats.failures += 1
+            stats.consecutive_failures += 1
+            stats.last_error = f"{type(e).__name__}: {e}"
+            logger.warning(
+                "バックグラウンドジョブ %s が失敗しました（連続 %d 回）: %s",
+                job.name,
+                stats.consecutive_failures,
+                e,
+            )
+        else:
+            stats.consecutive_failures = 0
+        finally:
+            duration = time.perf_counter() - started
+            stats.runs += 1
+            stats.last_duration_seconds = duration
+            stats.total_duration_seconds += duration
+            stats.max_duration_seconds = max(stats.max_duration_seconds, duration)
+            if stats.state == "running":
+                stats.state = "idle"
+
+    async def _run_job(self, job: BackgroundJob) -> None:
+        """ジョブ 1 件の実行ループ。"""
+        stats = job.stats
+        try:
+            if job.run_on_start and not self._stopping:
+                await self._execute(job)
+            while not self._stopping:
+                if stats.consecutive_failures >= job.error_budget:
+                    if job.restart_policy == "stop":
+                        logger.error(
+                            "バックグラウンドジョブ %s を停止: 連続 %d 回失敗",
+                            job.name,
+                            stats.consecutive_failures,
+                        )
+                        stats.state = "stopped"
+                        return
+                    stats.state = "backoff"
+                    logger.warning(
+                        "バックグラウンドジョブ %s を %.0f 秒後に再開します",
+                        job.name,
+                        job.restart_delay_seconds,
+                    )
+                    await self._backoff(job)
+                    if self._stopping:
+                        break
+                    stats.restarts += 1
+                    stats.consecutive_failures = 0
+                    stats.state = "idle"
+
+                if not job.triggered:
+                    await self._sleep(job, self._next_delay(job))
+                if self._stopping:
+                    break
+                # 実行前に要求を消化し、実行中に届いた trigger だけを次回に持ち越す
+                job.triggered = False
+                job.wake.clear()
+                await self._execute(job)
+        finally:
+            if self._stopping:
+                stats.state = "stopped"
@@ -9,6 +9,7 @@ from typing import Any
 
 import yaml
 
+from src.managers.agents_journal import read_agents_data
 from src.models.dashboard import AgentSummary, MessageSummary
 
 logger = logging.getLogger(__name__)
@@ -61,8 +62,7 @@ class DashboardSyncMixin:
             # 🔴 agents.json からエージェント情報を同期
             if agents_file.exists():
                 try:
-                    with open(agents_file, encoding="utf-8") as f:
-                        agents_data = json.load(f)
+                    agents_data = read_agents_data(agents_file)
 
                     dashboard.agents = []
                     for agent_id, agent_dict in agents_data.items():
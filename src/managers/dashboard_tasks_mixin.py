@@ -204,69 +204,81 @@ class DashboardTasksMixin:
         """
 
         def _update(dashboard: Dashboard) -> tuple[bool, str]:
-            task = self._resolve_task(dashboard, task_id)
-            if not task:
-                return False, f"タスク {task_id} が見つかりません"
+            return self.apply_task_status(dashboard, task_id, status, progress, error_message)
 
-            old_status = task.status
-            is_valid, error = self._validate_task_transition(old_status, status)
-            if not is_valid:
-                return False, error or "状態遷移が許可されていません"
+        return self._mutate_dashboard(_update)
 
-            now = datetime.now()
-            task.status = status
-
-            if progress is not None:
-                task.progress = progress
-
-            if error_message is not None:
-                task.error_message = error_message
-            elif status != TaskStatus.FAILED:
-                task.error_message = None
-
-            if status == TaskStatus.IN_PROGRESS:
-                if (
-                    old_status in (TaskStatus.PENDING, TaskStatus.BLOCKED)
-                    and task.started_at is None
-                ):
-                    task.started_at = now
-                if dashboard.session_started_at is None:
-                    dashboard.session_started_at = task.started_at or now
-                task.completed_at = None
-                task.metadata["last_in_progress_update_at"] = now.isoformat()
-                if task.assigned_agent_id:
-                    for agent_summary in dashboard.agents:
-                        if agent_summary.agent_id == task.assigned_agent_id:
-                            agent_summary.current_task_id = task.id
-                            if agent_summary.role == "worker":
-                                agent_summary.status = "busy"
-                            break
-            elif status in self._TERMINAL_TASK_STATUSES:
-                task.completed_at = now
-                if status == TaskStatus.COMPLETED:
-                    task.progress = 100
+    def apply_task_status(
+        self,
+        dashboard: Dashboard,
+        task_id: str,
+        status: TaskStatus,
+        progress: int | None = None,
+        error_message: str | None = None,
+    ) -> tuple[bool, str]:
+        """読み込み済み Dashboard 上でタスクのステータスを更新する。
+
+        run_dashboard_transaction の中で他の更新とまとめて適用するために使う。
+        引数と戻り値は update_task_status と同じ。
+        """
+        task = self._resolve_task(dashboard, task_id)
+        if not task:
+            return False, f"タスク {task_id} が見つかりません"
+
+        old_status = task.status
+        is_valid, error = self._validate_task_transition(old_status, status)
+        if not is_valid:
+            return False, error or "状態遷移が許可されていません"
+
+        now = datetime.now()
+        task.status = status
+
+        if progress is not None:
+            task.progress = progress
+
+        if error_message is not None:
+            task.error_message = error_message
+        elif status != TaskStatus.FAILED:
+            task.error_message = None
+
+        if status == TaskStatus.IN_PROGRESS:
+            if old_status in (TaskStatus.PENDING, TaskStatus.BLOCKED) and task.started_at is None:
+                task.started_at = now
+            if dashboard.session_started_at is None:
+                dashboard.session_started_at = task.started_at or now
+            task.completed_at = None
+            task.metadata["last_in_progress_update_at"] = now.isoformat()
+            if task.assigned_agent_id:
                 for agent_summary in dashboard.agents:
-                    if agent_summary.current_task_id == task.id:
-                        agent_summary.current_task_id = None
+                    if agent_summary.agent_id == task.assigned_agent_id:
+                        agent_summary.current_task_id = task.id
                         if agent_summary.role == "worker":
-                            agent_summary.status = "idle"
-            elif status == TaskStatus.PENDING:
-                task.completed_at = None
-
-            has_active_tasks = any(
-                t.status in (TaskStatus.PENDING, TaskStatus.IN_PROGRESS, TaskStatus.BLOCKED)
-                for t in dashboard.tasks
-            )
-            if dashboard.tasks and not has_active_tasks:
-                dashboard.session_finished_at = now
-            else:
-                dashboard.session_finished_at = None
+                            agent_summary.status = "busy"
+                        break
+        elif status in self._TERMINAL_TASK_STATUSES:
+            task.completed_at = now
+            if status == TaskStatus.COMPLETED:
+                task.progress = 100
+            for agent_summary in dashboard.agents:
+                if agent_summary.current_task_id == task.id:
+                    agent_summary.current_task_id = None
+                    if agent_summary.role == "worker":
+                        agent_summary.status = "idle"
+        elif status == TaskStatus.PENDING:
+            task.completed_at = None
 
-            dashboard.calculate_stats()
-            logger.info(f"タスク {task.id} のステータスを更新: {old_status} -> {status}")
-            return True, f"ステータスを更新しました: {status.value}"
+        has_active_tasks = any(
+            t.status in (TaskStatus.PENDING, TaskStatus.IN_PROGRESS, TaskStatus.BLOCKED)
+            for t in dashboard.tasks
+        )
+        if dashboard.tasks and not has_active_tasks:
+            dashboard.session_finished_at = now
+        else:
+            dashboard.session_finished_at = None
 
-        return self._mutate_dashboard(_update)
+        dashboard.calculate_stats()
+        logger.info(f"タスク {task.id} のステータスを更新: {old_status} -> {status}")
+        return True, f"ステータスを更新しました: {status.value}"
 
     def reopen_task(self, task_id: str, reset_progress: bool = False) -> tuple[bool, str]:
         """終端状態タスクを PENDING に戻す。
@@ -396,6 +408,14 @@ class DashboardTasksMixin:
 
         return self._mutate_dashboard(_remove)
 
+    def resolve_task(self, dashboard: Dashboard, task_id: str) -> TaskInfo | None:
+        """読み込み済みの Dashboard から task_id のタスクを解決する。
+
+        get_task と同じく exact / normalized / unique prefix で照合する。
+        監視サイクルのスナップショットなど、Dashboard を再読み込みせずに使い回す場合に用いる。
+        """
+        return self._resolve_task(dashboard, task_id)
+
     def get_task(self, task_id: str) -> TaskInfo | None:
         """タスクを取得する。
 
@@ -4,13 +4,12 @@ Dashboard のファイル書き込みおよびトランザクション処理を
 """
 
 import logging
-import os
-import tempfile
 from collections.abc import Callable
 from typing import TypeVar
 
 import yaml
 
+from src.managers.durable_io import atomic_write
 from src.models.dashboard import Dashboard
 
 logger = logging.getLogger(__name__)
@@ -59,18 +58,7 @@ class DashboardWriterMixin:
                 sort_keys=False,
             )
             content = f"---\n{yaml_str}---\n\n{md_content}"
-            dashboard_path.parent.mkdir(parents=True, exist_ok=True)
-            fd, tmp_path = tempfile.mkstemp(dir=str(dashboard_path.parent), suffix=".tmp")
-            try:
-                with os.fdopen(fd, "w", encoding="utf-8") as f:
-                    f.write(content)
-                os.replace(tmp_path, str(dashboard_path))
-            except BaseException:
-                try:
-                    os.unlink(tmp_path)
-                except OSError:
-                    pass
-                raise
+            atomic_write(dashboard_path, content)
             # 書き込み成功時にキャッシュを無効化
             self._read_cache = None
             self._read_cache_mtime = 0
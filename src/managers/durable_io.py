@@ -0,0 +1,194 @@
+"""メタデータ書き込みの耐久性モード（fast / atomic / durable）。
+
+agents.json・ジャーナル・IPC メッセージ・ダッシュボード・キュー状態などの書き込みは
+本モジュールを経由し、プロセス全体で同じ耐久性モードに従う。
+
+- ``fast``（デフォルト）: 一時ファイル + ``os.replace``。fsync しない。
+  他プロセスが書き込み途中の内容を読むことはないが、OS クラッシュ・電源断では
+  直近の書き込みが失われたり、空のファイルが残ることがある。
+- ``atomic``: ``fast`` に加えて置換前にファイル内容を fsync する。電源断後も
+  各ファイルは旧版か新版のどちらかになる（置換自体は失われることがある）。
+- ``durable``: ``atomic`` に加えて置換後にディレクトリを fsync し、ジャーナルへの
+  追記も fsync する。書き込みが返った時点で電源断後も残る。
+
+``durability_batch()`` の中では、ディレクトリの fsync をバッチ終了時に
+ディレクトリごと 1 回へまとめる（グループコミット）。
+"""
+
+import logging
+import os
+import stat
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DURABILITY_FAST = "fast"
+DURABILITY_ATOMIC = "atomic"
+DURABILITY_DURABLE = "durable"
+DURABILITY_MODES = (DURABILITY_FAST, DURABILITY_ATOMIC, DURABILITY_DURABLE)
+
+_SQLITE_SYNCHRONOUS = {
+    DURABILITY_FAST: "NORMAL",
+    DURABILITY_ATOMIC: "NORMAL",
+    DURABILITY_DURABLE: "FULL",
+}
+"""耐久性モード -> SQLite の PRAGMA synchronous（WAL モード前提）"""
+
+_durability = DURABILITY_FAST
+
+# durability_batch 中に fsync を保留しているディレクトリ（バッチ外では None）
+_pending_dir_syncs: ContextVar[set[str] | None] = ContextVar("pending_dir_syncs", default=None)
+
+
+def set_durability(mode: str) -> None:
+    """プロセス全体の耐久性モードを設定する。
+
+    Raises:
+        ValueError: 未知のモードの場合
+    """
+    global _durability
+    value = str(getattr(mode, "value", mode)).strip().lower()
+    if value not in DURABILITY_MODES:
+        modes = ", ".join(DURABILITY_MODES)
+        raise ValueError(f"durability は {modes} のいずれかを指定してください")
+    if value != _durability:
+        logger.info(f"メタデータ書き込みの耐久性モードを {value} に設定します")
+    _durability = value
+
+
+def get_durability() -> str:
+    """現在の耐久性モードを返す。"""
+    return _durability
+
+
+def sqlite_synchronous() -> str:
+    """現在のモードに対応する SQLite の PRAGMA synchronous の値を返す。"""
+    return _SQLITE_SYNCHRONOUS[_durability]
+
+
+def _fdatasync(fd: int) -> None:
+    sync = getattr(os, "fdatasync", os.fsync)
+    sync(fd)
+
+
+def _fsync_directory_now(directory: str) -> None:
+    try:
+        fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError as e:
+        logger.warning(f"ディレクトリの fsync に失敗: {directory}: {e}")
+        return
+    try:
+        os.fsync(fd)
+    except OSError as e:
+        # fsync できないファイルシステム（一部のネットワーク FS など）は警告のみ
+        logger.warning(f"ディレクトリの fsync に失敗: {directory}: {e}")
+    finally:
+        os.close(fd)
+
+
+def sync_directory(directory: Path | str) -> None:
+    """durable モードでディレクトリのエントリ変更（作成・置換・削除）を永続化する。
+
+    ``durability_batch()`` 中はバッチ終了時まで保留し、同じディレクトリは 1 回にまとめる。
+    """
+    if _durability != DURABILITY_DURABLE:
+        return
+    pending = _pending_dir_syncs.get()
+    if pending is not None:
+        pending.add(str(directory))
+        return
+    _fsync_directory_now(str(directory))
+
+
+def sync_file(fd: int) -> None:
+    """durable モードで追記したファイルの内容を永続化する。"""
+    if _durability == DURABILITY_DURABLE:
+        _fdatasync(fd)
+
+
+@contextmanager
+def durability_batch() -> Iterator[None]:
+    """このコンテキスト内のディレクトリ fsync を終了時にまとめて行う。
+
+    入れ子にした場合は最も外側のバッチで行う。fast / atomic モードでは何もしない。
+    """
+    if _pending_dir_syncs.get() is not None:
+        yield
+        return
+    pending: set[str] = set()
+    token = _pending_dir_syncs.set(pending)
+    try:
+        yield
+    finally:
+        _pending_dir_syncs.reset(token)
+        for directory in sorted(pending):
+            _fsync_directory_now(directory)
+
+
+def _read_process_umask() -> int:
+    """プロセスの umask を返す。
+
+    ``/proc/self/status`` の ``Umask:`` を優先する。読めない環境では umask を
+    一時的に設定し直して取得するため、スレッドが動き出す前（import 時）にのみ呼ぶ。
+    """
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        pass
+    mask = os.umask(0o022)
+    os.umask(mask)
+    return mask
+
+
+_new_file_mode = 0o666 & ~_read_process_umask()
+"""新規作成するファイルのモード（起動時の umask に従う）"""
+
+
+def _target_mode(path: Path) -> int:
+    """置き換え後のファイルモード（既存ファイルのモード、なければ 0o666 & ~umask）。
+
+    ``mkstemp`` の一時ファイルは 0600 で作成されるため、``write_text`` 等で
+    新規作成した場合と同じ権限になるよう置換前に設定する。
+    """
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except OSError:
+        return _new_file_mode
+
+
+def atomic_write(file_path: Path | str, content: str | bytes) -> None:
+    """一時ファイル + ``os.replace`` で file_path を置き換える（耐久性モードに従う）。
+
+    親ディレクトリが無ければ作成する。既存ファイルのモードは引き継ぎ、新規作成時は
+    umask に従う。失敗時は一時ファイルを削除して例外を送出する。
+    """
+    path = Path(file_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        try:
+            os.fchmod(fd, _target_mode(path))
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+            if _durability != DURABILITY_FAST:
+                _fdatasync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    sync_directory(path.parent)
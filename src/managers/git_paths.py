@@ -0,0 +1,193 @@
+"""git リポジトリのパス解決（プロセス全体のキャッシュ付き）。
+
+プロジェクトルートや tmux セッション名の決定ではほぼ全てのツール呼び出しで
+``git rev-parse`` を実行していた。本モジュールは ``.git`` エントリ
+（ディレクトリ、または worktree / submodule の ``gitdir:`` ファイル）と
+``commondir`` ファイルを直接読んでワークツリーのルートと共通 git ディレクトリを求め、
+結果を「解決済みパス + ``.git`` エントリの mtime」で検証するキャッシュに保持する。
+
+``GIT_DIR`` などリポジトリの探索を変える環境変数が設定されている場合や、
+``.git`` ファイルの内容を解釈できない場合は ``git rev-parse`` にフォールバックする。
+"""
+
+import os
+import subprocess
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+_GIT_DISCOVERY_ENV_VARS = (
+    "GIT_DIR",
+    "GIT_WORK_TREE",
+    "GIT_COMMON_DIR",
+    "GIT_CEILING_DIRECTORIES",
+    "GIT_DISCOVERY_ACROSS_FILESYSTEM",
+)
+"""設定されているとファイルシステムだけでは git と同じ探索結果を保証できない環境変数"""
+
+_MAX_CACHE_ENTRIES = 256
+"""キャッシュするパスの上限（超えたら全て破棄する）"""
+
+_GIT_TIMEOUT_SECONDS = 5
+
+
+@dataclass(frozen=True)
+class GitLocation:
+    """パスが属する git リポジトリの場所。"""
+
+    toplevel: Path
+    """ワークツリーのルート（``git rev-parse --show-toplevel`` 相当）"""
+    common_dir: Path
+    """共通 git ディレクトリ（``git rev-parse --git-common-dir`` 相当）"""
+
+
+_cache: dict[Path, tuple[Path | None, int | None, GitLocation]] = {}
+"""解決済みパス -> (.git エントリ, その mtime_ns, 結果)"""
+_cache_lock = threading.Lock()
+_stats = {
+    "lookups": 0,
+    "cache_hits": 0,
+    "fast_path": 0,
+    "git_fallbacks": 0,
+}
+
+
+def _find_git_entry(start: Path) -> Path | None:
+    """start から親方向に ``.git`` エントリを探す（見つからなければ None）。"""
+    for directory in (start, *start.parents):
+        entry = directory / ".git"
+        if os.path.lexists(entry):
+            return entry
+    return None
+
+
+def _read_pointer(file_path: Path, prefix: str = "") -> Path | None:
+    """``gitdir:`` / ``commondir`` ファイルが指すパスを返す（相対パスはファイル位置基準）。"""
+    try:
+        content = file_path.read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+    if prefix:
+        if not content.startswith(prefix):
+            return None
+        content = content[len(prefix) :].strip()
+    if not content:
+        return None
+    target = Path(content)
+    if not target.is_absolute():
+        target = file_path.parent / target
+    return Path(os.path.realpath(target))
+
+
+def _locate_from_entry(entry: Path) -> GitLocation | None:
+    """``.git`` エントリから場所を求める（解釈できない場合は None）。"""
+    toplevel = Path(os.path.realpath(entry.parent))
+    if entry.is_dir():
+        git_dir = Path(os.path.realpath(entry))
+    elif entry.is_file():
+        git_dir = _read_pointer(entry, "gitdir:")
+        if git_dir is None or not git_dir.is_dir():
+            return None
+    else:
+        return None
+    common_dir = git_dir
+    commondir_file = git_dir / "commondir"
+    if commondir_file.is_file():
+        pointed = _read_pointer(commondir_file)
+        if pointed is None:
+            return None
+        common_dir = pointed
+    return GitLocation(toplevel=toplevel, common_dir=common_dir)
+
+
+def _locate_with_git(path: Path) -> GitLocation | None:
+    """``git rev-parse`` で場所を求める（git リポジトリでなければ None）。"""
+    _stats["git_fallbacks"] += 1
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(path), "rev-parse", "--show-toplevel", "--git-common-dir"],
+            capture_output=True,
+            text=True,
+            timeout=_GIT_TIMEOUT_SECONDS,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    lines = result.stdout.strip().splitlines()
+    if result.returncode != 0 or len(lines) < 2:
+        return None
+    common_dir = Path(lines[1].strip())
+    if not common_dir.is_absolute():
+        common_dir = path / common_dir
+    return GitLocation(
+        toplevel=Path(os.path.realpath(lines[0].strip())),
+        common_dir=Path(os.path.realpath(common_dir)),
+    )
+
+
+def _entry_mtime(entry: Path) -> int | None:
+    try:
+        return os.lstat(entry).st_mtime_ns
+    except OSError:
+        return None
+
+
+def locate_git_repository(path: str | Path) -> GitLocation | None:
+    """path が属する git リポジトリの場所を返す（git リポジトリでなければ None）。
+
+    結果はキャッシュし、次回は ``.git`` エントリの mtime が変わっていなければ再利用する。
+    """
+    start = Path(os.path.realpath(Path(path).expanduser()))
+    _stats["lookups"] += 1
+
+    if any(os.environ.get(name) for name in _GIT_DISCOVERY_ENV_VARS):
+        return _locate_with_git(start)
+
+    with _cache_lock:
+        cached = _cache.get(start)
+    if cached is not None:
+        entry, mtime, location = cached
+        if entry is not None and _entry_mtime(entry) == mtime:
+            _stats["cache_hits"] += 1
+            return location
+
+    entry = _find_git_entry(start)
+    if entry is None:
+        # 親方向に .git が無ければ git も同じくリポジトリ外と判定する
+        return None
+    mtime = _entry_mtime(entry)
+    location = _locate_from_entry(entry)
+    if location is not None:
+        _stats["fast_path"] += 1
+    else:
+        location = _locate_with_git(start)
+        if location is None:
+            return None
+
+    with _cache_lock:
+        if len(_cache) >= _MAX_CACHE_ENTRIES:
+            _cache.clear()
+        _cache[start] = (entry, mtime, location)
+    return location
+
+
+def clear_git_path_cache() -> None:
+    """キャッシュと統計を破棄する。"""
+    with _cache_lock:
+        _cache.clear()
+        for key in _stats:
+            _stats[key] = 0
+
+
+def get_git_path_cache_stats() -> dict[str, Any]:
+    """キャッシュの統計を返す。
+
+    ``git_spawns_avoided`` はファイルシステムだけで解決できた回数（キャッシュヒット含む）。
+    """
+    with _cache_lock:
+        entries = len(_cache)
+    return {
+        **_stats,
+        "entries": entries,
+        "git_spawns_avoided": _stats["cache_hits"] + _stats["fast_path"],
+    }
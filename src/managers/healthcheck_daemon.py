@@ -1,6 +1,7 @@
 """Health check 常駐監視ループ。"""
 
 import asyncio
+import inspect
 import logging
 
 from src.models.agent import AgentRole, AgentStatus
@@ -123,12 +124,54 @@ def _should_auto_stop(app_ctx) -> bool:
     return in_progress_tasks == 0 and all_idle
 
 
+async def _wait_for_next_cycle(app_ctx, stop_event: asyncio.Event, timeout: float) -> None:
+    """次サイクルまで待機する。
+
+    スケジューラがある場合はその wakeup イベントを待つ。停止要求時は
+    stop_healthcheck_daemon が wakeup も立てるため、どちらでも早期に起床する。
+    """
+    scheduler = app_ctx.healthcheck_scheduler
+    event = stop_event
+    if scheduler is not None:
+        scheduler.wakeup.clear()
+        event = scheduler.wakeup
+    try:
+        await asyncio.wait_for(event.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+
+
+async def _close_healthcheck_manager(app_ctx, discard: bool = False) -> None:
+    """HealthcheckManager の継続中の復旧を停止する（discard=True なら破棄して再初期化を促す）。"""
+    manager = app_ctx.healthcheck_manager
+    if discard:
+        app_ctx.healthcheck_manager = None
+    if manager is None:
+        return
+    close = getattr(manager, "close", None)
+    if not callable(close):
+        return
+    try:
+        result = close()
+        if inspect.isawaitable(result):
+            await result
+    except Exception as e:
+        logger.warning("healthcheck manager の停止処理に失敗: %s", e)
+
+
 async def _run_healthcheck_loop(app_ctx) -> None:
-    """health check の常駐ループ本体。"""
+    """health check の常駐ループ本体。
+
+    Worker ごとの次回確認時刻は HealthcheckScheduler が管理し、各サイクルでは
+    期限到来した Worker だけを監視する。auto-stop 判定は従来どおり
+    ``healthcheck_interval_seconds`` ごとに行う。
+    """
     consecutive_errors = 0
     stop_reason = "unknown"
     stop_detail: str | None = None
     notify_stop = False
+    loop = asyncio.get_running_loop()
+    next_housekeeping_at = 0.0
     try:
         while True:
             stop_event = app_ctx.healthcheck_daemon_stop_event
@@ -136,22 +179,34 @@ async def _run_healthcheck_loop(app_ctx) -> None:
                 stop_reason = "stop_requested"
                 break
 
+            interval_seconds = max(1, int(app_ctx.settings.healthcheck_interval_seconds))
+            housekeeping = loop.time() >= next_housekeeping_at
             try:
                 from src.tools.helpers import sync_agents_from_file
-                from src.tools.helpers_managers import ensure_healthcheck_manager
+                from src.tools.helpers_managers import (
+                    ensure_healthcheck_manager,
+                    ensure_healthcheck_scheduler,
+                )
 
                 sync_agents_from_file(app_ctx)
-                healthcheck = ensure_healthcheck_manager(app_ctx)
-                result = await healthcheck.monitor_and_recover_workers(app_ctx)
-                escalated = result.get("escalated", [])
-                failed = result.get("failed_tasks", [])
-                if escalated or failed:
-                    logger.warning(
-                        "healthcheck daemon: recovered=%s escalated=%s failed=%s",
-                        len(result.get("recovered", [])),
-                        len(escalated),
-                        len(failed),
+                scheduler = ensure_healthcheck_scheduler(app_ctx)
+                scheduler.sync_agents(worker.id for worker in _list_workers(app_ctx))
+                due_ids = scheduler.pop_due()
+                if due_ids:
+                    healthcheck = ensure_healthcheck_manager(app_ctx)
+                    result = await healthcheck.monitor_and_recover_workers(
+                        app_ctx, agent_ids=due_ids
                     )
+                    scheduler.reschedule(due_ids, result, app_ctx.agents)
+                    escalated = result.get("escalated", [])
+                    failed = result.get("failed_tasks", [])
+                    if escalated or failed:
+                        logger.warning(
+                            "healthcheck daemon: recovered=%s escalated=%s failed=%s",
+                            len(result.get("recovered", [])),
+                            len(escalated),
+                            len(failed),
+                        )
                 # 正常サイクル: エラーカウンターリセット
                 consecutive_errors = 0
             except _FATAL_EXCEPTIONS as e:
@@ -182,41 +237,49 @@ async def _run_healthcheck_loop(app_ctx) -> None:
                         "healthcheck daemon を再初期化: 連続 %d 回エラー",
                         consecutive_errors,
                     )
-                    # healthcheck_manager をリセットして再初期化を促す
-                    app_ctx.healthcheck_manager = None
-
-            try:
-                should_stop = _should_auto_stop(app_ctx)
-            except Exception as e:
-                logger.error("healthcheck daemon auto-stop 判定エラー: %s", e)
-                stop_reason = "auto_stop_check_failed"
-                stop_detail = str(e)
-                notify_stop = True
-                break
-
-            if should_stop:
-                app_ctx.healthcheck_idle_cycles += 1
-                if (
-                    app_ctx.healthcheck_idle_cycles
-                    >= app_ctx.settings.healthcheck_idle_stop_consecutive
-                ):
-                    logger.info(
-                        "healthcheck daemon auto-stopped (idle_count=%s)",
-                        app_ctx.healthcheck_idle_cycles,
-                    )
-                    stop_reason = "auto_stop_idle"
-                    stop_detail = f"idle_count={app_ctx.healthcheck_idle_cycles}"
+                    # healthcheck_manager を停止・リセットして再初期化を促す
+                    await _close_healthcheck_manager(app_ctx, discard=True)
+
+            # 短い間隔の個別確認で idle 連続回数が早く進まないよう、
+            # auto-stop 判定は基本間隔ごとにのみ行う
+            if housekeeping:
+                next_housekeeping_at = loop.time() + interval_seconds
+                try:
+                    should_stop = _should_auto_stop(app_ctx)
+                except Exception as e:
+                    logger.error("healthcheck daemon auto-stop 判定エラー: %s", e)
+                    stop_reason = "auto_stop_check_failed"
+                    stop_detail = str(e)
                     notify_stop = True
                     break
-            else:
-                app_ctx.healthcheck_idle_cycles = 0
 
-            wait_seconds = max(1, int(app_ctx.settings.healthcheck_interval_seconds))
-            try:
-                await asyncio.wait_for(stop_event.wait(), timeout=wait_seconds)
-            except asyncio.TimeoutError:
-                pass
+                if should_stop:
+                    app_ctx.healthcheck_idle_cycles += 1
+                    if (
+                        app_ctx.healthcheck_idle_cycles
+                        >= app_ctx.settings.healthcheck_idle_stop_consecutive
+                    ):
+                        logger.info(
+                            "healthcheck daemon auto-stopped (idle_count=%s)",
+                            app_ctx.healthcheck_idle_cycles,
+                        )
+                        stop_reason = "auto_stop_idle"
+                        stop_detail = f"idle_count={app_ctx.healthcheck_idle_cycles}"
+                        notify_stop = True
+                        break
+                else:
+                    app_ctx.healthcheck_idle_cycles = 0
+
+            wait_seconds = max(0.0, next_housekeeping_at - loop.time())
+            scheduler = app_ctx.healthcheck_scheduler
+            if scheduler is not None:
+                until_next = scheduler.seconds_until_next()
+                if until_next is not None:
+                    wait_seconds = min(wait_seconds, until_next)
+            # 期限が密集していても連続実行しすぎないよう最短 1 秒は待つ
+            await _wait_for_next_cycle(app_ctx, stop_event, max(1.0, wait_seconds))
     finally:
+        await _close_healthcheck_manager(app_ctx)
         if notify_stop:
             await _notify_daemon_stopped(app_ctx, stop_reason=stop_reason, detail=stop_detail)
         app_ctx.healthcheck_daemon_task = None
@@ -251,6 +314,8 @@ async def stop_healthcheck_daemon(app_ctx, timeout_seconds: float = 5.0) -> bool
     async with app_ctx.healthcheck_daemon_lock:
         task = app_ctx.healthcheck_daemon_task
         if task is None:
+            # daemon 外（ツールからの監視）で開始された復旧も停止する
+            await _close_healthcheck_manager(app_ctx)
             app_ctx.healthcheck_daemon_stop_event = None
             app_ctx.healthcheck_idle_cycles = 0
             return False
@@ -258,6 +323,8 @@ async def stop_healthcheck_daemon(app_ctx, timeout_seconds: float = 5.0) -> bool
         stop_event = app_ctx.healthcheck_daemon_stop_event
         if stop_event is not None:
             stop_event.set()
+        if app_ctx.healthcheck_scheduler is not None:
+            app_ctx.healthcheck_scheduler.wakeup.set()
 
         current = asyncio.current_task()
         if task is current:
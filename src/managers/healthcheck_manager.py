@@ -3,27 +3,53 @@
 エージェントの死活監視を行い、異常を検出したら通知・復旧する。
 """
 
+import asyncio
 import hashlib
 import inspect
 import json
 import logging
 import subprocess
-from dataclasses import dataclass
+import time
+from collections.abc import Callable, Iterable, Mapping
+from contextvars import ContextVar, copy_context
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
+from src.managers.durable_io import atomic_write, durability_batch
+from src.managers.healthcheck_metrics import HealthcheckMetrics
+from src.managers.pane_log import pane_log_signature
+from src.managers.process_probe import (
+    clock_ticks_per_second,
+    is_proc_available,
+    page_size_bytes,
+    probe_process_tree,
+)
+from src.managers.tmux_shared import use_tmux_socket
+
 if TYPE_CHECKING:
     from src.context import AppContext
     from src.managers.dashboard_manager import DashboardManager
     from src.managers.tmux_manager import TmuxManager
     from src.models.agent import Agent
-    from src.models.dashboard import TaskInfo
+    from src.models.dashboard import Dashboard, TaskInfo
 
 logger = logging.getLogger(__name__)
 
 _SHELL_COMMANDS = {"zsh", "bash", "sh", "fish"}
 _AI_RUNNING_COMMAND_PREFIXES = ("codex", "claude", "gemini", "agent", "cursor-agent")
+_PANE_TABLE_TTL_SECONDS = 1.0
+"""list-panes で取得したペイン一覧を同一サイクル内で共有する期間（秒）"""
+
+HEALTHCHECK_STATE_FILE_NAME = "healthcheck_state.json"
+"""セッションディレクトリ配下に保存する監視状態ファイル名"""
+_STATE_FILE_VERSION = 1
+
+_DIAGNOSIS_TIMED_OUT = "timed_out"
+_DIAGNOSIS_FAILED = "failed"
+"""_diagnose_with_timeout が診断結果の代わりに返すマーカー"""
 
 
 def _is_ai_running(pane_command: str) -> bool:
@@ -37,6 +63,61 @@ def _is_ai_running(pane_command: str) -> bool:
     return normalized.startswith(_AI_RUNNING_COMMAND_PREFIXES)
 
 
+@dataclass(frozen=True)
+class _TaskSnapshot:
+    """監視サイクル開始時に 1 回だけ読み込んだタスク一覧（読み取り専用）。"""
+
+    tasks_by_agent: Mapping[str, tuple["TaskInfo", ...]]
+    """担当エージェントID -> タスク（Dashboard 上の並び順）"""
+
+    resolve_task: Callable[[str], "TaskInfo | None"]
+    """タスクIDの解決関数（exact / normalized / prefix）"""
+
+    def tasks_for(self, agent_id: str) -> tuple["TaskInfo", ...]:
+        """指定エージェントに割り当てられたタスクを返す。"""
+        return self.tasks_by_agent.get(agent_id, ())
+
+
+@dataclass
+class _DashboardUpdateBatch:
+    """監視サイクル中の Dashboard 更新を溜め、終了時に 1 トランザクションで反映する。"""
+
+    manager: "DashboardManager"
+    """反映先の DashboardManager"""
+
+    mutations: list[tuple[str, Callable[["Dashboard"], Any]]] = field(default_factory=list)
+    """(ラベル, 変更関数) の一覧。反映時にロック下で読み込んだ Dashboard に順に適用する"""
+
+    after_commit: list[Callable[[], None]] = field(default_factory=list)
+    """反映後に実行する処理（Admin への IPC 通知など）"""
+
+    agents: dict[str, "Agent"] = field(default_factory=dict)
+    """状態を更新したエージェント。反映時に agents.json へまとめて保存する"""
+
+    save_markdown: bool = False
+    """反映後に Markdown ダッシュボードを保存するか"""
+
+    closed: bool = False
+    """反映済みか（以降の更新は即時反映にフォールバックする）"""
+
+
+# 監視サイクルの更新バッファ。サイクルを跨いで継続する復旧タスクや
+# サイクル後の呼び出しからも参照されうるが、反映済み (closed) のバッファには
+# 積まずに即時反映する。
+_active_update_batch: ContextVar[_DashboardUpdateBatch | None] = ContextVar(
+    "healthcheck_dashboard_update_batch", default=None
+)
+
+
+def _increment_dashboard_counter(field_name: str) -> Callable[["Dashboard"], None]:
+    """Dashboard のプロセスカウンタを 1 加算する変更関数を返す。"""
+
+    def _mutate(dashboard_data: "Dashboard") -> None:
+        setattr(dashboard_data, field_name, int(getattr(dashboard_data, field_name, 0) or 0) + 1)
+
+    return _mutate
+
+
 @dataclass
 class HealthStatus:
     """エージェントのヘルス状態。"""
@@ -56,6 +137,9 @@ class HealthStatus:
     pane_current_command: str | None = None
     """pane で現在実行中のコマンド"""
 
+    ai_process: dict[str, Any] | None = None
+    """/proc から取得した AI CLI プロセス情報（Linux 以外・取得失敗時は None）"""
+
     def to_dict(self) -> dict:
         """辞書に変換する。"""
         return {
@@ -64,6 +148,7 @@ class HealthStatus:
             "tmux_session_alive": self.tmux_session_alive,
             "error_message": self.error_message,
             "pane_current_command": self.pane_current_command,
+            "ai_process": self.ai_process,
         }
 
 
@@ -78,23 +163,168 @@ class HealthcheckManager:
         stall_timeout_seconds: int = 600,
         in_progress_no_ipc_timeout_seconds: int = 120,
         max_recovery_attempts: int = 3,
+        recovery_concurrency: int = 2,
+        diagnosis_timeout_seconds: float = 15.0,
+        recovery_timeout_seconds: float = 180.0,
+        process_probe_enabled: bool = True,
+        cpu_active_min_percent: float = 2.0,
+        state_file: Path | None = None,
+        state_max_age_seconds: float = 3600.0,
+        metrics_file: Path | None = None,
+        metrics_snapshot_file: Path | None = None,
     ) -> None:
-        """HealthcheckManagerを初期化する。"""
+        """HealthcheckManagerを初期化する。
+
+        ``state_file`` を指定した場合は停滞判定の基準と復旧試行回数をそのファイルへ
+        保存し、初期化時に読み込む（MCP 再起動や daemon の再初期化を跨いで引き継ぐ）。
+        ``metrics_file`` を指定した場合は監視サイクルごとに計測値を
+        Prometheus のテキスト形式で書き出す。``metrics_snapshot_file`` を指定した場合は
+        監視サイクルごとに計測値を JSON で保存する（他の MCP プロセスからの参照用）。
+        """
         self.tmux_manager = tmux_manager
         self.agents = agents
         self.healthcheck_interval_seconds = healthcheck_interval_seconds
         self.stall_timeout_seconds = stall_timeout_seconds
         self.in_progress_no_ipc_timeout_seconds = in_progress_no_ipc_timeout_seconds
         self.max_recovery_attempts = max_recovery_attempts
+        self.recovery_concurrency = max(1, int(recovery_concurrency))
+        self.diagnosis_timeout_seconds = diagnosis_timeout_seconds
+        self.recovery_timeout_seconds = recovery_timeout_seconds
+        self.process_probe_enabled = process_probe_enabled
+        self.cpu_active_min_percent = cpu_active_min_percent
         self.last_monitor_at: datetime | None = None
 
         # 二段階判定用の状態
         self._pane_hash: dict[str, str] = {}
         self._pane_last_changed_at: dict[str, datetime] = {}
+        # tmux 活動カウンタの前回観測値（observed_at は観測時の epoch 秒）
+        self._pane_activity: dict[str, dict[str, int | None]] = {}
+        self._change_detection_stats: dict[str, int] = {
+            "activity": 0,
+            "content_hash": 0,
+            "pane_log": 0,
+        }
 
         # 同一 worker/task ごとの復旧試行回数
         self._recovery_failures: dict[str, int] = {}
 
+        # 並列復旧の同時実行数制御と、監視サイクルを跨いで継続中の復旧タスク
+        self._recovery_semaphore: asyncio.Semaphore | None = None
+        self._recovery_tasks: dict[str, asyncio.Task[dict[str, Any]]] = {}
+
+        # /proc による AI CLI プロセス確認
+        # （ソケットごとのペイン一覧と、AI CLI プロセスの pid・CPU 時間・観測時刻の前回値）
+        self._pane_tables: dict[str | None, tuple[float, dict[str, dict[str, Any]]]] = {}
+        self._pane_table_lock: asyncio.Lock | None = None
+        self._cpu_samples: dict[str, tuple[int, int, float]] = {}
+        self._ai_process_probe: dict[str, dict[str, Any]] = {}
+
+        # 監視状態の永続化（前回書き込んだ内容と同一なら書き込みを省略する）
+        self.state_file = state_file
+        self.state_max_age_seconds = state_max_age_seconds
+        self._last_saved_state: str | None = None
+        if state_file is not None:
+            self._load_state()
+
+        # 監視サイクルの計測値
+        self.metrics = HealthcheckMetrics()
+        self.metrics_file = metrics_file
+        self.metrics_snapshot_file = metrics_snapshot_file
+
+    def _load_state(self) -> None:
+        """保存済みの監視状態を読み込む。
+
+        形式が異なる・保存から ``state_max_age_seconds`` 以上経過した状態は破棄する。
+        未来時刻の基準時刻は時計のずれとみなして読み捨てる。
+        """
+        if self.state_file is None:
+            return
+        try:
+            raw = self.state_file.read_text(encoding="utf-8")
+            data = json.loads(raw)
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("ヘルスチェック状態の読み込みに失敗: %s", e)
+            return
+        if not isinstance(data, dict) or data.get("version") != _STATE_FILE_VERSION:
+            logger.info("ヘルスチェック状態の形式が異なるため破棄します: %s", self.state_file)
+            return
+
+        now = datetime.now()
+        try:
+            saved_at = datetime.fromisoformat(str(data.get("saved_at")))
+        except ValueError:
+            return
+        age_seconds = (now - saved_at).total_seconds()
+        if age_seconds < 0 or age_seconds > self.state_max_age_seconds:
+            logger.info(
+                "ヘルスチェック状態が古いため破棄します（保存から %.0f 秒）", age_seconds
+            )
+            return
+
+        pane_hash = data.get("pane_hash")
+        if isinstance(pane_hash, dict):
+            self._pane_hash = {str(k): str(v) for k, v in pane_hash.items()}
+        changed_at = data.get("pane_last_changed_at")
+        if isinstance(changed_at, dict):
+            for agent_id, value in changed_at.items():
+                try:
+                    parsed = datetime.fromisoformat(str(value))
+                except ValueError:
+                    continue
+                if parsed <= now:
+                    self._pane_last_changed_at[str(agent_id)] = parsed
+        pane_activity = data.get("pane_activity")
+        if isinstance(pane_activity, dict):
+            self._pane_activity = {
+                str(k): v for k, v in pane_activity.items() if isinstance(v, dict)
+            }
+        failures = data.get("recovery_failures")
+        if isinstance(failures, dict):
+            self._recovery_failures = {
+                str(k): int(v) for k, v in failures.items() if isinstance(v, int) and v > 0
+            }
+        self._last_saved_state = None
+        logger.info(
+            "ヘルスチェック状態を復元しました: baselines=%d recovery_failures=%d",
+            len(self._pane_hash),
+            len(self._recovery_failures),
+        )
+
+    def save_state(self) -> bool:
+        """監視状態をファイルへ保存する（内容が前回保存時と同じなら何もしない）。
+
+        Returns:
+            書き込んだ場合 True
+        """
+        if self.state_file is None:
+            return False
+        payload = {
+            "pane_hash": self._pane_hash,
+            "pane_last_changed_at": {
+                agent_id: changed_at.isoformat()
+                for agent_id, changed_at in self._pane_last_changed_at.items()
+            },
+            "pane_activity": self._pane_activity,
+            "recovery_failures": self._recovery_failures,
+        }
+        content = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+        if content == self._last_saved_state:
+            return False
+        document = {
+            "version": _STATE_FILE_VERSION,
+            "saved_at": datetime.now().isoformat(),
+            **payload,
+        }
+        try:
+            atomic_write(self.state_file, json.dumps(document, ensure_ascii=False, indent=2))
+        except OSError as e:
+            logger.warning("ヘルスチェック状態の保存に失敗: %s", e)
+            return False
+        self._last_saved_state = content
+        return True
+
     @staticmethod
     def _recovery_key(agent_id: str, task_id: str | None) -> str:
         normalized_task = task_id or "-"
@@ -107,6 +337,12 @@ class HealthcheckManager:
         self._pane_last_changed_at = {
             k: v for k, v in self._pane_last_changed_at.items() if k in active_ids
         }
+        self._pane_activity = {k: v for k, v in self._pane_activity.items() if k in active_ids}
+        self._cpu_samples = {k: v for k, v in self._cpu_samples.items() if k in active_ids}
+        self._ai_process_probe = {
+            k: v for k, v in self._ai_process_probe.items() if k in active_ids
+        }
+        self.metrics.prune_agents(active_ids)
 
         def _is_key_alive(key: str) -> bool:
             agent_id = key.split(":", 1)[0]
@@ -116,6 +352,84 @@ class HealthcheckManager:
             k: v for k, v in self._recovery_failures.items() if _is_key_alive(k)
         }
 
+    async def _pane_change_signature(self, agent: "Agent") -> str | None:
+        """Worker pane の変化検知用シグネチャを取得する。
+
+        安価な順に判定する:
+        1. ペインログの inode/サイズ（ペインログ有効時）
+        2. tmux の活動カウンタ（pane_activity / window_activity / history_size）
+        3. 判定が曖昧な場合のみ capture-pane の内容ハッシュ
+        """
+        log_signature = pane_log_signature(agent)
+        if log_signature is not None:
+            self._change_detection_stats["pane_log"] += 1
+            return log_signature
+
+        activity = await self._get_pane_activity(agent)
+        if activity is not None:
+            signature = self._signature_from_activity(agent.id, activity)
+            if signature is not None:
+                self._change_detection_stats["activity"] += 1
+                return signature
+
+        self._change_detection_stats["content_hash"] += 1
+        return await self._capture_pane_hash(agent)
+
+    async def _get_pane_activity(self, agent: "Agent") -> dict[str, int | None] | None:
+        """tmux からペインの活動カウンタを取得する（未対応・失敗時は None）。"""
+        session_name = agent.resolved_session_name
+        if not session_name or agent.window_index is None or agent.pane_index is None:
+            return None
+
+        get_activity = getattr(self.tmux_manager, "get_pane_activity", None)
+        if not callable(get_activity):
+            return None
+        try:
+            result = get_activity(session_name, agent.window_index, agent.pane_index)
+            if inspect.isawaitable(result):
+                result = await result
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.debug("ペイン活動情報の取得に失敗: %s", e)
+            return None
+        return result if isinstance(result, dict) else None
+
+    def _signature_from_activity(
+        self, agent_id: str, activity: dict[str, int | None]
+    ) -> str | None:
+        """活動カウンタからシグネチャを決定する。曖昧な場合は None を返す。"""
+        previous = self._pane_activity.get(agent_id)
+        observed_at = int(time.time())
+        self._pane_activity[agent_id] = {**activity, "observed_at": observed_at}
+
+        pane_activity = activity.get("pane_activity")
+        history_size = activity.get("history_size")
+        if isinstance(pane_activity, int):
+            # ペイン単位の最終出力時刻が取れる場合はそれだけで確定する
+            return f"activity:{pane_activity}:{history_size}"
+
+        if previous is None:
+            return None
+
+        window_activity = activity.get("window_activity")
+        previous_window_activity = previous.get("window_activity")
+        previous_observed_at = previous.get("observed_at")
+        if (
+            isinstance(window_activity, int)
+            and window_activity == previous_window_activity
+            and isinstance(previous_observed_at, int)
+            and window_activity < previous_observed_at
+        ):
+            # ウィンドウ内のどのペインにも出力がない = 対象ペインも無変化。
+            # 同一秒内の出力を取りこぼさないよう、前回観測より前の時刻のみ信用する。
+            return self._pane_hash.get(agent_id)
+
+        if isinstance(history_size, int) and history_size != previous.get("history_size"):
+            # スクロールバックが伸びた = 対象ペインに出力があった
+            return f"history:{window_activity}:{history_size}"
+
+        # 同一ウィンドウの他ペインの出力と区別できないため内容ハッシュで判定する
+        return None
+
     async def _capture_pane_hash(self, agent: "Agent") -> str | None:
         """Worker pane の出力ハッシュを取得する。"""
         session_name = agent.resolved_session_name
@@ -150,7 +464,12 @@ class HealthcheckManager:
         if inactive_for < timedelta(seconds=self.stall_timeout_seconds):
             return False
 
-        pane_hash = await self._capture_pane_hash(agent)
+        if self._is_cpu_advancing(agent_id):
+            # 画面出力がなくても CPU 時間が進んでいれば処理中とみなす
+            self._pane_last_changed_at[agent_id] = now
+            return False
+
+        pane_hash = await self._pane_change_signature(agent)
         if pane_hash is None:
             # pane 情報が取得できない場合は inactive 判定のみで扱う
             return True
@@ -211,7 +530,11 @@ class HealthcheckManager:
         if now - activity_at < timedelta(seconds=timeout_seconds):
             return False
 
-        pane_hash = await self._capture_pane_hash(agent)
+        if self._is_cpu_advancing(agent_id):
+            self._pane_last_changed_at[agent_id] = now
+            return False
+
+        pane_hash = await self._pane_change_signature(agent)
         if pane_hash is None:
             # pane 情報が取れない場合はタイムアウトのみで異常扱い
             return True
@@ -230,6 +553,104 @@ class HealthcheckManager:
         unchanged_for = now - self._pane_last_changed_at[agent_id]
         return unchanged_for >= timedelta(seconds=timeout_seconds)
 
+    async def _pane_process_info(self, agent: "Agent") -> dict[str, Any] | None:
+        """list-panes のペイン一覧から対象ペインの pane_pid / コマンドを取得する。
+
+        一覧は tmux サーバー（ソケット）単位で短時間共有し、同一サイクル内の
+        複数 Worker の診断で tmux を 1 回だけ呼び出す。未対応・失敗時は None。
+        """
+        session_name = agent.resolved_session_name
+        if not session_name or agent.window_index is None or agent.pane_index is None:
+            return None
+        list_panes = getattr(self.tmux_manager, "list_pane_processes", None)
+        if not callable(list_panes):
+            return None
+
+        socket = getattr(agent, "tmux_socket", None)
+        if self._pane_table_lock is None:
+            self._pane_table_lock = asyncio.Lock()
+        async with self._pane_table_lock:
+            cached = self._pane_tables.get(socket)
+            if cached is None or time.monotonic() - cached[0] > _PANE_TABLE_TTL_SECONDS:
+                try:
+                    with use_tmux_socket(socket):
+                        result = list_panes()
+                        if inspect.isawaitable(result):
+                            result = await result
+                except (OSError, subprocess.SubprocessError) as e:
+                    logger.debug("ペイン一覧の取得に失敗: %s", e)
+                    return None
+                if not isinstance(result, dict):
+                    return None
+                cached = (time.monotonic(), result)
+                self._pane_tables[socket] = cached
+
+        target = f"{session_name}:{agent.window_index}.{agent.pane_index}"
+        info = cached[1].get(target)
+        return info if isinstance(info, dict) else None
+
+    def _probe_ai_process(self, agent_id: str, pane_pid: int) -> dict[str, Any] | None:
+        """/proc を走査して AI CLI プロセスの状態・CPU 時間差分・RSS を取得する。
+
+        AI CLI プロセス自身の CPU 時間の前回観測値との差分を経過時間で割った使用率が
+        cpu_active_min_percent 以上であれば cpu_advancing=True（出力がなくても推論・処理が
+        進んでいる）とみなす。シェルやアイドル時のタイマー処理によるわずかな増分は含めない。
+        """
+        sample = probe_process_tree(pane_pid, _AI_RUNNING_COMMAND_PREFIXES)
+        if sample is None:
+            self._cpu_samples.pop(agent_id, None)
+            self._ai_process_probe.pop(agent_id, None)
+            return None
+
+        ticks_per_second = clock_ticks_per_second()
+        ai = sample.ai_process
+        cpu_delta_ticks: int | None = None
+        cpu_percent: float | None = None
+        previous = self._cpu_samples.pop(agent_id, None)
+        if ai is not None:
+            observed_at = time.monotonic()
+            self._cpu_samples[agent_id] = (ai.pid, ai.cpu_ticks, observed_at)
+            if previous is not None and previous[0] == ai.pid:
+                cpu_delta_ticks = max(0, ai.cpu_ticks - previous[1])
+                elapsed = observed_at - previous[2]
+                if elapsed > 0:
+                    cpu_percent = cpu_delta_ticks / ticks_per_second / elapsed * 100
+
+        probe: dict[str, Any] = {
+            "pane_pid": pane_pid,
+            "found": ai is not None,
+            "pid": ai.pid if ai else None,
+            "name": ai.comm if ai else None,
+            "state": ai.state if ai else None,
+            "alive": bool(ai and ai.alive),
+            "rss_bytes": ai.rss_pages * page_size_bytes() if ai else None,
+            "cpu_seconds": round(ai.cpu_ticks / ticks_per_second, 2) if ai else None,
+            "cpu_seconds_delta": (
+                round(cpu_delta_ticks / ticks_per_second, 2)
+                if cpu_delta_ticks is not None
+                else None
+            ),
+            "cpu_percent": round(cpu_percent, 2) if cpu_percent is not None else None,
+            "cpu_advancing": (
+                cpu_percent is not None and cpu_percent >= self.cpu_active_min_percent
+            ),
+            "process_count": sample.process_count,
+        }
+        self._ai_process_probe[agent_id] = probe
+        return probe
+
+    def _ai_cli_active(self, agent_id: str, pane_command: str) -> bool:
+        """AI CLI が実行中かを判定する（/proc の結果を優先し、なければコマンド名で判定）。"""
+        probe = self._ai_process_probe.get(agent_id)
+        if probe is not None and probe.get("found"):
+            return bool(probe.get("alive"))
+        return _is_ai_running(pane_command)
+
+    def _is_cpu_advancing(self, agent_id: str) -> bool:
+        """直近の /proc 確認で AI CLI プロセスが閾値以上の CPU を使用していたか。"""
+        probe = self._ai_process_probe.get(agent_id)
+        return bool(probe and probe.get("cpu_advancing"))
+
     async def check_agent(self, agent_id: str) -> HealthStatus:
         """単一エージェントのヘルスチェックを行う。"""
         from src.models.agent import AgentRole
@@ -252,7 +673,9 @@ class HealthcheckManager:
                 error_message="tmux セッション情報が未設定です",
             )
 
-        tmux_alive = await self.tmux_manager.session_exists(session_name)
+        # 別 tmux サーバーに配置された Worker はそのサーバー上のセッションを確認する
+        with use_tmux_socket(getattr(agent, "tmux_socket", None)):
+            tmux_alive = await self.tmux_manager.session_exists(session_name)
         if not tmux_alive:
             return HealthStatus(
                 agent_id=agent_id,
@@ -262,7 +685,18 @@ class HealthcheckManager:
             )
 
         pane_command: str | None = None
-        if agent.window_index is not None and agent.pane_index is not None:
+        ai_process: dict[str, Any] | None = None
+        pane_info = None
+        if self.process_probe_enabled and is_proc_available():
+            pane_info = await self._pane_process_info(agent)
+        if pane_info is not None:
+            # list-panes の一覧から取得できた場合は個別の display-message を省略する
+            raw_command = pane_info.get("pane_current_command")
+            pane_command = str(raw_command) if raw_command else None
+            pane_pid = pane_info.get("pane_pid")
+            if isinstance(pane_pid, int):
+                ai_process = self._probe_ai_process(agent_id, pane_pid)
+        elif agent.window_index is not None and agent.pane_index is not None:
             get_current = getattr(self.tmux_manager, "get_pane_current_command", None)
             if callable(get_current):
                 pane_command_result = get_current(
@@ -282,13 +716,20 @@ class HealthcheckManager:
         role = str(getattr(agent, "role", ""))
         is_worker = role == AgentRole.WORKER.value
         command_name = (pane_command or "").strip().lower()
-        if is_worker and agent.current_task and command_name in _SHELL_COMMANDS:
+        if ai_process is not None and ai_process["found"]:
+            # /proc で AI CLI を特定できた場合はフォアグラウンドのコマンド名
+            # （ラッパーの shell 等）ではなくプロセス状態で判定する
+            ai_dead = not ai_process["alive"]
+        else:
+            ai_dead = command_name in _SHELL_COMMANDS
+        if is_worker and agent.current_task and ai_dead:
             return HealthStatus(
                 agent_id=agent_id,
                 is_healthy=False,
                 tmux_session_alive=True,
                 error_message="ai_process_dead",
                 pane_current_command=pane_command,
+                ai_process=ai_process,
             )
 
         return HealthStatus(
@@ -297,6 +738,7 @@ class HealthcheckManager:
             tmux_session_alive=tmux_alive,
             error_message=None,
             pane_current_command=pane_command,
+            ai_process=ai_process,
         )
 
     async def check_all_agents(self) -> list[HealthStatus]:
@@ -331,11 +773,15 @@ class HealthcheckManager:
         if not session_name:
             return False, f"エージェント {agent_id} の tmux セッション情報がありません"
 
+        # 追加 Worker 用サーバー上のエージェントは記録されたソケットのサーバーを操作する
+        socket = agent.tmux_socket if isinstance(agent.tmux_socket, str) else None
         if force and agent.window_index is not None and agent.pane_index is not None:
             try:
-                window_name = self.tmux_manager._get_window_name(agent.window_index)
-                target = f"{session_name}:{window_name}.{agent.pane_index}"
-                code, _, stderr = await self.tmux_manager._run("send-keys", "-t", target, "C-c")
+                target = f"{session_name}:{agent.window_index}.{agent.pane_index}"
+                with use_tmux_socket(socket):
+                    code, _, stderr = await self.tmux_manager._run(
+                        "send-keys", "-t", target, "C-c"
+                    )
                 if code != 0:
                     return False, f"強制復旧に失敗しました: {stderr}"
                 return True, f"エージェント {agent_id} に割り込みを送信しました"
@@ -344,7 +790,8 @@ class HealthcheckManager:
 
         logger.info(f"エージェント {agent_id} の tmux セッションを再作成します")
         working_dir = agent.worktree_path or agent.working_dir or "."
-        success = await self.tmux_manager.create_session(session_name, working_dir)
+        with use_tmux_socket(socket):
+            success = await self.tmux_manager.create_session(session_name, working_dir)
         if success:
             return True, f"エージェント {agent_id} の tmux セッションを再作成しました"
         return False, f"エージェント {agent_id} の tmux セッション再作成に失敗しました"
@@ -408,43 +855,108 @@ class HealthcheckManager:
         task_id: str,
         reason: str,
     ) -> str | None:
-        """タスク失敗を dashboard 更新 + Admin IPC 通知する。エラー時は文字列を返す。"""
-        try:
-            from pathlib import Path
+        """タスク失敗を dashboard 更新 + Admin IPC 通知する。エラー時は文字列を返す。
 
-            from src.models.dashboard import TaskStatus
-            from src.models.message import MessagePriority, MessageType
-            from src.tools.helpers_managers import ensure_dashboard_manager, ensure_ipc_manager
+        監視サイクル中は dashboard 更新と通知をサイクル終了時の一括反映に回す。
+        """
+        from src.models.dashboard import TaskStatus
+
+        error_message = f"healthcheck_recovery_failed: {reason}"
+        batch = self._current_update_batch()
+        if batch is not None:
+            task_errors: list[str] = []
+
+            def _mark_failed(dashboard_data: "Dashboard") -> None:
+                success, message = batch.manager.apply_task_status(
+                    dashboard_data,
+                    task_id,
+                    TaskStatus.FAILED,
+                    error_message=error_message,
+                )
+                if not success:
+                    task_errors.append(message)
+
+            def _notify() -> None:
+                if task_errors:
+                    logger.warning("タスク %s の failed 化に失敗: %s", task_id, task_errors[0])
+                err = self._send_task_failed_ipc(app_ctx, agent_id, task_id, reason)
+                if err:
+                    logger.warning("タスク %s の失敗通知に失敗: %s", task_id, err)
+
+            batch.mutations.append((f"task_failed:{task_id}", _mark_failed))
+            batch.save_markdown = True
+            batch.after_commit.append(_notify)
+            return None
+
+        try:
+            from src.tools.helpers_managers import ensure_dashboard_manager
 
             dashboard = app_ctx.dashboard_manager or ensure_dashboard_manager(app_ctx)
             dashboard.update_task_status(
                 task_id=task_id,
                 status=TaskStatus.FAILED,
-                error_message=f"healthcheck_recovery_failed: {reason}",
+                error_message=error_message,
             )
             if app_ctx.project_root and app_ctx.session_id:
                 dashboard.save_markdown_dashboard(Path(app_ctx.project_root), app_ctx.session_id)
-
-            ipc = ensure_ipc_manager(app_ctx)
-            admin_ids = [wid for wid, w in self.agents.items() if w.role == "admin"]
-            for aid in admin_ids:
-                if aid not in ipc.get_all_agent_ids():
-                    ipc.register_agent(aid)
-                ipc.send_message(
-                    sender_id="healthcheck-daemon",
-                    receiver_id=aid,
-                    message_type=MessageType.ERROR,
-                    subject=f"task failed by healthcheck: {task_id}",
-                    content=(
-                        f"Worker {agent_id} の復旧上限超過により task {task_id} "
-                        f"を failed 化。理由: {reason}"
-                    ),
-                    priority=MessagePriority.HIGH,
-                    metadata={"agent_id": agent_id, "task_id": task_id, "reason": reason},
-                )
         except (OSError, KeyError, ValueError) as e:
             return str(e)
-        return None
+        return self._send_task_failed_ipc(app_ctx, agent_id, task_id, reason)
+
+    def _send_task_failed_ipc(
+        self,
+        app_ctx: "AppContext",
+        agent_id: str,
+        task_id: str,
+        reason: str,
+    ) -> str | None:
+        """タスク失敗を Admin に IPC 通知する。エラー時は文字列を返す。"""
+        with self.metrics.stage("notify"):
+            try:
+                from src.models.message import MessagePriority, MessageType
+                from src.tools.helpers_managers import ensure_ipc_manager
+
+                ipc = ensure_ipc_manager(app_ctx)
+                admin_ids = [wid for wid, w in self.agents.items() if w.role == "admin"]
+                for aid in admin_ids:
+                    if aid not in ipc.get_all_agent_ids():
+                        ipc.register_agent(aid)
+                    ipc.send_message(
+                        sender_id="healthcheck-daemon",
+                        receiver_id=aid,
+                        message_type=MessageType.ERROR,
+                        subject=f"task failed by healthcheck: {task_id}",
+                        content=(
+                            f"Worker {agent_id} の復旧上限超過により task {task_id} "
+                            f"を failed 化。理由: {reason}"
+                        ),
+                        priority=MessagePriority.HIGH,
+                        metadata={"agent_id": agent_id, "task_id": task_id, "reason": reason},
+                    )
+            except (OSError, KeyError, ValueError) as e:
+                return str(e)
+            return None
+
+    def _release_task_to_scheduler(
+        self,
+        app_ctx: "AppContext",
+        agent_id: str,
+        task_id: str,
+    ) -> None:
+        """failed 化したタスクの終了をスケジューラーへ伝え、空いた Worker への割り当てを促す。
+
+        監視サイクル中は failed 化が Dashboard に反映された後に伝える。
+        """
+        from src.managers.background_jobs import notify_task_terminal
+
+        def _release() -> None:
+            notify_task_terminal(app_ctx, task_id, agent_id, completed=False)
+
+        batch = self._current_update_batch()
+        if batch is not None:
+            batch.after_commit.append(_release)
+        else:
+            _release()
 
     async def _finalize_failed_task(
         self,
@@ -463,15 +975,11 @@ class HealthcheckManager:
             err = self._notify_admins_task_failed(app_ctx, agent_id, task_id, reason)
             if err:
                 detail["notify_error"] = err
+            self._release_task_to_scheduler(app_ctx, agent_id, task_id)
             agent.current_task = None
             agent.status = AgentStatus.IDLE
             agent.last_activity = datetime.now()
-            try:
-                from src.tools.helpers import save_agent_to_file
-
-                save_agent_to_file(app_ctx, agent)
-            except (OSError, json.JSONDecodeError, ValueError) as e:
-                logger.debug("復旧後のエージェント保存に失敗: %s", e)
+            self._persist_agent(app_ctx, agent, "復旧後")
         elif task_id:
             agent.current_task = None
             agent.status = AgentStatus.IDLE
@@ -487,17 +995,156 @@ class HealthcheckManager:
             "in_progress_no_ipc_timeout_seconds": self.in_progress_no_ipc_timeout_seconds,
             "max_recovery_attempts": self.max_recovery_attempts,
             "last_monitor_at": self.last_monitor_at.isoformat() if self.last_monitor_at else None,
+            "change_detection": dict(self._change_detection_stats),
+            "capture_cache": self._capture_cache_stats(),
+            "process_probe": {
+                "enabled": self.process_probe_enabled,
+                "available": is_proc_available(),
+            },
         }
 
+    def _capture_cache_stats(self) -> dict | None:
+        """tmux capture キャッシュの統計を返す（未対応の tmux_manager では None）。"""
+        getter = getattr(self.tmux_manager, "get_capture_cache_stats", None)
+        if not callable(getter):
+            return None
+        try:
+            stats = getter()
+        except Exception:
+            return None
+        return stats if isinstance(stats, dict) else None
+
+    @staticmethod
+    def _current_update_batch() -> _DashboardUpdateBatch | None:
+        """反映前の更新バッファを返す（監視サイクル外・反映済みなら None）。"""
+        batch = _active_update_batch.get()
+        if batch is None or batch.closed:
+            return None
+        return batch
+
+    @staticmethod
+    def _build_task_snapshot(dashboard: "DashboardManager | None") -> _TaskSnapshot | None:
+        """Dashboard を 1 回だけ読み込み、監視サイクル用のタスクスナップショットを作る。
+
+        読み込みに失敗した場合や Dashboard 実装が想定外の場合は None を返し、
+        呼び出し側は従来どおり都度読み込みにフォールバックする。
+        """
+        get_dashboard = getattr(dashboard, "get_dashboard", None)
+        if not callable(get_dashboard):
+            return None
+        try:
+            dashboard_data = get_dashboard()
+        except (OSError, ValueError, TimeoutError) as e:
+            logger.debug("タスクスナップショットの取得に失敗: %s", e)
+            return None
+        tasks = getattr(dashboard_data, "tasks", None)
+        if not isinstance(tasks, list):
+            return None
+
+        grouped: dict[str, list[TaskInfo]] = {}
+        for task in tasks:
+            if task.assigned_agent_id:
+                grouped.setdefault(task.assigned_agent_id, []).append(task)
+        tasks_by_agent = MappingProxyType(
+            {agent_id: tuple(agent_tasks) for agent_id, agent_tasks in grouped.items()}
+        )
+
+        resolver = getattr(dashboard, "resolve_task", None)
+
+        def _resolve(task_id: str) -> "TaskInfo | None":
+            if callable(resolver):
+                return resolver(dashboard_data, task_id)
+            return dashboard_data.get_task(task_id)
+
+        return _TaskSnapshot(tasks_by_agent=tasks_by_agent, resolve_task=_resolve)
+
+    def _record_process_counter(
+        self,
+        dashboard: "DashboardManager | None",
+        field_name: str,
+    ) -> None:
+        """process_crash_count / process_recovery_count を加算する（サイクル中は一括反映）。"""
+        if dashboard is None:
+            return
+        batch = self._current_update_batch()
+        if batch is not None:
+            batch.mutations.append((field_name, _increment_dashboard_counter(field_name)))
+            return
+        try:
+            if field_name == "process_crash_count":
+                dashboard.increment_process_crash_count()
+            else:
+                dashboard.increment_process_recovery_count()
+        except (AttributeError, ValueError) as e:
+            logger.debug("%s 更新に失敗: %s", field_name, e)
+
+    def _flush_update_batch(
+        self,
+        app_ctx: "AppContext | None",
+        batch: _DashboardUpdateBatch,
+    ) -> None:
+        """溜めた Dashboard 更新を 1 トランザクションで反映し、後処理を実行する。"""
+        batch.closed = True
+        with self.metrics.stage("dashboard_write"), durability_batch():
+            self._commit_update_batch(app_ctx, batch)
+        for callback in batch.after_commit:
+            callback()
+
+    def _commit_update_batch(
+        self,
+        app_ctx: "AppContext | None",
+        batch: _DashboardUpdateBatch,
+    ) -> None:
+        """溜めた変更を 1 トランザクションで反映し、必要なら Markdown を保存する。"""
+        if batch.mutations:
+
+            def _apply_all(dashboard_data: "Dashboard") -> None:
+                for label, mutate in batch.mutations:
+                    try:
+                        mutate(dashboard_data)
+                    except (AttributeError, KeyError, TypeError, ValueError) as e:
+                        logger.debug("Dashboard 更新 %s の適用に失敗: %s", label, e)
+                dashboard_data.calculate_stats()
+
+            try:
+                batch.manager.run_dashboard_transaction(_apply_all)
+            except (OSError, TimeoutError, ValueError, json.JSONDecodeError) as e:
+                logger.warning("監視サイクルの Dashboard 一括更新に失敗: %s", e)
+
+        if batch.agents and app_ctx is not None:
+            # Markdown は agents.json から再集計するため、その前に保存する
+            try:
+                from src.tools.helpers import save_agents_to_file
+
+                save_agents_to_file(app_ctx, batch.agents.values())
+            except (OSError, json.JSONDecodeError, ValueError) as e:
+                logger.debug("監視サイクルのエージェント一括保存に失敗: %s", e)
+
+        if (
+            batch.save_markdown
+            and app_ctx is not None
+            and app_ctx.project_root
+            and app_ctx.session_id
+        ):
+            try:
+                batch.manager.save_markdown_dashboard(
+                    Path(app_ctx.project_root), app_ctx.session_id
+                )
+            except (OSError, ValueError) as e:
+                logger.debug("Markdown ダッシュボード保存に失敗: %s", e)
+
     def _sync_worker_active_task(
         self,
         agent_id: str,
         agent: "Agent",
         dashboard: "DashboardManager | None",
         app_ctx: "AppContext | None",
+        snapshot: _TaskSnapshot | None = None,
     ) -> tuple["TaskInfo | None", str | None]:
         """Dashboard からアクティブタスクを同期し、エージェント状態を補正する。
 
+        ``snapshot`` を渡した場合は Dashboard を読み直さずにそれを参照する。
+
         Returns:
             (active_task, active_task_id)
         """
@@ -507,11 +1154,16 @@ class HealthcheckManager:
         active_task = None
         active_task_id = agent.current_task
 
-        if dashboard is None:
+        if dashboard is None and snapshot is None:
             return active_task, active_task_id
 
         try:
-            assigned_tasks = dashboard.list_tasks(agent_id=agent_id)
+            if snapshot is not None:
+                assigned_tasks = list(snapshot.tasks_for(agent_id))
+                get_task = snapshot.resolve_task
+            else:
+                assigned_tasks = dashboard.list_tasks(agent_id=agent_id)
+                get_task = dashboard.get_task
             active_tasks = [
                 task
                 for task in assigned_tasks
@@ -527,14 +1179,9 @@ class HealthcheckManager:
                     agent.current_task = active_task_id
                     if agent.status != AgentStatus.BUSY.value:
                         agent.status = AgentStatus.BUSY
-                    try:
-                        from src.tools.helpers import save_agent_to_file
-
-                        save_agent_to_file(app_ctx, agent)
-                    except (OSError, json.JSONDecodeError, ValueError) as e:
-                        logger.debug("BUSY ステータス保存に失敗: %s", e)
+                    self._persist_agent(app_ctx, agent, "BUSY ステータス")
             elif agent.current_task:
-                current_dashboard_task = dashboard.get_task(agent.current_task)
+                current_dashboard_task = get_task(agent.current_task)
                 if current_dashboard_task and current_dashboard_task.status in (
                     TaskStatus.COMPLETED,
                     TaskStatus.FAILED,
@@ -543,12 +1190,7 @@ class HealthcheckManager:
                     agent.current_task = None
                     if agent.status == AgentStatus.BUSY.value:
                         agent.status = AgentStatus.IDLE
-                    try:
-                        from src.tools.helpers import save_agent_to_file
-
-                        save_agent_to_file(app_ctx, agent)
-                    except (OSError, json.JSONDecodeError, ValueError) as e:
-                        logger.debug("IDLE ステータス保存に失敗: %s", e)
+                    self._persist_agent(app_ctx, agent, "IDLE ステータス")
                     active_task_id = None
         except (KeyError, ValueError, AttributeError) as e:
             logger.debug("アクティブタスクの取得に失敗: %s", e)
@@ -598,7 +1240,7 @@ class HealthcheckManager:
             pane_command = (health.pane_current_command or "").strip().lower()
             # AI CLI が実行中でセッション健全な場合は
             # no-IPC だけで強制復旧しない（長時間推論で誤検知しやすいため）。
-            if _is_ai_running(pane_command):
+            if self._ai_cli_active(agent_id, pane_command):
                 logger.info(
                     "in_progress_no_ipc をスキップ: agent=%s pane=%s",
                     agent_id,
@@ -609,7 +1251,7 @@ class HealthcheckManager:
 
         if await self._is_worker_stalled(agent_id, agent, now):
             pane_command = (health.pane_current_command or "").strip().lower()
-            if _is_ai_running(pane_command):
+            if self._ai_cli_active(agent_id, pane_command):
                 logger.info(
                     "task_stalled をスキップ: agent=%s pane=%s（AI CLI 実行中）",
                     agent_id,
@@ -629,13 +1271,28 @@ class HealthcheckManager:
         """復旧後のエージェント保存。"""
         if app_ctx is None:
             return
+        agent.ai_bootstrapped = False
+        self._persist_agent(app_ctx, agent, f"{label} 後")
+
+    def _persist_agent(
+        self,
+        app_ctx: "AppContext | None",
+        agent: "Agent",
+        label: str,
+    ) -> None:
+        """エージェントの状態を agents.json に保存する（サイクル中は終了時にまとめて保存）。"""
+        if app_ctx is None:
+            return
+        batch = self._current_update_batch()
+        if batch is not None:
+            batch.agents[agent.id] = agent
+            return
         try:
             from src.tools.helpers import save_agent_to_file
 
-            agent.ai_bootstrapped = False
             save_agent_to_file(app_ctx, agent)
         except (OSError, json.JSONDecodeError, ValueError) as e:
-            logger.debug("%s 後のエージェント保存に失敗: %s", label, e)
+            logger.debug("%s のエージェント保存に失敗: %s", label, e)
 
     def _increment_recovery_counter(
         self,
@@ -685,6 +1342,10 @@ class HealthcheckManager:
                 if not updated:
                     return
 
+            batch = self._current_update_batch()
+            if batch is not None:
+                batch.mutations.append((f"recovery_counter:{agent_id}", _mutate_dashboard))
+                return
             run_transaction(_mutate_dashboard)
         except (
             OSError,
@@ -1003,20 +1664,130 @@ class HealthcheckManager:
             return {"status": "failed", "detail": escalation, "failed_task": failed}
         return {"status": "escalated", "detail": escalation}
 
+    async def _diagnose_with_timeout(
+        self,
+        agent_id: str,
+        agent: "Agent",
+        active_task: "TaskInfo | None",
+        now: datetime,
+    ) -> tuple[str | None, bool] | str:
+        """タイムアウト付きで Worker を診断する。
+
+        Returns:
+            (recovery_reason, force_recovery)。タイムアウト時は _DIAGNOSIS_TIMED_OUT、
+            例外時は _DIAGNOSIS_FAILED
+        """
+        started = time.perf_counter()
+        try:
+            return await asyncio.wait_for(
+                self._diagnose_worker_issue(agent_id, agent, active_task, now),
+                timeout=self.diagnosis_timeout_seconds,
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Worker 診断がタイムアウトしました（%s 秒）: %s",
+                self.diagnosis_timeout_seconds,
+                agent_id,
+            )
+            return _DIAGNOSIS_TIMED_OUT
+        except Exception as e:
+            logger.warning("Worker 診断に失敗しました: %s (%s)", agent_id, e)
+            return _DIAGNOSIS_FAILED
+        finally:
+            self.metrics.observe_probe(agent_id, time.perf_counter() - started)
+
+    async def _run_bounded_recovery(
+        self,
+        app_ctx: "AppContext | None",
+        agent_id: str,
+        agent: "Agent",
+        recovery_reason: str,
+        force_recovery: bool,
+        task_key: str,
+    ) -> dict[str, Any]:
+        """同時実行数の上限内で段階復旧を実行する。"""
+        if self._recovery_semaphore is None:
+            self._recovery_semaphore = asyncio.Semaphore(self.recovery_concurrency)
+        async with self._recovery_semaphore:
+            return await self._attempt_staged_recovery(
+                app_ctx,
+                agent_id,
+                agent,
+                recovery_reason,
+                force_recovery,
+                task_key,
+            )
+
+    @staticmethod
+    def _recovery_task_result(agent_id: str, task: "asyncio.Task[dict[str, Any]]") -> dict:
+        """完了した復旧タスクの結果を取り出す（例外はエスカレーションとして扱う）。"""
+        if task.cancelled():
+            error = "recovery cancelled"
+        else:
+            exc = task.exception()
+            if exc is None:
+                return task.result()
+            error = str(exc) or type(exc).__name__
+            logger.error("Worker 復旧中に例外が発生しました: %s (%s)", agent_id, error)
+        return {
+            "status": "escalated",
+            "detail": {"agent_id": agent_id, "reason": "recovery_error", "message": error},
+        }
+
+    def cancel_recoveries(self) -> list["asyncio.Task[dict[str, Any]]"]:
+        """監視サイクルを跨いで継続中の復旧タスクをキャンセルし、そのタスクを返す。"""
+        tasks = list(self._recovery_tasks.values())
+        self._recovery_tasks.clear()
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            logger.info("継続中の Worker 復旧 %d 件をキャンセルしました", len(tasks))
+        return tasks
+
+    async def close(self) -> None:
+        """継続中の復旧タスクをキャンセルして終了を待つ。
+
+        マネージャーを破棄・差し替える前（daemon 停止・再初期化時）に呼び出し、
+        古いマネージャーの復旧がキー送信やセッション再作成を続けないようにする。
+        """
+        current = asyncio.current_task()
+        tasks = [task for task in self.cancel_recoveries() if task is not current]
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _collect_finished_recoveries(self) -> list[dict[str, Any]]:
+        """前回サイクルから継続していた復旧のうち、完了したものの結果を回収する。"""
+        results = []
+        for agent_id, task in list(self._recovery_tasks.items()):
+            if task.done():
+                del self._recovery_tasks[agent_id]
+                results.append(self._recovery_task_result(agent_id, task))
+        return results
+
     async def monitor_and_recover_workers(
-        self, app_ctx: "AppContext | None" = None
+        self,
+        app_ctx: "AppContext | None" = None,
+        agent_ids: Iterable[str] | None = None,
     ) -> dict[str, Any]:
-        """Worker の健全性を監視し、必要なら段階復旧する。"""
-        from src.models.agent import AgentRole, AgentStatus
+        """Worker の健全性を監視し、必要なら段階復旧する。
+
+        ``agent_ids`` を指定した場合はその Worker のみを監視する
+        （daemon のスケジューラが期限到来分だけを渡す）。
+
+        診断は全 Worker を並行に実行し（Worker ごとにタイムアウト付き）、
+        復旧は ``recovery_concurrency`` 件まで並列に実行する。
+        ``recovery_timeout_seconds`` 内に終わらない復旧は中断せずに継続させ、
+        次回以降のサイクルで結果を回収する（その間の対象 Worker は診断しない）。
 
+        Dashboard はサイクル開始時に 1 回だけ読み込み（タスクスナップショット）、
+        サイクル中のカウンタ・タスク状態の更新は終了時に 1 トランザクションで反映する。
+        Worker 数に関わらず Dashboard の読み書き回数は一定となる。
+        """
+        cycle_started = time.perf_counter()
         now = datetime.now()
         self.last_monitor_at = now
         self._prune_state()
 
-        recovered: list[dict[str, str]] = []
-        escalated: list[dict[str, str]] = []
-        failed_tasks: list[dict[str, str]] = []
-        skipped: list[str] = []
         dashboard = None
 
         if app_ctx is not None:
@@ -1031,9 +1802,83 @@ class HealthcheckManager:
                     logger.debug("Dashboard マネージャー取得に失敗: %s", e)
                     dashboard = None
 
+        # タスクは開始時に 1 回だけ読み込み、カウンタ等の更新は終了時に 1 回で反映する
+        with self.metrics.stage("dashboard_read"):
+            snapshot = self._build_task_snapshot(dashboard)
+        batch = None
+        cycle = self._monitor_cycle(app_ctx, agent_ids, dashboard, snapshot, now)
+        if snapshot is not None and dashboard is not None:
+            # バッファはコピーしたコンテキストでのみ有効にし、そのコンテキストで
+            # サイクルを実行する（呼び出し元のコンテキストには残らない）。
+            # サイクル中に生成した復旧タスクはこのバッファを引き継ぐが、
+            # 反映後は closed となり即時反映に戻る
+            batch = _DashboardUpdateBatch(manager=dashboard)
+            cycle_context = copy_context()
+            cycle_context.run(_active_update_batch.set, batch)
+            cycle = cycle_context.run(asyncio.ensure_future, cycle)
+        try:
+            result = await cycle
+        finally:
+            try:
+                if batch is not None:
+                    self._flush_update_batch(app_ctx, batch)
+            finally:
+                with self.metrics.stage("state_save"):
+                    self.save_state()
+
+        self.metrics.record_cycle(
+            time.perf_counter() - cycle_started,
+            self.healthcheck_interval_seconds,
+            result,
+        )
+        try:
+            if self.metrics_snapshot_file is not None:
+                self.metrics.write_snapshot_file(self.metrics_snapshot_file)
+            if self.metrics_file is not None:
+                self.metrics.write_prometheus_file(self.metrics_file)
+        except OSError as e:
+            logger.debug("ヘルスチェック計測値の書き出しに失敗: %s", e)
+        return result
+
+    async def _monitor_cycle(
+        self,
+        app_ctx: "AppContext | None",
+        agent_ids: Iterable[str] | None,
+        dashboard: "DashboardManager | None",
+        snapshot: _TaskSnapshot | None,
+        now: datetime,
+    ) -> dict[str, Any]:
+        """monitor_and_recover_workers の本体（1 サイクル分の監視と復旧）。"""
+        from src.models.agent import AgentRole, AgentStatus
+
+        recovered: list[dict[str, str]] = []
+        escalated: list[dict[str, str]] = []
+        failed_tasks: list[dict[str, str]] = []
+        skipped: list[str] = []
+        diagnosis_timed_out: list[str] = []
+        diagnosis_failed: list[str] = []
+        recovery_pending: list[str] = []
+
+        def record_result(result: dict[str, Any]) -> None:
+            if result["status"] == "recovered":
+                self._record_process_counter(dashboard, "process_recovery_count")
+                recovered.append(result["detail"])
+            elif result["status"] == "escalated":
+                escalated.append(result["detail"])
+            elif result["status"] == "failed":
+                escalated.append(result["detail"])
+                failed_tasks.append(result["failed_task"])
+
+        for result in self._collect_finished_recoveries():
+            record_result(result)
+
+        candidates: list[tuple[str, Agent, TaskInfo | None, str]] = []
+        target_ids = set(agent_ids) if agent_ids is not None else None
         for agent_id, agent in list(self.agents.items()):
             if agent.role != AgentRole.WORKER.value:
                 continue
+            if target_ids is not None and agent_id not in target_ids:
+                continue
             if agent.status in (AgentStatus.TERMINATED, AgentStatus.TERMINATED.value):
                 stale_keys = [
                     key for key in self._recovery_failures if key.startswith(f"{agent_id}:")
@@ -1043,11 +1888,17 @@ class HealthcheckManager:
                 skipped.append(agent_id)
                 continue
 
+            if agent_id in self._recovery_tasks:
+                # 前回サイクルの復旧が継続中
+                recovery_pending.append(agent_id)
+                continue
+
             active_task, active_task_id = self._sync_worker_active_task(
                 agent_id,
                 agent,
                 dashboard,
                 app_ctx,
+                snapshot,
             )
 
             current_key = self._recovery_key(agent_id, active_task_id)
@@ -1066,49 +1917,71 @@ class HealthcheckManager:
             if active_task_id is not None:
                 agent.current_task = active_task_id
 
-            recovery_reason, force_recovery = await self._diagnose_worker_issue(
-                agent_id,
-                agent,
-                active_task,
-                now,
+            candidates.append((agent_id, agent, active_task, current_key))
+
+        with self.metrics.stage("diagnosis"):
+            diagnoses = await asyncio.gather(
+                *(
+                    self._diagnose_with_timeout(agent_id, agent, active_task, now)
+                    for agent_id, agent, active_task, _ in candidates
+                )
             )
 
+        started: list[str] = []
+        for (agent_id, agent, _, current_key), diagnosis in zip(
+            candidates, diagnoses, strict=True
+        ):
+            if diagnosis == _DIAGNOSIS_TIMED_OUT:
+                diagnosis_timed_out.append(agent_id)
+                continue
+            if diagnosis == _DIAGNOSIS_FAILED:
+                diagnosis_failed.append(agent_id)
+                continue
+            recovery_reason, force_recovery = diagnosis
             if recovery_reason is None:
                 continue
 
-            if dashboard is not None:
-                try:
-                    dashboard.increment_process_crash_count()
-                except (AttributeError, ValueError) as e:
-                    logger.debug("process_crash_count 更新に失敗: %s", e)
+            self._record_process_counter(dashboard, "process_crash_count")
 
-            result = await self._attempt_staged_recovery(
-                app_ctx,
-                agent_id,
-                agent,
-                recovery_reason,
-                force_recovery,
-                current_key,
+            self._recovery_tasks[agent_id] = asyncio.create_task(
+                self._run_bounded_recovery(
+                    app_ctx,
+                    agent_id,
+                    agent,
+                    recovery_reason,
+                    force_recovery,
+                    current_key,
+                )
             )
+            started.append(agent_id)
 
-            if result["status"] == "recovered":
-                if dashboard is not None:
-                    try:
-                        dashboard.increment_process_recovery_count()
-                    except (AttributeError, ValueError) as e:
-                        logger.debug("process_recovery_count 更新に失敗: %s", e)
-                recovered.append(result["detail"])
-            elif result["status"] == "escalated":
-                escalated.append(result["detail"])
-            elif result["status"] == "failed":
-                escalated.append(result["detail"])
-                failed_tasks.append(result["failed_task"])
+        if started:
+            with self.metrics.stage("recovery"):
+                await asyncio.wait(
+                    [self._recovery_tasks[agent_id] for agent_id in started],
+                    timeout=self.recovery_timeout_seconds,
+                )
+        for agent_id in started:
+            task = self._recovery_tasks[agent_id]
+            if not task.done():
+                logger.warning(
+                    "Worker 復旧が %s 秒以内に完了しないため次回サイクルで回収します: %s",
+                    self.recovery_timeout_seconds,
+                    agent_id,
+                )
+                recovery_pending.append(agent_id)
+                continue
+            del self._recovery_tasks[agent_id]
+            record_result(self._recovery_task_result(agent_id, task))
 
         return {
             "recovered": recovered,
             "escalated": escalated,
             "failed_tasks": failed_tasks,
             "skipped": skipped,
+            "diagnosis_timed_out": diagnosis_timed_out,
+            "diagnosis_failed": diagnosis_failed,
+            "recovery_pending": recovery_pending,
             "healthcheck_interval_seconds": self.healthcheck_interval_seconds,
             "stall_timeout_seconds": self.stall_timeout_seconds,
             "in_progress_no_ipc_timeout_seconds": self.in_progress_no_ipc_timeout_seconds,
@@ -0,0 +1,297 @@
+"""ヘルスチェック監視サイクルの計測値。
+
+監視サイクル全体・段階ごと（Dashboard 読み込み、診断、復旧、Dashboard 書き込み、
+通知、状態保存）の所要時間と、Worker ごとの診断レイテンシをヒストグラムとして集計する。
+集計結果は ``get_healthcheck_metrics`` ツールで参照でき、設定により Prometheus の
+text exposition 形式のファイルとしてセッションディレクトリへ書き出す。
+
+daemon は 1 つの MCP プロセスでのみ動作するため、集計結果は監視サイクルごとに
+JSON のスナップショットとしてセッションディレクトリへ保存し、他のプロセスから参照できるようにする。
+"""
+
+import json
+import os
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from src.managers.durable_io import atomic_write
+
+LATENCY_BUCKETS_SECONDS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    180.0,
+)
+"""ヒストグラムのバケット上限（秒）。これを超える値は +Inf バケットに入る"""
+
+CYCLE_STAGES: tuple[str, ...] = (
+    "dashboard_read",
+    "diagnosis",
+    "recovery",
+    "dashboard_write",
+    "notify",
+    "state_save",
+)
+"""監視サイクルの段階名"""
+
+METRICS_FILE_NAME = "healthcheck_metrics.prom"
+"""セッションディレクトリ配下に書き出す Prometheus テキストファイル名"""
+
+METRICS_SNAPSHOT_FILE_NAME = "healthcheck_metrics.json"
+"""セッションディレクトリ配下に保存する計測値のスナップショットのファイル名"""
+
+_SNAPSHOT_FILE_VERSION = 1
+
+_PROMETHEUS_PREFIX = "multi_agent_mcp_healthcheck"
+
+
+class LatencyHistogram:
+    """固定バケットのレイテンシヒストグラム。"""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS_SECONDS) -> None:
+        self.buckets = buckets
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """計測値を 1 件追加する。"""
+        seconds = max(0.0, float(seconds))
+        index = len(self.buckets)
+        for i, upper in enumerate(self.buckets):
+            if seconds <= upper:
+                index = i
+                break
+        self.bucket_counts[index] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float | None:
+        """バケット上限による分位点の概算値を返す（計測なしは None）。"""
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for i, bucket_count in enumerate(self.bucket_counts):
+            cumulative += bucket_count
+            if cumulative >= rank:
+                return self.buckets[i] if i < len(self.buckets) else self.max
+        return self.max
+
+    def to_dict(self) -> dict[str, Any]:
+        """集計値を辞書で返す。"""
+        return {
+            "count": self.count,
+            "sum_seconds": round(self.total, 4),
+            "avg_seconds": round(self.total / self.count, 4) if self.count else None,
+            "max_seconds": round(self.max, 4),
+            "p50_seconds": self.quantile(0.5),
+            "p95_seconds": self.quantile(0.95),
+            "buckets": {
+                **{
+                    str(upper): count
+                    for upper, count in zip(self.buckets, self.bucket_counts, strict=False)
+                },
+                "+Inf": self.bucket_counts[-1],
+            },
+        }
+
+    def prometheus_lines(self, name: str, labels: str = "") -> list[str]:
+        """Prometheus text exposition 形式の行を返す（バケットは累積値）。"""
+        label_prefix = f"{labels}," if labels else ""
+        lines: list[str] = []
+        cumulative = 0
+        for upper, bucket_count in zip(self.buckets, self.bucket_counts, strict=False):
+            cumulative += bucket_count
+            lines.append(f'{name}_bucket{{{label_prefix}le="{upper}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{label_prefix}le="+Inf"}} {self.count}')
+        suffix = f"{{{labels}}}" if labels else ""
+        lines.append(f"{name}_sum{suffix} {self.total:.6f}")
+        lines.append(f"{name}_count{suffix} {self.count}")
+        return lines
+
+
+class HealthcheckMetrics:
+    """監視サイクルの計測値を集計する。"""
+
+    def __init__(self) -> None:
+        self.cycles = 0
+        self.overruns = 0
+        self.cycle_duration = LatencyHistogram()
+        self.stage_durations: dict[str, LatencyHistogram] = {
+            stage: LatencyHistogram() for stage in CYCLE_STAGES
+        }
+        self.probe_latency = LatencyHistogram()
+        self.agent_probes: dict[str, dict[str, float]] = {}
+        self.outcomes: Counter[str] = Counter()
+        self.last_cycle: dict[str, Any] | None = None
+        self._current_stages: dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """ブロックの所要時間を段階 ``name`` の計測値として記録する。"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe_stage(name, time.perf_counter() - started)
+
+    def observe_stage(self, name: str, seconds: float) -> None:
+        """段階の所要時間を記録する（同一サイクル内の複数回は合算して表示する）。"""
+        histogram = self.stage_durations.get(name)
+        if histogram is None:
+            histogram = self.stage_durations[name] = LatencyHistogram()
+        histogram.observe(seconds)
+        self._current_stages[name] = self._current_stages.get(name, 0.0) + seconds
+
+    def observe_probe(self, agent_id: str, seconds: float) -> None:
+        """Worker 1 件分の診断レイテンシを記録する。"""
+        self.probe_latency.observe(seconds)
+        entry = self.agent_probes.setdefault(
+            agent_id, {"count": 0, "sum_seconds": 0.0, "max_seconds": 0.0}
+        )
+        entry["count"] += 1
+        entry["sum_seconds"] += seconds
+        entry["max_seconds"] = max(entry["max_seconds"], seconds)
+        entry["last_seconds"] = seconds
+
+    def record_cycle(
+        self,
+        duration_seconds: float,
+        interval_seconds: float,
+        result: dict[str, Any],
+    ) -> None:
+        """サイクル全体の所要時間と結果を記録する。
+
+        所要時間が監視間隔を超えた場合は overrun として数える。
+        """
+        self.cycles += 1
+        self.cycle_duration.observe(duration_seconds)
+        overrun = interval_seconds > 0 and duration_seconds > interval_seconds
+        if overrun:
+            self.overruns += 1
+        outcome_counts = {
+            "recovered": len(result.get("recovered", [])),
+            "escalated": len(result.get("escalated", [])),
+            "failed": len(result.get("failed_tasks", [])),
+            "diagnosis_timed_out": len(result.get("diagnosis_timed_out", [])),
+            "diagnosis_failed": len(result.get("diagnosis_failed", [])),
+            "recovery_pending": len(result.get("recovery_pending", [])),
+        }
+        self.outcomes.update({k: v for k, v in outcome_counts.items() if v})
+        self.last_cycle = {
+            "duration_seconds": round(duration_seconds, 4),
+            "overrun": overrun,
+            "stages_seconds": {k: round(v, 4) for k, v in self._current_stages.items()},
+            "outcomes": outcome_counts,
+        }
+        self._current_stages = {}
+
+    def prune_agents(self, active_ids: set[str]) -> None:
+        """削除済みエージェントの診断レイテンシを破棄する。"""
+        self.agent_probes = {k: v for k, v in self.agent_probes.items() if k in active_ids}
+
+    def snapshot(self) -> dict[str, Any]:
+        """集計結果を辞書で返す。"""
+        return {
+            "cycles": self.cycles,
+            "overruns": self.overruns,
+            "cycle_duration": self.cycle_duration.to_dict(),
+            "stages": {name: hist.to_dict() for name, hist in self.stage_durations.items()},
+            "probe_latency": self.probe_latency.to_dict(),
+            "agents": {
+                agent_id: {
+                    "count": int(entry["count"]),
+                    "avg_seconds": round(entry["sum_seconds"] / entry["count"], 4),
+                    "max_seconds": round(entry["max_seconds"], 4),
+                    "last_seconds": round(entry.get("last_seconds", 0.0), 4),
+                }
+                for agent_id, entry in sorted(self.agent_probes.items())
+                if entry["count"]
+            },
+            "recovery_outcomes": dict(self.outcomes),
+            "last_cycle": self.last_cycle,
+        }
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition 形式の文字列を返す。"""
+        p = _PROMETHEUS_PREFIX
+        lines = [
+            f"# HELP {p}_cycles_total Completed healthcheck monitor cycles.",
+            f"# TYPE {p}_cycles_total counter",
+            f"{p}_cycles_total {self.cycles}",
+            f"# HELP {p}_overruns_total Cycles that took longer than the interval.",
+            f"# TYPE {p}_overruns_total counter",
+            f"{p}_overruns_total {self.overruns}",
+            f"# HELP {p}_cycle_duration_seconds Monitor cycle duration.",
+            f"# TYPE {p}_cycle_duration_seconds histogram",
+            *self.cycle_duration.prometheus_lines(f"{p}_cycle_duration_seconds"),
+            f"# HELP {p}_stage_duration_seconds Monitor cycle stage duration.",
+            f"# TYPE {p}_stage_duration_seconds histogram",
+        ]
+        for name, histogram in self.stage_durations.items():
+            lines.extend(
+                histogram.prometheus_lines(f"{p}_stage_duration_seconds", f'stage="{name}"')
+            )
+        lines.extend(
+            [
+                f"# HELP {p}_probe_duration_seconds Per-worker diagnosis latency.",
+                f"# TYPE {p}_probe_duration_seconds histogram",
+                *self.probe_latency.prometheus_lines(f"{p}_probe_duration_seconds"),
+                f"# HELP {p}_recovery_outcomes_total Recovery outcomes by kind.",
+                f"# TYPE {p}_recovery_outcomes_total counter",
+            ]
+        )
+        for outcome, count in sorted(self.outcomes.items()):
+            lines.append(f'{p}_recovery_outcomes_total{{outcome="{outcome}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus_file(self, path: Path) -> None:
+        """Prometheus テキストファイルをアトミックに書き出す（node_exporter textfile 向け）。"""
+        atomic_write(path, self.render_prometheus())
+
+    def write_snapshot_file(self, path: Path) -> None:
+        """集計結果を書き出したプロセスの pid・時刻とともに JSON でアトミックに保存する。"""
+        document = {
+            "version": _SNAPSHOT_FILE_VERSION,
+            "pid": os.getpid(),
+            "saved_at": datetime.now().isoformat(),
+            "metrics": self.snapshot(),
+        }
+        atomic_write(path, json.dumps(document, ensure_ascii=False))
+
+
+def read_metrics_snapshot(path: Path) -> dict[str, Any] | None:
+    """write_snapshot_file で保存したスナップショットを読み込む。
+
+    Returns:
+        pid・saved_at・metrics を含む dict。ファイルが無い・読めない・形式が異なる場合は None
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != _SNAPSHOT_FILE_VERSION
+        or not isinstance(data.get("metrics"), dict)
+    ):
+        return None
+    return data
@@ -0,0 +1,223 @@
+"""Worker ごとのヘルスチェック実行スケジュール。
+
+daemon は固定間隔で全 Worker を調べる代わりに、本モジュールの優先度キューから
+期限到来した Worker だけを監視する。Worker ごとの次回実行間隔は直前の監視結果と
+エージェント状態から決める。
+
+- 復旧直後・タスク送信直後・異常の疑いがある Worker は短い間隔で再確認する
+- 作業中の Worker は基本間隔で確認し、停滞判定の閾値が近い場合は前倒しする
+- タスクのない idle Worker は確認のたびに間隔を倍にしていく（上限あり）
+"""
+
+import asyncio
+import heapq
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.models.agent import Agent
+
+FAST_PROBE_ROUNDS = 3
+"""復旧直後・タスク送信直後に短い間隔で確認する回数"""
+
+
+@dataclass
+class ScheduleEntry:
+    """Worker 1 件分のスケジュール状態。"""
+
+    agent_id: str
+    next_due: float
+    """次回実行時刻（time.monotonic 基準）"""
+    interval_seconds: float
+    reason: str
+    idle_streak: int = 0
+    fast_remaining: int = 0
+    probes: int = 0
+    seq: int = 0
+    """最新のヒープ要素の通し番号（これと異なる要素は無効）"""
+
+
+class HealthcheckScheduler:
+    """Worker ごとの次回ヘルスチェック時刻を管理する優先度キュー。"""
+
+    def __init__(
+        self,
+        base_interval_seconds: float,
+        fast_interval_seconds: float,
+        idle_max_interval_seconds: float,
+        stall_threshold_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """HealthcheckScheduler を初期化する。
+
+        Args:
+            base_interval_seconds: 作業中 Worker の確認間隔（秒）
+            fast_interval_seconds: 要注意 Worker の確認間隔（秒）
+            idle_max_interval_seconds: idle Worker のバックオフ上限（秒）
+            stall_threshold_seconds: 停滞判定の閾値（秒）。接近時は確認を前倒しする
+            clock: 単調増加する現在時刻関数（テスト用）
+        """
+        self.base_interval_seconds = float(base_interval_seconds)
+        self.fast_interval_seconds = float(min(fast_interval_seconds, base_interval_seconds))
+        self.idle_max_interval_seconds = float(
+            max(idle_max_interval_seconds, base_interval_seconds)
+        )
+        self.stall_threshold_seconds = stall_threshold_seconds
+        self._clock = clock
+        self._entries: dict[str, ScheduleEntry] = {}
+        self._heap: list[tuple[float, int, str]] = []
+        self._seq = 0
+        self.wakeup = asyncio.Event()
+        """スケジュールが前倒しされたときに daemon の待機を解除するイベント"""
+
+    def _push(self, entry: ScheduleEntry) -> None:
+        # 古いヒープ要素は取り出し時に通し番号の不一致で読み捨てる
+        self._seq += 1
+        entry.seq = self._seq
+        heapq.heappush(self._heap, (entry.next_due, self._seq, entry.agent_id))
+
+    def _set_due(self, entry: ScheduleEntry, interval: float, reason: str, now: float) -> None:
+        entry.interval_seconds = interval
+        entry.reason = reason
+        entry.next_due = now + interval
+        self._push(entry)
+
+    def sync_agents(self, agent_ids: Iterable[str]) -> None:
+        """監視対象の Worker 一覧を反映する（新規は即時実行、消えた Worker は削除）。"""
+        current = set(agent_ids)
+        for agent_id in list(self._entries):
+            if agent_id not in current:
+                del self._entries[agent_id]
+        now = self._clock()
+        for agent_id in current:
+            if agent_id not in self._entries:
+                entry = ScheduleEntry(agent_id, now, 0.0, "new")
+                self._entries[agent_id] = entry
+                self._push(entry)
+
+    def pop_due(self) -> list[str]:
+        """期限到来した Worker ID を取り出す。
+
+        監視が例外で中断しても取り残されないよう、取り出した Worker には仮に
+        基本間隔後の実行時刻を設定する（通常は reschedule で上書きされる）。
+        """
+        now = self._clock()
+        due: list[str] = []
+        while self._heap and self._heap[0][0] <= now:
+            _, seq, agent_id = heapq.heappop(self._heap)
+            entry = self._entries.get(agent_id)
+            if entry is None or entry.seq != seq:
+                continue
+            due.append(agent_id)
+        for agent_id in due:
+            entry = self._entries[agent_id]
+            self._set_due(entry, self.base_interval_seconds, entry.reason, now)
+        return due
+
+    def seconds_until_next(self) -> float | None:
+        """次に期限到来する Worker までの秒数を返す（対象なしは None）。"""
+        while self._heap:
+            next_due, seq, agent_id = self._heap[0]
+            entry = self._entries.get(agent_id)
+            if entry is not None and entry.seq == seq:
+                return max(0.0, next_due - self._clock())
+            heapq.heappop(self._heap)
+        return None
+
+    def mark_urgent(self, agent_id: str, reason: str) -> None:
+        """指定 Worker を短い間隔での確認対象にする（タスク送信直後など）。"""
+        now = self._clock()
+        entry = self._entries.get(agent_id)
+        if entry is None:
+            entry = ScheduleEntry(agent_id, now + self.fast_interval_seconds, 0.0, reason)
+            self._entries[agent_id] = entry
+            self._push(entry)
+            self.wakeup.set()
+        entry.fast_remaining = FAST_PROBE_ROUNDS
+        entry.idle_streak = 0
+        if entry.next_due - now > self.fast_interval_seconds:
+            self._set_due(entry, self.fast_interval_seconds, reason, now)
+            self.wakeup.set()
+        else:
+            entry.reason = reason
+
+    def _busy_interval(self, agent: "Agent") -> tuple[float, str]:
+        """作業中 Worker の確認間隔を、停滞判定閾値までの残り時間も考慮して決める。"""
+        threshold = self.stall_threshold_seconds
+        last_activity = getattr(agent, "last_activity", None)
+        if not threshold or not isinstance(last_activity, datetime):
+            return self.base_interval_seconds, "busy"
+        remaining = threshold - (datetime.now() - last_activity).total_seconds()
+        if remaining >= self.base_interval_seconds:
+            return self.base_interval_seconds, "busy"
+        # 閾値超過直後に判定できるよう、残り時間（最短は fast 間隔）後に確認する
+        return max(self.fast_interval_seconds, remaining + 1.0), "stall_suspect"
+
+    def reschedule(
+        self,
+        probed_ids: Iterable[str],
+        result: dict[str, Any],
+        agents: dict[str, "Agent"],
+    ) -> None:
+        """監視結果をもとに、確認した Worker の次回実行時刻を決める。"""
+        from src.models.agent import AgentStatus
+
+        recovered = {d.get("agent_id") for d in result.get("recovered", []) if isinstance(d, dict)}
+        suspect = {d.get("agent_id") for d in result.get("escalated", []) if isinstance(d, dict)}
+        suspect.update(result.get("diagnosis_timed_out", []) or [])
+        suspect.update(result.get("diagnosis_failed", []) or [])
+        suspect.update(result.get("recovery_pending", []) or [])
+
+        now = self._clock()
+        for agent_id in probed_ids:
+            entry = self._entries.get(agent_id)
+            agent = agents.get(agent_id)
+            if entry is None or agent is None:
+                continue
+            entry.probes += 1
+
+            if agent_id in recovered:
+                entry.fast_remaining = FAST_PROBE_ROUNDS
+                entry.idle_streak = 0
+                self._set_due(entry, self.fast_interval_seconds, "recovered", now)
+                continue
+            if agent_id in suspect:
+                entry.idle_streak = 0
+                self._set_due(entry, self.fast_interval_seconds, "suspect", now)
+                continue
+            if entry.fast_remaining > 0:
+                entry.fast_remaining -= 1
+                self._set_due(entry, self.fast_interval_seconds, entry.reason, now)
+                continue
+
+            is_idle = agent.status in (AgentStatus.IDLE, AgentStatus.IDLE.value)
+            if is_idle and not agent.current_task:
+                interval = min(
+                    self.base_interval_seconds * (2**entry.idle_streak),
+                    self.idle_max_interval_seconds,
+                )
+                entry.idle_streak += 1
+                self._set_due(entry, interval, "idle", now)
+                continue
+
+            entry.idle_streak = 0
+            interval, reason = self._busy_interval(agent)
+            self._set_due(entry, interval, reason, now)
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """現在のスケジュールを次回実行が近い順に返す。"""
+        now = self._clock()
+        entries = sorted(self._entries.values(), key=lambda e: e.next_due)
+        return [
+            {
+                "agent_id": entry.agent_id,
+                "reason": entry.reason,
+                "interval_seconds": round(entry.interval_seconds, 1),
+                "next_check_in_seconds": round(max(0.0, entry.next_due - now), 1),
+                "probes": entry.probes,
+            }
+            for entry in entries
+        ]
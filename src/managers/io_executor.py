@@ -0,0 +1,137 @@
+"""ブロッキング I/O（git・ファイル操作）をイベントループ外で実行する共有スレッドプール。
+
+非同期ツールの中で ``subprocess.run`` やファイルの読み書きを直接行うと、その間は
+ヘルスチェックや他のリクエストも止まる。``run_blocking`` は上限付きの共有スレッド
+プールで関数を実行する（``asyncio.to_thread`` と同様に contextvars を引き継ぐ）。
+サーバー起動時にこのプールをイベントループの既定 executor にも設定するため、
+``asyncio.to_thread`` を使う処理も同じ上限に従う。
+
+デバッグ用に、イベントループを一定時間以上ブロックしたコールバックを検出する
+（asyncio のデバッグモードの ``slow_callback_duration`` を利用する）。
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+"""共有スレッドプールの既定のスレッド数"""
+
+_THREAD_NAME_PREFIX = "mcp-io"
+_SLOW_CALLBACK_HISTORY = 20
+"""保持する遅いコールバックの記録数"""
+
+_T = TypeVar("_T")
+
+_executor: ThreadPoolExecutor | None = None
+_max_workers = DEFAULT_MAX_WORKERS
+_executor_lock = threading.Lock()
+
+
+def configure_io_executor(max_workers: int) -> None:
+    """共有スレッドプールのスレッド数を設定する（変更時は次回の取得で作り直す）。"""
+    global _executor, _max_workers
+    if max_workers < 1:
+        raise ValueError("max_workers は 1 以上を指定してください")
+    with _executor_lock:
+        if max_workers == _max_workers:
+            return
+        _max_workers = max_workers
+        previous, _executor = _executor, None
+    if previous is not None:
+        # 実行中のジョブは完了させ、新規ジョブは新しいプールで受け付ける
+        previous.shutdown(wait=False)
+
+
+def get_io_executor() -> ThreadPoolExecutor:
+    """共有スレッドプールを返す（未作成なら作成する）。"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=_max_workers, thread_name_prefix=_THREAD_NAME_PREFIX
+            )
+        return _executor
+
+
+def install_io_executor(loop: asyncio.AbstractEventLoop) -> None:
+    """共有スレッドプールを loop の既定 executor にする（``asyncio.to_thread`` 用）。"""
+    loop.set_default_executor(get_io_executor())
+
+
+def shutdown_io_executor(wait: bool = False) -> None:
+    """共有スレッドプールを停止する（wait=True なら実行中のジョブの完了を待つ）。"""
+    global _executor
+    with _executor_lock:
+        previous, _executor = _executor, None
+    if previous is not None:
+        previous.shutdown(wait=wait)
+
+
+async def run_blocking(func: Callable[..., _T], /, *args: Any, **kwargs: Any) -> _T:
+    """ブロッキングな関数を共有スレッドプールで実行し、結果を返す。
+
+    ``asyncio.to_thread`` と同様に呼び出し元の contextvars を引き継ぐ。
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_io_executor(), call)
+
+
+# ========== 遅いコールバックの検出（デバッグ用） ==========
+
+
+class _SlowCallbackFilter(logging.Filter):
+    """asyncio のデバッグログから「コールバックの実行に時間がかかった」記録を集計する。"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.count = 0
+        self.recent: deque[str] = deque(maxlen=_SLOW_CALLBACK_HISTORY)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.msg == "Executing %s took %.3f seconds":
+            self.count += 1
+            self.recent.append(record.getMessage())
+        return True
+
+
+_slow_callback_filter: _SlowCallbackFilter | None = None
+
+
+def enable_slow_callback_detection(
+    loop: asyncio.AbstractEventLoop, threshold_seconds: float
+) -> None:
+    """loop をデバッグモードにし、threshold_seconds 以上ブロックしたコールバックを検出する。
+
+    検出結果は asyncio ロガーの WARNING として出力され、``get_slow_callback_stats`` で参照できる。
+    """
+    global _slow_callback_filter
+    loop.set_debug(True)
+    loop.slow_callback_duration = threshold_seconds
+    if _slow_callback_filter is None:
+        _slow_callback_filter = _SlowCallbackFilter()
+        logging.getLogger("asyncio").addFilter(_slow_callback_filter)
+    logger.info(
+        "遅いコールバックの検出を有効化しました（閾値: %.0f ms）", threshold_seconds * 1000
+    )
+
+
+def get_slow_callback_stats() -> dict[str, Any]:
+    """検出した遅いコールバックの件数と直近の記録を返す。"""
+    if _slow_callback_filter is None:
+        return {"enabled": False, "count": 0, "recent": []}
+    return {
+        "enabled": True,
+        "count": _slow_callback_filter.count,
+        "recent": list(_slow_callback_filter.recent),
+    }
@@ -7,15 +7,14 @@
 """
 
 import logging
-import os
 import re
-import tempfile
 import uuid
 from datetime import datetime
 from pathlib import Path
 
 import yaml
 
+from src.managers.durable_io import atomic_write, durability_batch
 from src.models.message import (
     Message,
     MessagePriority,
@@ -130,20 +129,11 @@ class IPCManager:
         return f"---\n{yaml_str}---\n\n{message.content}\n"
 
     def _atomic_write(self, file_path: Path, content: str) -> None:
-        """アトミック書き込み（tmpfile + os.replace）でファイルを安全に保存する。"""
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        fd, tmp_path = tempfile.mkstemp(dir=str(file_path.parent), suffix=".tmp")
-        try:
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                f.write(content)
-            os.replace(tmp_path, str(file_path))
-        except BaseException:
-            # 書き込み失敗時に一時ファイルを削除
-            try:
-                os.unlink(tmp_path)
-            except OSError:
-                pass
-            raise
+        """アトミック書き込み（tmpfile + os.replace）でファイルを安全に保存する。
+
+        fsync の有無は耐久性モード（durable_io）に従う。
+        """
+        atomic_write(file_path, content)
 
     def _write_message_file(self, agent_id: str, message: Message) -> Path:
         """メッセージを Markdown ファイルとしてアトミックに保存する。"""
@@ -226,9 +216,10 @@ class IPCManager:
 
         if receiver_id is None:
             # ブロードキャスト: 全エージェントのディレクトリに追加
-            for agent_id in self.get_all_agent_ids():
-                if agent_id != sender_id:
-                    self._write_message_file(agent_id, message)
+            with durability_batch():
+                for agent_id in self.get_all_agent_ids():
+                    if agent_id != sender_id:
+                        self._write_message_file(agent_id, message)
             logger.info(f"ブロードキャストメッセージを送信: {sender_id} -> all")
         else:
             # 特定エージェントへの送信
@@ -278,10 +269,12 @@ class IPCManager:
         # 既読マーク
         if mark_as_read:
             now = datetime.now()
-            for file_path, msg in messages:
-                if not msg.is_read:
-                    msg.read_at = now
-                    self._update_message_file(file_path, msg)
+            # 同じディレクトリの更新をまとめて永続化する（durable モード）
+            with durability_batch():
+                for file_path, msg in messages:
+                    if not msg.is_read:
+                        msg.read_at = now
+                        self._update_message_file(file_path, msg)
 
         return [m for _, m in messages]
 
@@ -24,19 +24,20 @@ from pathlib import Path
 
 import yaml
 
-from src.config.settings import Settings, get_mcp_dir
+from src.config.settings import get_default_settings, get_mcp_dir
+from src.managers.durable_io import atomic_write
 
 logger = logging.getLogger(__name__)
 
 
 def _get_default_max_entries() -> int:
     """Settings からデフォルトの最大エントリ数を取得する。"""
-    return Settings().memory_max_entries
+    return get_default_settings().memory_max_entries
 
 
 def _get_default_ttl_days() -> int:
     """Settings からデフォルトの TTL（日数）を取得する。"""
-    return Settings().memory_ttl_days
+    return get_default_settings().memory_ttl_days
 
 
 def _sanitize_filename(key: str) -> str:
@@ -225,7 +226,7 @@ class MemoryManager:
             )
             content = f"---\n{yaml_str}---\n\n{entry.content}\n"
 
-            file_path.write_text(content, encoding="utf-8")
+            atomic_write(file_path, content)
         except (OSError, yaml.YAMLError) as e:
             logger.error(f"エントリの保存に失敗 ({file_path}): {e}")
             raise
@@ -0,0 +1,192 @@
+"""tmux pipe-pane によるペイン出力ログ。
+
+``tmux pipe-pane`` から本モジュールをスクリプトとして起動し、ペイン出力を
+ANSI エスケープ除去済みの追記専用ログへ書き出す。ログが上限サイズを超えた場合は
+``{agent_id}.log.1`` へローテーションする（保持は 1 世代）。
+
+pipe-pane の子プロセスはペインのカレントディレクトリで起動されるため、
+本モジュールは ``src`` パッケージに依存せず標準ライブラリのみで動作させる。
+"""
+
+import os
+import re
+import shlex
+import sys
+from typing import BinaryIO
+
+_ANSI_ESCAPE_RE = re.compile(
+    rb"\x1b(?:"
+    rb"\[[0-?]*[ -/]*[@-~]"  # CSI
+    rb"|\][^\x07\x1b]*(?:\x07|\x1b\\)"  # OSC
+    rb"|[PX^_][^\x1b]*\x1b\\"  # DCS / SOS / PM / APC
+    rb"|[()][0-9A-Za-z]"  # 文字セット指定
+    rb"|[@-Z\\-_]"  # 2 バイトシーケンス
+    rb")"
+)
+_CONTROL_CHARS_RE = re.compile(rb"[\x00-\x08\x0b-\x1f\x7f]")
+
+_READ_CHUNK_BYTES = 65_536
+_TAIL_BLOCK_BYTES = 8_192
+_MAX_CARRY_BYTES = 65_536
+
+PANE_LOG_DIR_NAME = "logs"
+"""セッションディレクトリ配下のペインログ格納ディレクトリ名"""
+
+
+def strip_ansi_bytes(data: bytes) -> bytes:
+    """ANSI エスケープシーケンスと制御文字を除去する（改行・タブは保持）。"""
+    cleaned = _ANSI_ESCAPE_RE.sub(b"", data)
+    cleaned = cleaned.replace(b"\r\n", b"\n")
+    return _CONTROL_CHARS_RE.sub(b"", cleaned)
+
+
+def strip_ansi(text: str) -> str:
+    """文字列から ANSI エスケープシーケンスと制御文字を除去する。"""
+    return strip_ansi_bytes(text.encode("utf-8", errors="surrogateescape")).decode(
+        "utf-8", errors="replace"
+    )
+
+
+def get_pane_log_path(project_root: str, mcp_dir: str, session_id: str, agent_id: str) -> str:
+    """エージェントのペインログパスを返す。
+
+    Returns:
+        ``{project_root}/{mcp_dir}/{session_id}/logs/{agent_id}.log``
+    """
+    return os.path.join(project_root, mcp_dir, session_id, PANE_LOG_DIR_NAME, f"{agent_id}.log")
+
+
+def build_pipe_pane_command(log_path: str, max_bytes: int) -> str:
+    """tmux pipe-pane に渡すシェルコマンドを構築する。"""
+    return shlex.join([sys.executable, os.path.abspath(__file__), log_path, str(max_bytes)])
+
+
+def _read_file_tail(path: str, lines: int) -> list[bytes]:
+    """ファイル末尾から最大 lines 行を読み出す。"""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        data = b""
+        while position > 0 and data.count(b"\n") <= lines:
+            step = min(_TAIL_BLOCK_BYTES, position)
+            position -= step
+            f.seek(position)
+            data = f.read(step) + data
+    return data.splitlines()[-lines:] if lines > 0 else []
+
+
+def read_pane_log_tail(log_path: str, lines: int = 100) -> str | None:
+    """ペインログの末尾 lines 行を返す。
+
+    現行ログの行数が足りない場合はローテーション済みの ``.1`` からも補う。
+
+    Returns:
+        ログ末尾のテキスト。ログが存在しない場合は None
+    """
+    try:
+        tail = _read_file_tail(log_path, lines)
+    except OSError:
+        return None
+
+    if len(tail) < lines:
+        try:
+            tail = _read_file_tail(f"{log_path}.1", lines - len(tail)) + tail
+        except OSError:
+            pass
+    return b"\n".join(tail).decode("utf-8", errors="replace")
+
+
+def read_agent_pane_log(agent: object, lines: int = 100) -> str | None:
+    """エージェントに紐づくペインログの末尾を返す。
+
+    Returns:
+        ログ末尾のテキスト。ペインログ未設定・未作成の場合は None
+    """
+    log_path = getattr(agent, "pane_log_path", None)
+    if not isinstance(log_path, str) or not log_path:
+        return None
+    return read_pane_log_tail(log_path, lines)
+
+
+def pane_log_signature(agent: object) -> str | None:
+    """ペインログの更新検知用シグネチャ（inode と サイズ）を返す。
+
+    追記専用のため、出力があればサイズが、ローテーション時は inode が変化する。
+    """
+    log_path = getattr(agent, "pane_log_path", None)
+    if not isinstance(log_path, str) or not log_path:
+        return None
+    try:
+        st = os.stat(log_path)
+    except OSError:
+        return None
+    return f"log:{st.st_ino}:{st.st_size}"
+
+
+class _RotatingLogWriter:
+    """上限サイズ付きの追記専用ログライター。"""
+
+    def __init__(self, log_path: str, max_bytes: int) -> None:
+        self.log_path = log_path
+        self.max_bytes = max_bytes
+        os.makedirs(os.path.dirname(log_path) or ".", exist_ok=True)
+        self._file = open(log_path, "ab")  # noqa: SIM115
+        self._size = self._file.tell()
+
+    def write(self, data: bytes) -> None:
+        if not data:
+            return
+        if self._size > 0 and self._size + len(data) > self.max_bytes:
+            self._rotate()
+        self._file.write(data)
+        self._file.flush()
+        self._size += len(data)
+
+    def _rotate(self) -> None:
+        self._file.close()
+        os.replace(self.log_path, f"{self.log_path}.1")
+        self._file = open(self.log_path, "ab")  # noqa: SIM115
+        self._size = 0
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def run_writer(stream: BinaryIO, log_path: str, max_bytes: int) -> None:
+    """stream の内容を ANSI 除去しながらログへ書き込む。
+
+    エスケープシーケンスが読み込み境界で分断されないよう、改行単位で処理する。
+    """
+    writer = _RotatingLogWriter(log_path, max_bytes)
+    read = getattr(stream, "read1", stream.read)
+    carry = b""
+    try:
+        while True:
+            chunk = read(_READ_CHUNK_BYTES)
+            if not chunk:
+                break
+            carry += chunk
+            head, sep, rest = carry.rpartition(b"\n")
+            if sep:
+                writer.write(strip_ansi_bytes(head + sep))
+                carry = rest
+            if len(carry) > _MAX_CARRY_BYTES:
+                writer.write(strip_ansi_bytes(carry))
+                carry = b""
+        if carry:
+            writer.write(strip_ansi_bytes(carry))
+    finally:
+        writer.close()
+
+
+def main(argv: list[str]) -> int:
+    """pipe-pane から起動されるエントリポイント。"""
+    if len(argv) != 2:
+        print("usage: pane_log.py <log_path> <max_bytes>", file=sys.stderr)
+        return 2
+    run_writer(sys.stdin.buffer, argv[0], int(argv[1]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,168 @@
+"""/proc を用いた AI CLI プロセスの生存確認（Linux 専用）。
+
+tmux の ``pane_pid`` を起点に ``/proc/<pid>/task/*/children`` を辿って子孫プロセスを
+列挙し、各プロセスの ``stat`` から AI CLI 本体を特定する。``pane_current_command``
+はフォアグラウンドのプロセス名しか返さず、``codex-aarch64-a`` のような派生名や
+``node`` 経由で起動される CLI を取り違えやすいため、実行ファイル名・引数も照合する。
+
+CPU 時間（utime + stime）の前回観測値との差分は「まだ考えている」ことを示す
+安価な指標として、停滞判定の誤検知を避けるために使う。
+"""
+
+import os
+import sys
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+
+PROC_ROOT = Path("/proc")
+
+_MAX_DESCENDANTS = 256
+"""子孫探索で調べるプロセス数の上限"""
+
+_DEAD_STATES = frozenset({"Z", "X", "x"})
+"""終了済み（zombie / dead）を表す stat の状態文字"""
+
+
+@dataclass(frozen=True)
+class ProcessStat:
+    """/proc/<pid>/stat から読み取ったプロセス情報。"""
+
+    pid: int
+    comm: str
+    """カーネル上のプロセス名（最大 15 文字）"""
+    state: str
+    """状態文字（R / S / D / Z など）"""
+    cpu_ticks: int
+    """utime + stime（clock tick 単位）"""
+    rss_pages: int
+
+    @property
+    def alive(self) -> bool:
+        """zombie / dead 以外なら True。"""
+        return self.state not in _DEAD_STATES
+
+
+def is_proc_available(proc_root: Path = PROC_ROOT) -> bool:
+    """/proc による探索が利用可能か（Linux かつ /proc がマウント済み）を返す。"""
+    return sys.platform.startswith("linux") and (proc_root / "self" / "stat").exists()
+
+
+def clock_ticks_per_second() -> int:
+    """CPU 時間の単位（clock tick / 秒）を返す。"""
+    try:
+        return int(os.sysconf("SC_CLK_TCK"))
+    except (ValueError, OSError, AttributeError):
+        return 100
+
+
+def page_size_bytes() -> int:
+    """RSS の単位（ページサイズ）を返す。"""
+    try:
+        return int(os.sysconf("SC_PAGE_SIZE"))
+    except (ValueError, OSError, AttributeError):
+        return 4096
+
+
+def read_process_stat(pid: int, proc_root: Path = PROC_ROOT) -> ProcessStat | None:
+    """/proc/<pid>/stat を読み取る（プロセスが存在しない場合は None）。"""
+    try:
+        raw = (proc_root / str(pid) / "stat").read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return None
+    # comm は括弧で囲まれ、空白や括弧を含みうるため最後の ')' で区切る
+    open_paren = raw.find("(")
+    close_paren = raw.rfind(")")
+    if open_paren < 0 or close_paren < open_paren:
+        return None
+    fields = raw[close_paren + 2 :].split()
+    # fields[0] が stat の 3 番目（state）。utime=14, stime=15, rss=24 番目
+    if len(fields) < 22:
+        return None
+    try:
+        return ProcessStat(
+            pid=pid,
+            comm=raw[open_paren + 1 : close_paren],
+            state=fields[0],
+            cpu_ticks=int(fields[11]) + int(fields[12]),
+            rss_pages=int(fields[21]),
+        )
+    except ValueError:
+        return None
+
+
+def read_process_argv(pid: int, proc_root: Path = PROC_ROOT) -> list[str]:
+    """/proc/<pid>/cmdline を引数リストとして読み取る（取得失敗時は空）。"""
+    try:
+        raw = (proc_root / str(pid) / "cmdline").read_bytes()
+    except OSError:
+        return []
+    return [part.decode("utf-8", errors="replace") for part in raw.split(b"\0") if part]
+
+
+def list_child_pids(pid: int, proc_root: Path = PROC_ROOT) -> list[int]:
+    """全スレッドの children ファイルから直接の子プロセスを列挙する。"""
+    children: list[int] = []
+    try:
+        task_dirs = list((proc_root / str(pid) / "task").iterdir())
+    except OSError:
+        return children
+    for task_dir in task_dirs:
+        try:
+            content = (task_dir / "children").read_text(encoding="utf-8")
+        except OSError:
+            continue
+        children.extend(int(token) for token in content.split() if token.isdigit())
+    return children
+
+
+def _matches_prefixes(
+    stat: ProcessStat, argv: list[str], prefixes: tuple[str, ...]
+) -> bool:
+    """プロセス名・実行ファイル名・スクリプト名のいずれかが AI CLI に一致するか。"""
+    names = [stat.comm]
+    # node / python 経由の CLI はスクリプト名（argv[1]）で判別する
+    names.extend(os.path.basename(arg) for arg in argv[:2])
+    return any(name.strip().lower().startswith(prefixes) for name in names if name)
+
+
+@dataclass(frozen=True)
+class ProcessTreeSample:
+    """ペイン配下のプロセスツリーを 1 回走査した結果。"""
+
+    ai_process: ProcessStat | None
+    """AI CLI と判定したプロセス（見つからない場合は None）"""
+    process_count: int
+
+
+def probe_process_tree(
+    root_pid: int,
+    prefixes: tuple[str, ...],
+    proc_root: Path = PROC_ROOT,
+) -> ProcessTreeSample | None:
+    """root_pid 自身と子孫を幅優先で走査し、AI CLI のプロセスを特定する。
+
+    root_pid が存在しない場合は None を返す。
+    """
+    if read_process_stat(root_pid, proc_root) is None:
+        return None
+    queue: deque[int] = deque([root_pid])
+    seen: set[int] = set()
+    ai_process: ProcessStat | None = None
+    while queue and len(seen) < _MAX_DESCENDANTS:
+        pid = queue.popleft()
+        if pid in seen:
+            continue
+        seen.add(pid)
+        stat = read_process_stat(pid, proc_root)
+        if stat is None:
+            continue
+        if ai_process is None and _matches_prefixes(
+            stat, read_process_argv(pid, proc_root), prefixes
+        ):
+            ai_process = stat
+        queue.extend(list_child_pids(pid, proc_root))
+    return ProcessTreeSample(
+        ai_process=ai_process,
+        process_count=len(seen),
+    )
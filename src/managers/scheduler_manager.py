@@ -1,15 +1,34 @@
 """タスクスケジューラーマネージャー。
 
 タスクの優先度管理と、空いているWorkerへの自動割り当てを行う。
+
+依存関係は DAG として管理する。キュー上のタスクごとに未完了の依存タスク
+（入次数）を保持し、依存タスクから待ちタスクへの逆辺を辿って完了時に解消する。
+割り当て候補のヒープには依存がすべて解消したタスクだけを入れるため、
+次タスクの取得はヒープの先頭を見るだけで済む。
+
+``state_file`` を指定した場合、キュー・割り当て・完了済みタスクをセッション
+ディレクトリの JSON ファイルに保存し、Owner / Admin など複数の MCP プロセスで
+共有する。各操作はファイルロック下で行い、他プロセスがファイルを更新していた
+場合のみ読み直してメモリ上の依存グラフを再構築する。非同期の呼び出し元は
+``run_locked`` を使い、他プロセスがロックを保持している間もイベントループを止めない。
 """
 
+import asyncio
+import fcntl
+import functools
 import heapq
+import json
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import IntEnum
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, TypeVar
+
+from src.managers.durable_io import atomic_write
 
 if TYPE_CHECKING:
     from src.managers.dashboard_manager import DashboardManager
@@ -17,6 +36,31 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+SCHEDULER_STATE_FILE_NAME = "scheduler_queue.json"
+"""セッションディレクトリ配下のキュー保存ファイル名"""
+
+_STATE_FILE_VERSION = 1
+
+_COMPLETED_HISTORY_LIMIT = 256
+"""保持する完了済みタスク ID の上限（キュー上のタスクが依存している ID は上限を超えても残す）"""
+
+_LOCK_RETRY_INITIAL_SECONDS = 0.005
+_LOCK_RETRY_MAX_SECONDS = 0.1
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+_T = TypeVar("_T")
+
+
+def _queue_operation(method: _F) -> _F:
+    """メソッドをキューのトランザクション（ファイルロック・再読み込み・保存）内で実行する。"""
+
+    @functools.wraps(method)
+    def wrapper(self: "SchedulerManager", *args: Any, **kwargs: Any) -> Any:
+        with self._queue_transaction():
+            return method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
 
 class TaskPriority(IntEnum):
     """タスク優先度。"""
@@ -50,6 +94,9 @@ class ScheduledTask:
     dependencies: list[str] = field(default_factory=list, compare=False)
     """依存タスクのIDリスト"""
 
+    sequence: int = 0
+    """追加順の通し番号（同一優先度は先に追加したものを優先する）"""
+
 
 class SchedulerManager:
     """タスクスケジューラー。
@@ -63,6 +110,8 @@ class SchedulerManager:
         dashboard_manager: "DashboardManager",
         agents: dict[str, "Agent"],
         persist_agent_state: Callable[["Agent"], bool] | None = None,
+        state_file: Path | None = None,
+        persist_agents_state: Callable[[list["Agent"]], bool] | None = None,
     ) -> None:
         """SchedulerManagerを初期化する。
 
@@ -70,14 +119,238 @@ class SchedulerManager:
             dashboard_manager: ダッシュボードマネージャー
             agents: エージェントの辞書（agent_id -> Agent）
             persist_agent_state: エージェント状態永続化コールバック
+            state_file: キューの保存先（None の場合はプロセス内でのみ保持する）
+            persist_agents_state: 複数エージェントの状態を一括で永続化するコールバック
+                （自動割り当てループの結果をまとめて保存する。None なら 1 件ずつ保存する）
         """
         self.dashboard_manager = dashboard_manager
+        self.state_file = Path(state_file) if state_file else None
+        self._state_signature: tuple[int, int, int] | None = None
+        self._transaction_depth = 0
+        self._dirty = False
         self.agents = agents
         self._persist_agent_state = persist_agent_state
-        self._task_queue: list[ScheduledTask] = []
+        self._persist_agents_state = persist_agents_state
+        # 自動割り当てループ中に永続化を保留しているエージェント（ループ外は None）
+        self._pending_persist: dict[str, Agent] | None = None
+        self._ready_heap: list[ScheduledTask] = []  # 依存が解消したタスク（遅延削除）
         self._assigned_tasks: dict[str, str] = {}  # task_id -> agent_id
         self._task_map: dict[str, ScheduledTask] = {}  # task_id -> ScheduledTask
+        self._unmet_dependencies: dict[str, set[str]] = {}  # task_id -> 未完了の依存タスク
+        self._dependents: dict[str, set[str]] = {}  # 依存タスク -> それを待つ task_id（逆辺）
+        # 完了を確認済みの依存タスク（挿入順 = 完了順。古いものから間引く）
+        self._completed_tasks: dict[str, None] = {}
+        self._needs_refresh = False  # Dashboard で依存の完了を確認すべき待ちタスクがあるか
+        self._sequence = 0
+        self._released_at: dict[str, datetime] = {}  # worker_id -> 直近でタスクが終了した時刻
+        self._event_stats: dict[str, float] = {
+            "releases": 0,
+            "assignments": 0,
+            "idle_gap_seconds_total": 0.0,
+            "idle_gap_seconds_max": 0.0,
+            "estimated_saved_seconds": 0.0,
+        }
+
+    @contextmanager
+    def _queue_transaction(self) -> Iterator[None]:
+        """キュー操作 1 回分の排他区間。
+
+        最も外側の呼び出しでロックを取得し、他プロセスの更新を読み込む。
+        区間内で状態が変わった場合は抜ける際に保存する。入れ子の呼び出しは
+        外側のトランザクションに合流する。
+        """
+        if self.state_file is None or self._transaction_depth > 0:
+            self._transaction_depth += 1
+            try:
+                yield
+            finally:
+                self._transaction_depth -= 1
+            return
+
+        lock_file = self._acquire_queue_lock(blocking=True)
+        assert lock_file is not None
+        with self._locked_transaction(lock_file):
+            yield
+
+    def _acquire_queue_lock(self, blocking: bool) -> IO[str] | None:
+        """キューのロックファイルを開いて排他ロックを取得する。
+
+        blocking=False で他プロセスがロック中の場合は None を返す。
+        """
+        assert self.state_file is not None
+        lock_path = self.state_file.with_name(f"{self.state_file.name}.lock")
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        lock_file = open(lock_path, "a+", encoding="utf-8")  # noqa: SIM115
+        try:
+            flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+            fcntl.flock(lock_file.fileno(), flags)
+        except BlockingIOError:
+            lock_file.close()
+            return None
+        except BaseException:
+            lock_file.close()
+            raise
+        return lock_file
+
+    @contextmanager
+    def _locked_transaction(self, lock_file: IO[str]) -> Iterator[None]:
+        """取得済みのロック下で再読み込み・操作・保存を行い、最後にロックを解放する。"""
+        self._transaction_depth += 1
+        try:
+            self._reload_if_changed()
+            self._dirty = False
+            try:
+                yield
+            except BaseException:
+                if self._dirty:
+                    # 途中で失敗した変更は保存せず、次回の操作でファイルから読み直す
+                    self._state_signature = (-1, -1, -1)
+                raise
+            if self._dirty:
+                self._save_state()
+        finally:
+            self._dirty = False
+            self._transaction_depth -= 1
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            finally:
+                lock_file.close()
+
+    async def run_locked(self, func: Callable[..., _T], /, *args: Any, **kwargs: Any) -> _T:
+        """イベントループを止めずにロックを取得し、func を 1 回のトランザクションで実行する。
+
+        他プロセスがロックを保持している間はブロッキングせず、間隔を空けて取得を再試行する。
+        func はキュー操作のメソッド（同期関数）で、ロック保持中に await を挟まない。
+        """
+        if self.state_file is None or self._transaction_depth > 0:
+            return func(*args, **kwargs)
+        delay = _LOCK_RETRY_INITIAL_SECONDS
+        while (lock_file := self._acquire_queue_lock(blocking=False)) is None:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _LOCK_RETRY_MAX_SECONDS)
+        with self._locked_transaction(lock_file):
+            return func(*args, **kwargs)
+
+    def release_task_nowait(
+        self,
+        task_id: str,
+        worker_id: str | None = None,
+        completed: bool = True,
+    ) -> bool:
+        """ロックを待たずに release_task を実行する。
 
+        Returns:
+            反映した場合 True。他プロセスがキューのロックを保持している場合は何もせず False
+        """
+        if self.state_file is None or self._transaction_depth > 0:
+            self.release_task(task_id, worker_id, completed=completed)
+            return True
+        lock_file = self._acquire_queue_lock(blocking=False)
+        if lock_file is None:
+            return False
+        with self._locked_transaction(lock_file):
+            self.release_task(task_id, worker_id, completed=completed)
+        return True
+
+    def _file_signature(self) -> tuple[int, int, int] | None:
+        """保存ファイルの (inode, mtime_ns, size)。存在しなければ None。"""
+        assert self.state_file is not None
+        try:
+            stat = self.state_file.stat()
+        except OSError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _reload_if_changed(self) -> None:
+        """前回の読み書き以降に保存ファイルが変わっていれば読み直す。"""
+        signature = self._file_signature()
+        if signature == self._state_signature:
+            return
+        self._state_signature = signature
+        if signature is None:
+            # ファイルが削除された場合（セッションのクリーンアップ等）は空のキューに戻す
+            self._load_state({})
+            return
+        try:
+            assert self.state_file is not None
+            data = json.loads(self.state_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"スケジューラーのキューを読み込めませんでした: {e}")
+            return
+        if not isinstance(data, dict) or data.get("version") != _STATE_FILE_VERSION:
+            logger.warning("スケジューラーのキューの形式が不正なため無視します")
+            return
+        self._load_state(data)
+
+    def _load_state(self, data: dict[str, Any]) -> None:
+        """保存内容からキュー・割り当て・依存グラフを再構築する。"""
+        task_map: dict[str, ScheduledTask] = {}
+        for item in data.get("tasks", []):
+            try:
+                scheduled = ScheduledTask(
+                    priority=int(item["priority"]),
+                    created_at=datetime.fromisoformat(item["created_at"]),
+                    task_id=str(item["task_id"]),
+                    dependencies=[str(dep_id) for dep_id in item.get("dependencies", [])],
+                    sequence=int(item.get("sequence", 0)),
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+            task_map[scheduled.task_id] = scheduled
+
+        self._task_map = task_map
+        self._assigned_tasks = {
+            str(task_id): str(worker_id)
+            for task_id, worker_id in (data.get("assigned") or {}).items()
+        }
+        self._completed_tasks = dict.fromkeys(str(task_id) for task_id in data.get("completed", []))
+        self._sequence = max(
+            [int(data.get("sequence", 0)), *(t.sequence for t in task_map.values())]
+        )
+        self._unmet_dependencies = {}
+        self._dependents = {}
+        self._ready_heap = []
+        for scheduled in task_map.values():
+            unmet = {
+                dep_id
+                for dep_id in scheduled.dependencies
+                if dep_id not in self._completed_tasks
+            }
+            self._unmet_dependencies[scheduled.task_id] = unmet
+            for dep_id in unmet:
+                self._dependents.setdefault(dep_id, set()).add(scheduled.task_id)
+            if not unmet:
+                self._ready_heap.append(scheduled)
+        heapq.heapify(self._ready_heap)
+        self._needs_refresh = bool(self._dependents)
+
+    def _save_state(self) -> None:
+        """キューの状態を保存ファイルへアトミックに書き込む。"""
+        assert self.state_file is not None
+        payload = {
+            "version": _STATE_FILE_VERSION,
+            "sequence": self._sequence,
+            "tasks": [
+                {
+                    "task_id": scheduled.task_id,
+                    "priority": scheduled.priority,
+                    "created_at": scheduled.created_at.isoformat(),
+                    "dependencies": scheduled.dependencies,
+                    "sequence": scheduled.sequence,
+                }
+                for scheduled in sorted(self._task_map.values(), key=lambda t: t.sequence)
+            ],
+            "assigned": self._assigned_tasks,
+            "completed": list(self._completed_tasks),
+        }
+        try:
+            atomic_write(self.state_file, json.dumps(payload, ensure_ascii=False, indent=2))
+        except OSError as e:
+            logger.warning(f"スケジューラーのキューを保存できませんでした: {e}")
+            return
+        self._state_signature = self._file_signature()
+
+    @_queue_operation
     def enqueue_task(
         self,
         task_id: str,
@@ -93,23 +366,66 @@ class SchedulerManager:
 
         Returns:
             成功した場合True
+
+        Raises:
+            ValueError: 依存関係が循環する場合
         """
         if task_id in self._task_map:
             logger.warning(f"タスク {task_id} は既にキューに存在します")
             return False
 
+        dependencies = list(dict.fromkeys(dependencies or []))
+        cycle = self._find_dependency_cycle(task_id, dependencies)
+        if cycle:
+            raise ValueError(f"依存関係が循環しています: {' -> '.join(cycle)}")
+
+        self._sequence += 1
         scheduled = ScheduledTask(
             priority=priority.value,
             created_at=datetime.now(),
             task_id=task_id,
-            dependencies=dependencies or [],
+            dependencies=dependencies,
+            sequence=self._sequence,
         )
-        heapq.heappush(self._task_queue, scheduled)
         self._task_map[task_id] = scheduled
+        unmet = {dep_id for dep_id in dependencies if dep_id not in self._completed_tasks}
+        self._unmet_dependencies[task_id] = unmet
+        for dep_id in unmet:
+            self._dependents.setdefault(dep_id, set()).add(task_id)
+        if unmet:
+            # 依存タスクが既に完了しているかは次回の参照時にまとめて確認する
+            self._needs_refresh = True
+        else:
+            heapq.heappush(self._ready_heap, scheduled)
+        self._dirty = True
 
         logger.info(f"タスク {task_id} をキューに追加しました（優先度: {priority.name}）")
         return True
 
+    def _find_dependency_cycle(self, task_id: str, dependencies: list[str]) -> list[str] | None:
+        """task_id を追加すると循環が生じる場合、その経路を返す。"""
+        if task_id in dependencies:
+            return [task_id, task_id]
+        # キュー上のタスクの依存を辿り、task_id に戻る経路があれば循環
+        stack: list[tuple[str, list[str]]] = [
+            (dep_id, [task_id, dep_id]) for dep_id in dependencies
+        ]
+        visited: set[str] = set()
+        while stack:
+            current, path = stack.pop()
+            if current in visited:
+                continue
+            visited.add(current)
+            scheduled = self._task_map.get(current)
+            if scheduled is None:
+                continue
+            for dep_id in scheduled.dependencies:
+                if dep_id == task_id:
+                    return [*path, task_id]
+                stack.append((dep_id, [*path, dep_id]))
+        return None
+
+    @_queue_operation
     def dequeue_task(self, task_id: str) -> bool:
         """タスクをキューから削除する。
 
@@ -123,12 +439,19 @@ class SchedulerManager:
             return False
 
         del self._task_map[task_id]
-        self._task_queue = [t for t in self._task_queue if t.task_id != task_id]
-        heapq.heapify(self._task_queue)
+        for dep_id in self._unmet_dependencies.pop(task_id, set()):
+            waiting = self._dependents.get(dep_id)
+            if waiting is not None:
+                waiting.discard(task_id)
+                if not waiting:
+                    del self._dependents[dep_id]
+        # ヒープ上の要素は取り出し時に読み捨てる
+        self._dirty = True
 
         logger.info(f"タスク {task_id} をキューから削除しました")
         return True
 
+    @_queue_operation
     def update_priority(self, task_id: str, priority: TaskPriority) -> bool:
         """タスクの優先度を更新する。
 
@@ -148,23 +471,41 @@ class SchedulerManager:
         self.enqueue_task(task_id, priority, scheduled.dependencies)
         return True
 
-    def _dependencies_satisfied(self, dependencies: list[str]) -> bool:
-        """依存タスクが全て完了しているか確認する。
+    @_queue_operation
+    def mark_dependency_completed(self, task_id: str) -> None:
+        """タスクの完了を依存グラフに反映し、待っていたタスクの入次数を減らす。"""
+        if task_id not in self._completed_tasks:
+            self._completed_tasks[task_id] = None
+            self._prune_completed()
+            self._dirty = True
+        for waiting_id in self._dependents.pop(task_id, set()):
+            unmet = self._unmet_dependencies.get(waiting_id)
+            if unmet is None:
+                continue
+            unmet.discard(task_id)
+            if not unmet:
+                scheduled = self._task_map.get(waiting_id)
+                if scheduled is not None and waiting_id not in self._assigned_tasks:
+                    heapq.heappush(self._ready_heap, scheduled)
 
-        Args:
-            dependencies: 依存タスクのIDリスト
+    def _prune_completed(self) -> None:
+        """完了済みタスク ID を上限まで古い順に間引く（キュー上のタスクが依存する ID は残す）。
 
-        Returns:
-            全て完了している場合True
+        間引いた ID に依存するタスクが後から追加された場合も、Dashboard の状態から
+        完了を確認するため依存は解消される。
         """
-        if not dependencies:
-            return True
-
-        for dep_id in dependencies:
-            task = self.dashboard_manager.get_task(dep_id)
-            if not task or task.status != "completed":
-                return False
-        return True
+        excess = len(self._completed_tasks) - _COMPLETED_HISTORY_LIMIT
+        if excess <= 0:
+            return
+        referenced = {
+            dep_id for scheduled in self._task_map.values() for dep_id in scheduled.dependencies
+        }
+        for task_id in list(self._completed_tasks):
+            if excess <= 0:
+                break
+            if task_id not in referenced:
+                del self._completed_tasks[task_id]
+                excess -= 1
 
     def _build_task_status_snapshot(self) -> dict[str, str]:
         """Dashboard からタスク状態のスナップショットを作成する。
@@ -178,29 +519,46 @@ class SchedulerManager:
             snapshot[task.id] = status
         return snapshot
 
-    def _dependencies_satisfied_with_snapshot(
-        self,
-        dependencies: list[str],
-        status_snapshot: dict[str, str],
-    ) -> bool:
-        """スナップショットを使って依存タスク完了判定を行う。"""
-        if not dependencies:
-            return True
-        return all(status_snapshot.get(dep_id) == "completed" for dep_id in dependencies)
+    def _refresh_dependencies(self) -> None:
+        """Dashboard で完了済みの依存タスクを 1 回のスナップショットでまとめて反映する。
+
+        完了通知（complete_task / release_task）を経由せずに完了したタスクを拾うため、
+        新しい待ちタスクが追加された後や、割り当て可能なタスクが尽きたときに呼ぶ。
+        """
+        self._needs_refresh = False
+        if not self._dependents:
+            return
+        status_snapshot = self._build_task_status_snapshot()
+        for dep_id in list(self._dependents):
+            if status_snapshot.get(dep_id) == "completed":
+                self.mark_dependency_completed(dep_id)
+
+    def _peek_ready(self) -> ScheduledTask | None:
+        """割り当て可能なタスクの先頭を返す（無効になった要素は読み捨てる）。"""
+        while self._ready_heap:
+            scheduled = self._ready_heap[0]
+            if (
+                self._task_map.get(scheduled.task_id) is scheduled
+                and scheduled.task_id not in self._assigned_tasks
+            ):
+                return scheduled
+            heapq.heappop(self._ready_heap)
+        return None
 
+    @_queue_operation
     def get_next_task(self) -> str | None:
         """次に実行すべきタスクを取得する（依存関係考慮）。
 
         Returns:
             タスクID、なければNone
         """
-        status_snapshot = self._build_task_status_snapshot()
-        for scheduled in sorted(self._task_queue):
-            if scheduled.task_id in self._assigned_tasks:
-                continue
-            if self._dependencies_satisfied_with_snapshot(scheduled.dependencies, status_snapshot):
-                return scheduled.task_id
-        return None
+        if self._needs_refresh:
+            self._refresh_dependencies()
+        scheduled = self._peek_ready()
+        if scheduled is None and self._dependents:
+            self._refresh_dependencies()
+            scheduled = self._peek_ready()
+        return scheduled.task_id if scheduled else None
 
     def get_idle_workers(self) -> list[str]:
         """空いているWorkerのIDリストを取得する。
@@ -223,6 +581,7 @@ class SchedulerManager:
         idle_workers = self.get_idle_workers()
         return idle_workers[0] if idle_workers else None
 
+    @_queue_operation
     def assign_task(self, task_id: str, worker_id: str) -> tuple[bool, str]:
         """タスクをWorkerに割り当てる。
 
@@ -255,11 +614,11 @@ class SchedulerManager:
         agent.status = "busy"
         agent.current_task = task_id
         agent.last_activity = now
-        if self._persist_agent_state:
-            self._persist_agent_state(agent)
+        self._persist_agent(agent)
 
         # 割り当て
         self._assigned_tasks[task_id] = worker_id
+        self._dirty = True
         assigned, message = self.dashboard_manager.assign_task(task_id, worker_id)
         if not assigned:
             # 反映失敗時は状態を戻して整合性を維持する
@@ -267,13 +626,13 @@ class SchedulerManager:
             agent.status = previous_status
             agent.current_task = previous_task
             agent.last_activity = previous_last_activity
-            if self._persist_agent_state:
-                self._persist_agent_state(agent)
+            self._persist_agent(agent)
             return False, message
 
         logger.info(f"タスク {task_id} を Worker {worker_id} に割り当てました")
         return True, f"タスク {task_id} を Worker {worker_id} に割り当てました"
 
+    @_queue_operation
     def auto_assign(self) -> tuple[str, str] | None:
         """タスクを自動で1つ割り当てる。
 
@@ -293,6 +652,7 @@ class SchedulerManager:
             return (task_id, worker_id)
         return None
 
+    @_queue_operation
     def run_auto_assign_loop(self) -> list[tuple[str, str]]:
         """空いているWorker全てにタスクを割り当てる。
 
@@ -300,13 +660,42 @@ class SchedulerManager:
             割り当てた (task_id, worker_id) のリスト
         """
         assignments = []
-        while True:
-            result = self.auto_assign()
-            if not result:
-                break
-            assignments.append(result)
+        if self._pending_persist is not None:
+            # 外側のループが保存をまとめる
+            while result := self.auto_assign():
+                assignments.append(result)
+            return assignments
+
+        # 割り当てたWorkerの状態はループ後にまとめて保存する。
+        # キューのロックを保持したまま保存するため、他プロセスが保存前の状態で
+        # 同じWorkerに割り当てることはない
+        self._pending_persist = {}
+        try:
+            while result := self.auto_assign():
+                assignments.append(result)
+        finally:
+            pending, self._pending_persist = self._pending_persist, None
+            self._flush_persist(list(pending.values()))
         return assignments
 
+    def _persist_agent(self, agent: "Agent") -> None:
+        """エージェントの状態を永続化する（自動割り当てループ中は保留する）。"""
+        if self._pending_persist is not None:
+            self._pending_persist[agent.id] = agent
+        elif self._persist_agent_state:
+            self._persist_agent_state(agent)
+
+    def _flush_persist(self, agents: list["Agent"]) -> None:
+        """保留していたエージェントの状態をまとめて永続化する。"""
+        if not agents:
+            return
+        if self._persist_agents_state:
+            self._persist_agents_state(agents)
+        elif self._persist_agent_state:
+            for agent in agents:
+                self._persist_agent_state(agent)
+
+    @_queue_operation
     def complete_task(self, task_id: str) -> bool:
         """タスクの完了を記録する。
 
@@ -318,29 +707,93 @@ class SchedulerManager:
         """
         if task_id in self._assigned_tasks:
             del self._assigned_tasks[task_id]
+            self._dirty = True
 
+        self.mark_dependency_completed(task_id)
         return self.dequeue_task(task_id)
 
+    @_queue_operation
+    def release_task(
+        self,
+        task_id: str,
+        worker_id: str | None = None,
+        completed: bool = True,
+    ) -> None:
+        """タスクの終了（completed/failed/cancelled）を反映する。
+
+        キュー上のタスクを取り除き、Worker が空いた時刻を記録する。記録した時刻は
+        イベント起点の自動割り当てで Worker の待ち時間を計測するために使う。
+        completed でない終了（failed/cancelled）では依存待ちのタスクを解放しない。
+        """
+        if completed:
+            self.complete_task(task_id)
+        else:
+            if self._assigned_tasks.pop(task_id, None) is not None:
+                self._dirty = True
+            self.dequeue_task(task_id)
+        if worker_id:
+            self._released_at[worker_id] = datetime.now()
+            self._event_stats["releases"] += 1
+
+    def record_event_assignments(
+        self,
+        assignments: list[tuple[str, str]],
+        baseline_seconds: float,
+    ) -> None:
+        """イベント起点で割り当てたタスクについて Worker の待ち時間を記録する。
+
+        Args:
+            assignments: 割り当てた (task_id, worker_id) のリスト
+            baseline_seconds: イベント起点でない場合に割り当てまでに要すると見込む秒数。
+                実際の待ち時間との差を削減できた待ち時間の推定値として積算する
+        """
+        now = datetime.now()
+        for _, worker_id in assignments:
+            self._event_stats["assignments"] += 1
+            released_at = self._released_at.pop(worker_id, None)
+            if released_at is None:
+                continue
+            gap = max(0.0, (now - released_at).total_seconds())
+            self._event_stats["idle_gap_seconds_total"] += gap
+            self._event_stats["idle_gap_seconds_max"] = max(
+                self._event_stats["idle_gap_seconds_max"], gap
+            )
+            self._event_stats["estimated_saved_seconds"] += max(0.0, baseline_seconds - gap)
+
+    def get_event_assign_stats(self) -> dict:
+        """イベント起点の自動割り当ての統計を返す。"""
+        stats = self._event_stats
+        assignments = int(stats["assignments"])
+        return {
+            "releases": int(stats["releases"]),
+            "assignments": assignments,
+            "avg_idle_gap_seconds": (
+                round(stats["idle_gap_seconds_total"] / assignments, 3) if assignments else None
+            ),
+            "max_idle_gap_seconds": round(stats["idle_gap_seconds_max"], 3),
+            "estimated_saved_seconds": round(stats["estimated_saved_seconds"], 1),
+        }
+
+    @_queue_operation
     def get_queue_status(self) -> dict:
         """キューの状態を取得する。
 
         Returns:
             状態情報の辞書
         """
-        status_snapshot = self._build_task_status_snapshot()
+        self._refresh_dependencies()
         pending = []
-        for scheduled in sorted(self._task_queue):
+        for scheduled in sorted(self._task_map.values()):
             if scheduled.task_id not in self._assigned_tasks:
+                unmet = self._unmet_dependencies.get(scheduled.task_id, set())
                 pending.append(
                     {
                         "task_id": scheduled.task_id,
                         "priority": TaskPriority(scheduled.priority).name,
                         "created_at": scheduled.created_at.isoformat(),
                         "dependencies": scheduled.dependencies,
-                        "dependencies_satisfied": self._dependencies_satisfied_with_snapshot(
-                            scheduled.dependencies,
-                            status_snapshot,
-                        ),
+                        "dependencies_satisfied": not unmet,
+                        "unmet_dependencies": sorted(unmet),
                     }
                 )
 
@@ -352,8 +805,10 @@ class SchedulerManager:
             "pending_tasks": pending,
             "assigned_tasks": assigned,
             "idle_workers": self.get_idle_workers(),
+            "event_auto_assign": self.get_event_assign_stats(),
         }
 
+    @_queue_operation
     def get_task_info(self, task_id: str) -> dict | None:
         """タスクのスケジューラー情報を取得する。
 
@@ -29,12 +29,82 @@ class TmuxManager(TmuxWorkspaceMixin):
 
     def __init__(self, settings: "Settings") -> None:
         self.settings = settings
+        # (session, window) -> ソケット名。Agent.tmux_socket から登録される
+        self._window_sockets: dict[tuple[str, int], str | None] = {}
+
+    def register_window_socket(self, session: str, window: int, socket: str | None) -> None:
+        """ウィンドウが存在する tmux サーバー（ソケット）を登録する。"""
+        self._window_sockets[(session, window)] = socket
+
+    def get_window_socket(self, session: str, window: int) -> str | None:
+        """ウィンドウが存在する tmux サーバーのソケット名を返す（既定サーバーは None）。
+
+        ウィンドウ作成時・Agent の同期時に登録された値のみを使う。設定
+        （tmux_server_count）が後から変わっても既存ウィンドウの接続先は変わらない。
+        """
+        return self._window_sockets.get((session, window))
+
+    def assign_window_socket(self, session: str, window: int) -> str | None:
+        """新規作成するウィンドウの配置先ソケットを返す。
+
+        登録済みのウィンドウはその値を、未登録の場合は現在の tmux_server_count から
+        算出した値を返す（作成後に register_window_socket で登録する）。
+        """
+        key = (session, window)
+        if key in self._window_sockets:
+            return self._window_sockets[key]
+        return tmux_shared.resolve_worker_socket(window, self.settings.tmux_server_count)
+
+    def _socket_args(self, args: tuple[str, ...]) -> list[str]:
+        """コマンド引数のターゲットから接続先サーバーのソケット引数を決定する。"""
+        socket = tmux_shared.current_tmux_socket()
+        if socket is None:
+            socket = self._socket_for_args(args)
+        return tmux_shared.tmux_socket_args(socket)
+
+    def _socket_for_args(self, args: tuple[str, ...]) -> str | None:
+        """``-t`` / ``-s`` の ``session:window[.pane]`` からソケットを解決する。
+
+        window はインデックスのほか、ウィンドウ名（main / 追加Workerウィンドウ名）も受け付ける。
+        """
+        for flag in ("-t", "-s"):
+            if flag in args:
+                index = args.index(flag)
+                if index + 1 < len(args):
+                    target = args[index + 1]
+                    break
+        else:
+            return None
+
+        session, sep, rest = target.partition(":")
+        if not sep:
+            return None
+        window_index = self._window_index_from_target(rest.split(".", 1)[0])
+        if window_index is None:
+            return None
+        return self.get_window_socket(session, window_index)
+
+    def _window_index_from_target(self, window: str) -> int | None:
+        """ターゲットのウィンドウ部分（インデックスまたはウィンドウ名）をインデックスに変換する。
+
+        追加Workerウィンドウは ``{window_name_worker_prefix}{index + 1}`` の名前で作成される。
+        """
+        if window.isdigit():
+            return int(window)
+        if window == self.settings.window_name_main:
+            return 0
+        prefix = self.settings.window_name_worker_prefix
+        number = window[len(prefix) :] if window.startswith(prefix) else ""
+        if number.isdigit() and int(number) >= 2:
+            return int(number) - 1
+        return None
 
     async def _run(self, *args: str) -> tuple[int, str, str]:
         """tmuxコマンドを実行する。"""
         try:
             proc = await asyncio.create_subprocess_exec(
                 "tmux",
+                *self._socket_args(args),
                 *args,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
@@ -48,6 +118,26 @@ class TmuxManager(TmuxWorkspaceMixin):
             logger.error(f"tmux コマンド実行エラー: {e}")
             return 1, "", str(e)
 
+    async def _run_with_input(self, input_data: bytes, *args: str) -> tuple[int, str, str]:
+        """標準入力にデータを渡して tmux コマンドを実行する。"""
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "tmux",
+                *self._socket_args(args),
+                *args,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            stdout, stderr = await proc.communicate(input_data)
+            return proc.returncode or 0, stdout.decode(), stderr.decode()
+        except FileNotFoundError:
+            logger.error("tmux がインストールされていません")
+            return 1, "", "tmux not found"
+        except Exception as e:
+            logger.error(f"tmux コマンド実行エラー: {e}")
+            return 1, "", str(e)
+
     def _get_window_name(self, window_index: int) -> str:
         """ウィンドウインデックスからウィンドウ名を取得する。"""
         if window_index == 0:
@@ -97,8 +187,27 @@ class TmuxManager(TmuxWorkspaceMixin):
         code, _, stderr = await self._run("kill-session", "-t", session_name)
         if code != 0:
             logger.warning(f"セッション終了エラー（既に終了している可能性）: {stderr}")
+
+        # 追加 Worker 用サーバー上の同名セッションも終了する
+        for socket in self._list_shard_sockets():
+            with tmux_shared.use_tmux_socket(socket):
+                shard_code, _, _ = await self._run("kill-session", "-t", session_name)
+            if shard_code == 0:
+                logger.info("tmux サーバー %s のセッション %s を終了しました", socket, session_name)
+        self._window_sockets = {
+            key: value
+            for key, value in getattr(self, "_window_sockets", {}).items()
+            if key[0] != session_name
+        }
         return code == 0
 
+    def _list_shard_sockets(self) -> list[str]:
+        """設定と登録済みウィンドウから追加 Worker 用ソケットを列挙する。"""
+        server_count = getattr(self.settings, "tmux_server_count", 1)
+        sockets = set(tmux_shared.list_worker_sockets(server_count))
+        sockets.update(s for s in getattr(self, "_window_sockets", {}).values() if s)
+        return sorted(sockets)
+
     async def rename_session(self, old_name: str, new_name: str) -> bool:
         """tmux セッション名を変更する。"""
         code, _, stderr = await self._run("rename-session", "-t", old_name, new_name)
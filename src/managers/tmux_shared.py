@@ -1,9 +1,70 @@
 """tmux 管理で共有する定数とユーティリティ。"""
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 MAIN_SESSION = "main"
 MAIN_WINDOW_PANE_ADMIN = 0
 MAIN_WINDOW_WORKER_PANES = [1, 2, 3, 4, 5, 6]
 
+WORKER_SOCKET_PREFIX = "multi-agent-mcp-shard"
+"""追加 Worker ウィンドウを分散配置する tmux サーバーのソケット名プレフィックス"""
+
+_tmux_socket_override: ContextVar[str | None] = ContextVar("tmux_socket_override", default=None)
+
+
+def resolve_worker_socket(window_index: int, server_count: int) -> str | None:
+    """ウィンドウ番号から配置先 tmux サーバーのソケット名を決定する。
+
+    メインウィンドウ（window 0）は常に既定サーバーに置き、
+    追加ウィンドウ（window 1+）を残りのサーバーへラウンドロビンで割り当てる。
+
+    Returns:
+        ソケット名（既定サーバーの場合は None）
+    """
+    if not isinstance(server_count, int) or server_count <= 1 or window_index <= 0:
+        return None
+    shard = ((window_index - 1) % (server_count - 1)) + 1
+    return f"{WORKER_SOCKET_PREFIX}-{shard}"
+
+
+def list_worker_sockets(server_count: int) -> list[str]:
+    """追加 Worker 用 tmux サーバーのソケット名一覧を返す。"""
+    if not isinstance(server_count, int):
+        return []
+    return [f"{WORKER_SOCKET_PREFIX}-{shard}" for shard in range(1, server_count)]
+
+
+def tmux_socket_args(socket: str | None) -> list[str]:
+    """ソケット指定用の tmux 引数を返す（パスなら -S、名前なら -L）。"""
+    if not socket:
+        return []
+    return ["-S", socket] if "/" in socket else ["-L", socket]
+
+
+def current_tmux_socket() -> str | None:
+    """use_tmux_socket で指定中のソケットを返す。"""
+    return _tmux_socket_override.get()
+
+
+@contextmanager
+def use_tmux_socket(socket: str | None) -> Iterator[None]:
+    """このコンテキスト内の tmux コマンドを指定ソケットのサーバーへ向ける。
+
+    セッション単位のコマンド（has-session 等）はターゲットからサーバーを
+    判別できないため、シャード上のセッションを操作する場合に使用する。
+    socket が None の場合は何もしない。
+    """
+    if socket is None:
+        yield
+        return
+    token = _tmux_socket_override.set(socket)
+    try:
+        yield
+    finally:
+        _tmux_socket_override.reset(token)
+
 
 def escape_applescript(value: str) -> str:
     """AppleScript 文字列リテラル用にエスケープする。
@@ -25,9 +86,10 @@ def escape_applescript(value: str) -> str:
 def get_project_name(working_dir: str, enable_git: bool = True) -> str:
     """作業ディレクトリから tmux セッション名を取得する。"""
     import hashlib
-    import subprocess
     from pathlib import Path
 
+    from src.managers.git_paths import locate_git_repository
+
     normalized_dir = Path(working_dir).expanduser().resolve()
     hash_source = str(normalized_dir)
 
@@ -36,19 +98,11 @@ def get_project_name(working_dir: str, enable_git: bool = True) -> str:
         short_hash = hashlib.sha1(hash_source.encode("utf-8")).hexdigest()[:6]
         return f"{base}-{short_hash}"
 
-    result = subprocess.run(
-        ["git", "-C", working_dir, "rev-parse", "--git-common-dir"],
-        capture_output=True,
-        text=True,
-        timeout=5,
-    )
-    if result.returncode != 0:
+    location = locate_git_repository(working_dir)
+    if location is None:
         raise ValueError(f"{working_dir} は git リポジトリではありません")
 
-    git_common_dir = Path(result.stdout.strip())
-    if not git_common_dir.is_absolute():
-        git_common_dir = (Path(working_dir) / git_common_dir).resolve()
-    repo_root = git_common_dir.parent.resolve()
+    repo_root = location.common_dir.parent.resolve()
     base = repo_root.name or "workspace"
     hash_source = str(repo_root)
     short_hash = hashlib.sha1(hash_source.encode("utf-8")).hexdigest()[:6]
@@ -61,22 +115,12 @@ def get_legacy_project_name(working_dir: str, enable_git: bool = True) -> str |
     旧仕様は git モード時のみ suffix なし（repo basename）を採用していた。
     no-git は既に suffix 付きのため移行対象を持たない。
     """
-    import subprocess
-    from pathlib import Path
+    from src.managers.git_paths import locate_git_repository
 
     if not enable_git:
         return None
 
-    result = subprocess.run(
-        ["git", "-C", working_dir, "rev-parse", "--git-common-dir"],
-        capture_output=True,
-        text=True,
-        timeout=5,
-    )
-    if result.returncode != 0:
+    location = locate_git_repository(working_dir)
+    if location is None:
         raise ValueError(f"{working_dir} は git リポジトリではありません")
-
-    git_common_dir = Path(result.stdout.strip())
-    if not git_common_dir.is_absolute():
-        git_common_dir = (Path(working_dir) / git_common_dir).resolve()
-    return git_common_dir.parent.name
+    return location.common_dir.parent.name
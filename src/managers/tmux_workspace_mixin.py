@@ -2,16 +2,21 @@
 
 import asyncio
 import logging
+import os
 import re
 import time
+import uuid
 from typing import TYPE_CHECKING
 
 from src.config.settings import TerminalApp
 from src.config.template_loader import get_template_loader
+from src.managers.pane_log import build_pipe_pane_command
 from src.managers.tmux_shared import (
     MAIN_SESSION,
     MAIN_WINDOW_PANE_ADMIN,
     MAIN_WINDOW_WORKER_PANES,
+    current_tmux_socket,
+    use_tmux_socket,
 )
 
 if TYPE_CHECKING:
@@ -20,6 +25,12 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _consume_exception(future: "asyncio.Future[str]") -> None:
+    """待機者がいない場合の "exception was never retrieved" 警告を抑止する。"""
+    if not future.cancelled():
+        future.exception()
+
+
 class TmuxWorkspaceMixin:
     """tmux ワークスペース構築・ペイン操作機能を提供する mixin。"""
 
@@ -30,6 +41,7 @@ class TmuxWorkspaceMixin:
 
     async def _send_enter_key(self, target: str) -> bool:
         """Enter キーを送信する（C-m 優先、失敗時は Enter をフォールバック）。"""
+        self._invalidate_capture_cache(target)
         code, _, stderr = await self._run("send-keys", "-t", target, "C-m")
         if code == 0:
             return True
@@ -45,6 +57,7 @@ class TmuxWorkspaceMixin:
         """Codex の queue モードから通常入力へ復帰する。"""
         # Codex の "tab to queue message" 表示中は Enter では送信確定しないため、
         # まず Esc で queue 入力をキャンセルし、失敗時は C-c で復帰を試みる。
+        self._invalidate_capture_cache(target)
         code, _, stderr = await self._run("send-keys", "-t", target, "Escape")
         if code == 0:
             return True
@@ -253,14 +266,19 @@ class TmuxWorkspaceMixin:
         window_index: int,
         rows: int = 2,
         cols: int = 6,
+        working_dir: str | None = None,
     ) -> bool:
         """追加Workerウィンドウ（6×2グリッド）を作成する。
 
+        tmux_server_count > 1 の場合は、ウィンドウ番号に対応する別 tmux サーバー
+        （ソケット）上の同名セッションに作成する。
+
         Args:
             project_name: プロジェクト名（セッション名の一部）
             window_index: ウィンドウインデックス（1, 2, ...）
             rows: 行数
             cols: 列数
+            working_dir: 別サーバーにセッションを新規作成する場合の作業ディレクトリ
 
         Returns:
             成功した場合True
@@ -273,11 +291,20 @@ class TmuxWorkspaceMixin:
             lock = asyncio.Lock()
             self._extra_worker_window_lock = lock
 
+        socket = self.assign_window_socket(project_name, window_index)
+        if socket is not None:
+            async with lock:
+                with use_tmux_socket(socket):
+                    return await self._add_sharded_worker_window(
+                        project_name, window_index, window_name, rows, cols, working_dir
+                    )
+
         async with lock:
             # ウィンドウが既に存在するか確認
             windows = await self.list_windows(project_name)
             existing_indices = {w["index"] for w in windows}
             if window_index in existing_indices:
+                self.register_window_socket(project_name, window_index, None)
                 logger.info(f"ウィンドウ {window_index} は既に存在します")
                 return True
 
@@ -286,6 +313,7 @@ class TmuxWorkspaceMixin:
                 project_name, window_name, "追加Workerウィンドウ作成エラー"
             ):
                 return False
+            self.register_window_socket(project_name, window_index, None)
 
             # ウィンドウに pane-base-index を設定（ユーザーのグローバル設定に依存しない）
             window_target = f"{project_name}:{window_name}"
@@ -299,6 +327,60 @@ class TmuxWorkspaceMixin:
             logger.info(f"追加Workerウィンドウ作成完了: {project_name}:{window_name}")
             return True
 
+    async def _add_sharded_worker_window(
+        self,
+        project_name: str,
+        window_index: int,
+        window_name: str,
+        rows: int,
+        cols: int,
+        working_dir: str | None,
+    ) -> bool:
+        """別 tmux サーバー上に追加Workerウィンドウを作成する（use_tmux_socket 内で呼ぶ）。
+
+        ターゲット指定を既定サーバーと揃えるため、ウィンドウ番号は window_index に固定する。
+        """
+        socket = current_tmux_socket()
+        window_target = f"{project_name}:{window_index}"
+        cwd_args = ["-c", working_dir] if working_dir else []
+
+        if await self.session_exists(project_name):
+            windows = await self.list_windows(project_name)
+            if window_index in {w["index"] for w in windows}:
+                self.register_window_socket(project_name, window_index, socket)
+                logger.info(
+                    "ウィンドウ %s は既に存在します（tmux サーバー: %s）", window_index, socket
+                )
+                return True
+            code, _, stderr = await self._run(
+                "new-window", "-t", window_target, "-n", window_name, *cwd_args
+            )
+        else:
+            code, _, stderr = await self._run(
+                "new-session", "-d", "-s", project_name, "-n", window_name, *cwd_args
+            )
+            if code == 0:
+                await self._configure_session_options(project_name)
+                code, _, stderr = await self._run(
+                    "move-window", "-s", f"{project_name}:{window_name}", "-t", window_target
+                )
+        if code != 0:
+            logger.error(f"追加Workerウィンドウ作成エラー（tmux サーバー: {socket}）: {stderr}")
+            return False
+
+        self.register_window_socket(project_name, window_index, socket)
+        await self._run("set-window-option", "-t", window_target, "pane-base-index", "0")
+        if not await self._split_into_grid(project_name, window_index, rows, cols):
+            return False
+
+        logger.info(
+            "追加Workerウィンドウ作成完了: %s:%s（tmux サーバー: %s）",
+            project_name,
+            window_name,
+            socket,
+        )
+        return True
+
     async def _create_named_window(self, session: str, window_name: str, error_prefix: str) -> bool:
         """指定セッションに名前付きウィンドウを作成する。"""
         code, _, stderr = await self._run("new-window", "-t", session, "-n", window_name)
@@ -381,11 +463,21 @@ class TmuxWorkspaceMixin:
             await self._run("send-keys", "-t", target, "C-u")
 
         # コマンド送信
-        if literal:
+        # 大きいペイロードは 1 文字ずつ処理される send-keys -l を避け、
+        # paste-buffer で一括送信する（TUI の再描画回数を抑える）。
+        if literal and self._should_use_paste_buffer(command):
+            code, stderr = await self._paste_to_pane(target, command)
+            if code != 0:
+                logger.warning(
+                    f"paste-buffer 送信に失敗、send-keys へフォールバックします: {stderr}"
+                )
+                code, _, stderr = await self._run("send-keys", "-t", target, "-l", command)
+        elif literal:
             code, _, stderr = await self._run("send-keys", "-t", target, "-l", command)
         else:
             code, _, stderr = await self._run("send-keys", "-t", target, command)
 
+        self._invalidate_capture_cache(target)
         if code != 0:
             logger.error(f"ペインへのキー送信エラー: {stderr}")
             return False
@@ -397,6 +489,36 @@ class TmuxWorkspaceMixin:
         # Enter キーを別途送信
         return await self._send_enter_key(target)
 
+    def _should_use_paste_buffer(self, command: str) -> bool:
+        """paste-buffer 経由で送信すべきサイズかを判定する。"""
+        threshold = getattr(self.settings, "paste_buffer_threshold_bytes", 0)
+        if not isinstance(threshold, int) or threshold <= 0:
+            return False
+        return len(command.encode("utf-8")) >= threshold
+
+    async def _paste_to_pane(self, target: str, text: str) -> tuple[int, str]:
+        """load-buffer（標準入力）と paste-buffer でテキストを一括送信する。
+
+        送信ごとに一意な名前付きバッファを使い、貼り付け後に削除する（-d）。
+        -p によりアプリが bracketed paste を要求している場合は貼り付け扱いとなる。
+
+        Returns:
+            (終了コード, stderr)
+        """
+        buffer_name = f"mcp-send-{uuid.uuid4().hex[:12]}"
+        code, _, stderr = await self._run_with_input(
+            text.encode("utf-8"), "load-buffer", "-b", buffer_name, "-"
+        )
+        if code != 0:
+            return code, stderr
+
+        code, _, stderr = await self._run(
+            "paste-buffer", "-d", "-p", "-b", buffer_name, "-t", target
+        )
+        if code != 0:
+            await self._run("delete-buffer", "-b", buffer_name)
+        return code, stderr
+
     @staticmethod
     def _is_pending_codex_prompt(output: str, command: str) -> bool:
         """Codex プロンプトに未確定入力が残っているか判定する。"""
@@ -588,14 +710,126 @@ class TmuxWorkspaceMixin:
             キャプチャした出力テキスト
         """
         target = self._pane_target(session, window, pane)
+        ttl_seconds = self._capture_cache_ttl_seconds()
+        if ttl_seconds <= 0:
+            return await self._capture_pane_uncached(target, lines)
+
+        # ソケットも含めてキーにする（シャード間で同名ターゲットが重複し得るため）
+        key = (current_tmux_socket(), target, lines)
+        cache, inflight, stats = self._capture_cache_state()
+
+        cached = cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            stats["hits"] += 1
+            return cached[1]
+
+        # 同一キーのキャプチャが実行中なら、その結果を共有する。
+        # キャプチャは呼び出し元とは独立したタスクで実行し、各呼び出し元は shield 越しに
+        # 待つため、ある呼び出し元のキャンセル（タイムアウト等）が他の呼び出し元に波及しない
+        pending = inflight.get(key)
+        if pending is not None:
+            stats["coalesced"] += 1
+        else:
+            stats["misses"] += 1
+            pending = asyncio.ensure_future(
+                self._capture_and_cache(key, target, lines, ttl_seconds)
+            )
+            pending.add_done_callback(_consume_exception)
+            inflight[key] = pending
+        return await asyncio.shield(pending)
 
+    async def _capture_and_cache(
+        self,
+        key: tuple[str | None, str, int],
+        target: str,
+        lines: int,
+        ttl_seconds: float,
+    ) -> str:
+        """共有タスクとしてキャプチャを実行し、結果をキャッシュする。"""
+        cache, inflight, _ = self._capture_cache_state()
+        generation = self._capture_generation
+        current = asyncio.current_task()
+        try:
+            code, output = await self._capture_pane_raw(target, lines)
+        finally:
+            if inflight.get(key) is current:
+                del inflight[key]
+
+        # 失敗結果や、実行中に送信があった（無効化された）結果はキャッシュしない
+        if code == 0 and generation == self._capture_generation:
+            cache[key] = (time.monotonic() + ttl_seconds, output)
+            self._prune_capture_cache(cache)
+        return output
+
+    async def _capture_pane_uncached(self, target: str, lines: int) -> str:
+        """キャッシュを介さずにペインをキャプチャする。"""
+        _, output = await self._capture_pane_raw(target, lines)
+        return output
+
+    async def _capture_pane_raw(self, target: str, lines: int) -> tuple[int, str]:
+        """capture-pane を実行し、(終了コード, 出力) を返す（失敗時の出力は空文字）。"""
         code, stdout, stderr = await self._run(
             "capture-pane", "-t", target, "-p", "-S", f"-{lines}"
         )
         if code != 0:
             logger.error(f"ペインキャプチャエラー: {stderr}")
-            return ""
-        return stdout
+            return code, ""
+        return code, stdout
+
+    def _capture_cache_ttl_seconds(self) -> float:
+        """capture キャッシュの有効期間（秒）を返す。"""
+        ttl_ms = getattr(self.settings, "capture_cache_ttl_ms", 0)
+        if not isinstance(ttl_ms, int) or ttl_ms <= 0:
+            return 0.0
+        return ttl_ms / 1000
+
+    def _capture_cache_state(
+        self,
+    ) -> tuple[
+        dict[tuple[str | None, str, int], tuple[float, str]],
+        dict[tuple[str | None, str, int], "asyncio.Future[str]"],
+        dict[str, int],
+    ]:
+        """capture キャッシュの状態（キャッシュ・実行中・統計）を遅延初期化して返す。"""
+        if not isinstance(getattr(self, "_capture_cache", None), dict):
+            self._capture_cache = {}
+            self._capture_inflight = {}
+            self._capture_stats = {"hits": 0, "misses": 0, "coalesced": 0, "invalidations": 0}
+            self._capture_generation = 0
+        return self._capture_cache, self._capture_inflight, self._capture_stats
+
+    @staticmethod
+    def _prune_capture_cache(
+        cache: dict[tuple[str | None, str, int], tuple[float, str]],
+    ) -> None:
+        """期限切れのキャッシュエントリを削除する。"""
+        now = time.monotonic()
+        expired = [key for key, (expires_at, _) in cache.items() if expires_at <= now]
+        for key in expired:
+            del cache[key]
+
+    def _invalidate_capture_cache(self, target: str) -> None:
+        """指定ターゲットの capture キャッシュを破棄する。
+
+        キー送信直後のキャプチャが送信前の画面を返さないよう、送信系の操作から呼び出す。
+        """
+        cache = getattr(self, "_capture_cache", None)
+        if not isinstance(cache, dict):
+            return
+        self._capture_generation += 1
+        # 送信前に開始したキャプチャへ後続の呼び出しが合流しないようにする
+        for key in [key for key in self._capture_inflight if key[1] == target]:
+            del self._capture_inflight[key]
+        stale = [key for key in cache if key[1] == target]
+        for key in stale:
+            del cache[key]
+        if stale:
+            self._capture_stats["invalidations"] += 1
+
+    def get_capture_cache_stats(self) -> dict[str, int]:
+        """capture キャッシュのヒット・ミス数などの統計を返す。"""
+        cache, inflight, stats = self._capture_cache_state()
+        return {**stats, "entries": len(cache), "inflight": len(inflight)}
 
     async def get_pane_current_command(self, session: str, window: int, pane: int) -> str | None:
         """指定ペインで現在実行中のコマンド名を取得する。
@@ -622,6 +856,116 @@ class TmuxWorkspaceMixin:
         command = stdout.strip()
         return command or None
 
+    async def list_pane_processes(self) -> dict[str, dict[str, int | str | None]] | None:
+        """全ペインの pane_pid と pane_current_command を 1 回の list-panes で取得する。
+
+        use_tmux_socket で指定中のサーバーのペインが対象となる。
+
+        Returns:
+            ``session:window.pane`` をキーとする pane_pid / pane_current_command の辞書
+            （取得失敗時は None）
+        """
+        code, stdout, stderr = await self._run(
+            "list-panes",
+            "-a",
+            "-F",
+            "#{session_name}:#{window_index}.#{pane_index}|#{pane_pid}|#{pane_current_command}",
+        )
+        if code != 0:
+            logger.warning(f"ペイン一覧の取得エラー: {stderr}")
+            return None
+
+        panes: dict[str, dict[str, int | str | None]] = {}
+        for line in stdout.splitlines():
+            parts = line.split("|", 2)
+            if len(parts) != 3:
+                continue
+            target, pane_pid, command = parts
+            panes[target] = {
+                "pane_pid": int(pane_pid) if pane_pid.strip().isdigit() else None,
+                "pane_current_command": command.strip() or None,
+            }
+        return panes
+
+    async def get_pane_activity(
+        self, session: str, window: int, pane: int
+    ) -> dict[str, int | None] | None:
+        """ペインの活動カウンタを取得する（ペイン内容のキャプチャは行わない）。
+
+        ``pane_activity`` は tmux 3.4 未満では空文字になるため None を返す。
+
+        Args:
+            session: セッション名（プレフィックスなし）
+            window: ウィンドウ番号
+            pane: ペインインデックス
+
+        Returns:
+            pane_activity / window_activity / history_size の辞書（取得失敗時は None）
+        """
+        target = self._pane_target(session, window, pane)
+        code, stdout, stderr = await self._run(
+            "display-message",
+            "-p",
+            "-t",
+            target,
+            "#{pane_activity}|#{window_activity}|#{history_size}",
+        )
+        if code != 0:
+            logger.warning(f"ペイン活動情報の取得エラー: {stderr}")
+            return None
+
+        parts = stdout.strip().split("|")
+        if len(parts) != 3:
+            return None
+
+        def _to_int(value: str) -> int | None:
+            value = value.strip()
+            return int(value) if value.isdigit() else None
+
+        return {
+            "pane_activity": _to_int(parts[0]),
+            "window_activity": _to_int(parts[1]),
+            "history_size": _to_int(parts[2]),
+        }
+
+    async def start_pane_log(
+        self, session: str, window: int, pane: int, log_path: str, max_bytes: int
+    ) -> bool:
+        """pipe-pane でペイン出力をログファイルへ追記する。
+
+        既存の pipe があれば置き換える（``-o`` はトグル動作になるため使用しない）。
+
+        Args:
+            session: セッション名（プレフィックスなし）
+            window: ウィンドウ番号
+            pane: ペインインデックス
+            log_path: 追記先ログファイルパス
+            max_bytes: ローテーションする上限バイト数
+
+        Returns:
+            成功した場合True
+        """
+        target = self._pane_target(session, window, pane)
+        try:
+            os.makedirs(os.path.dirname(log_path), exist_ok=True)
+        except OSError as e:
+            logger.warning(f"ペインログディレクトリの作成に失敗: {e}")
+            return False
+
+        command = build_pipe_pane_command(log_path, max_bytes)
+        code, _, stderr = await self._run("pipe-pane", "-t", target, command)
+        if code != 0:
+            logger.warning(f"pipe-pane 開始エラー: {stderr}")
+        return code == 0
+
+    async def stop_pane_log(self, session: str, window: int, pane: int) -> bool:
+        """ペインの pipe-pane を停止する。"""
+        target = self._pane_target(session, window, pane)
+        code, _, stderr = await self._run("pipe-pane", "-t", target)
+        if code != 0:
+            logger.warning(f"pipe-pane 停止エラー: {stderr}")
+        return code == 0
+
     async def set_pane_title(self, session: str, window: int, pane: int, title: str) -> bool:
         """ペインにタイトルを設定する。
 
@@ -688,7 +1032,8 @@ class TmuxWorkspaceMixin:
         Returns:
             ペイン数
         """
-        windows = await self.list_windows(session)
+        with use_tmux_socket(self.get_window_socket(session, window)):
+            windows = await self.list_windows(session)
         for w in windows:
             if w["index"] == window:
                 return w["panes"]
@@ -59,6 +59,9 @@ class Agent(BaseModel):
     )
     window_index: int | None = Field(default=None, description="ウィンドウ番号（0, 1, 2, ...）")
     pane_index: int | None = Field(default=None, description="ウィンドウ内のペインインデックス")
+    tmux_socket: str | None = Field(
+        default=None, description="ペインが存在する tmux サーバーのソケット（None=既定サーバー）"
+    )
     cli_session_name: str | None = Field(
         default=None, description="AI CLI セッション名（必要時のみ）"
     )
@@ -70,6 +73,9 @@ class Agent(BaseModel):
         default=False,
         description="Worker が AI 起動済みかどうか（初回タスク送信後に True）",
     )
+    pane_log_path: str | None = Field(
+        default=None, description="pipe-pane によるペイン出力ログのパス（無効時は None）"
+    )
 
     @property
     def resolved_session_name(self) -> str | None:
@@ -1,5 +1,6 @@
 """Multi-Agent MCP Server エントリーポイント。"""
 
+import asyncio
 import logging
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
@@ -10,8 +11,16 @@ from mcp.server.fastmcp import FastMCP
 from src.config.settings import load_settings_for_project
 from src.context import AppContext
 from src.managers.ai_cli_manager import AiCliManager
+from src.managers.durable_io import set_durability
+from src.managers.io_executor import (
+    configure_io_executor,
+    enable_slow_callback_detection,
+    install_io_executor,
+    shutdown_io_executor,
+)
 from src.managers.tmux_manager import TmuxManager
 from src.tools import register_all_tools
+from src.tools.helpers_managers import ensure_background_supervisor
 
 # ログ設定（stderrに出力）
 logging.basicConfig(
@@ -55,21 +64,39 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
 
     # リソースを初期化
     settings = load_settings_for_project(Path.cwd())
+    set_durability(settings.durability)
+    loop = asyncio.get_running_loop()
+    configure_io_executor(settings.io_executor_max_workers)
+    install_io_executor(loop)
+    if settings.debug_slow_callback_ms > 0:
+        enable_slow_callback_detection(loop, settings.debug_slow_callback_ms / 1000)
     tmux = TmuxManager(settings)
     ai_cli = AiCliManager(settings)
 
     app_ctx = AppContext(settings=settings, tmux=tmux, ai_cli=ai_cli)
+    supervisor = ensure_background_supervisor(app_ctx)
+    await supervisor.start()
     try:
         yield app_ctx
     finally:
         # クリーンアップ
         logger.info("サーバーをシャットダウンしています...")
+        try:
+            await supervisor.stop()
+        except Exception as e:
+            logger.warning(f"バックグラウンドジョブ停止時に警告: {e}")
+
         try:
             from src.managers.healthcheck_daemon import stop_healthcheck_daemon
 
             await stop_healthcheck_daemon(app_ctx)
         except Exception as e:
             logger.warning(f"healthcheck daemon 停止時に警告: {e}")
+        # 停止できなかった daemon タスクもイベントループ終了前にキャンセルして回収する
+        daemon_task = app_ctx.healthcheck_daemon_task
+        if daemon_task is not None and not daemon_task.done():
+            daemon_task.cancel()
+            await asyncio.gather(daemon_task, return_exceptions=True)
 
         # best-effort: 次回起動時のリカバリ用に現在状態をファイルに保存
         try:
@@ -77,6 +104,8 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
         except Exception as e:
             logger.warning(f"シャットダウン状態の保存に失敗: {e}")
 
+        shutdown_io_executor()
+
         # サーバー停止時に tmux セッションを強制終了しない。
         # セッション終了は cleanup_workspace / cleanup_on_completion で明示的に行う。
         logger.info("tmux セッションの自動クリーンアップはスキップしました")
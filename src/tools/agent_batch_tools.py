@@ -15,9 +15,11 @@ from mcp.server.fastmcp import Context, FastMCP
 from src.managers.tmux_manager import MAIN_WINDOW_WORKER_PANES, get_project_name
 from src.models.agent import Agent, AgentRole, AgentStatus
 from src.tools.agent_helpers import (
+    _attach_pane_log,
     _create_worktree_for_worker,
     _post_create_agent,
     _send_task_to_worker,
+    _window_socket_for_agent,
     build_worker_task_branch,
     resolve_worker_number_from_slot,
 )
@@ -220,6 +222,7 @@ async def _setup_worker_tmux_pane(
                 window_index=window_index,
                 rows=settings.extra_worker_rows,
                 cols=settings.extra_worker_cols,
+                working_dir=repo_path,
             )
             if not ok:
                 return None, {
@@ -244,6 +247,7 @@ async def _setup_worker_tmux_pane(
         session_name=project_name,
         window_index=window_index,
         pane_index=pane_index,
+        tmux_socket=_window_socket_for_agent(tmux, project_name, window_index),
         ai_cli=worker_cli,
         created_at=now,
         last_activity=now,
@@ -337,6 +341,7 @@ async def _create_single_worker(
             agent.id,
             agent.tmux_session,
         )
+        await _attach_pane_log(app_ctx, agent)
         post_result = _post_create_agent(app_ctx, agent, agents)
 
         dispatch = await _assign_and_dispatch_task(
@@ -14,6 +14,7 @@ if TYPE_CHECKING:
 from src.config.settings import AICli, Settings
 from src.config.workflow_guides import get_role_template_path
 from src.context import AppContext
+from src.managers.pane_log import get_pane_log_path
 from src.managers.tmux_manager import (
     MAIN_WINDOW_PANE_ADMIN,
     MAIN_WINDOW_WORKER_PANES,
@@ -27,6 +28,7 @@ from src.tools.helpers import (
     get_enable_git_from_config,
     get_mcp_tool_prefix_from_config,
     resolve_main_repo_root,
+    resolve_project_root,
     save_agent_to_file,
     search_memory_context,
 )
@@ -276,6 +278,12 @@ def _validate_agent_creation(
     return agent_role, selected_cli, None
 
 
+def _window_socket_for_agent(tmux, session_name: str, window_index: int) -> str | None:
+    """ウィンドウ作成時に登録された tmux ソケット（Agent.tmux_socket に記録する値）を返す。"""
+    socket = tmux.get_window_socket(session_name, window_index)
+    return socket if isinstance(socket, str) else None
+
+
 async def _determine_pane_position(
     tmux,
     agents: dict[str, Agent],
@@ -289,7 +297,7 @@ async def _determine_pane_position(
 
     Returns:
         成功時: {"success": True, "session_name", "window_index", "pane_index",
-                "tmux_session", "log_location"}
+                "tmux_session", "tmux_socket", "log_location"}
         失敗時: {"success": False, "error": ...}
     """
     project_name = get_project_name(working_dir, enable_git=settings.enable_git)
@@ -301,6 +309,7 @@ async def _determine_pane_position(
             "window_index": None,
             "pane_index": None,
             "tmux_session": None,
+            "tmux_socket": None,
             "log_location": "tmux なし（起点の AI CLI（Owner））",
         }
 
@@ -325,6 +334,7 @@ async def _determine_pane_position(
                 window_index=window_index,
                 rows=settings.extra_worker_rows,
                 cols=settings.extra_worker_cols,
+                working_dir=working_dir,
             )
             if not ok:
                 return {
@@ -336,6 +346,7 @@ async def _determine_pane_position(
         session_name, window_index, pane_index, f"{agent_role.value}-{agent_id}"
     )
     tmux_session = f"{session_name}:{window_index}.{pane_index}"
+    tmux_socket = _window_socket_for_agent(tmux, session_name, window_index)
 
     return {
         "success": True,
@@ -343,10 +354,51 @@ async def _determine_pane_position(
         "window_index": window_index,
         "pane_index": pane_index,
         "tmux_session": tmux_session,
-        "log_location": tmux_session,
+        "tmux_socket": tmux_socket,
+        "log_location": (
+            f"{tmux_session}（tmux -L {tmux_socket}）" if tmux_socket else tmux_session
+        ),
     }
 
 
+async def _attach_pane_log(app_ctx: AppContext, agent: Agent) -> bool:
+    """設定が有効な場合、エージェントのペインへ pipe-pane ログを接続する。
+
+    成功時は agent.pane_log_path を設定する（ファイル保存は呼び出し側で行う）。
+
+    Returns:
+        ペインログを接続した場合 True
+    """
+    settings = app_ctx.settings
+    if not settings.pane_log_enabled:
+        return False
+    if agent.session_name is None or agent.window_index is None or agent.pane_index is None:
+        return False
+    if not app_ctx.session_id:
+        logger.info(f"エージェント {agent.id} のペインログ接続をスキップ（session_id 未設定）")
+        return False
+
+    try:
+        base_dir = resolve_project_root(app_ctx)
+    except ValueError:
+        base_dir = app_ctx.project_root or agent.working_dir
+    if not base_dir:
+        return False
+
+    log_path = get_pane_log_path(base_dir, settings.mcp_dir, app_ctx.session_id, agent.id)
+    ok = await app_ctx.tmux.start_pane_log(
+        agent.session_name,
+        agent.window_index,
+        agent.pane_index,
+        log_path,
+        settings.pane_log_max_bytes,
+    )
+    if ok:
+        agent.pane_log_path = log_path
+        logger.info(f"エージェント {agent.id} のペインログを接続しました: {log_path}")
+    return bool(ok)
+
+
 def _post_create_agent(
     app_ctx: AppContext,
     agent: Agent,
@@ -751,6 +803,10 @@ def _record_dispatch_success(
     if dispatch_mode == "bootstrap":
         agent.ai_bootstrapped = True
     save_agent_to_file(app_ctx, agent)
+    # 起動直後の異常を早く検知できるよう、daemon の確認を前倒しする
+    scheduler = getattr(app_ctx, "healthcheck_scheduler", None)
+    if scheduler is not None:
+        scheduler.mark_urgent(agent.id, "dispatched")
     dashboard = ensure_dashboard_manager(app_ctx)
     dashboard.save_markdown_dashboard(project_root, session_id)
     try:
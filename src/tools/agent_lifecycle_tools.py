@@ -11,8 +11,10 @@ from mcp.server.fastmcp import Context, FastMCP
 
 from src.config.settings import AICli, TerminalApp
 from src.config.template_loader import get_template_loader
+from src.managers.tmux_shared import use_tmux_socket
 from src.models.agent import Agent, AgentRole, AgentStatus
 from src.tools.agent_helpers import (
+    _attach_pane_log,
     _determine_pane_position,
     _post_create_agent,
     _resolve_tmux_session_name,
@@ -163,6 +165,7 @@ def register_lifecycle_tools(mcp: FastMCP) -> None:
             session_name=pane_result["session_name"],
             window_index=pane_result["window_index"],
             pane_index=pane_result["pane_index"],
+            tmux_socket=pane_result.get("tmux_socket"),
             ai_cli=selected_cli,
             created_at=now,
             last_activity=now,
@@ -173,6 +176,9 @@ def register_lifecycle_tools(mcp: FastMCP) -> None:
             f"エージェント {agent_id}（{role}）を作成しました: {pane_result['log_location']}"
         )
 
+        # ペインログ接続（MCP_PANE_LOG_ENABLED=true の場合のみ）
+        await _attach_pane_log(app_ctx, agent)
+
         # 後処理（IPC登録、ファイル保存、レジストリ、ダッシュボード）
         post_result = _post_create_agent(app_ctx, agent, agents)
 
@@ -316,10 +322,15 @@ def register_lifecycle_tools(mcp: FastMCP) -> None:
             await tmux.send_keys_to_pane(
                 agent.session_name, agent.window_index, agent.pane_index, "", literal=False
             )
-            session_name = agent.session_name
-            window_name = tmux._get_window_name(agent.window_index)
-            target = f"{session_name}:{window_name}.{agent.pane_index}"
-            await tmux._run("send-keys", "-t", target, "C-c")
+            target = f"{agent.session_name}:{agent.window_index}.{agent.pane_index}"
+            with use_tmux_socket(
+                agent.tmux_socket if isinstance(agent.tmux_socket, str) else None
+            ):
+                await tmux._run("send-keys", "-t", target, "C-c")
+            if agent.pane_log_path:
+                await tmux.stop_pane_log(
+                    agent.session_name, agent.window_index, agent.pane_index
+                )
             # ペインタイトルをクリア
             await tmux.set_pane_title(
                 agent.session_name, agent.window_index, agent.pane_index, "(empty)"
@@ -18,6 +18,8 @@ from mcp.server.fastmcp import Context, FastMCP
 
 from src.config.settings import AICli
 from src.config.workflow_guides import get_role_template_path
+from src.managers.io_executor import run_blocking
+from src.managers.pane_log import read_agent_pane_log
 from src.models.agent import AgentRole, AgentStatus
 from src.models.dashboard import TaskStatus
 from src.tools.agent_helpers import (
@@ -39,6 +41,7 @@ from src.tools.helpers import (
     require_permission,
     resolve_main_repo_root,
     save_agent_to_file,
+    save_agents_to_file,
     search_memory_context,
     sync_agents_from_file,
 )
@@ -96,6 +99,11 @@ def _audit_command_guard(
     logger.warning("command_guard=%s", payload)
 
 
+# 代替スクリーンで画面を再描画する CLI。ペインログは描画前のバイト列のため、
+# ANSI を除去しても表示中の画面にはならない
+_FULL_SCREEN_TUI_CLIS = frozenset({AICli.CODEX.value})
+
+
 def _resolve_cli_name_for_dispatch(agent: Agent, app_ctx: AppContext) -> str:
     """送信時に使用する CLI 名を正規化して解決する。"""
     # Worker は agents.json 上の stale ai_cli より .env 設定を優先する。
@@ -230,7 +238,10 @@ def register_tools(mcp: FastMCP) -> None:
             caller_agent_id: 呼び出し元エージェントID（必須）
 
         Returns:
-            出力内容（success, agent_id, lines, output または error）
+            出力内容（success, agent_id, lines, output, source または error）。
+            source が "pane_log" の場合、output はペインの出力ストリームから
+            ANSI を除去したもので、描画後の画面とは一致しないことがある。
+            全画面 TUI の CLI（Codex）は常に capture-pane（source: "tmux"）で取得する。
         """
         app_ctx, role_error = require_permission(
             ctx,
@@ -261,9 +272,17 @@ def register_tools(mcp: FastMCP) -> None:
                 "error": f"エージェント {agent_id} は tmux ペインに配置されていません",
             }
 
-        output = await tmux.capture_pane_by_index(
-            agent.session_name, agent.window_index, agent.pane_index, lines
-        )
+        # ペインログがあればファイルから読み出す（capture-pane の往復を省略）。
+        # 全画面 TUI はログが画面と一致しないため capture-pane を使う
+        output = None
+        source = "pane_log"
+        if _resolve_cli_name_for_dispatch(agent, app_ctx) not in _FULL_SCREEN_TUI_CLIS:
+            output = await run_blocking(read_agent_pane_log, agent, lines)
+        if output is None:
+            output = await tmux.capture_pane_by_index(
+                agent.session_name, agent.window_index, agent.pane_index, lines
+            )
+            source = "tmux"
 
         # Claude の statusLine からのみ実測コストを取得
         try:
@@ -282,6 +301,7 @@ def register_tools(mcp: FastMCP) -> None:
             "agent_id": agent_id,
             "lines": lines,
             "output": output,
+            "source": source,
         }
 
     async def _resolve_worker_task_id(
@@ -876,6 +896,7 @@ def register_tools(mcp: FastMCP) -> None:
 
         results: dict[str, bool] = {}
         now = datetime.now()
+        updated_agents = []
 
         for aid, agent in agents.items():
             if target_role and agent.role != target_role:
@@ -897,8 +918,10 @@ def register_tools(mcp: FastMCP) -> None:
 
             if success:
                 agent.last_activity = now
-                # ファイルに保存（MCP インスタンス間で共有）
-                save_agent_to_file(app_ctx, agent)
+                updated_agents.append(agent)
+
+        # ファイルにまとめて保存（MCP インスタンス間で共有）
+        save_agents_to_file(app_ctx, updated_agents)
 
         success_count = sum(1 for v in results.values() if v)
         total_count = len(results)
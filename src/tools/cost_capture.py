@@ -5,6 +5,7 @@ from __future__ import annotations
 import re
 from typing import Any
 
+from src.managers.pane_log import read_agent_pane_log
 from src.models.agent import Agent, AgentRole
 from src.tools.agent_helpers import resolve_worker_number_from_slot
 from src.tools.helpers import ensure_dashboard_manager
@@ -35,7 +36,10 @@ async def capture_claude_actual_cost_for_agent(
     task_id: str | None = None,
     capture_lines: int = 80,
 ) -> dict[str, Any] | None:
-    """対象エージェントの pane から Claude 実測コストを取り込む。"""
+    """対象エージェントの pane から Claude 実測コストを取り込む。
+
+    ペインログが有効な場合は capture-pane の代わりにログ末尾を参照する。
+    """
     agent_cli = agent.ai_cli or app_ctx.ai_cli.get_default_cli()
     cli_value = agent_cli.value if hasattr(agent_cli, "value") else str(agent_cli)
     if cli_value != "claude":
@@ -43,12 +47,14 @@ async def capture_claude_actual_cost_for_agent(
     if agent.session_name is None or agent.window_index is None or agent.pane_index is None:
         return None
 
-    output = await app_ctx.tmux.capture_pane_by_index(
-        agent.session_name,
-        agent.window_index,
-        agent.pane_index,
-        capture_lines,
-    )
+    output = read_agent_pane_log(agent, capture_lines)
+    if output is None:
+        output = await app_ctx.tmux.capture_pane_by_index(
+            agent.session_name,
+            agent.window_index,
+            agent.pane_index,
+            capture_lines,
+        )
     parsed = extract_claude_statusline_cost(output)
     if not parsed:
         return None
@@ -6,6 +6,7 @@ from typing import Any
 
 from mcp.server.fastmcp import Context, FastMCP
 
+from src.managers.background_jobs import notify_task_terminal
 from src.models.agent import AgentRole, AgentStatus
 from src.models.dashboard import TaskStatus, normalize_task_id
 from src.models.message import MessagePriority, MessageType
@@ -306,6 +307,12 @@ def register_tools(mcp: FastMCP) -> None:
                         assigned.status = AgentStatus.IDLE
                     assigned.last_activity = datetime.now()
                     save_agent_to_file(app_ctx, assigned)
+            notify_task_terminal(
+                app_ctx,
+                task_id,
+                task.assigned_agent_id if task else None,
+                completed=task_status == TaskStatus.COMPLETED,
+            )
 
         return {
             "success": success,
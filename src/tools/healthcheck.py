@@ -1,12 +1,16 @@
 """ヘルスチェック管理ツール。"""
 
 import logging
+import os
 import shlex
 from datetime import datetime
 from typing import Any
 
 from mcp.server.fastmcp import Context, FastMCP
 
+from src.managers.healthcheck_daemon import is_healthcheck_daemon_running
+from src.managers.healthcheck_metrics import read_metrics_snapshot
+from src.managers.tmux_shared import use_tmux_socket
 from src.tools.helpers import ensure_healthcheck_manager, require_permission
 
 logger = logging.getLogger(__name__)
@@ -45,6 +49,9 @@ async def execute_full_recovery(app_ctx, agent_id: str) -> dict[str, Any]:
     old_session_name = old_agent.session_name
     old_window_index = old_agent.window_index
     old_pane_index = old_agent.pane_index
+    old_tmux_socket = getattr(old_agent, "tmux_socket", None)
+    if not isinstance(old_tmux_socket, str):
+        old_tmux_socket = None
     enable_git = bool(getattr(app_ctx.settings, "enable_git", True))
 
     from src.tools.helpers import ensure_dashboard_manager
@@ -96,9 +103,9 @@ async def execute_full_recovery(app_ctx, agent_id: str) -> dict[str, Any]:
 
     if old_session_name is not None and old_window_index is not None and old_pane_index is not None:
         try:
-            window_name = tmux._get_window_name(old_window_index)
-            target = f"{old_session_name}:{window_name}.{old_pane_index}"
-            await tmux._run("send-keys", "-t", target, "C-c")
+            target = f"{old_session_name}:{old_window_index}.{old_pane_index}"
+            with use_tmux_socket(old_tmux_socket):
+                await tmux._run("send-keys", "-t", target, "C-c")
         except Exception as e:
             logger.warning(f"tmux ペインへの割り込み送信に失敗: {e}")
 
@@ -170,6 +177,7 @@ async def execute_full_recovery(app_ctx, agent_id: str) -> dict[str, Any]:
         session_name=old_session_name,
         window_index=old_window_index,
         pane_index=old_pane_index,
+        tmux_socket=old_tmux_socket,
     )
     agents[new_agent_id] = new_agent
     save_agent_to_file(app_ctx, new_agent)
@@ -184,16 +192,16 @@ async def execute_full_recovery(app_ctx, agent_id: str) -> dict[str, Any]:
         and recovery_dir
     ):
         try:
-            window_name = tmux._get_window_name(old_window_index)
-            target = f"{old_session_name}:{window_name}.{old_pane_index}"
+            target = f"{old_session_name}:{old_window_index}.{old_pane_index}"
             quoted_recovery_dir = shlex.quote(str(recovery_dir))
-            await tmux._run(
-                "send-keys",
-                "-t",
-                target,
-                f"cd {quoted_recovery_dir}",
-                "Enter",
-            )
+            with use_tmux_socket(old_tmux_socket):
+                await tmux._run(
+                    "send-keys",
+                    "-t",
+                    target,
+                    f"cd {quoted_recovery_dir}",
+                    "Enter",
+                )
             await tmux.set_pane_title(
                 old_session_name, old_window_index, old_pane_index, new_agent_id
             )
@@ -469,3 +477,115 @@ def register_tools(mcp: FastMCP) -> None:
                 f"escalated={len(result['escalated'])}, skipped={len(result['skipped'])}"
             ),
         }
+
+    @mcp.tool()
+    async def get_healthcheck_schedule(
+        caller_agent_id: str | None = None,
+        ctx: Context = None,
+    ) -> dict[str, Any]:
+        """healthcheck daemon の Worker ごとの確認スケジュールを取得する。
+
+        ※ Owner と Admin のみ使用可能。
+
+        Args:
+            caller_agent_id: 呼び出し元エージェントID（必須）
+
+        Returns:
+            スケジュール（success, daemon_running, schedule）。
+            schedule は次回確認が近い順で、各要素は agent_id, reason
+            （new/dispatched/recovered/suspect/stall_suspect/busy/idle）,
+            interval_seconds, next_check_in_seconds, probes を含む
+        """
+        app_ctx, role_error = require_permission(ctx, "get_healthcheck_schedule", caller_agent_id)
+        if role_error:
+            return role_error
+
+        scheduler = app_ctx.healthcheck_scheduler
+        schedule = scheduler.snapshot() if scheduler is not None else []
+        return {
+            "success": True,
+            "daemon_running": is_healthcheck_daemon_running(app_ctx),
+            "schedule": schedule,
+        }
+
+    @mcp.tool()
+    async def get_healthcheck_metrics(
+        caller_agent_id: str | None = None,
+        ctx: Context = None,
+    ) -> dict[str, Any]:
+        """ヘルスチェック監視サイクルの計測値を取得する。
+
+        ※ Owner と Admin のみ使用可能。
+
+        daemon は 1 つの MCP プロセスでのみ動作するため、このプロセスで daemon が
+        動いていない場合は、daemon が監視サイクルごとにセッションディレクトリへ保存した
+        スナップショット（healthcheck_metrics.json）を返す。
+
+        Args:
+            caller_agent_id: 呼び出し元エージェントID（必須）
+
+        Returns:
+            計測値（success, daemon_running, source, pid, saved_at, metrics, prometheus_file）。
+            daemon_running はこのプロセスで daemon が稼働中か。source は計測値の取得元
+            （this_process: このプロセスのメモリ / snapshot_file: 保存済みスナップショット）、
+            pid は計測したプロセスの PID、saved_at はスナップショットの保存時刻
+            （this_process の場合は None）。
+            metrics はサイクル数・overrun 回数・サイクル所要時間と段階別所要時間の
+            ヒストグラム・Worker ごとの診断レイテンシ・復旧結果の累計・直近サイクルの内訳を含む。
+            prometheus_file は Prometheus テキストの出力先（無効時は None）
+        """
+        app_ctx, role_error = require_permission(ctx, "get_healthcheck_metrics", caller_agent_id)
+        if role_error:
+            return role_error
+
+        healthcheck = ensure_healthcheck_manager(app_ctx)
+        metrics_file = getattr(healthcheck, "metrics_file", None)
+        daemon_running = is_healthcheck_daemon_running(app_ctx)
+        response: dict[str, Any] = {
+            "success": True,
+            "daemon_running": daemon_running,
+            "source": "this_process",
+            "pid": os.getpid(),
+            "saved_at": None,
+            "metrics": healthcheck.metrics.snapshot(),
+            "prometheus_file": str(metrics_file) if metrics_file else None,
+        }
+        snapshot_file = getattr(healthcheck, "metrics_snapshot_file", None)
+        if not daemon_running and snapshot_file is not None:
+            saved = read_metrics_snapshot(snapshot_file)
+            if saved is not None:
+                response.update(
+                    source="snapshot_file",
+                    pid=saved.get("pid"),
+                    saved_at=saved.get("saved_at"),
+                    metrics=saved["metrics"],
+                )
+        return response
+
+    @mcp.tool()
+    async def get_background_jobs(
+        caller_agent_id: str | None = None,
+        ctx: Context = None,
+    ) -> dict[str, Any]:
+        """サーバー常駐のバックグラウンドジョブの状態と実行統計を取得する。
+
+        ※ Owner と Admin のみ使用可能。
+
+        Args:
+            caller_agent_id: 呼び出し元エージェントID（必須）
+
+        Returns:
+            ジョブ一覧（success, running, jobs）。
+            各ジョブは name, state（pending/idle/running/backoff/stopped）, interval_seconds,
+            runs, failures, consecutive_failures, restarts, triggers, 所要時間, last_error を含む
+        """
+        app_ctx, role_error = require_permission(ctx, "get_background_jobs", caller_agent_id)
+        if role_error:
+            return role_error
+
+        supervisor = app_ctx.background_supervisor
+        return {
+            "success": True,
+            "running": supervisor is not None and supervisor.running,
+            "jobs": supervisor.snapshot() if supervisor is not None else [],
+        }
@@ -14,6 +14,8 @@ from typing import Any
 
 from src.config.settings import load_effective_settings_for_project, resolve_project_env_file
 from src.context import AppContext
+from src.managers.durable_io import set_durability
+from src.managers.io_executor import run_blocking
 from src.models.agent import AgentRole
 
 logger = logging.getLogger(__name__)
@@ -56,6 +58,7 @@ def refresh_app_settings(app_ctx: AppContext, project_root: str) -> None:
     app_ctx.settings = settings
     app_ctx.ai_cli.settings = settings
     app_ctx.tmux.settings = settings
+    set_durability(settings.durability)
     if app_ctx.healthcheck_manager is not None:
         app_ctx.healthcheck_manager.healthcheck_interval_seconds = (
             settings.healthcheck_interval_seconds
@@ -467,7 +470,8 @@ async def _send_macos_notification(msg_type_value: str, sender_id: str) -> bool:
     try:
         notification_title = escape_applescript("Multi-Agent MCP")
         notification_body = escape_applescript(f"[IPC] {msg_type_value} from {sender_id}")
-        subprocess.run(
+        await run_blocking(
+            subprocess.run,
             [
                 "osascript",
                 "-e",
@@ -597,9 +601,11 @@ def get_admin_poll_state(app_ctx: AppContext, admin_id: str) -> dict[str, Any]:
 from src.tools.helpers_git import resolve_main_repo_root  # noqa: E402
 from src.tools.helpers_managers import (  # noqa: E402, F401
     _global_memory_manager,
+    ensure_background_supervisor,
     ensure_dashboard_manager,
     ensure_global_memory_manager,
     ensure_healthcheck_manager,
+    ensure_healthcheck_scheduler,
     ensure_ipc_manager,
     ensure_memory_manager,
     ensure_persona_manager,
@@ -614,6 +620,7 @@ from src.tools.helpers_persistence import (  # noqa: E402, F401
     load_agents_from_file,
     remove_agent_from_file,
     save_agent_to_file,
+    save_agents_to_file,
     sync_agents_from_file,
 )
 from src.tools.helpers_registry import (  # noqa: E402, F401
@@ -628,7 +635,10 @@ from src.tools.helpers_registry import (  # noqa: E402, F401
     get_project_root_from_registry,
     get_session_id_from_config,
     get_session_id_from_registry,
+    prune_registry,
+    read_agent_registry_entry,
     remove_agent_from_registry,
     remove_agents_by_owner,
     save_agent_to_registry,
+    save_agents_to_registry,
 )
@@ -9,20 +9,27 @@ sentinel 値パターンは既存の `is None` チェック・テスト・型ア
 import logging
 import os
 from pathlib import Path
+from typing import TypeVar
 
 from src.context import AppContext
+from src.managers.background_jobs import register_default_jobs
+from src.managers.background_supervisor import BackgroundSupervisor
 from src.managers.dashboard_manager import DashboardManager
 from src.managers.gtrconfig_manager import GtrconfigManager
-from src.managers.healthcheck_manager import HealthcheckManager
+from src.managers.healthcheck_manager import HEALTHCHECK_STATE_FILE_NAME, HealthcheckManager
+from src.managers.healthcheck_metrics import METRICS_FILE_NAME, METRICS_SNAPSHOT_FILE_NAME
+from src.managers.healthcheck_scheduler import HealthcheckScheduler
 from src.managers.ipc_manager import IPCManager
 from src.managers.memory_manager import MemoryManager
 from src.managers.persona_manager import PersonaManager
-from src.managers.scheduler_manager import SchedulerManager
+from src.managers.scheduler_manager import SCHEDULER_STATE_FILE_NAME, SchedulerManager
 from src.managers.worktree_manager import WorktreeManager
 from src.tools.helpers_registry import ensure_session_id
 
 logger = logging.getLogger(__name__)
 
+_ManagerT = TypeVar("_ManagerT")
+
 
 def get_worktree_manager(app_ctx: AppContext, repo_path: str) -> WorktreeManager:
     """指定リポジトリのWorktreeManagerを取得または作成する。"""
@@ -38,14 +45,69 @@ def get_gtrconfig_manager(app_ctx: AppContext, project_path: str) -> GtrconfigMa
     return app_ctx.gtrconfig_managers[project_path]
 
 
+def _manager_identity(
+    app_ctx: AppContext, session_scoped: bool = True
+) -> tuple[str, str | None, str, bool] | None:
+    """マネージャーの参照先を決める入力（project_root, session_id, mcp_dir, enable_git）。
+
+    project_root（セッション単位のマネージャーでは session_id も）が未確定なら None。
+    """
+    project_root = app_ctx.project_root
+    session_id = app_ctx.session_id if session_scoped else None
+    if not isinstance(project_root, str) or not project_root:
+        return None
+    if session_scoped and (not isinstance(session_id, str) or not session_id):
+        return None
+    settings = app_ctx.settings
+    return (project_root, session_id, settings.mcp_dir, bool(settings.enable_git))
+
+
+def _cached_manager(
+    app_ctx: AppContext, name: str, current: _ManagerT | None, session_scoped: bool = True
+) -> _ManagerT | None:
+    """前回と同じ識別キーで生成済みのマネージャーがあれば返す（無ければ None）。"""
+    identities = getattr(app_ctx, "_manager_identities", None)
+    if current is None or not isinstance(identities, dict):
+        return None
+    entry = identities.get(name)
+    if (
+        entry is None
+        or entry[1] is not current
+        or entry[2] is not app_ctx.settings
+        or entry[0] != _manager_identity(app_ctx, session_scoped)
+    ):
+        return None
+    return current
+
+
+def _remember_manager(
+    app_ctx: AppContext, name: str, manager: object, session_scoped: bool = True
+) -> None:
+    """マネージャーを現在の識別キーと対応付けて記録する。"""
+    identities = getattr(app_ctx, "_manager_identities", None)
+    if not isinstance(identities, dict):
+        return
+    identity = _manager_identity(app_ctx, session_scoped)
+    if identity is None:
+        identities.pop(name, None)
+    else:
+        identities[name] = (identity, manager, app_ctx.settings)
+
+
 def ensure_ipc_manager(app_ctx: AppContext) -> IPCManager:
     """IPCManagerが初期化されていることを確認する。
 
     worktree 内で実行されている場合でも、メインリポジトリの IPC ディレクトリを使用する。
 
+    前回と同じ (project_root, session_id, mcp_dir) で生成済みなら、パスを解決せずに返す。
+
     Raises:
         ValueError: project_root が設定されていない場合
     """
+    cached = _cached_manager(app_ctx, "ipc", app_ctx.ipc_manager)
+    if cached is not None:
+        return cached
+
     from src.tools.helpers import resolve_project_root
 
     try:
@@ -86,6 +148,7 @@ def ensure_ipc_manager(app_ctx: AppContext) -> IPCManager:
     if not reuse_current:
         app_ctx.ipc_manager = IPCManager(ipc_dir)
         app_ctx.ipc_manager.initialize()
+    _remember_manager(app_ctx, "ipc", app_ctx.ipc_manager)
     return app_ctx.ipc_manager
 
 
@@ -96,10 +159,15 @@ def ensure_dashboard_manager(app_ctx: AppContext) -> DashboardManager:
     注意: initialize() は呼ばない。ディレクトリ・ファイル作成は
     init_tmux_workspace（Owner のみ）で明示的に行う。
     Worker の MCP プロセスからはファイル読み取りのみ安全に行える。
+    前回と同じ (project_root, session_id, mcp_dir) で生成済みなら、パスを解決せずに返す。
 
     Raises:
         ValueError: project_root または session_id が設定されていない場合
     """
+    cached = _cached_manager(app_ctx, "dashboard", app_ctx.dashboard_manager)
+    if cached is not None:
+        return cached
+
     from src.tools.helpers import resolve_project_root
 
     base_dir = resolve_project_root(app_ctx)
@@ -148,26 +216,60 @@ def ensure_dashboard_manager(app_ctx: AppContext) -> DashboardManager:
         )
     else:
         app_ctx.dashboard_manager.settings = app_ctx.settings
+    _remember_manager(app_ctx, "dashboard", app_ctx.dashboard_manager)
     return app_ctx.dashboard_manager
 
 
 def ensure_scheduler_manager(app_ctx: AppContext) -> SchedulerManager:
-    """SchedulerManagerが初期化されていることを確認する。"""
-    if app_ctx.scheduler_manager is None:
-        from src.tools.helpers_persistence import save_agent_to_file
+    """SchedulerManagerが初期化されていることを確認する。
 
-        dashboard = ensure_dashboard_manager(app_ctx)
+    キューはセッションディレクトリのファイルで Owner / Admin など他の MCP プロセスと
+    共有する。セッションが切り替わった場合は新しいセッションのキューで作り直す。
+    """
+    dashboard = ensure_dashboard_manager(app_ctx)
+    scheduler = app_ctx.scheduler_manager
+    if (
+        scheduler is None
+        or scheduler.dashboard_manager is not dashboard
+        or getattr(scheduler, "state_file", None) is None
+    ):
+        from src.tools.helpers_persistence import save_agent_to_file, save_agents_to_file
+
+        state_file = Path(dashboard.dashboard_dir).parent / SCHEDULER_STATE_FILE_NAME
         app_ctx.scheduler_manager = SchedulerManager(
             dashboard,
             app_ctx.agents,
             persist_agent_state=lambda agent: save_agent_to_file(app_ctx, agent),
+            state_file=state_file,
+            persist_agents_state=lambda agents: save_agents_to_file(app_ctx, agents),
         )
     return app_ctx.scheduler_manager
 
 
+def _healthcheck_session_dir(app_ctx: AppContext) -> Path | None:
+    """ヘルスチェックの状態・計測値の保存先（セッションディレクトリ）。未確定なら None。"""
+    if not app_ctx.project_root or not app_ctx.session_id:
+        return None
+    from src.tools.helpers import resolve_project_root
+
+    try:
+        base_dir = resolve_project_root(app_ctx)
+    except ValueError:
+        base_dir = app_ctx.project_root
+    return Path(base_dir) / app_ctx.settings.mcp_dir / app_ctx.session_id
+
+
 def ensure_healthcheck_manager(app_ctx: AppContext) -> HealthcheckManager:
-    """HealthcheckManagerが初期化されていることを確認する。"""
+    """HealthcheckManagerが初期化されていることを確認する。
+
+    セッションが確定している場合は監視状態をセッションディレクトリへ永続化し、
+    再初期化時（daemon の連続エラー・MCP 再起動）に引き継ぐ。
+    """
     if app_ctx.healthcheck_manager is None:
+        session_dir = _healthcheck_session_dir(app_ctx)
+        metrics_file = None
+        if session_dir is not None and app_ctx.settings.healthcheck_metrics_textfile_enabled:
+            metrics_file = session_dir / METRICS_FILE_NAME
         app_ctx.healthcheck_manager = HealthcheckManager(
             tmux_manager=app_ctx.tmux,
             agents=app_ctx.agents,
@@ -177,10 +279,47 @@ def ensure_healthcheck_manager(app_ctx: AppContext) -> HealthcheckManager:
                 app_ctx.settings.healthcheck_in_progress_no_ipc_timeout_seconds
             ),
             max_recovery_attempts=app_ctx.settings.healthcheck_max_recovery_attempts,
+            recovery_concurrency=app_ctx.settings.healthcheck_recovery_concurrency,
+            diagnosis_timeout_seconds=app_ctx.settings.healthcheck_diagnosis_timeout_seconds,
+            recovery_timeout_seconds=app_ctx.settings.healthcheck_recovery_timeout_seconds,
+            process_probe_enabled=app_ctx.settings.healthcheck_process_probe_enabled,
+            cpu_active_min_percent=app_ctx.settings.healthcheck_cpu_active_min_percent,
+            state_file=session_dir / HEALTHCHECK_STATE_FILE_NAME if session_dir else None,
+            state_max_age_seconds=app_ctx.settings.healthcheck_state_max_age_seconds,
+            metrics_file=metrics_file,
+            metrics_snapshot_file=session_dir / METRICS_SNAPSHOT_FILE_NAME if session_dir else None,
         )
     return app_ctx.healthcheck_manager
 
 
+def ensure_healthcheck_scheduler(app_ctx: AppContext) -> HealthcheckScheduler:
+    """HealthcheckScheduler が初期化されていることを確認する。"""
+    if app_ctx.healthcheck_scheduler is None:
+        settings = app_ctx.settings
+        app_ctx.healthcheck_scheduler = HealthcheckScheduler(
+            base_interval_seconds=settings.healthcheck_interval_seconds,
+            fast_interval_seconds=settings.healthcheck_fast_interval_seconds,
+            idle_max_interval_seconds=settings.healthcheck_idle_max_interval_seconds,
+            stall_threshold_seconds=min(
+                settings.healthcheck_stall_timeout_seconds,
+                settings.healthcheck_in_progress_no_ipc_timeout_seconds,
+            ),
+        )
+    return app_ctx.healthcheck_scheduler
+
+
+def ensure_background_supervisor(app_ctx: AppContext) -> BackgroundSupervisor:
+    """BackgroundSupervisor が初期化されていることを確認する。
+
+    初期化時に既定のジョブを登録する。ジョブの実行開始・停止は app_lifespan が行う。
+    """
+    if app_ctx.background_supervisor is None:
+        supervisor = BackgroundSupervisor()
+        register_default_jobs(app_ctx, supervisor)
+        app_ctx.background_supervisor = supervisor
+    return app_ctx.background_supervisor
+
+
 def ensure_persona_manager(app_ctx: AppContext) -> PersonaManager:
     """PersonaManagerが初期化されていることを確認する。"""
     if app_ctx.persona_manager is None:
@@ -194,6 +333,10 @@ def ensure_memory_manager(app_ctx: AppContext) -> MemoryManager:
     worktree 内で実行されている場合でも、メインリポジトリの
     `{mcp_dir}/memory`（セッション非依存）を使用する。
     """
+    cached = _cached_manager(app_ctx, "memory", app_ctx.memory_manager, session_scoped=False)
+    if cached is not None:
+        return cached
+
     from src.tools.helpers import resolve_project_root
 
     project_root = resolve_project_root(
@@ -218,6 +361,7 @@ def ensure_memory_manager(app_ctx: AppContext) -> MemoryManager:
 
     if app_ctx.memory_manager is None or current_dir_abs != memory_dir_abs:
         app_ctx.memory_manager = MemoryManager(storage_dir=memory_dir)
+    _remember_manager(app_ctx, "memory", app_ctx.memory_manager, session_scoped=False)
     return app_ctx.memory_manager
 
 
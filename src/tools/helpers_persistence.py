@@ -2,20 +2,22 @@
 
 from __future__ import annotations
 
-import fcntl
 import json
 import logging
-import os
-import tempfile
-import time
-from collections.abc import Iterator
-from contextlib import contextmanager
+from collections.abc import Iterable
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from src.config.settings import get_mcp_dir
 from src.context import AppContext
+from src.managers.agents_journal import (
+    append_agent_records,
+    clear_read_cache,
+    delete_agents_store,
+    get_agents_store_signature,
+    read_agents_data,
+)
 from src.tools.helpers_git import resolve_main_repo_root
 from src.tools.helpers_registry import (
     ensure_session_id,
@@ -27,10 +29,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-# sync_agents_from_file のキャッシュ TTL（秒）
-_SYNC_CACHE_TTL_SECONDS = 5.0
-# scope（session/path）ごとの最終同期時刻を保持する
-_last_sync_times: dict[str, float] = {}
+# scope ごとに最終同期時点の (同期先の agents dict の id, agents.json・ジャーナルのシグネチャ)
+_last_sync_signatures: dict[str, tuple[int, tuple | None]] = {}
+# scope ごとに最終同期時点の (同期先の agents dict の id, エージェント ID -> 生データ)
+_last_synced_raw: dict[str, tuple[int, dict[str, Any]]] = {}
+# (project_root, enable_git, session_id, mcp_dir) -> 解決済みの agents.json パス
+_agents_file_path_cache: dict[tuple[str, bool, str, str], Path] = {}
 
 
 def _normalize_project_root_for_persistence(
@@ -48,7 +52,20 @@ def _normalize_project_root_for_persistence(
 
 def reset_sync_cache() -> None:
     """sync_agents_from_file のキャッシュをリセットする（テスト用）。"""
-    _last_sync_times.clear()
+    _last_sync_signatures.clear()
+    _last_synced_raw.clear()
+    _agents_file_path_cache.clear()
+    clear_read_cache()
+
+
+def _agents_file_signature(agents_file: Path | None) -> tuple | None:
+    """agents.json とジャーナルの (inode, mtime_ns, size)。agents.json が無ければ None。"""
+    if agents_file is None:
+        return None
+    signature = get_agents_store_signature(agents_file)
+    if signature[0] is None:
+        return None
+    return signature
 
 
 def _get_agents_file_path(project_root: str | None, session_id: str | None = None) -> Path | None:
@@ -75,18 +92,33 @@ def _resolve_agents_file_path(
     *,
     working_dir_fallback: str | None = None,
 ) -> Path | None:
-    """AppContext から agents.json の実体パスを解決する。"""
+    """AppContext から agents.json の実体パスを解決する。
+
+    ツール呼び出しごとに実行されるため、正規化（realpath・git ルート解決）の結果を
+    入力の組ごとに再利用する。
+    """
     project_root = app_ctx.project_root
     if not project_root:
         project_root = get_project_root_from_config()
     if not project_root and working_dir_fallback:
         project_root = working_dir_fallback
 
-    project_root = _normalize_project_root_for_persistence(
-        project_root, app_ctx.settings.enable_git
-    )
     session_id = ensure_session_id(app_ctx)
-    return _get_agents_file_path(project_root, session_id)
+    enable_git = bool(app_ctx.settings.enable_git)
+    cache_key = None
+    if project_root and session_id:
+        cache_key = (str(project_root), enable_git, session_id, get_mcp_dir())
+        cached = _agents_file_path_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    project_root = _normalize_project_root_for_persistence(project_root, enable_git)
+    agents_file = _get_agents_file_path(project_root, session_id)
+    if cache_key is not None and agents_file is not None:
+        if len(_agents_file_path_cache) >= 64:
+            _agents_file_path_cache.clear()
+        _agents_file_path_cache[cache_key] = agents_file
+    return agents_file
 
 
 def _get_sync_cache_key(agents_file: Path | None) -> str:
@@ -99,40 +131,40 @@ def _get_sync_cache_key(agents_file: Path | None) -> str:
         return str(agents_file.expanduser())
 
 
-def _get_agents_lock_path(agents_file: Path) -> Path:
-    """agents.json 用の排他ロックファイルパスを返す。"""
-    return agents_file.with_name(f"{agents_file.stem}.lock")
+def save_agents_to_file(app_ctx: AppContext, agents: Iterable[Agent]) -> bool:
+    """複数のエージェント情報をまとめてファイルに保存する。
 
+    更新は agents.json のジャーナルへ 1 回の追記として記録するため、
+    ロックの保持時間は保存件数・エージェント総数に比例しない。
+    worktree 内で実行されている場合でも、メインリポジトリの agents.json に保存する。
 
-@contextmanager
-def _agents_file_lock(agents_file: Path) -> Iterator[None]:
-    """agents.json の更新時に排他ロックを取得する。"""
-    lock_path = _get_agents_lock_path(agents_file)
-    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    Args:
+        app_ctx: アプリケーションコンテキスト
+        agents: 保存するエージェント
 
-    with open(lock_path, "a+", encoding="utf-8") as lock_file:
-        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
-        try:
-            yield
-        finally:
-            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    Returns:
+        成功した場合 True
+    """
+    agents = list(agents)
+    if not agents:
+        return True
 
+    agents_file = _resolve_agents_file_path(app_ctx, working_dir_fallback=agents[0].working_dir)
+
+    if not agents_file:
+        logger.debug("project_root が設定されていないため、エージェント情報を保存できません")
+        return False
 
-def _atomic_write_json(file_path: Path, payload: dict[str, Any]) -> None:
-    """JSON payload をアトミックに書き込む。"""
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    content = json.dumps(payload, ensure_ascii=False, indent=2, default=str)
-    fd, tmp_path = tempfile.mkstemp(dir=str(file_path.parent), suffix=".tmp")
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            f.write(content)
-        os.replace(tmp_path, str(file_path))
-    except BaseException:
-        try:
-            os.unlink(tmp_path)
-        except OSError:
-            pass
-        raise
+        append_agent_records(
+            agents_file, {agent.id: agent.model_dump(mode="json") for agent in agents}
+        )
+        logger.debug(f"エージェント {len(agents)} 件を {agents_file} に保存しました")
+        return True
+
+    except (OSError, json.JSONDecodeError, ValueError) as e:
+        logger.warning(f"エージェント情報の保存に失敗: {e}")
+        return False
 
 
 def save_agent_to_file(app_ctx: AppContext, agent: Agent) -> bool:
@@ -148,33 +180,42 @@ def save_agent_to_file(app_ctx: AppContext, agent: Agent) -> bool:
     Returns:
         成功した場合 True
     """
+    return save_agents_to_file(app_ctx, [agent])
 
-    agents_file = _resolve_agents_file_path(app_ctx, working_dir_fallback=agent.working_dir)
-
-    if not agents_file:
-        logger.debug("project_root が設定されていないため、エージェント情報を保存できません")
-        return False
 
-    try:
-        with _agents_file_lock(agents_file):
-            # 既存のエージェント情報を読み込み
-            agents_data: dict[str, Any] = {}
-            if agents_file.exists():
-                with open(agents_file, encoding="utf-8") as f:
-                    agents_data = json.load(f)
+def _parse_agent(agent_id: str, data: Any) -> Agent | None:
+    """agents.json の 1 エントリを Agent に変換する（失敗時は None）。
 
-            # エージェント情報を追加/更新
-            agents_data[agent.id] = agent.model_dump(mode="json")
+    data は同期キャッシュに保持されるため変更しない。
+    """
+    from src.models.agent import Agent  # 循環インポート回避
 
-            # アトミック書き込み（tmpfile + os.replace）
-            _atomic_write_json(agents_file, agents_data)
+    try:
+        fields = dict(data)
+        # datetime 文字列を datetime オブジェクトに変換
+        if isinstance(fields.get("created_at"), str):
+            fields["created_at"] = datetime.fromisoformat(fields["created_at"])
+        if isinstance(fields.get("last_activity"), str):
+            fields["last_activity"] = datetime.fromisoformat(fields["last_activity"])
+        return Agent(**fields)
+    except (KeyError, ValueError, TypeError) as e:
+        logger.warning(f"エージェント {agent_id} のパースに失敗: {e}")
+        return None
 
-        logger.debug(f"エージェント {agent.id} を {agents_file} に保存しました")
-        return True
 
-    except (OSError, json.JSONDecodeError, ValueError) as e:
-        logger.warning(f"エージェント情報の保存に失敗: {e}")
-        return False
+def _read_raw_agents(agents_file: Path | None) -> dict[str, Any]:
+    """agents.json（+ ジャーナル）の生データを読み込む。無い・読めない場合は空。"""
+    if not agents_file or not agents_file.exists():
+        return {}
+    try:
+        agents_data = read_agents_data(agents_file)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"エージェント情報の読み込みに失敗: {e}")
+        return {}
+    if not isinstance(agents_data, dict):
+        logger.warning(f"エージェント情報の形式が不正です: {agents_file}")
+        return {}
+    return agents_data
 
 
 def load_agents_from_file(app_ctx: AppContext, agents_file: Path | None = None) -> dict[str, Agent]:
@@ -186,75 +227,86 @@ def load_agents_from_file(app_ctx: AppContext, agents_file: Path | None = None)
     Returns:
         エージェント ID -> Agent の辞書
     """
-    from src.models.agent import Agent  # 循環インポート回避
-
     resolved_agents_file = agents_file or _resolve_agents_file_path(app_ctx)
+    agents: dict[str, Agent] = {}
+    for agent_id, data in _read_raw_agents(resolved_agents_file).items():
+        agent = _parse_agent(agent_id, data)
+        if agent is not None:
+            agents[agent_id] = agent
 
-    if not resolved_agents_file or not resolved_agents_file.exists():
-        return {}
-
-    try:
-        with open(resolved_agents_file, encoding="utf-8") as f:
-            agents_data = json.load(f)
-
-        agents: dict[str, Agent] = {}
-        for agent_id, data in agents_data.items():
-            try:
-                # datetime 文字列を datetime オブジェクトに変換
-                if isinstance(data.get("created_at"), str):
-                    data["created_at"] = datetime.fromisoformat(data["created_at"])
-                if isinstance(data.get("last_activity"), str):
-                    data["last_activity"] = datetime.fromisoformat(data["last_activity"])
-                agents[agent_id] = Agent(**data)
-            except (KeyError, ValueError, TypeError) as e:
-                logger.warning(f"エージェント {agent_id} のパースに失敗: {e}")
-
+    if agents:
         logger.debug(
             f"{len(agents)} 件のエージェント情報を {resolved_agents_file} から読み込みました"
         )
-        return agents
-
-    except (OSError, json.JSONDecodeError) as e:
-        logger.warning(f"エージェント情報の読み込みに失敗: {e}")
-        return {}
+    return agents
+
+
+def _register_agent_tmux_sockets(app_ctx: AppContext) -> None:
+    """Agent に記録された tmux ソケットを TmuxManager のルーティングへ登録する。"""
+    from src.models.agent import AgentStatus  # 循環インポート回避
+
+    register = getattr(app_ctx.tmux, "register_window_socket", None)
+    if not callable(register):
+        return
+    for agent in app_ctx.agents.values():
+        if (
+            agent.status == AgentStatus.TERMINATED
+            or agent.session_name is None
+            or agent.window_index is None
+        ):
+            continue
+        register(agent.session_name, agent.window_index, agent.tmux_socket)
 
 
 def sync_agents_from_file(app_ctx: AppContext, force: bool = False) -> int:
     """ファイルからエージェント情報をメモリに同期する。
 
-    キャッシュTTL（5秒）以内の再呼び出しはスキップする。
-    force=True で強制同期。
+    agents.json とジャーナルの (inode, mtime_ns, size) が前回の同期から変わっていなければ
+    stat だけで戻る。変わっていれば直ちに読み直し、前回の同期から生データが変わった
+    エージェントだけを検証して反映する。force=True で全エージェントを比較し直す。
 
     Args:
         app_ctx: アプリケーションコンテキスト
-        force: TTL を無視して強制同期するか
+        force: 変更検知を無視して強制同期するか
 
     Returns:
         追加または更新されたエージェント数
     """
     agents_file = _resolve_agents_file_path(app_ctx)
     cache_key = _get_sync_cache_key(agents_file)
+    agents_id = id(app_ctx.agents)
+    # 読み込み前に取得する（読み込み中の更新は次回の同期で検知される）
+    signature = (agents_id, _agents_file_signature(agents_file))
 
-    if not force:
-        now = time.monotonic()
-        last_sync_time = _last_sync_times.get(cache_key, 0.0)
-        if (now - last_sync_time) < _SYNC_CACHE_TTL_SECONDS:
-            return 0
+    if not force and _last_sync_signatures.get(cache_key) == signature:
+        return 0
 
-    file_agents = load_agents_from_file(app_ctx, agents_file=agents_file)
+    raw_agents = _read_raw_agents(agents_file)
+    previous = _last_synced_raw.get(cache_key)
+    previous_raw = previous[1] if previous and previous[0] == agents_id and not force else {}
     synced = 0
 
-    for agent_id, agent in file_agents.items():
+    for agent_id, data in raw_agents.items():
         current = app_ctx.agents.get(agent_id)
-        if current is None:
-            app_ctx.agents[agent_id] = agent
-            synced += 1
+        if current is not None:
+            if previous_raw.get(agent_id) == data:
+                # 前回の同期から変わっていない（メモリ側の変更を巻き戻さない）
+                continue
+            if current.model_dump(mode="json") == data:
+                continue
+        agent = _parse_agent(agent_id, data)
+        if agent is None:
             continue
-        if current.model_dump(mode="json") != agent.model_dump(mode="json"):
-            app_ctx.agents[agent_id] = agent
-            synced += 1
+        if current is not None and current.model_dump(mode="json") == agent.model_dump(
+            mode="json"
+        ):
+            continue
+        app_ctx.agents[agent_id] = agent
+        synced += 1
 
-    _last_sync_times[cache_key] = time.monotonic()
+    _last_sync_signatures[cache_key] = signature
+    _last_synced_raw[cache_key] = (agents_id, raw_agents)
+    _register_agent_tmux_sockets(app_ctx)
 
     if synced > 0:
         logger.info(f"ファイルから {synced} 件のエージェント情報を同期しました")
@@ -281,11 +333,11 @@ def delete_agents_file(app_ctx: AppContext) -> bool:
     )
     session_id = ensure_session_id(app_ctx)
     agents_file = _get_agents_file_path(project_root, session_id)
-    if agents_file and agents_file.exists():
+    if agents_file:
         try:
-            agents_file.unlink()
-            logger.info(f"agents.json を削除しました: {agents_file}")
-            return True
+            if delete_agents_store(agents_file):
+                logger.info(f"agents.json を削除しました: {agents_file}")
+                return True
         except OSError as e:
             logger.warning(f"agents.json 削除に失敗: {e}")
     return False
@@ -307,18 +359,11 @@ def remove_agent_from_file(app_ctx: AppContext, agent_id: str) -> bool:
         return False
 
     try:
-        with _agents_file_lock(agents_file):
-            with open(agents_file, encoding="utf-8") as f:
-                agents_data = json.load(f)
-
-            if agent_id in agents_data:
-                del agents_data[agent_id]
-                _atomic_write_json(agents_file, agents_data)
-
-                logger.debug(f"エージェント {agent_id} を {agents_file} から削除しました")
-                return True
-
-        return False
+        if agent_id not in read_agents_data(agents_file):
+            return False
+        append_agent_records(agents_file, {agent_id: None})
+        logger.debug(f"エージェント {agent_id} を {agents_file} から削除しました")
+        return True
 
     except (OSError, json.JSONDecodeError) as e:
         logger.warning(f"エージェント情報の削除に失敗: {e}")
@@ -5,11 +5,14 @@ from __future__ import annotations
 import json
 import logging
 import os
-import tempfile
+import sqlite3
+import threading
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from src.config.settings import get_mcp_dir
+from src.managers.durable_io import sqlite_synchronous
 from src.tools.helpers_git import resolve_main_repo_root
 
 if TYPE_CHECKING:
@@ -17,6 +20,16 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+REGISTRY_DB_FILE_NAME = "registry.db"
+"""エージェントレジストリ（SQLite, WAL モード）のファイル名"""
+
+_REGISTRY_BUSY_TIMEOUT_SECONDS = 5.0
+
+# レジストリ DB の接続（(pid, DB パス) -> 接続）。接続の共有は _registry_lock で直列化する
+_registry_connections: dict[tuple[int, str], sqlite3.Connection] = {}
+_registry_synchronous: dict[tuple[int, str], str] = {}
+_registry_lock = threading.RLock()
+
 
 # ========== グローバルレジストリ ==========
 
@@ -31,10 +44,148 @@ def _get_global_mcp_dir() -> Path:
 
 
 def _get_agent_registry_dir() -> Path:
-    """エージェントレジストリディレクトリを取得する。"""
+    """エージェントレジストリディレクトリを取得する（registry.db と旧形式の JSON を置く）。"""
     return _get_global_mcp_dir() / "agents"
 
 
+def _get_registry_db_path() -> Path:
+    """エージェントレジストリの SQLite データベースのパスを取得する。"""
+    return _get_agent_registry_dir() / REGISTRY_DB_FILE_NAME
+
+
+def _migrate_legacy_registry_files(conn: sqlite3.Connection, registry_dir: Path) -> None:
+    """旧形式（エージェントごとの JSON + .lock）のレジストリを取り込み、削除する。"""
+    legacy_files = sorted(registry_dir.glob("*.json"))
+    if not legacy_files:
+        return
+    rows = []
+    for agent_file in legacy_files:
+        try:
+            with open(agent_file, encoding="utf-8") as f:
+                data = json.load(f)
+            rows.append(
+                (
+                    data.get("agent_id") or agent_file.stem,
+                    data["owner_id"],
+                    data["project_root"],
+                    data.get("session_id"),
+                    agent_file.stat().st_mtime,
+                )
+            )
+        except (OSError, json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"旧形式のレジストリファイルを取り込めません: {agent_file}: {e}")
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        # 取り込み済みの行（他プロセスが先に移行した場合）は上書きしない
+        conn.executemany(
+            "INSERT OR IGNORE INTO agents "
+            "(agent_id, owner_id, project_root, session_id, updated_at) VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    for path in (*legacy_files, *registry_dir.glob("*.lock"), *registry_dir.glob("*.tmp")):
+        try:
+            path.unlink()
+        except OSError:
+            pass
+    logger.info(f"旧形式のレジストリ {len(rows)} 件を {REGISTRY_DB_FILE_NAME} に移行しました")
+
+
+def _get_registry_connection() -> sqlite3.Connection:
+    """レジストリ DB への接続を返す（プロセス内でパスごとに 1 接続を再利用する）。
+
+    初回接続時にスキーマを作成し、旧形式の JSON ファイルがあれば取り込む。
+    PRAGMA synchronous は耐久性モード（durable_io）に合わせる。
+    呼び出し側は ``_registry_lock`` を保持していること。
+    """
+    db_path = _get_registry_db_path()
+    key = (os.getpid(), str(db_path))
+    synchronous = sqlite_synchronous()
+    conn = _registry_connections.get(key)
+    if conn is not None:
+        if _registry_synchronous.get(key) != synchronous:
+            conn.execute(f"PRAGMA synchronous={synchronous}")
+            _registry_synchronous[key] = synchronous
+        return conn
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(
+        str(db_path),
+        timeout=_REGISTRY_BUSY_TIMEOUT_SECONDS,
+        isolation_level=None,
+        check_same_thread=False,
+    )
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={synchronous}")
+        conn.execute(f"PRAGMA busy_timeout={int(_REGISTRY_BUSY_TIMEOUT_SECONDS * 1000)}")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS agents ("
+            "agent_id TEXT PRIMARY KEY, "
+            "owner_id TEXT NOT NULL, "
+            "project_root TEXT NOT NULL, "
+            "session_id TEXT, "
+            "updated_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_agents_owner_id ON agents (owner_id)")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_agents_project_root ON agents (project_root)"
+        )
+        _migrate_legacy_registry_files(conn, db_path.parent)
+    except BaseException:
+        conn.close()
+        raise
+    _registry_connections[key] = conn
+    _registry_synchronous[key] = synchronous
+    return conn
+
+
+def save_agents_to_registry(
+    entries: list[tuple[str, str, str, str | None]],
+) -> int:
+    """複数のエージェント情報を 1 トランザクションでグローバルレジストリに保存する。
+
+    Args:
+        entries: (agent_id, owner_id, project_root, session_id) のリスト
+
+    Returns:
+        保存したエージェント数
+    """
+    if not entries:
+        return 0
+    now = time.time()
+    rows = [
+        (agent_id, owner_id, project_root, session_id or None, now)
+        for agent_id, owner_id, project_root, session_id in entries
+    ]
+    with _registry_lock:
+        conn = _get_registry_connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                "INSERT INTO agents "
+                "(agent_id, owner_id, project_root, session_id, updated_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(agent_id) DO UPDATE SET "
+                "owner_id = excluded.owner_id, "
+                "project_root = excluded.project_root, "
+                "session_id = excluded.session_id, "
+                "updated_at = excluded.updated_at",
+                rows,
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+    for agent_id, _owner_id, project_root, session_id in entries:
+        logger.debug(
+            f"エージェントをレジストリに保存: {agent_id} -> {project_root} (session: {session_id})"
+        )
+    return len(rows)
+
+
 def save_agent_to_registry(
     agent_id: str,
     owner_id: str,
@@ -49,44 +200,52 @@ def save_agent_to_registry(
         project_root: プロジェクトルートパス
         session_id: セッションID（タスクディレクトリ名）
     """
-    registry_dir = _get_agent_registry_dir()
-    registry_dir.mkdir(parents=True, exist_ok=True)
-    agent_file = registry_dir / f"{agent_id}.json"
-    data = {
-        "agent_id": agent_id,
-        "owner_id": owner_id,
-        "project_root": project_root,
-    }
-    if session_id:
-        data["session_id"] = session_id
+    save_agents_to_registry([(agent_id, owner_id, project_root, session_id)])
+
+
+def read_agent_registry_entry(agent_id: str) -> dict | None:
+    """レジストリからエージェントの登録内容を取得する。
+
+    主キー検索 1 回で済むため、ツール呼び出しごとの権限チェックでも
+    ファイルの読み込みやパースは発生しない。
+
+    Args:
+        agent_id: エージェントID
 
-    # アトミック書き込み: 共通ロックファイルで排他 → tempfile → os.replace
-    lock_file_path = registry_dir / f"{agent_id}.lock"
-    fd, tmp_path = tempfile.mkstemp(dir=str(registry_dir), suffix=".tmp")
+    Returns:
+        登録内容の dict、見つからない・読み込めない場合は None
+    """
     try:
-        with open(lock_file_path, "a+", encoding="utf-8") as lock_fh:
-            try:
-                import fcntl
-
-                fcntl.flock(lock_fh.fileno(), fcntl.LOCK_EX)
-            except ImportError:
-                pass  # 非 POSIX 環境ではロックなしで続行
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-                f.flush()
-                os.fsync(f.fileno())
-            os.replace(tmp_path, str(agent_file))
-    except BaseException:
-        # 書き込み失敗時は一時ファイルを削除
-        try:
-            os.unlink(tmp_path)
-        except OSError:
-            pass
-        raise
+        with _registry_lock:
+            row = (
+                _get_registry_connection()
+                .execute(
+                    "SELECT owner_id, project_root, session_id FROM agents WHERE agent_id = ?",
+                    (agent_id,),
+                )
+                .fetchone()
+            )
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"レジストリの読み込みに失敗: {agent_id}: {e}")
+        return None
+    if row is None:
+        return None
+    data = {"agent_id": agent_id, "owner_id": row[0], "project_root": row[1]}
+    if row[2]:
+        data["session_id"] = row[2]
+    return data
 
-    logger.debug(
-        f"エージェントをレジストリに保存: {agent_id} -> {project_root} (session: {session_id})"
-    )
+
+def reset_registry_cache() -> None:
+    """プロセス内で保持しているレジストリ DB の接続を閉じる（テスト用）。"""
+    with _registry_lock:
+        for conn in _registry_connections.values():
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        _registry_connections.clear()
+        _registry_synchronous.clear()
 
 
 def get_project_root_from_registry(agent_id: str) -> str | None:
@@ -98,19 +257,13 @@ def get_project_root_from_registry(agent_id: str) -> str | None:
     Returns:
         project_root のパス、見つからない場合は None
     """
-    agent_file = _get_agent_registry_dir() / f"{agent_id}.json"
-    if not agent_file.exists():
-        return None
-    try:
-        with open(agent_file, encoding="utf-8") as f:
-            data = json.load(f)
-        project_root = data.get("project_root")
-        if project_root:
-            logger.debug(f"レジストリから project_root を取得: {agent_id} -> {project_root}")
-        return project_root
-    except (OSError, json.JSONDecodeError) as e:
-        logger.warning(f"レジストリファイルの読み込みに失敗: {agent_file}: {e}")
+    data = read_agent_registry_entry(agent_id)
+    if data is None:
         return None
+    project_root = data.get("project_root")
+    if project_root:
+        logger.debug(f"レジストリから project_root を取得: {agent_id} -> {project_root}")
+    return project_root
 
 
 def get_session_id_from_registry(agent_id: str) -> str | None:
@@ -122,19 +275,13 @@ def get_session_id_from_registry(agent_id: str) -> str | None:
     Returns:
         session_id、見つからない場合は None
     """
-    agent_file = _get_agent_registry_dir() / f"{agent_id}.json"
-    if not agent_file.exists():
-        return None
-    try:
-        with open(agent_file, encoding="utf-8") as f:
-            data = json.load(f)
-        session_id = data.get("session_id")
-        if session_id:
-            logger.debug(f"レジストリから session_id を取得: {agent_id} -> {session_id}")
-        return session_id
-    except (OSError, json.JSONDecodeError) as e:
-        logger.warning(f"レジストリファイルの読み込みに失敗: {agent_file}: {e}")
+    data = read_agent_registry_entry(agent_id)
+    if data is None:
         return None
+    session_id = data.get("session_id")
+    if session_id:
+        logger.debug(f"レジストリから session_id を取得: {agent_id} -> {session_id}")
+    return session_id
 
 
 def remove_agent_from_registry(agent_id: str) -> bool:
@@ -144,11 +291,17 @@ def remove_agent_from_registry(agent_id: str) -> bool:
         agent_id: エージェントID
 
     Returns:
-        削除成功時 True
+        削除成功時 True（削除対象がない・削除に失敗した場合は False）
     """
-    agent_file = _get_agent_registry_dir() / f"{agent_id}.json"
-    if agent_file.exists():
-        agent_file.unlink()
+    try:
+        with _registry_lock:
+            cursor = _get_registry_connection().execute(
+                "DELETE FROM agents WHERE agent_id = ?", (agent_id,)
+            )
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"レジストリからの削除に失敗: {agent_id}: {e}")
+        return False
+    if cursor.rowcount:
         logger.debug(f"エージェントをレジストリから削除: {agent_id}")
         return True
     return False
@@ -161,25 +314,56 @@ def remove_agents_by_owner(owner_id: str) -> int:
         owner_id: オーナーエージェントID
 
     Returns:
-        削除したエージェント数
+        削除したエージェント数（削除に失敗した場合は 0）
     """
-    registry_dir = _get_agent_registry_dir()
-    if not registry_dir.exists():
+    try:
+        with _registry_lock:
+            cursor = _get_registry_connection().execute(
+                "DELETE FROM agents WHERE owner_id = ?", (owner_id,)
+            )
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"オーナー {owner_id} のエージェントのレジストリからの削除に失敗: {e}")
         return 0
+    removed_count = max(cursor.rowcount, 0)
+    if removed_count:
+        logger.debug(f"オーナー {owner_id} のエージェント {removed_count} 件をレジストリから削除")
+    return removed_count
 
-    removed_count = 0
-    for agent_file in registry_dir.glob("*.json"):
-        try:
-            with open(agent_file, encoding="utf-8") as f:
-                data = json.load(f)
-            if data.get("owner_id") == owner_id:
-                agent_file.unlink()
-                logger.debug(f"エージェントをレジストリから削除: {agent_file.stem}")
-                removed_count += 1
-        except (OSError, json.JSONDecodeError) as e:
-            logger.warning(f"レジストリファイルの処理に失敗: {agent_file}: {e}")
 
-    return removed_count
+def prune_registry() -> int:
+    """project_root が存在しなくなったエージェントをレジストリから削除する。
+
+    cleanup されずに終了したセッション（プロセスの強制終了など）の
+    登録がレジストリに残り続けるのを防ぐ。
+
+    Returns:
+        削除したエージェント数
+    """
+    with _registry_lock:
+        conn = _get_registry_connection()
+        roots = [row[0] for row in conn.execute("SELECT DISTINCT project_root FROM agents")]
+    missing = [root for root in roots if not os.path.isdir(root)]
+    if not missing:
+        return 0
+    with _registry_lock:
+        conn = _get_registry_connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            removed = 0
+            for root in missing:
+                # 判定後に同じ project_root で再登録された場合に備えて再確認する
+                if os.path.isdir(root):
+                    continue
+                removed += conn.execute(
+                    "DELETE FROM agents WHERE project_root = ?", (root,)
+                ).rowcount
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+    if removed:
+        logger.info(f"存在しない project_root のエージェント {removed} 件をレジストリから削除")
+    return removed
 
 
 def get_project_root_from_config(
@@ -201,6 +385,100 @@ def get_project_root_from_config(
 # ========== config.json ヘルパー ==========
 
 
+CONFIG_FILE_NAME = "config.json"
+
+_MAX_CONFIG_CACHE_ENTRIES = 64
+"""キャッシュする config.json の上限（超えたら全て破棄する）"""
+
+# config.json のパス -> ((inode, mtime_ns, size), パース結果, 読み込みエラー)
+_config_documents: dict[Path, tuple[tuple[int, int, int], dict | None, str | None]] = {}
+# working_dir -> ((inode, mtime_ns), 探索ディレクトリ)
+_config_search_cache: dict[str, tuple[tuple[int, int], list[Path]]] = {}
+_config_documents_lock = threading.Lock()
+
+
+def _load_config_document(config_file: Path) -> tuple[dict | None, str | None]:
+    """config.json をパースした dict を返す（ファイルが変わっていなければキャッシュを使う）。
+
+    Returns:
+        (config, error)。ファイルが無ければ (None, None)、読み込みに失敗した場合は
+        (None, エラーメッセージ)
+    """
+    try:
+        stat = config_file.stat()
+    except OSError:
+        with _config_documents_lock:
+            _config_documents.pop(config_file, None)
+        return None, None
+    signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    with _config_documents_lock:
+        cached = _config_documents.get(config_file)
+    if cached is not None and cached[0] == signature:
+        return cached[1], cached[2]
+
+    config: dict | None = None
+    error: str | None = None
+    try:
+        with open(config_file, encoding="utf-8") as f:
+            loaded = json.load(f)
+        if isinstance(loaded, dict):
+            config = loaded
+        else:
+            error = "JSON オブジェクトではありません"
+    except (OSError, json.JSONDecodeError) as e:
+        error = str(e)
+    if error is not None:
+        logger.warning(f"config.json の読み込みに失敗: {config_file}: {error}")
+
+    with _config_documents_lock:
+        if len(_config_documents) >= _MAX_CONFIG_CACHE_ENTRIES:
+            _config_documents.clear()
+        _config_documents[config_file] = (signature, config, error)
+    return config, error
+
+
+def clear_config_cache() -> None:
+    """config.json のキャッシュを破棄する（テスト用）。"""
+    with _config_documents_lock:
+        _config_documents.clear()
+        _config_search_cache.clear()
+
+
+def _config_search_dirs(working_dir: str) -> list[Path]:
+    """config.json を探すディレクトリ（working_dir → worktree のメインリポジトリ）を返す。
+
+    パス解決の結果は working_dir の (inode, mtime_ns) が変わらない間は再利用する。
+    """
+    try:
+        stat = os.stat(Path(working_dir).expanduser())
+        signature: tuple[int, int] | None = (stat.st_ino, stat.st_mtime_ns)
+    except OSError:
+        signature = None
+    with _config_documents_lock:
+        cached = _config_search_cache.get(working_dir)
+    if signature is not None and cached is not None and cached[0] == signature:
+        return cached[1]
+
+    resolved_working_dir = Path(working_dir).expanduser().resolve()
+    search_dirs = [resolved_working_dir]
+    try:
+        main_repo = resolve_main_repo_root(working_dir)
+        resolved_main_repo = Path(main_repo).expanduser().resolve()
+        if resolved_main_repo != resolved_working_dir:
+            search_dirs.append(resolved_main_repo)
+    except ValueError:
+        # 非gitディレクトリの場合は working_dir のみ探索する
+        pass
+
+    if signature is not None:
+        with _config_documents_lock:
+            if len(_config_search_cache) >= _MAX_CONFIG_CACHE_ENTRIES:
+                _config_search_cache.clear()
+            _config_search_cache[working_dir] = (signature, search_dirs)
+    return search_dirs
+
+
 def _get_from_config(
     key: str,
     working_dir: str | None = None,
@@ -208,7 +486,9 @@ def _get_from_config(
 ) -> object | None:
     """config.json から指定キーの値を取得する。
 
-    working_dir → worktree のメインリポジトリの順で探索する。
+    working_dir → worktree のメインリポジトリの順で探索する。config.json は
+    ディレクトリごとに 1 回だけパースし、変更（inode / mtime / サイズ）が無い間は
+    全キーの取得でその結果を使う。
 
     Args:
         key: 取得するキー名
@@ -218,36 +498,23 @@ def _get_from_config(
     Returns:
         値が見つかった場合はその値、見つからない場合は None
     """
-    search_dirs: list[Path] = []
-
-    if working_dir:
-        resolved_working_dir = Path(working_dir).expanduser().resolve()
-        search_dirs.append(resolved_working_dir)
-        try:
-            main_repo = resolve_main_repo_root(working_dir)
-            resolved_main_repo = Path(main_repo).expanduser().resolve()
-            if resolved_main_repo != resolved_working_dir:
-                search_dirs.append(resolved_main_repo)
-        except ValueError:
-            # 非gitディレクトリの場合は working_dir のみ探索する
-            pass
-
+    mcp_dir = get_mcp_dir()
+    search_dirs = _config_search_dirs(working_dir) if working_dir else []
     for base_dir in search_dirs:
-        config_file = base_dir / get_mcp_dir() / "config.json"
-        if config_file.exists():
-            try:
-                with open(config_file, encoding="utf-8") as f:
-                    config = json.load(f)
-                value = config.get(key)
-                if value is not None:
-                    logger.debug(f"config.json から {key} を取得: {value}")
-                    return value
-            except (OSError, json.JSONDecodeError) as e:
-                if strict:
-                    raise InvalidConfigError(
-                        f"invalid_config: {config_file} の読み込みに失敗しました: {e}"
-                    ) from e
-                logger.warning(f"config.json の読み込みに失敗: {e}")
+        config_file = base_dir / mcp_dir / CONFIG_FILE_NAME
+        config, error = _load_config_document(config_file)
+        if error is not None:
+            if strict:
+                raise InvalidConfigError(
+                    f"invalid_config: {config_file} の読み込みに失敗しました: {error}"
+                )
+            continue
+        if config is None:
+            continue
+        value = config.get(key)
+        if value is not None:
+            logger.debug(f"config.json から {key} を取得: {value}")
+            return value
 
     return None
 
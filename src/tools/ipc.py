@@ -12,7 +12,9 @@ if TYPE_CHECKING:
 from mcp.server.fastmcp import Context, FastMCP
 
 from src.config.role_permissions import requires_worker_admin_receiver
-from src.models.agent import AgentRole, AgentStatus
+from src.managers.background_jobs import notify_task_terminal
+from src.managers.io_executor import run_blocking
+from src.models.agent import Agent, AgentRole, AgentStatus
 from src.models.dashboard import TaskStatus, normalize_task_id
 from src.models.message import Message, MessagePriority, MessageType
 from src.tools.helpers import (
@@ -23,7 +25,7 @@ from src.tools.helpers import (
     get_owner_wait_state,
     notify_agent_via_tmux,
     require_permission,
-    save_agent_to_file,
+    save_agents_to_file,
     sync_agents_from_file,
     validate_sender_caller_match,
 )
@@ -133,6 +135,8 @@ def _auto_update_dashboard_from_messages(
 
     applied = 0
     skipped_reasons: list[str] = []
+    # 更新した reporter はループ後にまとめて agents.json へ保存する
+    updated_agents: dict[str, Agent] = {}
 
     for msg in task_messages:
         raw_task_id = msg.metadata.get("task_id")
@@ -172,7 +176,7 @@ def _auto_update_dashboard_from_messages(
                     agent.current_task = task_id
                     if str(agent.role) == AgentRole.WORKER.value:
                         agent.status = AgentStatus.BUSY
-                    save_agent_to_file(app_ctx, agent)
+                    updated_agents[agent.id] = agent
                 applied += 1
 
             elif msg.message_type == MessageType.TASK_COMPLETE:
@@ -194,7 +198,8 @@ def _auto_update_dashboard_from_messages(
                         agent.current_task = None
                     if str(agent.role) == AgentRole.WORKER.value:
                         agent.status = AgentStatus.IDLE
-                    save_agent_to_file(app_ctx, agent)
+                    updated_agents[agent.id] = agent
+                notify_task_terminal(app_ctx, task_id, reporter)
                 applied += 1
 
             elif msg.message_type == MessageType.TASK_FAILED:
@@ -214,12 +219,16 @@ def _auto_update_dashboard_from_messages(
                         agent.current_task = None
                     if str(agent.role) == AgentRole.WORKER.value:
                         agent.status = AgentStatus.IDLE
-                    save_agent_to_file(app_ctx, agent)
+                    updated_agents[agent.id] = agent
+                notify_task_terminal(app_ctx, task_id, reporter, completed=False)
                 applied += 1
         except Exception as e:
             logger.debug(f"タスク {task_id} の Dashboard 更新をスキップ: {e}")
             skipped_reasons.append(f"update_error:{task_id}")
 
+    if updated_agents:
+        save_agents_to_file(app_ctx, updated_agents.values())
+
     # Markdown ダッシュボードも更新
     try:
         if app_ctx.session_id and app_ctx.project_root:
@@ -454,10 +463,13 @@ def _check_branch_merge_state(project_root: str, branches: list[str]) -> list[di
     return _check_branch_integration_state(project_root, filtered)
 
 
-def _validate_admin_completion_gate(
+async def _validate_admin_completion_gate(
     app_ctx: "AppContext", sender_id: str, receiver_id: str | None, msg_type: MessageType
 ) -> tuple[bool, dict[str, Any]]:
-    """Admin -> Owner の task_complete を品質ゲートで検証する。"""
+    """Admin -> Owner の task_complete を品質ゲートで検証する。
+
+    Dashboard の読み込みと git によるブランチ統合状態の確認はスレッドプールで実行する。
+    """
     if msg_type != MessageType.TASK_COMPLETE or not receiver_id:
         return True, {}
 
@@ -474,8 +486,8 @@ def _validate_admin_completion_gate(
         return True, {}
 
     dashboard = ensure_dashboard_manager(app_ctx)
-    tasks = dashboard.list_tasks()
-    summary = dashboard.get_summary()
+    tasks = await run_blocking(dashboard.list_tasks)
+    summary = await run_blocking(dashboard.get_summary)
     settings = app_ctx.settings
 
     reasons: list[str] = []
@@ -518,7 +530,9 @@ def _validate_admin_completion_gate(
 
     branches = [t.branch for t in completed_tasks if t.branch]
     if app_ctx.project_root and branches:
-        integration_states = _check_branch_merge_state(str(app_ctx.project_root), branches)
+        integration_states = await run_blocking(
+            _check_branch_merge_state, str(app_ctx.project_root), branches
+        )
         not_integrated = [
             s
             for s in integration_states
@@ -700,7 +714,7 @@ def register_tools(mcp: FastMCP) -> None:
             if receiver_id not in ipc.get_all_agent_ids():
                 ipc.register_agent(receiver_id)
 
-        gate_ok, gate_detail = _validate_admin_completion_gate(
+        gate_ok, gate_detail = await _validate_admin_completion_gate(
             app_ctx, sender_id, receiver_id, msg_type
         )
         if not gate_ok:
@@ -711,7 +725,8 @@ def register_tools(mcp: FastMCP) -> None:
                 "gate": gate_detail,
             }
 
-        message = ipc.send_message(
+        message = await run_blocking(
+            ipc.send_message,
             sender_id=sender_id,
             receiver_id=receiver_id,
             message_type=msg_type,
@@ -893,7 +908,8 @@ def register_tools(mcp: FastMCP) -> None:
                 if ipc.get_unread_count(caller_agent_id) == 0:
                     return _owner_polling_blocked_response(owner_wait_state.get("admin_id"))
 
-        messages = ipc.read_messages(
+        messages = await run_blocking(
+            ipc.read_messages,
             agent_id=agent_id,
             unread_only=unread_only,
             message_type=msg_type,
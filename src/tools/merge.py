@@ -7,6 +7,7 @@ from typing import Any
 
 from mcp.server.fastmcp import Context, FastMCP
 
+from src.managers.io_executor import run_blocking
 from src.models.dashboard import TaskStatus
 from src.tools.helpers import ensure_dashboard_manager, require_permission
 
@@ -63,6 +64,57 @@ def _is_worktree_clean(repo_path: str) -> tuple[bool, str]:
     return out.strip() == "", out
 
 
+def _apply_branches(
+    repo_path: str,
+    base_branch: str,
+    branches: list[str],
+    strategy: str,
+    merged: list[str],
+    already_merged: list[str],
+    failed: list[dict[str, str]],
+    conflicts: list[dict[str, str]],
+) -> int:
+    """各ブランチを base_branch へ一時コミットとして適用し、結果をリストへ追加する。
+
+    Returns:
+        作成した一時コミットの数
+    """
+    temp_commit_count = 0
+    for branch in branches:
+        if not _branch_exists(repo_path, branch):
+            failed.append({"branch": branch, "error": "branch_not_found"})
+            continue
+        if _is_branch_merged(repo_path, branch, base_branch):
+            already_merged.append(branch)
+            continue
+        if strategy == "merge":
+            ok, out = _run_git(repo_path, ["merge", "--no-ff", "--no-commit", branch])
+        else:
+            ok, out = _run_git(repo_path, ["merge", "--squash", branch])
+
+        if not ok:
+            lower = out.lower()
+            if "conflict" in lower:
+                conflicts.append({"branch": branch, "error": out})
+                _run_git(repo_path, ["merge", "--abort"])
+                _run_git(repo_path, ["rebase", "--abort"])
+            else:
+                failed.append({"branch": branch, "error": out})
+            continue
+
+        commit_ok, commit_out = _run_git(
+            repo_path,
+            ["commit", "--no-verify", "-m", f"tmp merge preview: {branch}"],
+        )
+        if not commit_ok:
+            failed.append({"branch": branch, "error": commit_out})
+            _run_git(repo_path, ["merge", "--abort"])
+            continue
+        temp_commit_count += 1
+        merged.append(branch)
+    return temp_commit_count
+
+
 def register_tools(mcp: FastMCP) -> None:
     """マージ関連ツールを登録する。"""
 
@@ -90,7 +142,7 @@ def register_tools(mcp: FastMCP) -> None:
 
         repo = str(Path(repo_path).resolve())
         dashboard = ensure_dashboard_manager(app_ctx)
-        tasks = dashboard.list_tasks(status=TaskStatus.COMPLETED)
+        tasks = await run_blocking(dashboard.list_tasks, status=TaskStatus.COMPLETED)
 
         branches = sorted({t.branch for t in tasks if t.branch})
         merged: list[str] = []
@@ -98,7 +150,8 @@ def register_tools(mcp: FastMCP) -> None:
         failed: list[dict[str, str]] = []
         conflicts: list[dict[str, str]] = []
 
-        clean, status_output = _is_worktree_clean(repo)
+        # git はスレッドプールで実行する（待機中もイベントループを止めない）
+        clean, status_output = await run_blocking(_is_worktree_clean, repo)
         if not clean:
             return {
                 "success": False,
@@ -109,27 +162,26 @@ def register_tools(mcp: FastMCP) -> None:
                 "status": status_output,
             }
 
-        if not _branch_exists(repo, base_branch):
+        if not await run_blocking(_branch_exists, repo, base_branch):
             return {
                 "success": False,
                 "error": f"base ブランチが存在しません: {base_branch}",
             }
 
-        ok, checkout_error = _run_git(repo, ["checkout", base_branch])
+        ok, checkout_error = await run_blocking(_run_git, repo, ["checkout", base_branch])
         if not ok:
             return {
                 "success": False,
                 "error": f"base ブランチへの checkout に失敗しました: {checkout_error}",
             }
 
-        ok, base_head = _run_git(repo, ["rev-parse", "HEAD"])
+        ok, base_head = await run_blocking(_run_git, repo, ["rev-parse", "HEAD"])
         if not ok:
             return {
                 "success": False,
                 "error": f"HEAD 取得に失敗しました: {base_head}",
             }
 
-        temp_commit_count = 0
         strategy_warning: str | None = None
         effective_strategy = strategy
         if strategy == "rebase":
@@ -138,46 +190,28 @@ def register_tools(mcp: FastMCP) -> None:
                 "strategy=rebase は no-commit プレビューでは非対応のため merge 相当で適用しました。"
             )
 
-        for branch in branches:
-            if not _branch_exists(repo, branch):
-                failed.append({"branch": branch, "error": "branch_not_found"})
-                continue
-            if _is_branch_merged(repo, branch, base_branch):
-                already_merged.append(branch)
-                continue
-            if effective_strategy == "merge":
-                ok, out = _run_git(repo, ["merge", "--no-ff", "--no-commit", branch])
-            else:
-                ok, out = _run_git(repo, ["merge", "--squash", branch])
-
-            if not ok:
-                lower = out.lower()
-                if "conflict" in lower:
-                    conflicts.append({"branch": branch, "error": out})
-                    _run_git(repo, ["merge", "--abort"])
-                    _run_git(repo, ["rebase", "--abort"])
-                else:
-                    failed.append({"branch": branch, "error": out})
-                continue
-
-            commit_ok, commit_out = _run_git(
-                repo,
-                ["commit", "--no-verify", "-m", f"tmp merge preview: {branch}"],
-            )
-            if not commit_ok:
-                failed.append({"branch": branch, "error": commit_out})
-                _run_git(repo, ["merge", "--abort"])
-                continue
-            temp_commit_count += 1
-            merged.append(branch)
+        temp_commit_count = await run_blocking(
+            _apply_branches,
+            repo,
+            base_branch,
+            branches,
+            effective_strategy,
+            merged,
+            already_merged,
+            failed,
+            conflicts,
+        )
 
         reset_ok = True
         reset_error: str | None = None
         if temp_commit_count > 0:
-            reset_ok, reset_error = _run_git(repo, ["reset", "--mixed", base_head])
+            reset_ok, reset_error = await run_blocking(
+                _run_git, repo, ["reset", "--mixed", base_head]
+            )
 
         # マージ結果を messages に残す
-        dashboard.add_message(
+        await run_blocking(
+            dashboard.add_message,
             sender_id=caller_agent_id or "system",
             receiver_id=None,
             message_type="task_complete",
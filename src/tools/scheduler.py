@@ -23,6 +23,10 @@ def register_tools(mcp: FastMCP) -> None:
 
         ※ Admin のみ使用可能。
 
+        MCP_SCHEDULER_EVENT_AUTO_ASSIGN_ENABLED=true の場合、タスク終了時にキューの
+        タスクが空き Worker に自動で割り当てられるが、Worker へのタスク送信は行わない。
+        Admin は通知（IPC・tmux）を受けて send_task で送信する必要がある。
+
         Args:
             task_id: タスクID
             priority: 優先度（critical/high/medium/low）
@@ -48,7 +52,12 @@ def register_tools(mcp: FastMCP) -> None:
                 "error": f"無効な優先度です: {priority}（有効: {valid_priorities}）",
             }
 
-        success = scheduler.enqueue_task(task_id, task_priority, dependencies)
+        try:
+            success = await scheduler.run_locked(
+                scheduler.enqueue_task, task_id, task_priority, dependencies
+            )
+        except ValueError as e:
+            return {"success": False, "error": str(e)}
 
         if not success:
             return {
@@ -84,7 +93,7 @@ def register_tools(mcp: FastMCP) -> None:
 
         scheduler = ensure_scheduler_manager(app_ctx)
 
-        assignments = scheduler.run_auto_assign_loop()
+        assignments = await scheduler.run_locked(scheduler.run_auto_assign_loop)
 
         return {
             "success": True,
@@ -114,7 +123,7 @@ def register_tools(mcp: FastMCP) -> None:
 
         scheduler = ensure_scheduler_manager(app_ctx)
 
-        queue_status = scheduler.get_queue_status()
+        queue_status = await scheduler.run_locked(scheduler.get_queue_status)
 
         return {
             "success": True,
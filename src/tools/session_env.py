@@ -11,6 +11,7 @@ from src.config.settings import (
     Settings,
     load_effective_settings_for_project,
 )
+from src.managers.durable_io import atomic_write
 from src.tools.helpers_git import resolve_main_repo_root
 
 logger = logging.getLogger(__name__)
@@ -142,6 +143,10 @@ MCP_EXTRA_WORKER_ROWS={v(s.extra_worker_rows)}
 MCP_EXTRA_WORKER_COLS={v(s.extra_worker_cols)}
 MCP_WORKERS_PER_EXTRA_WINDOW={v(s.workers_per_extra_window)}
 
+# Worker を分散配置する tmux サーバー数（2 以上で追加ウィンドウを別サーバーへ分散）
+# 分散先は `tmux -L multi-agent-mcp-shard-N attach` で参照できる
+MCP_TMUX_SERVER_COUNT={v(s.tmux_server_count)}
+
 # ========== ターミナル設定 ==========
 # デフォルトのターミナルアプリ（auto / ghostty / iterm2 / terminal）
 MCP_DEFAULT_TERMINAL={v(s.default_terminal)}
@@ -213,6 +218,12 @@ MCP_HEALTHCHECK_INTERVAL_SECONDS={v(s.healthcheck_interval_seconds)}
 # tmux 連続送信時の最小待機秒数（全CLI共通）
 MCP_SEND_COOLDOWN_SECONDS={v(s.send_cooldown_seconds)}
 
+# この長さ（バイト）以上の送信は tmux paste-buffer で一括送信する（0 で無効）
+MCP_PASTE_BUFFER_THRESHOLD_BYTES={v(s.paste_buffer_threshold_bytes)}
+
+# capture-pane 結果の共有キャッシュ期間（ミリ秒、0 で無効）
+MCP_CAPTURE_CACHE_TTL_MS={v(s.capture_cache_ttl_ms)}
+
 # 無応答判定の閾値（秒）
 MCP_HEALTHCHECK_STALL_TIMEOUT_SECONDS={v(s.healthcheck_stall_timeout_seconds)}
 
@@ -225,6 +236,40 @@ MCP_HEALTHCHECK_MAX_RECOVERY_ATTEMPTS={v(s.healthcheck_max_recovery_attempts)}
 # 実作業なし状態が続いた場合に daemon を停止する連続回数
 MCP_HEALTHCHECK_IDLE_STOP_CONSECUTIVE={v(s.healthcheck_idle_stop_consecutive)}
 
+# 復旧直後・タスク送信直後・異常疑いの Worker の確認間隔（秒）
+MCP_HEALTHCHECK_FAST_INTERVAL_SECONDS={v(s.healthcheck_fast_interval_seconds)}
+
+# idle Worker の確認間隔の上限（秒、確認ごとに倍化）
+MCP_HEALTHCHECK_IDLE_MAX_INTERVAL_SECONDS={v(s.healthcheck_idle_max_interval_seconds)}
+
+# 監視サイクル内で同時に実行する Worker 復旧の上限数
+MCP_HEALTHCHECK_RECOVERY_CONCURRENCY={v(s.healthcheck_recovery_concurrency)}
+
+# Worker 1 件あたりの診断タイムアウト（秒）
+MCP_HEALTHCHECK_DIAGNOSIS_TIMEOUT_SECONDS={v(s.healthcheck_diagnosis_timeout_seconds)}
+
+# 監視サイクルが復旧完了を待つ上限（秒、超過分は次回サイクルで回収）
+MCP_HEALTHCHECK_RECOVERY_TIMEOUT_SECONDS={v(s.healthcheck_recovery_timeout_seconds)}
+
+# Linux で /proc から AI CLI プロセスの生存・CPU 時間を確認するか
+MCP_HEALTHCHECK_PROCESS_PROBE_ENABLED={v(s.healthcheck_process_probe_enabled)}
+
+# AI CLI プロセスが処理中とみなす CPU 使用率の下限（1 コア比の %）
+MCP_HEALTHCHECK_CPU_ACTIVE_MIN_PERCENT={v(s.healthcheck_cpu_active_min_percent)}
+
+# 保存済みヘルスチェック状態を再起動時に引き継ぐ有効期間（秒）
+MCP_HEALTHCHECK_STATE_MAX_AGE_SECONDS={v(s.healthcheck_state_max_age_seconds)}
+
+# 監視サイクルの計測値を Prometheus テキスト形式でセッションディレクトリへ書き出すか
+MCP_HEALTHCHECK_METRICS_TEXTFILE_ENABLED={v(s.healthcheck_metrics_textfile_enabled)}
+
+# ========== ペインログ設定 ==========
+# tmux pipe-pane でペイン出力をセッション配下の logs/ へ追記するか
+MCP_PANE_LOG_ENABLED={v(s.pane_log_enabled)}
+
+# ペインログのローテーション閾値（バイト）
+MCP_PANE_LOG_MAX_BYTES={v(s.pane_log_max_bytes)}
+
 # ========== 品質チェック設定 ==========
 # 品質チェックの最大イテレーション回数
 MCP_QUALITY_CHECK_MAX_ITERATIONS={v(s.quality_check_max_iterations)}
@@ -232,6 +277,10 @@ MCP_QUALITY_CHECK_MAX_ITERATIONS={v(s.quality_check_max_iterations)}
 # 同一問題の繰り返し上限（この回数を超えたら Owner に相談）
 MCP_QUALITY_CHECK_SAME_ISSUE_LIMIT={v(s.quality_check_same_issue_limit)}
 
+# ========== スケジューラー設定 ==========
+# タスク終了時にキューのタスクを空き Worker へ即時に自動割り当てするか
+MCP_SCHEDULER_EVENT_AUTO_ASSIGN_ENABLED={v(s.scheduler_event_auto_assign_enabled)}
+
 # ========== メモリ設定 ==========
 # メモリの最大エントリ数
 MCP_MEMORY_MAX_ENTRIES={v(s.memory_max_entries)}
@@ -239,6 +288,23 @@ MCP_MEMORY_MAX_ENTRIES={v(s.memory_max_entries)}
 # メモリエントリの保持期間（日）
 MCP_MEMORY_TTL_DAYS={v(s.memory_ttl_days)}
 
+# メモリの定期整理（TTL 超過・上限超過のアーカイブ）の間隔（秒、0 で無効）
+MCP_MEMORY_PRUNE_INTERVAL_SECONDS={v(s.memory_prune_interval_seconds)}
+
+# グローバルレジストリから project_root が存在しないエージェントを削除する間隔（秒、0 で無効）
+MCP_REGISTRY_GC_INTERVAL_SECONDS={v(s.registry_gc_interval_seconds)}
+
+# メタデータ書き込みの耐久性モード（fast: fsync なし / atomic: ファイルを fsync /
+# durable: ファイルとディレクトリを fsync）
+MCP_DURABILITY={v(s.durability)}
+
+# ========== 非同期 I/O 設定 ==========
+# git・ファイル I/O をイベントループ外で実行する共有スレッドプールのスレッド数
+MCP_IO_EXECUTOR_MAX_WORKERS={v(s.io_executor_max_workers)}
+
+# イベントループをこの時間（ミリ秒）以上ブロックしたコールバックを警告する（0 で無効）
+MCP_DEBUG_SLOW_CALLBACK_MS={v(s.debug_slow_callback_ms)}
+
 # ========== スクリーンショット設定 ==========
 # スクリーンショットとして認識する拡張子（JSON形式）
 MCP_SCREENSHOT_EXTENSIONS={v(s.screenshot_extensions)}
@@ -342,8 +408,7 @@ def _setup_mcp_directories(
     if session_id:
         config_data["session_id"] = session_id
     if not config_file.exists():
-        with open(config_file, "w", encoding="utf-8") as f:
-            json.dump(config_data, f, ensure_ascii=False, indent=2)
+        atomic_write(config_file, json.dumps(config_data, ensure_ascii=False, indent=2))
         config_created = True
         logger.info(f"config.json を作成しました: {config_file}")
     else:
@@ -367,8 +432,7 @@ def _setup_mcp_directories(
                 existing["session_id"] = session_id
                 updated = True
             if updated:
-                with open(config_file, "w", encoding="utf-8") as f:
-                    json.dump(existing, f, ensure_ascii=False, indent=2)
+                atomic_write(config_file, json.dumps(existing, ensure_ascii=False, indent=2))
                 logger.info(f"config.json を更新しました: {config_file}")
         except Exception as e:
             raise ValueError(f"invalid_config: {config_file} の読み込みに失敗しました: {e}") from e
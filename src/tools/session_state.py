@@ -4,13 +4,13 @@ import json
 import logging
 import os
 import shutil
-import tempfile
 from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
 from src.config.settings import get_mcp_dir
 from src.context import AppContext
+from src.managers.durable_io import atomic_write
 
 logger = logging.getLogger(__name__)
 
@@ -61,11 +61,19 @@ def _reset_app_context(app_ctx: AppContext) -> None:
     app_ctx.ipc_manager = None
     app_ctx.dashboard_manager = None
     app_ctx.scheduler_manager = None
+    if app_ctx.healthcheck_manager is not None:
+        # 破棄するマネージャーの継続中の復旧が次のセッションへ作用しないようにする
+        app_ctx.healthcheck_manager.cancel_recoveries()
     app_ctx.healthcheck_manager = None
     app_ctx.healthcheck_daemon_task = None
     app_ctx.healthcheck_daemon_stop_event = None
     app_ctx.healthcheck_daemon_lock = None
     app_ctx.healthcheck_idle_cycles = 0
+    # 前セッションの Worker の確認予定と起床要求を持ち越さない
+    app_ctx.healthcheck_scheduler = None
+    if app_ctx.background_supervisor is not None:
+        # サーバー常駐のため破棄せず、前セッションで要求された実行（自動割り当て等）のみ取り消す
+        app_ctx.background_supervisor.clear_triggers()
     app_ctx.persona_manager = None
     app_ctx.memory_manager = None
     app_ctx.worktree_managers.clear()
@@ -75,6 +83,7 @@ def _reset_app_context(app_ctx: AppContext) -> None:
     app_ctx._admin_poll_state.clear()
     app_ctx._owner_wait_state.clear()
     app_ctx._admin_last_healthcheck_at.clear()
+    app_ctx._manager_identities.clear()
 
 
 def _collect_session_names(agents: dict[str, Any]) -> list[str]:
@@ -146,18 +155,7 @@ def _clear_config_session_id(app_ctx: AppContext) -> bool:
             return False
         del config["session_id"]
         # アトミック書き込み
-        content = json.dumps(config, ensure_ascii=False, indent=2)
-        fd, tmp_path = tempfile.mkstemp(dir=str(config_file.parent), suffix=".tmp")
-        try:
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                f.write(content)
-            os.replace(tmp_path, str(config_file))
-        except BaseException:
-            try:
-                os.unlink(tmp_path)
-            except OSError:
-                pass
-            raise
+        atomic_write(config_file, json.dumps(config, ensure_ascii=False, indent=2))
         logger.info(f"config.json から session_id をクリアしました: {config_file}")
         return True
     except (OSError, json.JSONDecodeError) as e:
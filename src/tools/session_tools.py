@@ -394,23 +394,21 @@ def register_tools(mcp: FastMCP) -> None:
             # session_id 未設定で agents.json への保存に失敗している
             from src.models.agent import AgentRole
             from src.tools.helpers_persistence import save_agent_to_file as _save_agent
-            from src.tools.helpers_registry import save_agent_to_registry
+            from src.tools.helpers_registry import save_agents_to_registry
 
+            owner_agent = next(
+                (a for a in app_ctx.agents.values() if a.role == AgentRole.OWNER),
+                None,
+            )
+            registry_entries = []
             for agent in app_ctx.agents.values():
                 _save_agent(app_ctx, agent)
-                owner_agent = next(
-                    (a for a in app_ctx.agents.values() if a.role == AgentRole.OWNER),
-                    None,
-                )
                 owner_id = owner_agent.id if owner_agent else agent.id
-                if agent.role == AgentRole.OWNER:
-                    owner_id = agent.id
-                save_agent_to_registry(
-                    agent_id=agent.id,
-                    owner_id=owner_id,
-                    project_root=resolved_project_root,
-                    session_id=session_id,
+                registry_entries.append(
+                    (agent.id, owner_id, resolved_project_root, session_id)
                 )
+            # レジストリへは 1 トランザクションでまとめて登録する
+            save_agents_to_registry(registry_entries)
             provisional_cleanup_result = cleanup_orphan_provisional_sessions(
                 resolved_project_root,
                 app_ctx.settings.mcp_dir,
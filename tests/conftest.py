@@ -36,6 +36,20 @@ def disable_macos_notifications(monkeypatch):
     )
 
 
+@pytest.fixture(autouse=True)
+def isolate_agent_registry(tmp_path, monkeypatch):
+    """テスト中のグローバルレジストリを一時ディレクトリに向ける。"""
+    from src.tools.helpers_registry import reset_registry_cache
+
+    monkeypatch.setattr(
+        "src.tools.helpers_registry._get_agent_registry_dir",
+        lambda: tmp_path / "agent-registry",
+    )
+    reset_registry_cache()
+    yield
+    reset_registry_cache()
+
+
 @pytest.fixture
 def temp_dir():
     """一時ディレクトリを作成する。"""
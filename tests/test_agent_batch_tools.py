@@ -146,6 +146,7 @@ class TestPreferredCliNewWorker:
         """preferred_cli='cursor' 指定時に AICli.CURSOR で Worker が作成される。"""
         mock_tmux = AsyncMock()
         mock_tmux.create_main_session.return_value = True
+        mock_tmux.get_window_socket = MagicMock(return_value=None)
         mock_ctx = MagicMock()
         mock_ctx.tmux = mock_tmux
 
@@ -177,6 +178,7 @@ class TestPreferredCliNewWorker:
         """preferred_cli 未指定時はデフォルト CLI（get_worker_cli）が使われる。"""
         mock_tmux = AsyncMock()
         mock_tmux.create_main_session.return_value = True
+        mock_tmux.get_window_socket = MagicMock(return_value=None)
         mock_ctx = MagicMock()
         mock_ctx.tmux = mock_tmux
 
@@ -207,6 +209,7 @@ class TestPreferredCliNewWorker:
         """無効な preferred_cli はデフォルト CLI にフォールバックする。"""
         mock_tmux = AsyncMock()
         mock_tmux.create_main_session.return_value = True
+        mock_tmux.get_window_socket = MagicMock(return_value=None)
         mock_ctx = MagicMock()
         mock_ctx.tmux = mock_tmux
 
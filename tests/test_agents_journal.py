@@ -0,0 +1,137 @@
+"""agents_journal（agents.json のスナップショット + 追記ジャーナル）のテスト。"""
+
+import json
+
+import pytest
+
+from src.managers import agents_journal
+from src.managers.agents_journal import (
+    append_agent_records,
+    compact_agents_journal,
+    delete_agents_store,
+    get_journal_path,
+    read_agents_data,
+)
+
+
+@pytest.fixture
+def agents_file(temp_dir):
+    return temp_dir / "session" / "agents.json"
+
+
+def _record(agent_id: str, status: str = "idle") -> dict:
+    return {"id": agent_id, "status": status}
+
+
+class TestAgentsJournal:
+    """追記・読み込みのテスト。"""
+
+    def test_append_is_replayed_without_rewriting_snapshot(self, agents_file):
+        """追記はジャーナルにのみ書かれ、読み込み時に適用される。"""
+        append_agent_records(agents_file, {"a": _record("a")})
+        snapshot_before = agents_file.stat()
+
+        append_agent_records(agents_file, {"b": _record("b"), "a": _record("a", "busy")})
+        append_agent_records(agents_file, {"b": None})
+
+        snapshot_after = agents_file.stat()
+        assert (snapshot_after.st_ino, snapshot_after.st_size) == (
+            snapshot_before.st_ino,
+            snapshot_before.st_size,
+        )
+        assert read_agents_data(agents_file) == {"a": _record("a", "busy")}
+
+    def test_partial_trailing_line_is_ignored(self, agents_file):
+        """追記途中の末尾行は無視する。"""
+        append_agent_records(agents_file, {"a": _record("a")})
+        with open(get_journal_path(agents_file), "a", encoding="utf-8") as f:
+            f.write('{"id": "b", "agent": {"id"')
+
+        assert read_agents_data(agents_file) == {"a": _record("a")}
+
+    def test_compacts_when_journal_exceeds_threshold(self, agents_file, monkeypatch):
+        """ジャーナルが閾値を超えるとスナップショットへ畳み込む。"""
+        monkeypatch.setattr(agents_journal, "_JOURNAL_COMPACT_BYTES", 200)
+        for i in range(10):
+            append_agent_records(agents_file, {f"agent-{i}": _record(f"agent-{i}")})
+
+        snapshot = json.loads(agents_file.read_text(encoding="utf-8"))
+        assert len(snapshot) >= 5
+        assert get_journal_path(agents_file).stat().st_size <= 200
+        assert len(read_agents_data(agents_file)) == 10
+
+    def test_explicit_compaction(self, agents_file):
+        """compact_agents_journal でスナップショットに最新状態が書き出される。"""
+        append_agent_records(agents_file, {"a": _record("a"), "b": _record("b")})
+        append_agent_records(agents_file, {"a": None})
+
+        assert compact_agents_journal(agents_file) is True
+        assert json.loads(agents_file.read_text(encoding="utf-8")) == {"b": _record("b")}
+        assert read_agents_data(agents_file) == {"b": _record("b")}
+
+    def test_externally_replaced_snapshot_discards_journal(self, agents_file):
+        """agents.json が外部で書き換えられたら古いジャーナルは適用しない。"""
+        append_agent_records(agents_file, {"a": _record("a")})
+        agents_file.write_text(json.dumps({"x": _record("x")}), encoding="utf-8")
+
+        assert read_agents_data(agents_file) == {"x": _record("x")}
+        assert not get_journal_path(agents_file).exists()
+
+        append_agent_records(agents_file, {"y": _record("y")})
+        assert read_agents_data(agents_file) == {"x": _record("x"), "y": _record("y")}
+
+    def test_stale_journal_after_compaction_is_not_applied(self, agents_file):
+        """基準が一致しないジャーナル（コンパクション競合）は適用しない。"""
+        append_agent_records(agents_file, {"a": _record("a")})
+        stale_journal = get_journal_path(agents_file).read_text(encoding="utf-8")
+        append_agent_records(agents_file, {"a": _record("a", "busy")})
+        compact_agents_journal(agents_file)
+        get_journal_path(agents_file).write_text(stale_journal, encoding="utf-8")
+
+        assert read_agents_data(agents_file) == {"a": _record("a", "busy")}
+
+    def test_delete_store_removes_snapshot_and_journal(self, agents_file):
+        """delete_agents_store で agents.json とジャーナルを削除する。"""
+        append_agent_records(agents_file, {"a": _record("a")})
+
+        assert delete_agents_store(agents_file) is True
+        assert not agents_file.exists()
+        assert not get_journal_path(agents_file).exists()
+        assert delete_agents_store(agents_file) is False
+
+    def test_incremental_read_applies_only_new_records(self, agents_file, monkeypatch):
+        """2 回目以降はジャーナルの追記分だけを読んで適用する。"""
+        append_agent_records(agents_file, {"a": _record("a"), "b": _record("b")})
+        first = read_agents_data(agents_file)
+
+        applied: list[bytes] = []
+        original = agents_journal._apply_records
+        monkeypatch.setattr(
+            agents_journal,
+            "_apply_records",
+            lambda data, chunk: (applied.append(chunk), original(data, chunk)),
+        )
+        append_agent_records(agents_file, {"b": _record("b", "busy")})
+
+        assert read_agents_data(agents_file) == {"a": _record("a"), "b": _record("b", "busy")}
+        assert len(applied) == 1
+        assert applied[0].count(b"\n") == 1
+        # 以前に返した dict は変更されない
+        assert first["b"] == _record("b")
+
+    def test_incremental_read_detects_compaction_and_replacement(self, agents_file):
+        """コンパクションや外部での置き換え後は全体を読み直す。"""
+        append_agent_records(agents_file, {"a": _record("a")})
+        read_agents_data(agents_file)
+
+        append_agent_records(agents_file, {"b": _record("b")})
+        compact_agents_journal(agents_file)
+        append_agent_records(agents_file, {"c": _record("c")})
+        assert set(read_agents_data(agents_file)) == {"a", "b", "c"}
+
+        agents_file.write_text(json.dumps({"x": _record("x")}), encoding="utf-8")
+        assert read_agents_data(agents_file) == {"x": _record("x")}
+
+        delete_agents_store(agents_file)
+        with pytest.raises(FileNotFoundError):
+            read_agents_data(agents_file)
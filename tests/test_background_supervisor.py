@@ -0,0 +1,240 @@
+"""BackgroundSupervisor のテスト。"""
+
+import asyncio
+import random
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.managers.background_jobs import (
+    MEMORY_PRUNE_JOB,
+    REGISTRY_GC_JOB,
+    SCHEDULER_AUTO_ASSIGN_JOB,
+    register_default_jobs,
+)
+from src.managers.background_supervisor import BackgroundSupervisor
+
+
+async def _wait_until(predicate, timeout: float = 2.0) -> None:
+    """条件が満たされるまでイベントループを回す。"""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("条件が満たされませんでした")
+        await asyncio.sleep(0.005)
+
+
+def _job(supervisor: BackgroundSupervisor, name: str) -> dict:
+    return next(job for job in supervisor.snapshot() if job["name"] == name)
+
+
+class TestBackgroundSupervisor:
+    """ジョブの実行・失敗時の方針・停止のテスト。"""
+
+    def test_register_validates_parameters(self):
+        """重複名や不正なパラメータは登録できない。"""
+        supervisor = BackgroundSupervisor()
+
+        async def noop():
+            return None
+
+        supervisor.register("a", noop, interval_seconds=10)
+        with pytest.raises(ValueError):
+            supervisor.register("a", noop)
+        with pytest.raises(ValueError):
+            supervisor.register("b", noop, interval_seconds=0)
+        with pytest.raises(ValueError):
+            supervisor.register("c", noop, restart_policy="retry")
+        assert _job(supervisor, "a")["state"] == "pending"
+
+    @pytest.mark.asyncio
+    async def test_periodic_job_runs_and_records_stats(self):
+        """周期ジョブが繰り返し実行され、実行回数と所要時間が記録される。"""
+        supervisor = BackgroundSupervisor(rng=random.Random(0))
+        calls = []
+
+        async def tick():
+            calls.append(1)
+
+        supervisor.register("tick", tick, interval_seconds=0.01, run_on_start=True)
+        await supervisor.start()
+        await _wait_until(lambda: len(calls) >= 3)
+        await supervisor.stop()
+
+        job = _job(supervisor, "tick")
+        assert job["runs"] >= 3
+        assert job["failures"] == 0
+        assert job["last_duration_seconds"] is not None
+        assert job["state"] == "stopped"
+
+    @pytest.mark.asyncio
+    async def test_event_job_runs_only_when_triggered(self):
+        """イベント実行のみのジョブは trigger されたときだけ実行される。"""
+        supervisor = BackgroundSupervisor()
+        calls = []
+
+        async def handle():
+            calls.append(1)
+
+        supervisor.register("event", handle)
+        assert supervisor.trigger("missing") is False
+        await supervisor.start()
+        await asyncio.sleep(0.05)
+        assert calls == []
+
+        assert supervisor.trigger("event") is True
+        await _wait_until(lambda: len(calls) == 1)
+        await supervisor.stop()
+        assert _job(supervisor, "event")["triggers"] == 1
+        assert supervisor.trigger("event") is False
+
+    @pytest.mark.asyncio
+    async def test_stop_policy_disables_job_after_error_budget(self):
+        """restart_policy=stop のジョブは連続失敗が上限に達すると停止する。"""
+        supervisor = BackgroundSupervisor()
+
+        async def broken():
+            raise RuntimeError("boom")
+
+        supervisor.register(
+            "broken", broken, interval_seconds=0.01, error_budget=2, restart_policy="stop"
+        )
+        await supervisor.start()
+        await _wait_until(lambda: _job(supervisor, "broken")["state"] == "stopped")
+
+        job = _job(supervisor, "broken")
+        assert job["failures"] == 2
+        assert job["last_error"] == "RuntimeError: boom"
+        assert supervisor.trigger("broken") is False
+        await supervisor.stop()
+
+    @pytest.mark.asyncio
+    async def test_restart_policy_resumes_after_delay(self):
+        """restart_policy=restart のジョブは待機後に再開し、成功で連続失敗が解消される。"""
+        supervisor = BackgroundSupervisor()
+        outcomes = iter([RuntimeError("1"), RuntimeError("2")])
+
+        async def flaky():
+            error = next(outcomes, None)
+            if error is not None:
+                raise error
+
+        supervisor.register(
+            "flaky",
+            flaky,
+            interval_seconds=0.01,
+            error_budget=2,
+            restart_delay_seconds=0.01,
+        )
+        await supervisor.start()
+        await _wait_until(lambda: _job(supervisor, "flaky")["runs"] >= 3)
+        await supervisor.stop()
+
+        job = _job(supervisor, "flaky")
+        assert job["restarts"] == 1
+        assert job["failures"] == 2
+        assert job["consecutive_failures"] == 0
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_jobs_exceeding_timeout(self):
+        """停止時に完了しないジョブはタイムアウト後にキャンセルされる。"""
+        supervisor = BackgroundSupervisor()
+        started = asyncio.Event()
+
+        async def slow():
+            started.set()
+            await asyncio.sleep(60)
+
+        supervisor.register("slow", slow, run_on_start=True)
+        await supervisor.start()
+        await started.wait()
+        await supervisor.stop(timeout_seconds=0.01)
+
+        assert supervisor.running is False
+        assert _job(supervisor, "slow")["state"] == "stopped"
+
+
+class TestDefaultJobs:
+    """既定ジョブのテスト。"""
+
+    @pytest.mark.asyncio
+    async def test_memory_prune_job_uses_initialized_manager(self, settings):
+        """memory_prune は初期化済みの MemoryManager のみを整理する。"""
+        app_ctx = MagicMock()
+        app_ctx.settings = settings
+        app_ctx.memory_manager = None
+        supervisor = BackgroundSupervisor()
+        register_default_jobs(app_ctx, supervisor)
+
+        await supervisor.start()
+        supervisor.trigger(MEMORY_PRUNE_JOB)
+        await _wait_until(lambda: _job(supervisor, MEMORY_PRUNE_JOB)["runs"] == 1)
+
+        app_ctx.memory_manager = MagicMock()
+        app_ctx.memory_manager.prune.return_value = 2
+        supervisor.trigger(MEMORY_PRUNE_JOB)
+        await _wait_until(lambda: _job(supervisor, MEMORY_PRUNE_JOB)["runs"] == 2)
+        await supervisor.stop()
+
+        app_ctx.memory_manager.prune.assert_called_once_with()
+        assert _job(supervisor, MEMORY_PRUNE_JOB)["failures"] == 0
+
+    def test_memory_prune_can_be_disabled(self, settings):
+        """間隔 0 の場合は memory_prune を登録しない。"""
+        settings.memory_prune_interval_seconds = 0
+        settings.registry_gc_interval_seconds = 0
+        app_ctx = MagicMock()
+        app_ctx.settings = settings
+        supervisor = BackgroundSupervisor()
+        register_default_jobs(app_ctx, supervisor)
+        assert [job["name"] for job in supervisor.snapshot()] == [SCHEDULER_AUTO_ASSIGN_JOB]
+
+    @pytest.mark.asyncio
+    async def test_auto_assign_enabled_after_startup_runs(self, settings):
+        """起動後に設定を有効化しても scheduler_auto_assign が割り当てを行う。"""
+        from unittest.mock import AsyncMock
+
+        settings.memory_prune_interval_seconds = 0
+        settings.registry_gc_interval_seconds = 0
+        app_ctx = MagicMock()
+        app_ctx.settings = settings
+        app_ctx.project_root = None
+        app_ctx.scheduler_manager.run_locked = AsyncMock(return_value=[])
+        supervisor = BackgroundSupervisor()
+        register_default_jobs(app_ctx, supervisor)
+        await supervisor.start()
+
+        supervisor.trigger(SCHEDULER_AUTO_ASSIGN_JOB)
+        await _wait_until(lambda: _job(supervisor, SCHEDULER_AUTO_ASSIGN_JOB)["runs"] == 1)
+        app_ctx.scheduler_manager.run_locked.assert_not_awaited()
+
+        app_ctx.settings = settings.model_copy(
+            update={"scheduler_event_auto_assign_enabled": True}
+        )
+        assert supervisor.trigger(SCHEDULER_AUTO_ASSIGN_JOB) is True
+        await _wait_until(lambda: _job(supervisor, SCHEDULER_AUTO_ASSIGN_JOB)["runs"] == 2)
+        await supervisor.stop()
+
+        app_ctx.scheduler_manager.run_locked.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_registry_gc_runs_on_start(self, settings, temp_dir):
+        """registry_gc は起動直後に実行され、存在しない project_root の登録を削除する。"""
+        from src.tools.helpers_registry import (
+            read_agent_registry_entry,
+            save_agent_to_registry,
+        )
+
+        save_agent_to_registry("stale-001", "stale-001", str(temp_dir / "gone"))
+        settings.memory_prune_interval_seconds = 0
+        app_ctx = MagicMock()
+        app_ctx.settings = settings
+        supervisor = BackgroundSupervisor()
+        register_default_jobs(app_ctx, supervisor)
+
+        await supervisor.start()
+        await _wait_until(lambda: _job(supervisor, REGISTRY_GC_JOB)["runs"] == 1)
+        await supervisor.stop()
+
+        assert read_agent_registry_entry("stale-001") is None
+        assert _job(supervisor, REGISTRY_GC_JOB)["failures"] == 0
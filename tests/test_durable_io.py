@@ -0,0 +1,145 @@
+"""durable_io（メタデータ書き込みの耐久性モード）のテスト。"""
+
+import os
+import stat
+from unittest.mock import patch
+
+import pytest
+
+from src.config.settings import Durability, Settings
+from src.managers import durable_io
+from src.managers.agents_journal import append_agent_records
+from src.managers.durable_io import (
+    atomic_write,
+    durability_batch,
+    get_durability,
+    set_durability,
+)
+from src.tools import helpers_registry
+from src.tools.helpers_registry import REGISTRY_DB_FILE_NAME, save_agent_to_registry
+
+
+@pytest.fixture(autouse=True)
+def restore_durability():
+    previous = get_durability()
+    yield
+    set_durability(previous)
+
+
+@pytest.fixture
+def sync_calls():
+    """fdatasync（ファイル）と fsync（ディレクトリ）の呼び出しを記録する。"""
+    with (
+        patch.object(durable_io.os, "fdatasync", wraps=os.fdatasync) as file_sync,
+        patch.object(durable_io.os, "fsync", wraps=os.fsync) as dir_sync,
+    ):
+        yield file_sync, dir_sync
+
+
+class TestDurabilityModes:
+    """モードごとの fsync の有無のテスト。"""
+
+    def test_set_durability_validates_mode(self):
+        """既知のモード（Enum も可）のみ受け付ける。"""
+        set_durability(Durability.DURABLE)
+        assert get_durability() == "durable"
+        with pytest.raises(ValueError):
+            set_durability("paranoid")
+        assert get_durability() == "durable"
+
+    def test_settings_rejects_unknown_mode(self, monkeypatch):
+        """MCP_DURABILITY に未知の値を指定するとエラーになる。"""
+        monkeypatch.setenv("MCP_DURABILITY", "atomic")
+        assert Settings().durability == Durability.ATOMIC
+        monkeypatch.setenv("MCP_DURABILITY", "paranoid")
+        with pytest.raises(ValueError):
+            Settings()
+
+    @pytest.mark.parametrize(
+        ("mode", "file_syncs", "dir_syncs"),
+        [("fast", 0, 0), ("atomic", 1, 0), ("durable", 1, 1)],
+    )
+    def test_atomic_write_syncs_per_mode(self, temp_dir, sync_calls, mode, file_syncs, dir_syncs):
+        """fast は fsync なし、atomic はファイルのみ、durable はディレクトリも fsync する。"""
+        set_durability(mode)
+        target = temp_dir / "nested" / "state.json"
+
+        atomic_write(target, '{"ok": true}')
+
+        assert target.read_text(encoding="utf-8") == '{"ok": true}'
+        assert list(target.parent.glob("*.tmp")) == []
+        assert (sync_calls[0].call_count, sync_calls[1].call_count) == (file_syncs, dir_syncs)
+
+    def test_batch_groups_directory_syncs(self, temp_dir, sync_calls):
+        """durability_batch 内のディレクトリ fsync はディレクトリごと 1 回にまとまる。"""
+        set_durability("durable")
+        (temp_dir / "a").mkdir()
+        (temp_dir / "b").mkdir()
+
+        with durability_batch():
+            for i in range(5):
+                atomic_write(temp_dir / "a" / f"{i}.md", "x")
+            atomic_write(temp_dir / "b" / "0.md", "x")
+            assert sync_calls[1].call_count == 0
+
+        assert sync_calls[0].call_count == 6
+        assert sync_calls[1].call_count == 2
+
+    def test_failed_write_removes_temp_file(self, temp_dir):
+        """置換に失敗した場合は一時ファイルを残さない。"""
+        target = temp_dir / "state.json"
+        with (
+            patch.object(durable_io.os, "replace", side_effect=OSError("boom")),
+            pytest.raises(OSError),
+        ):
+            atomic_write(target, "x")
+
+        assert list(temp_dir.iterdir()) == []
+
+    def test_file_mode_follows_umask_or_existing_file(self, temp_dir, monkeypatch):
+        """新規作成は起動時の umask に従い、既存ファイルはモードを引き継ぐ。"""
+        created = temp_dir / "created.md"
+        existing = temp_dir / "existing.md"
+        existing.write_text("old")
+        existing.chmod(0o640)
+        monkeypatch.setattr(durable_io, "_new_file_mode", 0o644)
+
+        # 他スレッドのファイル作成に影響しないよう、書き込みごとに umask を変更しない
+        with patch.object(durable_io.os, "umask") as umask:
+            atomic_write(created, "new")
+            atomic_write(existing, "new")
+
+        umask.assert_not_called()
+        assert stat.S_IMODE(created.stat().st_mode) == 0o644
+        assert stat.S_IMODE(existing.stat().st_mode) == 0o640
+        assert existing.read_text() == "new"
+
+
+class TestDurabilityIntegration:
+    """各書き込み経路がモードに従うことのテスト。"""
+
+    def test_journal_append_syncs_only_when_durable(self, temp_dir, sync_calls):
+        """ジャーナルへの追記は durable のときだけ fsync する。"""
+        agents_file = temp_dir / "agents.json"
+        append_agent_records(agents_file, {"a": {"id": "a"}})
+        sync_calls[0].reset_mock()
+
+        set_durability("atomic")
+        append_agent_records(agents_file, {"a": {"id": "a", "status": "busy"}})
+        assert sync_calls[0].call_count == 0
+
+        set_durability("durable")
+        append_agent_records(agents_file, {"a": {"id": "a", "status": "idle"}})
+        assert sync_calls[0].call_count == 1
+
+    def test_registry_synchronous_follows_mode(self, temp_dir):
+        """レジストリの PRAGMA synchronous がモードに合わせて切り替わる。"""
+        save_agent_to_registry("agent-1", "owner-1", str(temp_dir))
+        conn = helpers_registry._registry_connections[
+            (os.getpid(), str(helpers_registry._get_agent_registry_dir() / REGISTRY_DB_FILE_NAME))
+        ]
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+        set_durability("durable")
+        save_agent_to_registry("agent-2", "owner-1", str(temp_dir))
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2  # FULL
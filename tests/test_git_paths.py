@@ -0,0 +1,121 @@
+"""git_paths（git リポジトリのパス解決キャッシュ）のテスト。"""
+
+import os
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.managers.git_paths import (
+    clear_git_path_cache,
+    get_git_path_cache_stats,
+    locate_git_repository,
+)
+from src.tools.helpers_git import resolve_main_repo_root
+
+
+def _git_rev_parse(path: Path) -> tuple[Path, Path]:
+    result = subprocess.run(
+        ["git", "-C", str(path), "rev-parse", "--show-toplevel", "--git-common-dir"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    toplevel, common_dir = result.stdout.strip().splitlines()
+    common = Path(common_dir)
+    if not common.is_absolute():
+        common = path / common
+    return Path(os.path.realpath(toplevel)), Path(os.path.realpath(common))
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch):
+    for name in ("GIT_DIR", "GIT_WORK_TREE", "GIT_COMMON_DIR", "GIT_CEILING_DIRECTORIES"):
+        monkeypatch.delenv(name, raising=False)
+    clear_git_path_cache()
+    yield
+    clear_git_path_cache()
+
+
+@pytest.fixture
+def worktree(git_repo, temp_dir):
+    path = temp_dir / "wt"
+    subprocess.run(
+        ["git", "worktree", "add", "-b", "feature", str(path)],
+        cwd=str(git_repo),
+        capture_output=True,
+        check=True,
+    )
+    return path
+
+
+class TestLocateGitRepository:
+    """ファイルシステムのみでの解決のテスト。"""
+
+    def test_matches_git_for_repo_subdir_and_worktree(self, git_repo, worktree):
+        """通常リポジトリ・サブディレクトリ・worktree で git と同じ結果になる。"""
+        subdir = git_repo / "a" / "b"
+        subdir.mkdir(parents=True)
+
+        with patch("src.managers.git_paths.subprocess.run") as mock_run:
+            results = {p: locate_git_repository(p) for p in (git_repo, subdir, worktree)}
+        mock_run.assert_not_called()
+
+        for path, location in results.items():
+            assert (location.toplevel, location.common_dir) == _git_rev_parse(path)
+
+    def test_resolve_main_repo_root_from_worktree(self, git_repo, worktree):
+        """worktree からメインリポジトリのルートを解決できる。"""
+        assert resolve_main_repo_root(worktree) == os.path.realpath(git_repo)
+        assert resolve_main_repo_root(git_repo) == os.path.realpath(git_repo)
+
+    def test_resolve_main_repo_root_rejects_missing_path(self, git_repo):
+        """リポジトリ内でも存在しないパスは ValueError（typo を黙って解決しない）。"""
+        with pytest.raises(ValueError):
+            resolve_main_repo_root(git_repo / "no-such-dir")
+
+    def test_non_repository_returns_none(self, temp_dir):
+        """.git が見つからないパスは None（git は起動しない）。"""
+        plain = temp_dir / "plain"
+        plain.mkdir()
+
+        with patch("src.managers.git_paths.subprocess.run") as mock_run:
+            assert locate_git_repository(plain) is None
+        mock_run.assert_not_called()
+        with pytest.raises(ValueError):
+            resolve_main_repo_root(plain)
+
+    def test_cache_hit_and_invalidation_on_git_entry_mtime(self, git_repo):
+        """2 回目はキャッシュから返し、.git の mtime が変わると再解決する。"""
+        locate_git_repository(git_repo)
+        locate_git_repository(git_repo)
+        stats = get_git_path_cache_stats()
+        assert stats["fast_path"] == 1
+        assert stats["cache_hits"] == 1
+        assert stats["git_spawns_avoided"] == 2
+
+        git_entry = git_repo / ".git"
+        mtime = git_entry.stat().st_mtime_ns + 1_000_000_000
+        os.utime(git_entry, ns=(mtime, mtime))
+        locate_git_repository(git_repo)
+
+        assert get_git_path_cache_stats()["fast_path"] == 2
+
+    def test_unreadable_git_file_falls_back_to_git(self, temp_dir):
+        """解釈できない .git ファイルは git rev-parse で解決を試みる。"""
+        broken = temp_dir / "broken"
+        broken.mkdir()
+        (broken / ".git").write_text("not a pointer\n", encoding="utf-8")
+
+        assert locate_git_repository(broken) is None
+        assert get_git_path_cache_stats()["git_fallbacks"] == 1
+
+    def test_git_env_override_uses_git(self, git_repo, monkeypatch):
+        """GIT_DIR 等が設定されている場合は git の判定に従う。"""
+        monkeypatch.setenv("GIT_DIR", str(git_repo / ".git"))
+
+        location = locate_git_repository(git_repo)
+
+        assert location is not None
+        assert get_git_path_cache_stats()["git_fallbacks"] == 1
@@ -184,6 +184,38 @@ async def test_stop_healthcheck_daemon(temp_dir, settings):
     assert is_healthcheck_daemon_running(app_ctx) is False
 
 
+@pytest.mark.asyncio
+async def test_stop_cancels_detached_recoveries(temp_dir, settings):
+    """daemon 停止時はサイクルを跨いで継続中の復旧をキャンセルして終了を待つ。"""
+    from src.managers.healthcheck_manager import HealthcheckManager
+
+    settings.healthcheck_interval_seconds = 10
+    settings.healthcheck_idle_stop_consecutive = 100
+    worker = _make_idle_worker()
+    app_ctx = _make_daemon_ctx(temp_dir, settings, {worker.id: worker})
+    manager = HealthcheckManager(app_ctx.tmux, app_ctx.agents)
+    manager.monitor_and_recover_workers = app_ctx.healthcheck_manager.monitor_and_recover_workers
+    app_ctx.healthcheck_manager = manager
+    recovery_cancelled = asyncio.Event()
+
+    async def _hanging_recovery():
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            recovery_cancelled.set()
+            raise
+
+    recovery = asyncio.create_task(_hanging_recovery())
+    manager._recovery_tasks[worker.id] = recovery
+
+    await start_healthcheck_daemon(app_ctx)
+    await stop_healthcheck_daemon(app_ctx, timeout_seconds=2.0)
+
+    assert recovery.done()
+    assert recovery_cancelled.is_set()
+    assert manager._recovery_tasks == {}
+
+
 @pytest.mark.asyncio
 async def test_stop_when_not_running_returns_false(temp_dir, settings):
     """daemon が起動していない状態で stop を呼ぶと False を返す。"""
@@ -226,3 +258,28 @@ def test_should_auto_stop_with_no_workers(temp_dir, settings):
     """Worker がいない場合は auto-stop 条件を満たす。"""
     app_ctx = _make_daemon_ctx(temp_dir, settings)
     assert _should_auto_stop(app_ctx) is True
+
+
+@pytest.mark.asyncio
+async def test_daemon_monitors_only_due_workers(temp_dir, settings):
+    """daemon はスケジューラで期限到来した Worker のみを監視する。"""
+    settings.healthcheck_interval_seconds = 10
+    settings.healthcheck_idle_stop_consecutive = 100
+
+    worker = _make_idle_worker()
+    app_ctx = _make_daemon_ctx(temp_dir, settings, {worker.id: worker})
+
+    with patch("src.tools.helpers.sync_agents_from_file"):
+        await start_healthcheck_daemon(app_ctx)
+        for _ in range(50):
+            if app_ctx.healthcheck_manager.monitor_and_recover_workers.await_count:
+                break
+            await asyncio.sleep(0.02)
+        await stop_healthcheck_daemon(app_ctx, timeout_seconds=2.0)
+
+    monitor = app_ctx.healthcheck_manager.monitor_and_recover_workers
+    monitor.assert_awaited_once()
+    assert monitor.await_args.kwargs["agent_ids"] == [worker.id]
+    schedule = app_ctx.healthcheck_scheduler.snapshot()
+    assert schedule[0]["agent_id"] == worker.id
+    assert schedule[0]["reason"] == "idle"
@@ -1,6 +1,8 @@
 """HealthcheckManagerのテスト。"""
 
+import asyncio
 import hashlib
+import json
 from datetime import datetime, timedelta
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
@@ -681,3 +683,707 @@ class TestHealthcheckMonitoring:
         current_task = dashboard.get_task(task.id)
         assert current_task is not None
         assert current_task.metadata["process_recovery_count"] == 2
+
+
+class TestPaneActivityChangeDetection:
+    """tmux 活動カウンタによる変化検知のテスト。"""
+
+    @staticmethod
+    def _make_worker() -> Agent:
+        now = datetime.now()
+        return Agent(
+            id="worker-001",
+            role=AgentRole.WORKER,
+            status=AgentStatus.BUSY,
+            tmux_session="test:0.1",
+            session_name="test",
+            window_index=0,
+            pane_index=1,
+            current_task="task-001",
+            created_at=now,
+            last_activity=now,
+        )
+
+    @pytest.mark.asyncio
+    async def test_pane_activity_avoids_capture(self):
+        """pane_activity が取れる場合は capture-pane を呼ばない。"""
+        worker = self._make_worker()
+        tmux = MagicMock()
+        tmux.get_pane_activity = AsyncMock(
+            side_effect=[
+                {"pane_activity": 100, "window_activity": 100, "history_size": 5},
+                {"pane_activity": 100, "window_activity": 120, "history_size": 5},
+                {"pane_activity": 130, "window_activity": 130, "history_size": 6},
+            ]
+        )
+        tmux.capture_pane_by_index = AsyncMock(return_value="output")
+        healthcheck = HealthcheckManager(tmux_manager=tmux, agents={worker.id: worker})
+
+        first = await healthcheck._pane_change_signature(worker)
+        second = await healthcheck._pane_change_signature(worker)
+        third = await healthcheck._pane_change_signature(worker)
+
+        assert first == second
+        assert third != second
+        tmux.capture_pane_by_index.assert_not_called()
+        assert healthcheck.get_summary()["change_detection"]["activity"] == 3
+
+    @pytest.mark.asyncio
+    async def test_unchanged_window_activity_reuses_previous_signature(self):
+        """window_activity が前回観測以前のまま変わらなければ再キャプチャしない。"""
+        worker = self._make_worker()
+        tmux = MagicMock()
+        tmux.get_pane_activity = AsyncMock(
+            return_value={"pane_activity": None, "window_activity": 100, "history_size": 5}
+        )
+        tmux.capture_pane_by_index = AsyncMock(return_value="output")
+        healthcheck = HealthcheckManager(tmux_manager=tmux, agents={worker.id: worker})
+
+        first = await healthcheck._pane_change_signature(worker)
+        healthcheck._pane_hash[worker.id] = first
+        second = await healthcheck._pane_change_signature(worker)
+
+        assert first == hashlib.sha1(b"output").hexdigest()
+        assert second == first
+        assert tmux.capture_pane_by_index.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_ambiguous_window_activity_falls_back_to_hash(self):
+        """他ペインの出力と区別できない場合は内容ハッシュで判定する。"""
+        worker = self._make_worker()
+        tmux = MagicMock()
+        tmux.get_pane_activity = AsyncMock(
+            side_effect=[
+                {"pane_activity": None, "window_activity": 100, "history_size": 5},
+                {"pane_activity": None, "window_activity": 2**40, "history_size": 5},
+            ]
+        )
+        tmux.capture_pane_by_index = AsyncMock(return_value="output")
+        healthcheck = HealthcheckManager(tmux_manager=tmux, agents={worker.id: worker})
+
+        await healthcheck._pane_change_signature(worker)
+        await healthcheck._pane_change_signature(worker)
+
+        assert tmux.capture_pane_by_index.await_count == 2
+        assert healthcheck.get_summary()["change_detection"]["content_hash"] == 2
+
+
+class TestConcurrentMonitoring:
+    """monitor_and_recover_workers の並行診断・並列復旧のテスト。"""
+
+    @staticmethod
+    def _make_workers(count: int) -> dict[str, Agent]:
+        now = datetime.now()
+        return {
+            f"worker-{i}": Agent(
+                id=f"worker-{i}",
+                role=AgentRole.WORKER,
+                status=AgentStatus.BUSY,
+                session_name="test",
+                window_index=0,
+                pane_index=i,
+                current_task=f"task-{i}",
+                created_at=now,
+                last_activity=now,
+            )
+            for i in range(1, count + 1)
+        }
+
+    @pytest.mark.asyncio
+    async def test_diagnosis_runs_concurrently_with_timeout(self):
+        """診断は並行実行され、タイムアウトした Worker だけが保留になる。"""
+        agents = self._make_workers(3)
+        healthcheck = HealthcheckManager(
+            tmux_manager=MagicMock(), agents=agents, diagnosis_timeout_seconds=0.2
+        )
+
+        async def diagnose(agent_id, agent, active_task, now):
+            if agent_id == "worker-3":
+                raise RuntimeError("tmux unavailable")
+            await asyncio.sleep(5 if agent_id == "worker-2" else 0.1)
+            return None, False
+
+        healthcheck._diagnose_worker_issue = diagnose
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        result = await healthcheck.monitor_and_recover_workers()
+
+        assert loop.time() - started < 1.0
+        assert result["diagnosis_timed_out"] == ["worker-2"]
+        assert result["diagnosis_failed"] == ["worker-3"]
+        assert healthcheck.metrics.outcomes["diagnosis_failed"] == 1
+        assert result["recovered"] == []
+
+    @pytest.mark.asyncio
+    async def test_recovery_respects_concurrency_limit(self):
+        """復旧は recovery_concurrency 件までしか同時実行されない。"""
+        agents = self._make_workers(4)
+        healthcheck = HealthcheckManager(
+            tmux_manager=MagicMock(), agents=agents, recovery_concurrency=2
+        )
+        healthcheck._diagnose_worker_issue = AsyncMock(return_value=("task_stalled", True))
+        running = 0
+        peak = 0
+
+        async def recover(app_ctx, agent_id, agent, reason, force, task_key):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+            return {"status": "recovered", "detail": {"agent_id": agent_id}}
+
+        healthcheck._attempt_staged_recovery = recover
+
+        result = await healthcheck.monitor_and_recover_workers()
+
+        assert peak == 2
+        assert [d["agent_id"] for d in result["recovered"]] == list(agents)
+
+    @pytest.mark.asyncio
+    async def test_slow_recovery_is_collected_next_cycle(self):
+        """待機上限を超えた復旧は継続し、次回サイクルで結果が回収される。"""
+        agents = self._make_workers(2)
+        healthcheck = HealthcheckManager(
+            tmux_manager=MagicMock(),
+            agents=agents,
+            recovery_timeout_seconds=0.1,
+        )
+        healthcheck._diagnose_worker_issue = AsyncMock(return_value=("task_stalled", True))
+        release = asyncio.Event()
+
+        async def recover(app_ctx, agent_id, agent, reason, force, task_key):
+            if agent_id == "worker-1":
+                await release.wait()
+            return {"status": "recovered", "detail": {"agent_id": agent_id}}
+
+        healthcheck._attempt_staged_recovery = recover
+
+        first = await healthcheck.monitor_and_recover_workers()
+        assert [d["agent_id"] for d in first["recovered"]] == ["worker-2"]
+        assert first["recovery_pending"] == ["worker-1"]
+
+        release.set()
+        await asyncio.sleep(0)
+        healthcheck._diagnose_worker_issue = AsyncMock(return_value=(None, False))
+        second = await healthcheck.monitor_and_recover_workers()
+        assert [d["agent_id"] for d in second["recovered"]] == ["worker-1"]
+        assert second["recovery_pending"] == []
+
+    @pytest.mark.asyncio
+    async def test_recovery_exception_is_escalated(self):
+        """復旧中の例外は他 Worker に波及せずエスカレーションとして報告される。"""
+        agents = self._make_workers(2)
+        healthcheck = HealthcheckManager(tmux_manager=MagicMock(), agents=agents)
+        healthcheck._diagnose_worker_issue = AsyncMock(return_value=("task_stalled", True))
+
+        async def recover(app_ctx, agent_id, agent, reason, force, task_key):
+            if agent_id == "worker-1":
+                raise RuntimeError("boom")
+            return {"status": "recovered", "detail": {"agent_id": agent_id}}
+
+        healthcheck._attempt_staged_recovery = recover
+
+        result = await healthcheck.monitor_and_recover_workers()
+
+        assert [d["agent_id"] for d in result["recovered"]] == ["worker-2"]
+        assert result["escalated"][0]["agent_id"] == "worker-1"
+        assert result["escalated"][0]["message"] == "boom"
+
+
+class TestDashboardCycleBatching:
+    """監視サイクル単位の Dashboard スナップショット・一括反映のテスト。"""
+
+    @staticmethod
+    def _setup(temp_dir, settings, worker_count: int):
+        dashboard = DashboardManager(
+            workspace_id="test-session",
+            workspace_path=str(temp_dir),
+            dashboard_dir=str(temp_dir / ".multi-agent-mcp" / "test-session" / "dashboard"),
+        )
+        dashboard.initialize()
+        ipc = IPCManager(str(temp_dir / ".ipc"))
+        ipc.initialize()
+
+        now = datetime.now()
+        agents: dict[str, Agent] = {
+            "admin-001": Agent(
+                id="admin-001",
+                role=AgentRole.ADMIN,
+                status=AgentStatus.IDLE,
+                created_at=now,
+                last_activity=now,
+            )
+        }
+        for i in range(1, worker_count + 1):
+            worker = Agent(
+                id=f"worker-{i}",
+                role=AgentRole.WORKER,
+                status=AgentStatus.BUSY,
+                session_name="test",
+                window_index=0,
+                pane_index=i,
+                created_at=now,
+                last_activity=now,
+            )
+            agents[worker.id] = worker
+            task = dashboard.create_task(title=f"task {i}", assigned_agent_id=worker.id)
+            dashboard.update_task_status(task.id, TaskStatus.IN_PROGRESS, progress=10)
+
+        app_ctx = AppContext(
+            settings=settings,
+            tmux=MagicMock(),
+            ai_cli=AiCliManager(settings),
+            agents=agents,
+            ipc_manager=ipc,
+            dashboard_manager=dashboard,
+            workspace_id="test-session",
+            project_root=str(temp_dir),
+            session_id="test-session",
+        )
+        healthcheck = HealthcheckManager(
+            tmux_manager=app_ctx.tmux, agents=agents, recovery_concurrency=4
+        )
+        healthcheck._diagnose_worker_issue = AsyncMock(return_value=("task_stalled", True))
+        return dashboard, app_ctx, healthcheck
+
+    @pytest.mark.asyncio
+    async def test_failed_cycle_unbinds_update_batch(self, temp_dir, settings):
+        """サイクルが例外で終了しても更新バッファは反映され、コンテキストから外れる。"""
+        from src.managers.healthcheck_manager import _active_update_batch
+
+        _, app_ctx, healthcheck = self._setup(temp_dir, settings, worker_count=1)
+        seen_batches = []
+
+        async def failing_cycle(*args):
+            seen_batches.append(healthcheck._current_update_batch())
+            raise RuntimeError("boom")
+
+        healthcheck._monitor_cycle = failing_cycle
+
+        with pytest.raises(RuntimeError):
+            await healthcheck.monitor_and_recover_workers(app_ctx)
+
+        assert seen_batches[0] is not None
+        assert seen_batches[0].closed is True
+        assert _active_update_batch.get() is None
+
+    @pytest.mark.asyncio
+    async def test_cancelling_monitor_cancels_cycle(self, temp_dir, settings):
+        """監視をキャンセルするとサイクル本体もキャンセルされ、バッファは反映される。"""
+        _, app_ctx, healthcheck = self._setup(temp_dir, settings, worker_count=1)
+        entered = asyncio.Event()
+        cycle_cancelled = False
+        seen_batches = []
+
+        async def slow_cycle(*args):
+            nonlocal cycle_cancelled
+            seen_batches.append(healthcheck._current_update_batch())
+            entered.set()
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                cycle_cancelled = True
+                raise
+
+        healthcheck._monitor_cycle = slow_cycle
+
+        monitor = asyncio.create_task(healthcheck.monitor_and_recover_workers(app_ctx))
+        await entered.wait()
+        monitor.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await monitor
+
+        assert cycle_cancelled is True
+        assert seen_batches[0].closed is True
+
+    @pytest.mark.asyncio
+    async def test_cycle_reads_once_and_commits_once(self, temp_dir, settings):
+        """Worker 数に関わらず Dashboard の読み込み・書き込み回数が一定となる。"""
+        dashboard, app_ctx, healthcheck = self._setup(temp_dir, settings, worker_count=6)
+        task_ids = {t.assigned_agent_id: t.id for t in dashboard.list_tasks()}
+
+        async def recover(ctx, agent_id, agent, reason, force, task_key):
+            if agent_id == "worker-1":
+                detail = await healthcheck._finalize_failed_task(ctx, agent_id, agent, reason)
+                return {"status": "failed", "detail": detail, "failed_task": detail}
+            healthcheck._increment_recovery_counter(ctx, agent_id, agent.current_task, reason)
+            return {"status": "recovered", "detail": {"agent_id": agent_id}}
+
+        healthcheck._attempt_staged_recovery = recover
+
+        transactions = 0
+        original_transaction = dashboard.run_dashboard_transaction
+
+        def counting_transaction(mutate, **kwargs):
+            nonlocal transactions
+            transactions += 1
+            return original_transaction(mutate, **kwargs)
+
+        dashboard.run_dashboard_transaction = counting_transaction  # type: ignore[method-assign]
+        dashboard.get_dashboard = MagicMock(wraps=dashboard.get_dashboard)  # type: ignore[method-assign]
+        dashboard.list_tasks = MagicMock(side_effect=AssertionError("no per-worker read"))  # type: ignore[method-assign]
+        dashboard.get_task = MagicMock(side_effect=AssertionError("no per-worker read"))  # type: ignore[method-assign]
+
+        result = await healthcheck.monitor_and_recover_workers(app_ctx)
+
+        # 一括更新 1 回 + failed 化に伴う Markdown 同期 1 回（Worker 数に依存しない）
+        assert transactions == 2
+        assert dashboard.get_dashboard.call_count == 1
+        assert len(result["recovered"]) == 5
+        assert [d["agent_id"] for d in result["failed_tasks"]] == ["worker-1"]
+
+        data = dashboard._read_dashboard()
+        assert data.process_crash_count == 6
+        assert data.process_recovery_count == 5
+        failed = data.get_task(task_ids["worker-1"])
+        assert failed.status == TaskStatus.FAILED
+        assert failed.error_message.startswith("healthcheck_recovery_failed")
+        recovered = data.get_task(task_ids["worker-2"])
+        assert recovered.metadata["process_recovery_count"] == 1
+        assert data.failed_tasks == 1
+
+        messages = app_ctx.ipc_manager.read_messages("admin-001")
+        assert [m.subject for m in messages] == [
+            f"task failed by healthcheck: {task_ids['worker-1']}"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_task_is_released_to_scheduler_after_commit(self, temp_dir, settings):
+        """failed 化したタスクは Dashboard 反映後にスケジューラーへ伝えられる。"""
+        from src.managers.background_jobs import SCHEDULER_AUTO_ASSIGN_JOB
+
+        settings.scheduler_event_auto_assign_enabled = True
+        dashboard, app_ctx, healthcheck = self._setup(temp_dir, settings, worker_count=1)
+        task_id = dashboard.list_tasks()[0].id
+        app_ctx.scheduler_manager = MagicMock()
+        app_ctx.background_supervisor = MagicMock()
+        released_status = []
+        app_ctx.scheduler_manager.release_task_nowait.side_effect = (
+            lambda tid, wid, completed: released_status.append(dashboard.get_task(tid).status)
+            or True
+        )
+
+        async def recover(ctx, agent_id, agent, reason, force, task_key):
+            detail = await healthcheck._finalize_failed_task(ctx, agent_id, agent, reason)
+            return {"status": "failed", "detail": detail, "failed_task": detail}
+
+        healthcheck._attempt_staged_recovery = recover
+        await healthcheck.monitor_and_recover_workers(app_ctx)
+
+        app_ctx.scheduler_manager.release_task_nowait.assert_called_once_with(
+            task_id, "worker-1", completed=False
+        )
+        assert released_status == [TaskStatus.FAILED]
+        app_ctx.background_supervisor.trigger.assert_called_once_with(SCHEDULER_AUTO_ASSIGN_JOB)
+
+    @pytest.mark.asyncio
+    async def test_detached_recovery_updates_immediately_after_cycle(self, temp_dir, settings):
+        """サイクル終了後に完了した復旧の更新は即時反映される。"""
+        dashboard, app_ctx, healthcheck = self._setup(temp_dir, settings, worker_count=1)
+        healthcheck.recovery_timeout_seconds = 0.05
+        task_id = dashboard.list_tasks()[0].id
+        release = asyncio.Event()
+        done = asyncio.Event()
+
+        async def recover(ctx, agent_id, agent, reason, force, task_key):
+            await release.wait()
+            healthcheck._increment_recovery_counter(ctx, agent_id, task_id, reason)
+            done.set()
+            return {"status": "recovered", "detail": {"agent_id": agent_id}}
+
+        healthcheck._attempt_staged_recovery = recover
+
+        result = await healthcheck.monitor_and_recover_workers(app_ctx)
+        assert result["recovery_pending"] == ["worker-1"]
+
+        release.set()
+        await done.wait()
+        task = dashboard.get_task(task_id)
+        assert task.metadata["process_recovery_count"] == 1
+
+
+class TestProcessProbe:
+    """/proc による AI CLI プロセス確認のテスト。"""
+
+    @staticmethod
+    def _setup(monkeypatch, pane_command: str, samples: list):
+        from src.managers import healthcheck_manager as hm_module
+        from src.managers.process_probe import ProcessStat, ProcessTreeSample
+
+        now = datetime.now()
+        agents = {
+            f"worker-{i}": Agent(
+                id=f"worker-{i}",
+                role=AgentRole.WORKER,
+                status=AgentStatus.BUSY,
+                session_name="proj",
+                window_index=0,
+                pane_index=i,
+                current_task=f"task-{i}",
+                created_at=now,
+                last_activity=now - timedelta(seconds=3600),
+            )
+            for i in (1, 2)
+        }
+        tmux = MagicMock()
+        tmux.session_exists = AsyncMock(return_value=True)
+        tmux.get_pane_current_command = AsyncMock(return_value=pane_command)
+        tmux.list_pane_processes = AsyncMock(
+            return_value={
+                f"proj:0.{i}": {"pane_pid": 1000 + i, "pane_current_command": pane_command}
+                for i in (1, 2)
+            }
+        )
+
+        remaining = list(samples)
+
+        def fake_probe(pane_pid, prefixes):
+            ai_ticks, state = remaining.pop(0) if len(remaining) > 1 else remaining[0]
+            if ai_ticks is None:
+                return ProcessTreeSample(ai_process=None, process_count=1)
+            ai = ProcessStat(
+                pid=pane_pid + 1, comm="node", state=state, cpu_ticks=ai_ticks, rss_pages=256
+            )
+            return ProcessTreeSample(ai_process=ai, process_count=2)
+
+        monkeypatch.setattr(hm_module, "is_proc_available", lambda: True)
+        monkeypatch.setattr(hm_module, "probe_process_tree", fake_probe)
+        healthcheck = HealthcheckManager(tmux_manager=tmux, agents=agents)
+        return healthcheck, tmux
+
+    @pytest.mark.asyncio
+    async def test_single_pane_listing_shared_across_workers(self, monkeypatch):
+        """複数 Worker の確認で list-panes は 1 回だけ実行し、個別取得は行わない。"""
+        healthcheck, tmux = self._setup(monkeypatch, "node", [(100, "S")])
+
+        statuses = await healthcheck.check_all_agents()
+
+        assert all(status.is_healthy for status in statuses)
+        assert tmux.list_pane_processes.await_count == 1
+        tmux.get_pane_current_command.assert_not_awaited()
+        probe = statuses[0].ai_process
+        assert probe["found"] is True
+        assert probe["alive"] is True
+        assert probe["rss_bytes"] > 0
+
+    @pytest.mark.asyncio
+    async def test_ai_cli_behind_shell_wrapper_is_alive(self, monkeypatch):
+        """フォアグラウンドが shell でも AI CLI プロセスが生きていれば正常とする。"""
+        healthcheck, _ = self._setup(monkeypatch, "bash", [(100, "S")])
+
+        status = await healthcheck.check_agent("worker-1")
+
+        assert status.is_healthy is True
+
+    @pytest.mark.asyncio
+    async def test_zombie_ai_cli_is_dead(self, monkeypatch):
+        """AI CLI が zombie の場合は ai_process_dead と判定する。"""
+        healthcheck, _ = self._setup(monkeypatch, "node", [(100, "Z")])
+
+        status = await healthcheck.check_agent("worker-1")
+
+        assert status.is_healthy is False
+        assert status.error_message == "ai_process_dead"
+
+    @pytest.mark.asyncio
+    async def test_missing_ai_cli_falls_back_to_pane_command(self, monkeypatch):
+        """AI CLI が見つからない場合は従来どおりコマンド名で判定する。"""
+        healthcheck, _ = self._setup(monkeypatch, "zsh", [(None, "S")])
+
+        status = await healthcheck.check_agent("worker-1")
+
+        assert status.error_message == "ai_process_dead"
+
+    @pytest.mark.asyncio
+    async def test_cpu_advancing_prevents_stall_detection(self, monkeypatch):
+        """画面が変化しなくても CPU 時間が進んでいれば停滞と判定しない。"""
+        healthcheck, _ = self._setup(monkeypatch, "bash", [(100, "S"), (160, "S")])
+        healthcheck._pane_change_signature = AsyncMock(return_value="same")
+        agent = healthcheck.agents["worker-1"]
+        now = datetime.now()
+        healthcheck._pane_hash["worker-1"] = "same"
+        healthcheck._pane_last_changed_at["worker-1"] = now - timedelta(seconds=3600)
+
+        await healthcheck.check_agent("worker-1")
+        assert healthcheck._ai_process_probe["worker-1"]["cpu_advancing"] is False
+        assert await healthcheck._is_worker_stalled("worker-1", agent, now) is True
+
+        healthcheck._pane_tables.clear()
+        await healthcheck.check_agent("worker-1")
+        probe = healthcheck._ai_process_probe["worker-1"]
+        assert probe["cpu_advancing"] is True
+        assert probe["cpu_seconds_delta"] > 0
+        assert await healthcheck._is_worker_stalled("worker-1", agent, now) is False
+
+    @pytest.mark.asyncio
+    async def test_idle_cpu_ticks_still_count_as_stalled(self, monkeypatch):
+        """アイドル時程度の CPU 時間の増加は処理中とみなさず、停滞と判定する。"""
+        from src.managers import healthcheck_manager as hm_module
+
+        healthcheck, _ = self._setup(monkeypatch, "node", [(100, "S"), (102, "S")])
+        healthcheck._pane_change_signature = AsyncMock(return_value="same")
+        agent = healthcheck.agents["worker-1"]
+        now = datetime.now()
+        healthcheck._pane_hash["worker-1"] = "same"
+        healthcheck._pane_last_changed_at["worker-1"] = now - timedelta(seconds=3600)
+
+        await healthcheck.check_agent("worker-1")
+        # 前回観測を 60 秒前とし、その間の増分 2 tick（約 0.03%）を評価する
+        pid, ticks, observed_at = healthcheck._cpu_samples["worker-1"]
+        healthcheck._cpu_samples["worker-1"] = (pid, ticks, observed_at - 60)
+        monkeypatch.setattr(hm_module, "clock_ticks_per_second", lambda: 100)
+        healthcheck._pane_tables.clear()
+        await healthcheck.check_agent("worker-1")
+
+        probe = healthcheck._ai_process_probe["worker-1"]
+        assert probe["cpu_seconds_delta"] == 0.02
+        assert probe["cpu_percent"] < healthcheck.cpu_active_min_percent
+        assert probe["cpu_advancing"] is False
+        assert await healthcheck._is_worker_stalled("worker-1", agent, now) is True
+
+
+class TestStatePersistence:
+    """監視状態の永続化・復元のテスト。"""
+
+    @staticmethod
+    def _manager(state_file, max_age: float = 3600.0) -> HealthcheckManager:
+        return HealthcheckManager(
+            tmux_manager=MagicMock(),
+            agents={},
+            state_file=state_file,
+            state_max_age_seconds=max_age,
+        )
+
+    def test_state_round_trip(self, temp_dir):
+        """保存した停滞基準と復旧試行回数が新しいインスタンスに引き継がれる。"""
+        state_file = temp_dir / "healthcheck_state.json"
+        changed_at = datetime.now() - timedelta(seconds=300)
+        first = self._manager(state_file)
+        first._pane_hash["worker-1"] = "sig"
+        first._pane_last_changed_at["worker-1"] = changed_at
+        first._recovery_failures["worker-1:task-1"] = 2
+
+        assert first.save_state() is True
+        assert first.save_state() is False
+
+        restored = self._manager(state_file)
+        assert restored._pane_hash == {"worker-1": "sig"}
+        assert restored._pane_last_changed_at["worker-1"] == changed_at
+        assert restored._recovery_failures == {"worker-1:task-1": 2}
+
+    def test_stale_or_invalid_state_is_discarded(self, temp_dir):
+        """保存から有効期間を過ぎた状態・形式違い・未来時刻は読み込まない。"""
+        state_file = temp_dir / "healthcheck_state.json"
+        first = self._manager(state_file)
+        first._recovery_failures["worker-1:task-1"] = 2
+        first._pane_last_changed_at["worker-1"] = datetime.now() + timedelta(hours=1)
+        first.save_state()
+
+        restored = self._manager(state_file)
+        assert restored._recovery_failures == {"worker-1:task-1": 2}
+        assert "worker-1" not in restored._pane_last_changed_at
+
+        data = json.loads(state_file.read_text())
+        data["saved_at"] = (datetime.now() - timedelta(hours=2)).isoformat()
+        state_file.write_text(json.dumps(data))
+        assert self._manager(state_file)._recovery_failures == {}
+
+        data["saved_at"] = datetime.now().isoformat()
+        data["version"] = 999
+        state_file.write_text(json.dumps(data))
+        assert self._manager(state_file)._recovery_failures == {}
+
+        state_file.write_text("{broken")
+        assert self._manager(state_file)._recovery_failures == {}
+
+    @pytest.mark.asyncio
+    async def test_monitor_cycle_persists_and_reinit_restores(self, temp_dir, settings):
+        """監視サイクル後に保存され、ensure_healthcheck_manager の再初期化で復元される。"""
+        from src.tools.helpers_managers import ensure_healthcheck_manager
+
+        app_ctx = AppContext(
+            settings=settings,
+            tmux=MagicMock(),
+            ai_cli=AiCliManager(settings),
+            agents={},
+            project_root=str(temp_dir),
+            session_id="test-session",
+        )
+        healthcheck = ensure_healthcheck_manager(app_ctx)
+        assert healthcheck.state_file is not None
+        healthcheck._recovery_failures["worker-1:task-1"] = 1
+        healthcheck.agents["worker-1"] = Agent(
+            id="worker-1",
+            role=AgentRole.WORKER,
+            status=AgentStatus.BUSY,
+            current_task="task-1",
+            created_at=datetime.now(),
+            last_activity=datetime.now(),
+        )
+        healthcheck._diagnose_worker_issue = AsyncMock(return_value=(None, False))
+
+        await healthcheck.monitor_and_recover_workers()
+        assert healthcheck.state_file.exists()
+
+        app_ctx.healthcheck_manager = None
+        restored = ensure_healthcheck_manager(app_ctx)
+        assert restored is not healthcheck
+        assert restored._recovery_failures == {"worker-1:task-1": 1}
+
+
+class TestCycleMetrics:
+    """監視サイクルの計測値のテスト。"""
+
+    @pytest.mark.asyncio
+    async def test_monitor_cycle_records_stages_and_probes(self, temp_dir, settings):
+        """サイクル所要時間・段階別時間・Worker の診断レイテンシを記録しファイルへ書き出す。"""
+        from src.tools.helpers_managers import ensure_healthcheck_manager
+
+        settings.healthcheck_metrics_textfile_enabled = True
+        app_ctx = AppContext(
+            settings=settings,
+            tmux=MagicMock(),
+            ai_cli=AiCliManager(settings),
+            agents={},
+            project_root=str(temp_dir),
+            session_id="test-session",
+        )
+        healthcheck = ensure_healthcheck_manager(app_ctx)
+        assert healthcheck.metrics_file is not None
+        healthcheck.agents["worker-1"] = Agent(
+            id="worker-1",
+            role=AgentRole.WORKER,
+            status=AgentStatus.BUSY,
+            current_task="task-1",
+            created_at=datetime.now(),
+            last_activity=datetime.now(),
+        )
+        healthcheck._diagnose_worker_issue = AsyncMock(return_value=(None, False))
+
+        await healthcheck.monitor_and_recover_workers()
+
+        snapshot = healthcheck.metrics.snapshot()
+        assert snapshot["cycles"] == 1
+        assert snapshot["cycle_duration"]["count"] == 1
+        assert snapshot["stages"]["diagnosis"]["count"] == 1
+        assert snapshot["stages"]["state_save"]["count"] == 1
+        assert snapshot["agents"]["worker-1"]["count"] == 1
+        assert "diagnosis" in snapshot["last_cycle"]["stages_seconds"]
+        text = healthcheck.metrics_file.read_text()
+        assert "multi_agent_mcp_healthcheck_cycles_total 1" in text
+
+    def test_metrics_file_disabled_by_default(self, temp_dir, settings):
+        """既定では Prometheus テキストファイルを書き出さない。"""
+        from src.tools.helpers_managers import ensure_healthcheck_manager
+
+        app_ctx = AppContext(
+            settings=settings,
+            tmux=MagicMock(),
+            ai_cli=AiCliManager(settings),
+            agents={},
+            project_root=str(temp_dir),
+            session_id="test-session",
+        )
+        assert ensure_healthcheck_manager(app_ctx).metrics_file is None
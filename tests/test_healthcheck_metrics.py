@@ -0,0 +1,115 @@
+"""HealthcheckMetrics のテスト。"""
+
+import os
+
+from src.managers.healthcheck_metrics import (
+    HealthcheckMetrics,
+    LatencyHistogram,
+    read_metrics_snapshot,
+)
+
+
+class TestLatencyHistogram:
+    """LatencyHistogram のテスト。"""
+
+    def test_observe_and_quantiles(self):
+        """バケットへの振り分けと分位点の概算値。"""
+        histogram = LatencyHistogram(buckets=(0.1, 1.0, 10.0))
+        for value in (0.05, 0.5, 0.5, 5.0, 50.0):
+            histogram.observe(value)
+
+        data = histogram.to_dict()
+        assert data["count"] == 5
+        assert data["buckets"] == {"0.1": 1, "1.0": 2, "10.0": 1, "+Inf": 1}
+        assert data["max_seconds"] == 50.0
+        assert histogram.quantile(0.5) == 1.0
+        assert histogram.quantile(1.0) == 50.0
+        assert LatencyHistogram().quantile(0.5) is None
+
+    def test_prometheus_buckets_are_cumulative(self):
+        """Prometheus 出力のバケットは累積値になる。"""
+        histogram = LatencyHistogram(buckets=(0.1, 1.0))
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(2.0)
+
+        lines = histogram.prometheus_lines("x", 'stage="a"')
+        assert 'x_bucket{stage="a",le="0.1"} 1' in lines
+        assert 'x_bucket{stage="a",le="1.0"} 2' in lines
+        assert 'x_bucket{stage="a",le="+Inf"} 3' in lines
+        assert 'x_count{stage="a"} 3' in lines
+
+
+class TestHealthcheckMetrics:
+    """HealthcheckMetrics のテスト。"""
+
+    def test_record_cycle_counts_overruns_and_outcomes(self):
+        """監視間隔を超えたサイクルと復旧結果を集計する。"""
+        metrics = HealthcheckMetrics()
+        metrics.observe_stage("diagnosis", 0.2)
+        metrics.observe_stage("diagnosis", 0.3)
+        metrics.record_cycle(0.6, 60, {"recovered": [{"agent_id": "w1"}]})
+        metrics.record_cycle(
+            90.0, 60, {"escalated": [{"agent_id": "w2"}], "diagnosis_timed_out": ["w3"]}
+        )
+
+        snapshot = metrics.snapshot()
+        assert snapshot["cycles"] == 2
+        assert snapshot["overruns"] == 1
+        assert snapshot["recovery_outcomes"] == {
+            "recovered": 1,
+            "escalated": 1,
+            "diagnosis_timed_out": 1,
+        }
+        assert snapshot["stages"]["diagnosis"]["count"] == 2
+        assert snapshot["last_cycle"]["overrun"] is True
+        # 段階別の内訳はサイクルごとにリセットされる
+        assert snapshot["last_cycle"]["stages_seconds"] == {}
+
+    def test_probe_latency_per_agent_and_prune(self):
+        """Worker ごとの診断レイテンシを集計し、削除済み Worker は破棄する。"""
+        metrics = HealthcheckMetrics()
+        metrics.observe_probe("w1", 0.1)
+        metrics.observe_probe("w1", 0.3)
+        metrics.observe_probe("w2", 0.2)
+
+        agents = metrics.snapshot()["agents"]
+        assert agents["w1"] == {
+            "count": 2,
+            "avg_seconds": 0.2,
+            "max_seconds": 0.3,
+            "last_seconds": 0.3,
+        }
+
+        metrics.prune_agents({"w2"})
+        assert list(metrics.snapshot()["agents"]) == ["w2"]
+        assert metrics.probe_latency.count == 3
+
+    def test_write_prometheus_file(self, temp_dir):
+        """Prometheus テキストファイルを書き出す。"""
+        metrics = HealthcheckMetrics()
+        metrics.record_cycle(1.0, 60, {"failed_tasks": [{"task_id": "t1"}]})
+        path = temp_dir / "session" / "healthcheck_metrics.prom"
+
+        metrics.write_prometheus_file(path)
+
+        text = path.read_text()
+        assert "# TYPE multi_agent_mcp_healthcheck_cycle_duration_seconds histogram" in text
+        assert 'multi_agent_mcp_healthcheck_recovery_outcomes_total{outcome="failed"} 1' in text
+        assert list(path.parent.iterdir()) == [path]
+
+    def test_snapshot_file_round_trip(self, temp_dir):
+        """スナップショットを保存・読み込みできる（無い・形式違いは None）。"""
+        metrics = HealthcheckMetrics()
+        metrics.record_cycle(1.0, 60, {"recovered": [{"agent_id": "w1"}]})
+        path = temp_dir / "session" / "healthcheck_metrics.json"
+        assert read_metrics_snapshot(path) is None
+
+        metrics.write_snapshot_file(path)
+
+        saved = read_metrics_snapshot(path)
+        assert saved is not None
+        assert saved["pid"] == os.getpid()
+        assert saved["metrics"] == metrics.snapshot()
+        path.write_text('{"version": 0}')
+        assert read_metrics_snapshot(path) is None
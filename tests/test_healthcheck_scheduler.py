@@ -0,0 +1,146 @@
+"""HealthcheckScheduler のテスト。"""
+
+from datetime import datetime, timedelta
+
+from src.managers.healthcheck_scheduler import FAST_PROBE_ROUNDS, HealthcheckScheduler
+from src.models.agent import Agent, AgentRole, AgentStatus
+
+
+class FakeClock:
+    """手動で進める単調時計。"""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _worker(agent_id: str, status=AgentStatus.IDLE, task=None, idle_for: float = 0) -> Agent:
+    last_activity = datetime.now() - timedelta(seconds=idle_for)
+    return Agent(
+        id=agent_id,
+        role=AgentRole.WORKER,
+        status=status,
+        current_task=task,
+        created_at=last_activity,
+        last_activity=last_activity,
+    )
+
+
+def _make_scheduler(clock: FakeClock, stall_threshold: float | None = None):
+    return HealthcheckScheduler(
+        base_interval_seconds=60,
+        fast_interval_seconds=10,
+        idle_max_interval_seconds=300,
+        stall_threshold_seconds=stall_threshold,
+        clock=clock,
+    )
+
+
+def _due_in(scheduler: HealthcheckScheduler, agent_id: str) -> float:
+    entry = next(e for e in scheduler.snapshot() if e["agent_id"] == agent_id)
+    return entry["next_check_in_seconds"]
+
+
+class TestHealthcheckScheduler:
+    """スケジュール計算のテスト。"""
+
+    def test_new_agents_are_due_immediately(self):
+        """新規 Worker は即時確認対象となり、削除された Worker は除外される。"""
+        clock = FakeClock()
+        scheduler = _make_scheduler(clock)
+        scheduler.sync_agents(["w1", "w2"])
+
+        assert sorted(scheduler.pop_due()) == ["w1", "w2"]
+        assert scheduler.pop_due() == []
+
+        scheduler.sync_agents(["w2"])
+        assert [e["agent_id"] for e in scheduler.snapshot()] == ["w2"]
+
+    def test_idle_agent_backs_off_up_to_max(self):
+        """idle Worker は確認ごとに間隔が倍になり上限で止まる。"""
+        clock = FakeClock()
+        scheduler = _make_scheduler(clock)
+        agents = {"w1": _worker("w1")}
+        scheduler.sync_agents(agents)
+
+        intervals = []
+        for _ in range(5):
+            clock.now += 1000
+            probed = scheduler.pop_due()
+            scheduler.reschedule(probed, {}, agents)
+            intervals.append(_due_in(scheduler, "w1"))
+
+        assert intervals == [60, 120, 240, 300, 300]
+
+    def test_recovered_and_suspect_agents_are_probed_fast(self):
+        """復旧・エスカレーションされた Worker は短い間隔で再確認される。"""
+        clock = FakeClock()
+        scheduler = _make_scheduler(clock)
+        agents = {
+            "w1": _worker("w1", AgentStatus.BUSY, "t1"),
+            "w2": _worker("w2", AgentStatus.BUSY, "t2"),
+            "w3": _worker("w3", AgentStatus.BUSY, "t3"),
+        }
+        scheduler.sync_agents(agents)
+        probed = scheduler.pop_due()
+        scheduler.reschedule(
+            probed,
+            {"recovered": [{"agent_id": "w1"}], "diagnosis_timed_out": ["w2"]},
+            agents,
+        )
+
+        schedule = {e["agent_id"]: e for e in scheduler.snapshot()}
+        assert schedule["w1"]["reason"] == "recovered"
+        assert schedule["w1"]["next_check_in_seconds"] == 10
+        assert schedule["w2"]["reason"] == "suspect"
+        assert schedule["w2"]["next_check_in_seconds"] == 10
+        assert schedule["w3"]["reason"] == "busy"
+        assert schedule["w3"]["next_check_in_seconds"] == 60
+
+    def test_dispatch_marks_agent_urgent_for_limited_rounds(self):
+        """タスク送信直後は一定回数だけ短い間隔で確認し、その後は通常間隔に戻る。"""
+        clock = FakeClock()
+        scheduler = _make_scheduler(clock)
+        agents = {"w1": _worker("w1")}
+        scheduler.sync_agents(agents)
+        scheduler.reschedule(scheduler.pop_due(), {}, agents)
+        assert _due_in(scheduler, "w1") == 60
+
+        agents["w1"].status = AgentStatus.BUSY
+        agents["w1"].current_task = "t1"
+        scheduler.mark_urgent("w1", "dispatched")
+        assert scheduler.wakeup.is_set()
+        assert _due_in(scheduler, "w1") == 10
+
+        reasons = []
+        for _ in range(FAST_PROBE_ROUNDS + 1):
+            clock.now += 10
+            scheduler.reschedule(scheduler.pop_due(), {}, agents)
+            reasons.append(next(iter(scheduler.snapshot()))["reason"])
+        assert reasons == ["dispatched"] * FAST_PROBE_ROUNDS + ["busy"]
+
+    def test_busy_agent_near_stall_threshold_is_probed_early(self):
+        """停滞判定の閾値が近い作業中 Worker は閾値直後に確認する。"""
+        clock = FakeClock()
+        scheduler = _make_scheduler(clock, stall_threshold=120)
+        agents = {"w1": _worker("w1", AgentStatus.BUSY, "t1", idle_for=100)}
+        scheduler.sync_agents(agents)
+        scheduler.reschedule(scheduler.pop_due(), {}, agents)
+
+        entry = scheduler.snapshot()[0]
+        assert entry["reason"] == "stall_suspect"
+        assert 10 <= entry["next_check_in_seconds"] <= 22
+
+    def test_seconds_until_next_tracks_earliest_entry(self):
+        """次回実行までの秒数は最も近い Worker を基準にする。"""
+        clock = FakeClock()
+        scheduler = _make_scheduler(clock)
+        assert scheduler.seconds_until_next() is None
+
+        agents = {"w1": _worker("w1"), "w2": _worker("w2", AgentStatus.BUSY, "t")}
+        scheduler.sync_agents(agents)
+        assert scheduler.seconds_until_next() == 0.0
+        scheduler.reschedule(scheduler.pop_due(), {"escalated": [{"agent_id": "w2"}]}, agents)
+        assert scheduler.seconds_until_next() == 10.0
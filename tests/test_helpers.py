@@ -2,6 +2,7 @@
 
 import fcntl
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 from types import SimpleNamespace
@@ -10,19 +11,23 @@ from unittest.mock import AsyncMock, MagicMock, call, patch
 import pytest
 
 from src.context import AppContext
+from src.managers.agents_journal import compact_agents_journal
 from src.managers.ai_cli_manager import AiCliManager
 from src.managers.tmux_manager import TmuxManager
 from src.models.agent import Agent, AgentRole, AgentStatus
 from src.tools.helpers import (
+    InvalidConfigError,
     check_tool_permission,
     get_enable_git_from_config,
     get_mcp_tool_prefix_from_config,
     get_project_root_from_config,
+    get_session_id_from_config,
     load_agents_from_file,
     remove_agent_from_file,
     resolve_main_repo_root,
     resolve_project_root,
     save_agent_to_file,
+    save_agents_to_file,
     sync_agents_from_file,
 )
 
@@ -190,6 +195,55 @@ class TestGetEnableGitFromConfig:
         assert result is None
 
 
+class TestConfigDocumentCache:
+    """config.json のパース結果キャッシュのテスト。"""
+
+    def _write_config(self, temp_dir: Path, payload: dict | str) -> Path:
+        mcp_dir = temp_dir / ".multi-agent-mcp"
+        mcp_dir.mkdir(parents=True, exist_ok=True)
+        config_file = mcp_dir / "config.json"
+        content = payload if isinstance(payload, str) else json.dumps(payload)
+        config_file.write_text(content, encoding="utf-8")
+        return config_file
+
+    def test_multiple_keys_share_one_parse(self, temp_dir):
+        """複数キーの取得でも config.json のパースは 1 回だけ。"""
+        self._write_config(
+            temp_dir,
+            {"mcp_tool_prefix": "mcp__x__", "session_id": "s-1", "enable_git": False},
+        )
+
+        with patch("src.tools.helpers_registry.json.load", wraps=json.load) as mock_load:
+            assert get_mcp_tool_prefix_from_config(str(temp_dir)) == "mcp__x__"
+            assert get_session_id_from_config(str(temp_dir)) == "s-1"
+            assert get_enable_git_from_config(str(temp_dir)) is False
+
+        assert mock_load.call_count == 1
+
+    def test_rewritten_config_is_reparsed(self, temp_dir):
+        """config.json が書き換えられたら次の取得で反映される。"""
+        config_file = self._write_config(temp_dir, {"session_id": "s-1"})
+        assert get_session_id_from_config(str(temp_dir)) == "s-1"
+
+        self._write_config(temp_dir, {"session_id": "s-22"})
+        assert get_session_id_from_config(str(temp_dir)) == "s-22"
+
+        config_file.unlink()
+        assert get_session_id_from_config(str(temp_dir)) is None
+
+    def test_broken_config_raises_only_in_strict_mode(self, temp_dir):
+        """破損した config.json は strict のときだけ例外になる（キャッシュ済みでも同じ）。"""
+        self._write_config(temp_dir, "{broken")
+
+        assert get_session_id_from_config(str(temp_dir)) is None
+        with pytest.raises(InvalidConfigError):
+            get_session_id_from_config(str(temp_dir), strict=True)
+
+        self._write_config(temp_dir, "[1, 2]")
+        with pytest.raises(InvalidConfigError):
+            get_enable_git_from_config(str(temp_dir), strict=True)
+
+
 class TestCheckToolPermission:
     """check_tool_permission 関数のテスト。"""
 
@@ -493,6 +547,7 @@ class TestAgentFilePersistence:
             / persistence_ctx.session_id
             / "agents.json"
         )
+        compact_agents_journal(agents_file)
         raw = json.loads(agents_file.read_text(encoding="utf-8"))
         raw["persist-agent-001"].pop("ai_bootstrapped", None)
         agents_file.write_text(json.dumps(raw, ensure_ascii=False, indent=2), encoding="utf-8")
@@ -521,6 +576,44 @@ class TestAgentFilePersistence:
         assert persistence_ctx.agents["persist-agent-001"].status == AgentStatus.IDLE.value
         assert persistence_ctx.agents["persist-agent-001"].current_task is None
 
+    def test_sync_agents_picks_up_change_immediately(self, persistence_ctx, sample_agent):
+        """他プロセスによる更新は TTL を待たずに次の同期で反映されることをテスト。"""
+        save_agent_to_file(persistence_ctx, sample_agent)
+        sync_agents_from_file(persistence_ctx)
+
+        updated = sample_agent.model_copy(deep=True)
+        updated.status = AgentStatus.BUSY
+        updated.current_task = "task-from-other-process"
+        save_agent_to_file(persistence_ctx, updated)
+
+        assert sync_agents_from_file(persistence_ctx) == 1
+        assert persistence_ctx.agents["persist-agent-001"].current_task == (
+            "task-from-other-process"
+        )
+        assert sync_agents_from_file(persistence_ctx) == 0
+
+    def test_sync_agents_revalidates_only_changed_entries(self, persistence_ctx, sample_agent):
+        """生データが変わったエージェントだけを検証し直すことをテスト。"""
+        from src.tools import helpers_persistence
+
+        others = [
+            sample_agent.model_copy(update={"id": f"persist-agent-{i:03d}"}) for i in range(2, 6)
+        ]
+        save_agents_to_file(persistence_ctx, [sample_agent, *others])
+        sync_agents_from_file(persistence_ctx)
+
+        changed = others[0].model_copy(deep=True)
+        changed.status = AgentStatus.BUSY
+        save_agent_to_file(persistence_ctx, changed)
+
+        with patch.object(
+            helpers_persistence, "_parse_agent", wraps=helpers_persistence._parse_agent
+        ) as mock_parse:
+            assert sync_agents_from_file(persistence_ctx) == 1
+
+        assert [c.args[0] for c in mock_parse.call_args_list] == [changed.id]
+        assert persistence_ctx.agents[changed.id].status == AgentStatus.BUSY.value
+
     def test_sync_agents_cache_is_scoped_by_session(self, settings, git_repo):
         """同期TTLキャッシュが session ごとに分離されることをテスト。"""
         from src.tools.helpers_persistence import reset_sync_cache
@@ -574,7 +667,7 @@ class TestAgentFilePersistence:
 
     def test_save_agent_to_file_uses_agents_file_lock(self, persistence_ctx, sample_agent):
         """save 時に agents.json 更新ロックを取得することをテスト。"""
-        with patch("src.tools.helpers_persistence.fcntl.flock") as mock_flock:
+        with patch("src.managers.agents_journal.fcntl.flock") as mock_flock:
             result = save_agent_to_file(persistence_ctx, sample_agent)
 
         assert result is True
@@ -582,6 +675,20 @@ class TestAgentFilePersistence:
         assert fcntl.LOCK_EX in lock_modes
         assert fcntl.LOCK_UN in lock_modes
 
+    def test_save_agents_to_file_appends_once(self, persistence_ctx, sample_agent):
+        """複数エージェントの保存はジャーナルへの 1 回の追記で済むことをテスト。"""
+        save_agent_to_file(persistence_ctx, sample_agent)
+        others = [
+            sample_agent.model_copy(update={"id": f"persist-agent-{i:03d}"}) for i in range(2, 6)
+        ]
+
+        with patch("src.managers.agents_journal.os.write", wraps=os.write) as mock_write:
+            assert save_agents_to_file(persistence_ctx, others) is True
+
+        assert mock_write.call_count == 1
+        agents = load_agents_from_file(persistence_ctx)
+        assert set(agents) == {"persist-agent-001", *(agent.id for agent in others)}
+
     def test_remove_agent_from_file(self, persistence_ctx, sample_agent):
         """エージェントをファイルから削除できることをテスト。"""
         save_agent_to_file(persistence_ctx, sample_agent)
@@ -601,7 +708,7 @@ class TestAgentFilePersistence:
         """remove 時に agents.json 更新ロックを取得することをテスト。"""
         save_agent_to_file(persistence_ctx, sample_agent)
 
-        with patch("src.tools.helpers_persistence.fcntl.flock") as mock_flock:
+        with patch("src.managers.agents_journal.fcntl.flock") as mock_flock:
             result = remove_agent_from_file(persistence_ctx, "persist-agent-001")
 
         assert result is True
@@ -862,6 +969,44 @@ class TestEnsureIpcManager:
         assert str(manager.ipc_dir).endswith(".multi-agent-mcp/new-session/ipc")
         assert manager.ipc_dir != old_ipc_dir
 
+    def test_same_identity_skips_path_resolution(self, app_ctx, git_repo):
+        """同じ (project_root, session_id) の 2 回目はパスを解決せずに返す。"""
+        from src.tools.helpers_managers import ensure_dashboard_manager, ensure_ipc_manager
+
+        app_ctx.project_root = str(git_repo)
+        app_ctx.session_id = "session-a"
+        ipc = ensure_ipc_manager(app_ctx)
+        dashboard = ensure_dashboard_manager(app_ctx)
+
+        with (
+            patch("src.tools.helpers.resolve_project_root") as mock_resolve,
+            patch("src.tools.helpers_managers.os.path.realpath") as mock_realpath,
+        ):
+            assert ensure_ipc_manager(app_ctx) is ipc
+            assert ensure_dashboard_manager(app_ctx) is dashboard
+        mock_resolve.assert_not_called()
+        mock_realpath.assert_not_called()
+
+    def test_identity_change_or_replacement_recomputes(self, app_ctx, git_repo):
+        """session_id の変更や外部からの差し替えがあれば再判定する。"""
+        from src.managers.ipc_manager import IPCManager
+        from src.tools.helpers_managers import ensure_ipc_manager
+
+        app_ctx.project_root = str(git_repo)
+        app_ctx.session_id = "session-a"
+        first = ensure_ipc_manager(app_ctx)
+
+        app_ctx.session_id = "session-b"
+        second = ensure_ipc_manager(app_ctx)
+        assert second is not first
+        assert str(second.ipc_dir).endswith(".multi-agent-mcp/session-b/ipc")
+
+        replaced = IPCManager(str(git_repo / ".multi-agent-mcp" / "session-a" / "ipc"))
+        app_ctx.ipc_manager = replaced
+        third = ensure_ipc_manager(app_ctx)
+        assert third is not replaced
+        assert str(third.ipc_dir).endswith(".multi-agent-mcp/session-b/ipc")
+
 
 class TestCodexPromptDetection:
     """Codex 入力残留判定のテスト。"""
@@ -1091,3 +1236,103 @@ class TestTmuxRateLimit:
         assert success is True
         sleep_mock.assert_not_awaited()
         manager.send_and_confirm_to_pane.assert_awaited_once()
+
+
+class TestPermissionFastPath:
+    """check_tool_permission の高速経路（キャッシュ）のテスト。"""
+
+    @pytest.fixture
+    def perm_ctx(self, settings, git_repo, temp_dir, monkeypatch):
+        from src.tools.helpers_persistence import reset_sync_cache
+        from src.tools.helpers_registry import reset_registry_cache, save_agent_to_registry
+
+        monkeypatch.setattr(
+            "src.tools.helpers_registry._get_agent_registry_dir", lambda: temp_dir / "registry"
+        )
+        reset_sync_cache()
+        reset_registry_cache()
+        ctx = AppContext(
+            settings=settings,
+            tmux=TmuxManager(settings),
+            ai_cli=AiCliManager(settings),
+            project_root=str(git_repo),
+            session_id="perm-session",
+        )
+        now = datetime.now()
+        owner = Agent(
+            id="owner-001",
+            role=AgentRole.OWNER,
+            status=AgentStatus.IDLE,
+            working_dir=str(git_repo),
+            created_at=now,
+            last_activity=now,
+        )
+        ctx.agents[owner.id] = owner
+        save_agent_to_file(ctx, owner)
+        save_agent_to_registry(owner.id, owner.id, str(git_repo), "perm-session")
+        yield ctx
+        reset_sync_cache()
+        reset_registry_cache()
+
+    @staticmethod
+    def _count_opens(func, calls):
+        import builtins
+
+        real_open = builtins.open
+        opened: list[str] = []
+
+        def counting_open(file, *args, **kwargs):
+            opened.append(str(file))
+            return real_open(file, *args, **kwargs)
+
+        with patch("builtins.open", counting_open):
+            for _ in range(calls):
+                func()
+        return opened
+
+    def test_repeated_calls_do_not_reopen_registry_or_agents_file(self, perm_ctx):
+        """ファイルが変わらない限り、レジストリ・agents.json を開き直さない。"""
+        check_tool_permission(perm_ctx, "get_dashboard", "owner-001")
+
+        opened = self._count_opens(
+            lambda: check_tool_permission(perm_ctx, "get_dashboard", "owner-001"), 50
+        )
+
+        assert [p for p in opened if p.endswith(".json")] == []
+
+    def test_registry_change_is_picked_up(self, perm_ctx, temp_dir):
+        """レジストリが更新されると新しい session_id を反映する。"""
+        from src.tools.helpers_registry import save_agent_to_registry
+
+        check_tool_permission(perm_ctx, "get_dashboard", "owner-001")
+        save_agent_to_registry(
+            "owner-001", "owner-001", perm_ctx.project_root, "perm-session-2"
+        )
+
+        check_tool_permission(perm_ctx, "get_dashboard", "owner-001")
+
+        assert perm_ctx.session_id == "perm-session-2"
+
+    def test_agent_created_by_other_process_is_found_immediately(self, perm_ctx, git_repo):
+        """他プロセスが agents.json に追加したエージェントを直後の呼び出しで解決する。"""
+        check_tool_permission(perm_ctx, "get_dashboard", "owner-001")
+        other_ctx = AppContext(
+            settings=perm_ctx.settings,
+            tmux=perm_ctx.tmux,
+            ai_cli=perm_ctx.ai_cli,
+            project_root=str(git_repo),
+            session_id="perm-session",
+        )
+        now = datetime.now()
+        admin = Agent(
+            id="admin-001",
+            role=AgentRole.ADMIN,
+            status=AgentStatus.IDLE,
+            working_dir=str(git_repo),
+            created_at=now,
+            last_activity=now,
+        )
+        save_agent_to_file(other_ctx, admin)
+
+        assert check_tool_permission(perm_ctx, "get_dashboard", "admin-001") is None
+        assert "admin-001" in perm_ctx.agents
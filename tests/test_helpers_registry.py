@@ -0,0 +1,139 @@
+"""グローバルレジストリ（SQLite）のテスト。"""
+
+import json
+import sqlite3
+
+from src.tools import helpers_registry
+from src.tools.helpers_registry import (
+    REGISTRY_DB_FILE_NAME,
+    get_project_root_from_registry,
+    get_session_id_from_registry,
+    prune_registry,
+    read_agent_registry_entry,
+    remove_agent_from_registry,
+    remove_agents_by_owner,
+    reset_registry_cache,
+    save_agent_to_registry,
+    save_agents_to_registry,
+)
+
+
+class TestAgentRegistry:
+    """登録・参照・削除のテスト。"""
+
+    def test_upsert_and_read(self, temp_dir):
+        """保存した内容を読み出せ、再保存で上書きされる。"""
+        save_agent_to_registry("agent-1", "owner-1", str(temp_dir), "session-a")
+        save_agent_to_registry("agent-1", "owner-1", str(temp_dir), "session-b")
+
+        assert read_agent_registry_entry("agent-1") == {
+            "agent_id": "agent-1",
+            "owner_id": "owner-1",
+            "project_root": str(temp_dir),
+            "session_id": "session-b",
+        }
+        assert get_project_root_from_registry("agent-1") == str(temp_dir)
+        assert get_session_id_from_registry("agent-1") == "session-b"
+        assert read_agent_registry_entry("missing") is None
+
+    def test_uses_wal_database(self, temp_dir):
+        """レジストリは WAL モードの SQLite に保存され、JSON ファイルは作られない。"""
+        save_agent_to_registry("agent-1", "owner-1", str(temp_dir))
+
+        registry_dir = helpers_registry._get_agent_registry_dir()
+        db_path = registry_dir / REGISTRY_DB_FILE_NAME
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert list(registry_dir.glob("*.json")) == []
+        assert list(registry_dir.glob("*.lock")) == []
+
+    def test_batch_upsert(self, temp_dir):
+        """複数エージェントを 1 回の呼び出しで保存できる。"""
+        entries = [(f"worker-{i}", "owner-1", str(temp_dir), "session-a") for i in range(5)]
+
+        assert save_agents_to_registry(entries) == 5
+        assert save_agents_to_registry([]) == 0
+        assert all(read_agent_registry_entry(f"worker-{i}") for i in range(5))
+
+    def test_remove_by_agent_and_owner(self, temp_dir):
+        """エージェント単位・オーナー単位で削除できる。"""
+        save_agents_to_registry(
+            [
+                ("owner-1", "owner-1", str(temp_dir), None),
+                ("worker-1", "owner-1", str(temp_dir), None),
+                ("owner-2", "owner-2", str(temp_dir), None),
+            ]
+        )
+
+        assert remove_agent_from_registry("owner-2") is True
+        assert remove_agent_from_registry("owner-2") is False
+        assert remove_agents_by_owner("owner-1") == 2
+        assert remove_agents_by_owner("owner-1") == 0
+        assert read_agent_registry_entry("worker-1") is None
+
+    def test_remove_returns_failure_when_database_is_locked(self, temp_dir, monkeypatch):
+        """DB エラー時は例外を送出せず False / 0 を返す（セッションの片付けを止めない）。"""
+
+        def _locked_connection():
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(helpers_registry, "_get_registry_connection", _locked_connection)
+
+        assert remove_agent_from_registry("agent-1") is False
+        assert remove_agents_by_owner("owner-1") == 0
+
+    def test_visible_from_another_connection(self, temp_dir):
+        """別プロセス相当の新しい接続からも更新が見える。"""
+        save_agent_to_registry("agent-1", "owner-1", str(temp_dir), "session-a")
+        reset_registry_cache()
+        assert get_session_id_from_registry("agent-1") == "session-a"
+
+        db_path = helpers_registry._get_agent_registry_dir() / REGISTRY_DB_FILE_NAME
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "UPDATE agents SET session_id = 'session-b' WHERE agent_id = 'agent-1'"
+            )
+        assert get_session_id_from_registry("agent-1") == "session-b"
+
+
+class TestRegistryMaintenance:
+    """GC と旧形式からの移行のテスト。"""
+
+    def test_prune_removes_agents_with_missing_project_root(self, temp_dir):
+        """project_root が存在しないエージェントだけを削除する。"""
+        alive = temp_dir / "alive"
+        alive.mkdir()
+        save_agents_to_registry(
+            [
+                ("agent-1", "owner-1", str(alive), None),
+                ("agent-2", "owner-2", str(temp_dir / "gone"), None),
+                ("agent-3", "owner-2", str(temp_dir / "gone"), None),
+            ]
+        )
+
+        assert prune_registry() == 2
+        assert read_agent_registry_entry("agent-1") is not None
+        assert read_agent_registry_entry("agent-2") is None
+        assert prune_registry() == 0
+
+    def test_migrates_legacy_json_files(self, temp_dir):
+        """旧形式の JSON を取り込み、JSON・lock ファイルを削除する。"""
+        registry_dir = helpers_registry._get_agent_registry_dir()
+        registry_dir.mkdir(parents=True)
+        (registry_dir / "legacy-1.json").write_text(
+            json.dumps(
+                {
+                    "agent_id": "legacy-1",
+                    "owner_id": "owner-1",
+                    "project_root": str(temp_dir),
+                    "session_id": "old-session",
+                }
+            ),
+            encoding="utf-8",
+        )
+        (registry_dir / "legacy-1.lock").touch()
+        (registry_dir / "broken.json").write_text("{", encoding="utf-8")
+
+        assert get_session_id_from_registry("legacy-1") == "old-session"
+        assert list(registry_dir.glob("*.json")) == []
+        assert list(registry_dir.glob("*.lock")) == []
@@ -0,0 +1,138 @@
+"""io_executor（ブロッキング I/O 用共有スレッドプール）のテスト。"""
+
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+
+import pytest
+
+from src.config.settings import Settings
+from src.managers import io_executor
+from src.managers.io_executor import (
+    DEFAULT_MAX_WORKERS,
+    configure_io_executor,
+    enable_slow_callback_detection,
+    get_io_executor,
+    get_slow_callback_stats,
+    install_io_executor,
+    run_blocking,
+    shutdown_io_executor,
+)
+
+_request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id", default="-")
+
+
+@pytest.fixture(autouse=True)
+def reset_executor():
+    yield
+    shutdown_io_executor(wait=True)
+    configure_io_executor(DEFAULT_MAX_WORKERS)
+
+
+class TestRunBlocking:
+    """run_blocking のテスト。"""
+
+    async def test_runs_in_shared_pool_with_context(self):
+        """共有プールのスレッドで実行し、contextvars と例外を引き継ぐ。"""
+        _request_id.set("req-1")
+
+        def work(value: int) -> tuple[str, str, int]:
+            return threading.current_thread().name, _request_id.get(), value * 2
+
+        thread_name, request_id, result = await run_blocking(work, 21)
+
+        assert thread_name.startswith("mcp-io")
+        assert request_id == "req-1"
+        assert result == 42
+        with pytest.raises(ZeroDivisionError):
+            await run_blocking(lambda: 1 / 0)
+
+    async def test_event_loop_keeps_running_while_blocked(self):
+        """ブロッキング処理の実行中も他のコルーチンが進む。"""
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(ticker())
+        await run_blocking(time.sleep, 0.2)
+        task.cancel()
+
+        assert ticks >= 5
+
+    async def test_pool_is_bounded(self):
+        """同時実行数は設定したスレッド数を超えない。"""
+        configure_io_executor(2)
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def work() -> None:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+
+        await asyncio.gather(*(run_blocking(work) for _ in range(6)))
+
+        assert peak == 2
+        assert get_io_executor()._max_workers == 2
+
+    async def test_install_makes_to_thread_use_shared_pool(self):
+        """install_io_executor 後は asyncio.to_thread も共有プールで実行される。"""
+        install_io_executor(asyncio.get_running_loop())
+
+        thread_name = await asyncio.to_thread(lambda: threading.current_thread().name)
+
+        assert thread_name.startswith("mcp-io")
+
+
+class TestSlowCallbackDetection:
+    """遅いコールバック検出のテスト。"""
+
+    async def test_detects_blocking_callback(self, monkeypatch):
+        """閾値を超えてイベントループを止めたコールバックを記録する。"""
+        monkeypatch.setattr(io_executor, "_slow_callback_filter", None)
+        loop = asyncio.get_running_loop()
+        previous_debug = loop.get_debug()
+        previous_duration = loop.slow_callback_duration
+        try:
+            enable_slow_callback_detection(loop, 0.02)
+            loop.call_soon(time.sleep, 0.05)
+            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)
+
+            stats = get_slow_callback_stats()
+            assert stats["enabled"] is True
+            assert stats["count"] >= 1
+            assert "took" in stats["recent"][-1]
+        finally:
+            loop.set_debug(previous_debug)
+            loop.slow_callback_duration = previous_duration
+            logging.getLogger("asyncio").removeFilter(io_executor._slow_callback_filter)
+
+
+class TestIoExecutorSettings:
+    """非同期 I/O 設定のバリデーションのテスト。"""
+
+    @pytest.mark.parametrize(
+        ("env", "value"),
+        [
+            ("MCP_IO_EXECUTOR_MAX_WORKERS", "0"),
+            ("MCP_IO_EXECUTOR_MAX_WORKERS", "65"),
+            ("MCP_DEBUG_SLOW_CALLBACK_MS", "5"),
+        ],
+    )
+    def test_rejects_out_of_range_values(self, monkeypatch, env, value):
+        """範囲外の値を指定するとエラーになる。"""
+        monkeypatch.setenv(env, value)
+        with pytest.raises(ValueError):
+            Settings()
@@ -0,0 +1,126 @@
+"""pane_log モジュールのテスト。"""
+
+import io
+import os
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.managers.healthcheck_manager import HealthcheckManager
+from src.managers.pane_log import (
+    build_pipe_pane_command,
+    get_pane_log_path,
+    pane_log_signature,
+    read_agent_pane_log,
+    read_pane_log_tail,
+    run_writer,
+    strip_ansi,
+)
+from src.models.agent import Agent, AgentRole, AgentStatus
+
+
+class TestStripAnsi:
+    """strip_ansi のテスト。"""
+
+    def test_removes_csi_and_osc_sequences(self):
+        """色指定・カーソル移動・OSC タイトルが除去される。"""
+        raw = "\x1b]0;title\x07\x1b[1;32mOK\x1b[0m done\x1b[2K\r\n"
+        assert strip_ansi(raw) == "OK done\n"
+
+    def test_keeps_multibyte_text(self):
+        """日本語などのマルチバイト文字は保持される。"""
+        assert strip_ansi("\x1b[31m完了\x1b[0m 💰 $1.25") == "完了 💰 $1.25"
+
+
+class TestRunWriter:
+    """run_writer のテスト。"""
+
+    def test_writes_stripped_output(self, temp_dir):
+        """ANSI 除去済みの出力がログに追記される。"""
+        log_path = str(temp_dir / "logs" / "agent.log")
+        run_writer(io.BytesIO(b"\x1b[32mline-1\x1b[0m\r\nline-2\n"), log_path, 65_536)
+        run_writer(io.BytesIO(b"line-3"), log_path, 65_536)
+
+        with open(log_path, encoding="utf-8") as f:
+            assert f.read() == "line-1\nline-2\nline-3"
+
+    def test_rotates_when_exceeding_max_bytes(self, temp_dir):
+        """上限超過時は .1 へローテーションし、末尾読み出しで両方を参照する。"""
+        log_path = str(temp_dir / "agent.log")
+        payload = b"".join(f"line-{i:03d}\n".encode() for i in range(30))
+        run_writer(io.BytesIO(payload), log_path, 100)
+        run_writer(io.BytesIO(b"tail-1\ntail-2\n"), log_path, 100)
+
+        assert os.path.exists(f"{log_path}.1")
+        assert os.path.getsize(log_path) <= 100
+        tail = read_pane_log_tail(log_path, lines=3)
+        assert tail == "line-029\ntail-1\ntail-2"
+
+
+class TestReadPaneLog:
+    """ペインログ読み出しのテスト。"""
+
+    def test_read_tail_returns_last_lines(self, temp_dir):
+        """末尾 N 行のみを返す。"""
+        log_path = temp_dir / "agent.log"
+        log_path.write_text("".join(f"{i}\n" for i in range(5000)))
+        assert read_pane_log_tail(str(log_path), lines=2) == "4998\n4999"
+
+    def test_returns_none_when_missing(self, temp_dir):
+        """ログ未作成・未設定の場合は None を返す。"""
+        assert read_pane_log_tail(str(temp_dir / "missing.log")) is None
+        assert read_agent_pane_log(SimpleNamespace(pane_log_path=None)) is None
+
+    def test_signature_changes_on_append(self, temp_dir):
+        """追記によりシグネチャが変化する。"""
+        log_path = temp_dir / "agent.log"
+        log_path.write_text("a\n")
+        agent = SimpleNamespace(pane_log_path=str(log_path))
+        before = pane_log_signature(agent)
+        with open(log_path, "a") as f:
+            f.write("b\n")
+        assert pane_log_signature(agent) != before
+
+    def test_path_and_command(self):
+        """ログパスと pipe-pane コマンドが構築できる。"""
+        path = get_pane_log_path("/repo", ".multi-agent-mcp", "sess", "agent-1")
+        assert path == "/repo/.multi-agent-mcp/sess/logs/agent-1.log"
+        command = build_pipe_pane_command(path, 1024)
+        assert "pane_log.py" in command
+        assert command.endswith(f"{path} 1024")
+
+
+class TestHealthcheckUsesPaneLog:
+    """HealthcheckManager のペインログ利用テスト。"""
+
+    @pytest.mark.asyncio
+    async def test_change_signature_prefers_log(self, temp_dir):
+        """ペインログがある場合は capture-pane を呼ばない。"""
+        log_path = temp_dir / "worker.log"
+        log_path.write_text("working\n")
+        now = datetime.now()
+        worker = Agent(
+            id="worker-001",
+            role=AgentRole.WORKER,
+            status=AgentStatus.BUSY,
+            session_name="test",
+            window_index=0,
+            pane_index=1,
+            pane_log_path=str(log_path),
+            created_at=now,
+            last_activity=now,
+        )
+        tmux = MagicMock()
+        tmux.capture_pane_by_index = AsyncMock(return_value="")
+        healthcheck = HealthcheckManager(tmux_manager=tmux, agents={worker.id: worker})
+
+        first = await healthcheck._pane_change_signature(worker)
+        with open(log_path, "a") as f:
+            f.write("more\n")
+        second = await healthcheck._pane_change_signature(worker)
+
+        assert first is not None
+        assert first != second
+        tmux.capture_pane_by_index.assert_not_called()
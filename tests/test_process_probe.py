@@ -0,0 +1,109 @@
+"""/proc ベースの AI CLI プロセス確認のテスト。"""
+
+import os
+from pathlib import Path
+
+from src.managers.process_probe import (
+    is_proc_available,
+    probe_process_tree,
+    read_process_stat,
+)
+
+PREFIXES = ("codex", "claude", "gemini")
+
+
+def _write_process(
+    proc_root: Path,
+    pid: int,
+    comm: str,
+    argv: list[str],
+    children: list[int] | None = None,
+    state: str = "S",
+    utime: int = 0,
+    stime: int = 0,
+    rss_pages: int = 10,
+) -> None:
+    proc_dir = proc_root / str(pid)
+    (proc_dir / "task" / str(pid)).mkdir(parents=True)
+    # state 以降: ppid pgrp session tty tpgid flags minflt cminflt majflt cmajflt utime stime
+    #            cutime cstime priority nice num_threads itrealvalue starttime vsize rss
+    stat_fields = [state, "1", "1", "1", "0", "-1", "0", "0", "0", "0", "0"]
+    stat_fields += [str(utime), str(stime), "0", "0", "20", "0", "1", "0", "0", "0"]
+    stat_fields += [str(rss_pages), "0"]
+    (proc_dir / "stat").write_text(f"{pid} ({comm}) " + " ".join(stat_fields))
+    (proc_dir / "cmdline").write_bytes(b"\0".join(arg.encode() for arg in argv) + b"\0")
+    (proc_dir / "task" / str(pid) / "children").write_text(
+        " ".join(str(child) for child in children or [])
+    )
+
+
+class TestReadProcessStat:
+    """stat の解析テスト。"""
+
+    def test_parses_comm_with_spaces_and_parens(self, tmp_path):
+        """comm に空白や括弧を含んでも後続フィールドを正しく読む。"""
+        _write_process(tmp_path, 10, "weird (name)", ["x"], utime=7, stime=3, rss_pages=42)
+
+        stat = read_process_stat(10, tmp_path)
+
+        assert stat is not None
+        assert stat.comm == "weird (name)"
+        assert stat.state == "S"
+        assert stat.cpu_ticks == 10
+        assert stat.rss_pages == 42
+
+    def test_missing_process_returns_none(self, tmp_path):
+        """存在しない PID は None を返す。"""
+        assert read_process_stat(999, tmp_path) is None
+
+
+class TestProbeProcessTree:
+    """子孫プロセス探索のテスト。"""
+
+    def test_finds_renamed_binary_under_shell(self, tmp_path):
+        """shell 配下の派生名バイナリ（codex-aarch64-a）を AI CLI と判定する。"""
+        _write_process(tmp_path, 100, "zsh", ["-zsh"], children=[200], utime=1)
+        _write_process(tmp_path, 200, "codex-aarch64-a", ["/opt/codex-aarch64-a"], utime=50)
+
+        sample = probe_process_tree(100, PREFIXES, tmp_path)
+
+        assert sample is not None
+        assert sample.ai_process is not None
+        assert sample.ai_process.pid == 200
+        assert sample.process_count == 2
+
+    def test_finds_cli_launched_through_interpreter(self, tmp_path):
+        """node 経由で起動された CLI はスクリプト名で判定する。"""
+        _write_process(tmp_path, 100, "bash", ["bash"], children=[200])
+        _write_process(tmp_path, 200, "node", ["node", "/usr/local/bin/claude"], children=[300])
+        _write_process(tmp_path, 300, "rg", ["rg", "pattern"])
+
+        sample = probe_process_tree(100, PREFIXES, tmp_path)
+
+        assert sample.ai_process is not None
+        assert sample.ai_process.pid == 200
+        assert sample.process_count == 3
+
+    def test_zombie_ai_process_is_not_alive(self, tmp_path):
+        """zombie 状態の AI CLI は alive=False となる。"""
+        _write_process(tmp_path, 100, "zsh", ["zsh"], children=[200])
+        _write_process(tmp_path, 200, "claude", ["claude"], state="Z")
+
+        sample = probe_process_tree(100, PREFIXES, tmp_path)
+
+        assert sample.ai_process is not None
+        assert sample.ai_process.alive is False
+
+    def test_shell_only_pane_has_no_ai_process(self, tmp_path):
+        """AI CLI がいないペインは ai_process=None、存在しない PID は None を返す。"""
+        _write_process(tmp_path, 100, "zsh", ["zsh"])
+
+        assert probe_process_tree(100, PREFIXES, tmp_path).ai_process is None
+        assert probe_process_tree(555, PREFIXES, tmp_path) is None
+
+
+def test_is_proc_available_requires_proc_mount(tmp_path):
+    """/proc/self/stat がない場合は利用不可と判定する。"""
+    assert is_proc_available(tmp_path) is False
+    if os.path.exists("/proc/self/stat"):
+        assert is_proc_available() is True
@@ -1,8 +1,14 @@
 """SchedulerManagerのテスト。"""
 
+import asyncio
+import fcntl
+from datetime import timedelta
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
+import pytest
+
+from src.managers import scheduler_manager as scheduler_module
 from src.managers.scheduler_manager import SchedulerManager, TaskPriority
 
 
@@ -166,6 +172,34 @@ class TestSchedulerManager:
         assert assignments == [(first_task.id, "agent-002")]
         assert sample_agents["agent-002"].status == "busy"
 
+    def test_run_auto_assign_loop_persists_workers_in_one_batch(
+        self,
+        dashboard_manager,
+        sample_agents,
+    ):
+        """自動割り当てループで更新した Worker をまとめて 1 回で永続化することをテスト。"""
+        sample_agents["agent-003"].status = "idle"
+        persist_agent_state = MagicMock(return_value=True)
+        persist_agents_state = MagicMock(return_value=True)
+        scheduler = SchedulerManager(
+            dashboard_manager,
+            sample_agents,
+            persist_agent_state=persist_agent_state,
+            persist_agents_state=persist_agents_state,
+        )
+        for title in ("first-task", "second-task"):
+            task = dashboard_manager.create_task(title)
+            scheduler.enqueue_task(task.id, TaskPriority.HIGH)
+
+        assignments = scheduler.run_auto_assign_loop()
+
+        assert len(assignments) == 2
+        persist_agent_state.assert_not_called()
+        persist_agents_state.assert_called_once()
+        (persisted,) = persist_agents_state.call_args.args
+        assert {agent.id for agent in persisted} == {"agent-002", "agent-003"}
+        assert all(agent.status == "busy" for agent in persisted)
+
     def test_get_next_task_uses_dashboard_snapshot_once(self):
         """依存判定で Dashboard のスナップショットを 1 回だけ使うことをテスト。"""
         dashboard = MagicMock()
@@ -199,3 +233,244 @@ class TestSchedulerManager:
         assert by_task_id["task-ng"]["dependencies_satisfied"] is False
         dashboard.list_tasks.assert_called_once()
         dashboard.get_task.assert_not_called()
+
+    def test_release_task_records_idle_gap_for_event_assignments(
+        self,
+        dashboard_manager,
+        sample_agents,
+    ):
+        """タスク終了で Worker が空いた時刻を記録し、再割り当てまでの待ち時間を集計する。"""
+        scheduler = SchedulerManager(dashboard_manager, sample_agents)
+        scheduler.enqueue_task("done-task", TaskPriority.HIGH)
+
+        scheduler.release_task("done-task", "agent-002")
+        assert scheduler.get_task_info("done-task") is None
+
+        scheduler._released_at["agent-002"] -= timedelta(seconds=5)
+        scheduler.record_event_assignments([("next-task", "agent-002")], baseline_seconds=60)
+
+        stats = scheduler.get_queue_status()["event_auto_assign"]
+        assert stats["releases"] == 1
+        assert stats["assignments"] == 1
+        assert 5 <= stats["avg_idle_gap_seconds"] < 6
+        assert 54 <= stats["estimated_saved_seconds"] <= 55
+
+
+class TestSchedulerDependencyGraph:
+    """依存関係 DAG のテスト。"""
+
+    @staticmethod
+    def _scheduler(agents=None, completed=()):
+        dashboard = MagicMock()
+        dashboard.list_tasks.return_value = [
+            SimpleNamespace(id=task_id, status="completed") for task_id in completed
+        ]
+        dashboard.assign_task.return_value = (True, "ok")
+        return SchedulerManager(dashboard, agents or {}), dashboard
+
+    def test_completion_unblocks_dependents_without_dashboard_reads(self):
+        """完了通知で逆辺を辿って待ちタスクが割り当て候補になる。"""
+        scheduler, dashboard = self._scheduler()
+        scheduler.enqueue_task("a", TaskPriority.LOW)
+        scheduler.enqueue_task("b", TaskPriority.CRITICAL, dependencies=["a"])
+        scheduler.enqueue_task("c", TaskPriority.CRITICAL, dependencies=["a", "b"])
+
+        assert scheduler.get_next_task() == "a"
+        reads = dashboard.list_tasks.call_count
+
+        scheduler.complete_task("a")
+        assert scheduler.get_next_task() == "b"
+        scheduler.complete_task("b")
+        assert scheduler.get_next_task() == "c"
+        assert dashboard.list_tasks.call_count == reads
+
+    def test_failed_release_keeps_dependents_blocked(self):
+        """failed/cancelled での終了では依存待ちのタスクを解放しない。"""
+        scheduler, _ = self._scheduler()
+        scheduler.enqueue_task("a")
+        scheduler.enqueue_task("b", dependencies=["a"])
+
+        scheduler.release_task("a", completed=False)
+
+        assert scheduler.get_next_task() is None
+        status = scheduler.get_queue_status()
+        assert status["pending_tasks"][0]["unmet_dependencies"] == ["a"]
+
+    def test_dependency_completed_on_dashboard_is_picked_up(self):
+        """完了通知を経由せず Dashboard 上で完了した依存も反映される。"""
+        scheduler, _ = self._scheduler(completed=["external"])
+        scheduler.enqueue_task("a", dependencies=["external"])
+
+        assert scheduler.get_next_task() == "a"
+
+    def test_auto_assign_loop_reads_dashboard_at_most_once(self, sample_agents):
+        """複数件の割り当てでも Dashboard の読み込みはループ全体で高々 1 回。"""
+        sample_agents["agent-003"].status = "idle"
+        scheduler, dashboard = self._scheduler(sample_agents)
+        for i in range(5):
+            scheduler.enqueue_task(f"task-{i}", TaskPriority.MEDIUM)
+
+        assignments = scheduler.run_auto_assign_loop()
+
+        assert assignments == [("task-0", "agent-002"), ("task-1", "agent-003")]
+        assert dashboard.list_tasks.call_count <= 1
+        assert scheduler.get_next_task() == "task-2"
+
+    def test_same_priority_keeps_insertion_order(self):
+        """同一優先度では先に追加したタスクから割り当てる。"""
+        scheduler, _ = self._scheduler()
+        for task_id in ("x", "y", "z"):
+            scheduler.enqueue_task(task_id, TaskPriority.HIGH)
+        scheduler.update_priority("x", TaskPriority.HIGH)
+
+        assert scheduler.get_next_task() == "y"
+
+    def test_enqueue_rejects_dependency_cycles(self):
+        """依存関係が循環するタスクは追加できない。"""
+        scheduler, _ = self._scheduler()
+        scheduler.enqueue_task("a", dependencies=["c"])
+        scheduler.enqueue_task("b", dependencies=["a"])
+
+        with pytest.raises(ValueError, match="c -> b -> a -> c"):
+            scheduler.enqueue_task("c", dependencies=["b"])
+        with pytest.raises(ValueError):
+            scheduler.enqueue_task("d", dependencies=["d"])
+        assert scheduler.get_task_info("c") is None
+
+
+class TestSchedulerSharedQueue:
+    """state_file による複数プロセス間のキュー共有のテスト。"""
+
+    @staticmethod
+    def _scheduler(state_file, agents=None):
+        dashboard = MagicMock()
+        dashboard.list_tasks.return_value = []
+        dashboard.assign_task.return_value = (True, "ok")
+        return SchedulerManager(dashboard, agents or {}, state_file=state_file)
+
+    def test_enqueue_is_visible_to_other_instance(self, tmp_path):
+        """別インスタンス（別プロセス相当）で追加したタスクが参照できる。"""
+        state_file = tmp_path / "scheduler_queue.json"
+        owner = self._scheduler(state_file)
+        admin = self._scheduler(state_file)
+
+        owner.enqueue_task("a", TaskPriority.LOW)
+        admin.enqueue_task("b", TaskPriority.HIGH, dependencies=["a"])
+
+        status = owner.get_queue_status()
+        assert [t["task_id"] for t in status["pending_tasks"]] == ["b", "a"]
+        assert owner.get_next_task() == "a"
+
+        admin.complete_task("a")
+        assert owner.get_next_task() == "b"
+        assert owner.get_queue_status()["pending_tasks"][0]["dependencies_satisfied"]
+
+    def test_assignment_is_not_duplicated_across_instances(self, tmp_path, sample_agents):
+        """一方で割り当てたタスクは他方の割り当て候補から外れる。"""
+        state_file = tmp_path / "scheduler_queue.json"
+        first = self._scheduler(state_file, sample_agents)
+        second = self._scheduler(state_file, {})
+        first.enqueue_task("a")
+        first.enqueue_task("b")
+
+        assert first.auto_assign() == ("a", "agent-002")
+
+        assert second.get_next_task() == "b"
+        assert second.get_queue_status()["assigned_tasks"] == [
+            {"task_id": "a", "worker_id": "agent-002"}
+        ]
+
+    def test_queue_survives_restart(self, tmp_path):
+        """再起動後のインスタンスが保存済みのキューを引き継ぐ。"""
+        state_file = tmp_path / "scheduler_queue.json"
+        before = self._scheduler(state_file)
+        before.enqueue_task("a", TaskPriority.LOW)
+        before.enqueue_task("b", TaskPriority.LOW)
+        before.enqueue_task("c", TaskPriority.CRITICAL, dependencies=["a"])
+
+        after = self._scheduler(state_file)
+
+        assert after.get_next_task() == "a"
+        info = after.get_task_info("c")
+        assert info["priority"] == "CRITICAL"
+        assert info["dependencies"] == ["a"]
+        after.enqueue_task("d", TaskPriority.LOW)
+        after.complete_task("a")
+        assert after.get_next_task() == "c"
+        after.dequeue_task("c")
+        assert after.get_next_task() == "b"
+
+    def test_read_only_operations_do_not_rewrite_file(self, tmp_path):
+        """状態を変えない操作ではファイルを書き換えない。"""
+        state_file = tmp_path / "scheduler_queue.json"
+        scheduler = self._scheduler(state_file)
+        scheduler.enqueue_task("a")
+        mtime = state_file.stat().st_mtime_ns
+
+        scheduler.get_next_task()
+        scheduler.get_task_info("a")
+        scheduler.get_queue_status()
+
+        assert state_file.stat().st_mtime_ns == mtime
+
+    @pytest.mark.asyncio
+    async def test_run_locked_waits_without_blocking_event_loop(self, tmp_path):
+        """他プロセスがロック中でもイベントループを止めず、解放後に操作を実行する。"""
+        state_file = tmp_path / "scheduler_queue.json"
+        scheduler = self._scheduler(state_file)
+        scheduler.enqueue_task("a")
+
+        with open(tmp_path / "scheduler_queue.json.lock", "a+") as other:
+            fcntl.flock(other.fileno(), fcntl.LOCK_EX)
+            pending = asyncio.create_task(scheduler.run_locked(scheduler.enqueue_task, "b"))
+            await asyncio.sleep(0.05)
+            assert not pending.done()
+            assert scheduler.release_task_nowait("a") is False
+            fcntl.flock(other.fileno(), fcntl.LOCK_UN)
+
+        assert await asyncio.wait_for(pending, timeout=1) is True
+        assert scheduler.release_task_nowait("a") is True
+        assert [t["task_id"] for t in scheduler.get_queue_status()["pending_tasks"]] == ["b"]
+
+    def test_completed_history_is_capped(self, tmp_path, monkeypatch):
+        """完了済み ID は上限まで古い順に間引き、待ちタスクが依存する ID は残す。"""
+        monkeypatch.setattr(scheduler_module, "_COMPLETED_HISTORY_LIMIT", 3)
+        state_file = tmp_path / "scheduler_queue.json"
+        scheduler = self._scheduler(state_file)
+        scheduler.enqueue_task("waiting", dependencies=["done-0", "other"])
+
+        for i in range(6):
+            scheduler.complete_task(f"done-{i}")
+
+        reloaded = self._scheduler(state_file)
+        reloaded.get_next_task()
+        assert list(reloaded._completed_tasks) == ["done-0", "done-4", "done-5"]
+        assert reloaded.get_task_info("waiting") is not None
+
+    @pytest.mark.asyncio
+    async def test_notify_task_terminal_defers_while_locked(self, tmp_path):
+        """ロック中のタスク終了は待たずに戻り、解放後に反映して自動割り当てを要求する。"""
+        from src.managers.background_jobs import SCHEDULER_AUTO_ASSIGN_JOB, notify_task_terminal
+
+        state_file = tmp_path / "scheduler_queue.json"
+        scheduler = self._scheduler(state_file)
+        scheduler.enqueue_task("a")
+        supervisor = MagicMock()
+        app_ctx = SimpleNamespace(
+            scheduler_manager=scheduler,
+            settings=SimpleNamespace(scheduler_event_auto_assign_enabled=True),
+            background_supervisor=supervisor,
+        )
+
+        with open(tmp_path / "scheduler_queue.json.lock", "a+") as other:
+            fcntl.flock(other.fileno(), fcntl.LOCK_EX)
+            assert notify_task_terminal(app_ctx, "a", "agent-001") is True
+            supervisor.trigger.assert_not_called()
+            fcntl.flock(other.fileno(), fcntl.LOCK_UN)
+
+        for _ in range(100):
+            if supervisor.trigger.called:
+                break
+            await asyncio.sleep(0.01)
+        supervisor.trigger.assert_called_once_with(SCHEDULER_AUTO_ASSIGN_JOB)
+        assert scheduler.get_task_info("a") is None
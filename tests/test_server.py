@@ -24,3 +24,48 @@ async def test_app_lifespan_does_not_cleanup_tmux_sessions(monkeypatch):
         assert app_ctx.tmux is not None
 
     mock_cleanup.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_app_lifespan_starts_and_stops_background_jobs(monkeypatch):
+    """サーバーの起動・終了に合わせてバックグラウンドジョブを開始・停止することをテスト。"""
+    from src import server
+
+    monkeypatch.setattr(server, "TmuxManager", lambda settings: MagicMock())
+    monkeypatch.setattr(server, "AiCliManager", lambda settings: MagicMock())
+
+    async with server.app_lifespan(server.mcp) as app_ctx:
+        supervisor = app_ctx.background_supervisor
+        assert supervisor is not None
+        assert supervisor.running is True
+        assert [job["name"] for job in supervisor.snapshot()] == [
+            "scheduler_auto_assign",
+            "memory_prune",
+            "registry_gc",
+        ]
+
+    assert supervisor.running is False
+    assert supervisor.snapshot()[0]["state"] == "stopped"
+
+
+@pytest.mark.asyncio
+async def test_app_lifespan_cancels_daemon_task_on_shutdown(monkeypatch):
+    """daemon の停止処理が失敗しても、終了時に daemon タスクをキャンセルして回収する。"""
+    import asyncio
+
+    from src import server
+    from src.managers import healthcheck_daemon
+
+    monkeypatch.setattr(server, "TmuxManager", lambda settings: MagicMock())
+    monkeypatch.setattr(server, "AiCliManager", lambda settings: MagicMock())
+    monkeypatch.setattr(
+        healthcheck_daemon,
+        "stop_healthcheck_daemon",
+        AsyncMock(side_effect=RuntimeError("boom")),
+    )
+
+    async with server.app_lifespan(server.mcp) as app_ctx:
+        daemon_task = asyncio.create_task(asyncio.sleep(3600))
+        app_ctx.healthcheck_daemon_task = daemon_task
+
+    assert daemon_task.cancelled()
@@ -57,6 +57,27 @@ class TestResetAppContext:
         _reset_app_context(app_ctx)
         assert len(app_ctx._owner_wait_state) == 0
 
+    def test_resets_healthcheck_schedule_and_pending_triggers(self, app_ctx):
+        """Worker の確認予定と、前セッションで要求されたジョブ実行を持ち越さないこと。"""
+        from src.managers.background_jobs import SCHEDULER_AUTO_ASSIGN_JOB
+        from src.tools.helpers_managers import (
+            ensure_background_supervisor,
+            ensure_healthcheck_scheduler,
+        )
+
+        scheduler = ensure_healthcheck_scheduler(app_ctx)
+        scheduler.sync_agents(["worker-001"])
+        scheduler.mark_urgent("worker-001", "dispatched")
+        supervisor = ensure_background_supervisor(app_ctx)
+        assert supervisor.trigger(SCHEDULER_AUTO_ASSIGN_JOB) is True
+
+        _reset_app_context(app_ctx)
+
+        assert app_ctx.healthcheck_scheduler is None
+        assert app_ctx.background_supervisor is supervisor
+        assert supervisor.clear_triggers() == 0
+        assert ensure_healthcheck_scheduler(app_ctx).snapshot() == []
+
 
 class TestClearConfigSessionId:
     """_clear_config_session_id のテスト。"""
@@ -8,8 +8,10 @@ from src.config.settings import (
     ModelDefaults,
     Settings,
     WorkerCliMode,
+    clear_settings_cache,
     get_mcp_dir,
     get_project_env_file,
+    load_effective_settings_for_project,
     load_settings_for_project,
     resolve_model_for_cli,
 )
@@ -34,7 +36,7 @@ class TestGetMcpDir:
         assert result == ".custom-mcp-dir"
 
     def test_reflects_env_change_without_cache(self, monkeypatch):
-        """キャッシュせず呼び出しごとに環境変数変更を反映することをテスト。"""
+        """環境変数が変わると構築済みの設定を使わず反映することをテスト。"""
         monkeypatch.setenv("MCP_MCP_DIR", ".custom-a")
         assert get_mcp_dir() == ".custom-a"
 
@@ -243,6 +245,78 @@ class TestLoadSettingsForProject:
         assert settings.model_profile_standard_admin_model == ModelDefaults.OPUS
 
 
+class TestSettingsCache:
+    """Settings キャッシュのテスト。"""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self, monkeypatch):
+        monkeypatch.delenv("MCP_ENABLE_GIT", raising=False)
+        clear_settings_cache()
+        yield
+        clear_settings_cache()
+
+    @staticmethod
+    def _write_env(temp_dir, content):
+        mcp_dir = temp_dir / ".multi-agent-mcp"
+        mcp_dir.mkdir(parents=True, exist_ok=True)
+        (mcp_dir / ".env").write_text(content, encoding="utf-8")
+        return mcp_dir
+
+    def test_reuses_settings_until_inputs_change(self, temp_dir, monkeypatch):
+        """入力が変わらない間は Settings を再構築しない。"""
+        self._write_env(temp_dir, "MCP_MAX_WORKERS=4\n")
+        constructed = []
+        original_init = Settings.__init__
+
+        def counting_init(self, *args, **kwargs):
+            constructed.append(kwargs.get("_env_file"))
+            original_init(self, *args, **kwargs)
+
+        monkeypatch.setattr(Settings, "__init__", counting_init)
+        for _ in range(3):
+            load_settings_for_project(str(temp_dir))
+            load_effective_settings_for_project(str(temp_dir))
+        assert len(constructed) == 1
+
+        monkeypatch.setenv("MCP_MEMORY_TTL_DAYS", "7")
+        settings = load_settings_for_project(str(temp_dir))
+        assert len(constructed) == 2
+        assert settings.memory_ttl_days == 7
+
+    def test_env_file_change_is_reflected(self, temp_dir, monkeypatch):
+        """.env を書き換えると新しい値で再構築される。"""
+        monkeypatch.delenv("MCP_MODEL_PROFILE_STANDARD_ADMIN_MODEL", raising=False)
+        self._write_env(temp_dir, "MCP_MODEL_PROFILE_STANDARD_ADMIN_MODEL=model-a\n")
+        assert load_settings_for_project(str(temp_dir)).model_profile_standard_admin_model == (
+            "model-a"
+        )
+
+        self._write_env(temp_dir, "MCP_MODEL_PROFILE_STANDARD_ADMIN_MODEL=model-bb\n")
+        assert load_settings_for_project(str(temp_dir)).model_profile_standard_admin_model == (
+            "model-bb"
+        )
+
+    def test_config_json_change_is_reflected(self, temp_dir):
+        """config.json の enable_git の変更が反映される。"""
+        mcp_dir = self._write_env(temp_dir, "")
+        config_file = mcp_dir / "config.json"
+        config_file.write_text('{"enable_git": false}', encoding="utf-8")
+        assert load_effective_settings_for_project(str(temp_dir)).enable_git is False
+
+        config_file.write_text('{"enable_git": true} ', encoding="utf-8")
+        assert load_effective_settings_for_project(str(temp_dir)).enable_git is True
+
+    def test_returned_settings_are_independent_copies(self, temp_dir):
+        """呼び出し側の変更はキャッシュに影響しない。"""
+        first = load_effective_settings_for_project(str(temp_dir))
+        first.enable_git = not first.enable_git
+
+        second = load_effective_settings_for_project(str(temp_dir))
+
+        assert second is not first
+        assert second.enable_git is not first.enable_git
+
+
 class TestWorkerCliAndModelResolution:
     """Worker CLI / モデル解決ロジックのテスト。"""
 
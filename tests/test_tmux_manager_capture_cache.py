@@ -0,0 +1,125 @@
+"""TmuxManager の capture-pane 共有キャッシュのテスト。"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.config.settings import Settings
+from src.managers.tmux_manager import TmuxManager
+
+
+def _make_manager(ttl_ms: int, outputs: list[str] | None = None) -> TmuxManager:
+    manager = TmuxManager(Settings(capture_cache_ttl_ms=ttl_ms))
+    remaining = list(outputs or ["screen"])
+
+    async def fake_run(*args):
+        if args[0] == "capture-pane":
+            await asyncio.sleep(0.01)
+            return 0, remaining.pop(0) if len(remaining) > 1 else remaining[0], ""
+        return 0, "", ""
+
+    manager._run = AsyncMock(side_effect=fake_run)
+    return manager
+
+
+def _capture_calls(manager: TmuxManager) -> int:
+    return sum(1 for call in manager._run.await_args_list if call.args[0] == "capture-pane")
+
+
+class TestCaptureCache:
+    """capture_pane_by_index のキャッシュ・合流テスト。"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_captures_share_one_subprocess(self):
+        """同時呼び出しは 1 回の capture-pane に合流する。"""
+        manager = _make_manager(ttl_ms=500)
+
+        results = await asyncio.gather(
+            *(manager.capture_pane_by_index("proj", 0, 1) for _ in range(5))
+        )
+
+        assert results == ["screen"] * 5
+        assert _capture_calls(manager) == 1
+        stats = manager.get_capture_cache_stats()
+        assert stats["misses"] == 1
+        assert stats["coalesced"] == 4
+
+    @pytest.mark.asyncio
+    async def test_cancelling_first_caller_does_not_cancel_coalesced_callers(self):
+        """最初の呼び出し元がキャンセルされても、合流した呼び出し元は結果を受け取る。"""
+        manager = _make_manager(ttl_ms=500)
+
+        owner = asyncio.create_task(manager.capture_pane_by_index("proj", 0, 1))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(manager.capture_pane_by_index("proj", 0, 1))
+        await asyncio.sleep(0)
+        owner.cancel()
+
+        assert await waiter == "screen"
+        with pytest.raises(asyncio.CancelledError):
+            await owner
+        assert _capture_calls(manager) == 1
+        # キャンセルされた呼び出し元の分も含め、結果はキャッシュされる
+        assert await manager.capture_pane_by_index("proj", 0, 1) == "screen"
+        assert _capture_calls(manager) == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_within_ttl_and_key_includes_lines(self):
+        """TTL 内の再取得はキャッシュを返し、行数が異なれば別キーとなる。"""
+        manager = _make_manager(ttl_ms=500)
+
+        await manager.capture_pane_by_index("proj", 0, 1, lines=50)
+        await manager.capture_pane_by_index("proj", 0, 1, lines=50)
+        await manager.capture_pane_by_index("proj", 0, 1, lines=120)
+
+        assert _capture_calls(manager) == 2
+        assert manager.get_capture_cache_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refetched(self):
+        """TTL 経過後は再度 capture-pane を実行する。"""
+        manager = _make_manager(ttl_ms=20, outputs=["old", "new"])
+
+        assert await manager.capture_pane_by_index("proj", 0, 1) == "old"
+        await asyncio.sleep(0.05)
+        assert await manager.capture_pane_by_index("proj", 0, 1) == "new"
+        assert _capture_calls(manager) == 2
+
+    @pytest.mark.asyncio
+    async def test_send_invalidates_cached_capture(self):
+        """キー送信後のキャプチャは送信前の画面を返さない。"""
+        manager = _make_manager(ttl_ms=1000, outputs=["before", "after"])
+
+        assert await manager.capture_pane_by_index("proj", 0, 1) == "before"
+        assert await manager.send_keys_to_pane("proj", 0, 1, "echo hi", clear_input=False)
+        assert await manager.capture_pane_by_index("proj", 0, 1) == "after"
+        assert manager.get_capture_cache_stats()["invalidations"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_failed_capture_is_not_cached(self):
+        """capture-pane が失敗した場合はキャッシュせず次回に再試行する。"""
+        manager = TmuxManager(Settings(capture_cache_ttl_ms=1000))
+        manager._run = AsyncMock(side_effect=[(1, "", "no pane"), (0, "ok", "")])
+
+        assert await manager.capture_pane_by_index("proj", 0, 1) == ""
+        assert await manager.capture_pane_by_index("proj", 0, 1) == "ok"
+        assert manager._run.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_ttl_zero_disables_cache(self):
+        """TTL 0 の場合は毎回 capture-pane を実行する。"""
+        manager = _make_manager(ttl_ms=0)
+
+        await asyncio.gather(*(manager.capture_pane_by_index("proj", 0, 1) for _ in range(3)))
+
+        assert _capture_calls(manager) == 3
+
+
+class TestCaptureCacheSettings:
+    """capture_cache_ttl_ms の設定検証テスト。"""
+
+    def test_rejects_out_of_range(self):
+        """1000ms を超える値は拒否する。"""
+        with pytest.raises(ValueError):
+            Settings(capture_cache_ttl_ms=1001)
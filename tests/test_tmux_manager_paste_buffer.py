@@ -0,0 +1,66 @@
+"""TmuxManager の paste-buffer 送信テスト。"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.config.settings import Settings
+from src.managers.tmux_manager import TmuxManager
+
+
+def _make_manager(threshold: int) -> TmuxManager:
+    manager = TmuxManager(Settings(paste_buffer_threshold_bytes=threshold))
+    manager._run = AsyncMock(return_value=(0, "", ""))
+    manager._run_with_input = AsyncMock(return_value=(0, "", ""))
+    return manager
+
+
+class TestSendKeysPasteBuffer:
+    """send_keys_to_pane の送信経路切り替えテスト。"""
+
+    @pytest.mark.asyncio
+    async def test_small_payload_uses_send_keys(self):
+        """閾値未満は従来通り send-keys -l で送信する。"""
+        manager = _make_manager(threshold=64)
+
+        assert await manager.send_keys_to_pane("proj", 0, 1, "short", clear_input=False)
+
+        manager._run_with_input.assert_not_awaited()
+        first_call = manager._run.await_args_list[0].args
+        assert first_call == ("send-keys", "-t", "proj:0.1", "-l", "short")
+
+    @pytest.mark.asyncio
+    async def test_large_payload_uses_paste_buffer(self):
+        """閾値以上は load-buffer + paste-buffer -p で一括送信する。"""
+        manager = _make_manager(threshold=64)
+        payload = "タスク指示 " * 40
+
+        assert await manager.send_keys_to_pane("proj", 0, 1, payload, clear_input=False)
+
+        load_call = manager._run_with_input.await_args
+        assert load_call.args[0] == payload.encode("utf-8")
+        assert load_call.args[1:3] == ("load-buffer", "-b")
+        buffer_name = load_call.args[3]
+        paste_args = manager._run.await_args_list[0].args
+        assert paste_args == ("paste-buffer", "-d", "-p", "-b", buffer_name, "-t", "proj:0.1")
+        assert manager._run.await_args_list[-1].args == ("send-keys", "-t", "proj:0.1", "C-m")
+
+    @pytest.mark.asyncio
+    async def test_paste_failure_falls_back_to_send_keys(self):
+        """load-buffer 失敗時は send-keys -l にフォールバックする。"""
+        manager = _make_manager(threshold=8)
+        manager._run_with_input = AsyncMock(return_value=(1, "", "no server"))
+
+        assert await manager.send_keys_to_pane("proj", 0, 1, "x" * 32, clear_input=False)
+
+        first_call = manager._run.await_args_list[0].args
+        assert first_call == ("send-keys", "-t", "proj:0.1", "-l", "x" * 32)
+
+    @pytest.mark.asyncio
+    async def test_threshold_zero_disables_paste(self):
+        """閾値 0 の場合は常に send-keys を使う。"""
+        manager = _make_manager(threshold=0)
+
+        assert await manager.send_keys_to_pane("proj", 0, 1, "x" * 10_000, clear_input=False)
+
+        manager._run_with_input.assert_not_awaited()
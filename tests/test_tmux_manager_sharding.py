@@ -0,0 +1,162 @@
+"""TmuxManager の複数 tmux サーバー分散テスト。"""
+
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.config.settings import Settings
+from src.managers.healthcheck_manager import HealthcheckManager
+from src.managers.tmux_manager import TmuxManager
+from src.managers.tmux_shared import use_tmux_socket
+from src.models.agent import Agent, AgentRole, AgentStatus
+
+
+class TestSocketRouting:
+    """ターゲットからの接続先サーバー解決テスト。"""
+
+    def test_pane_target_routes_to_shard(self):
+        """追加ウィンドウのペインは登録されたサーバーへ向く。"""
+        manager = TmuxManager(Settings(tmux_server_count=2))
+        manager.register_window_socket("proj", 2, "multi-agent-mcp-shard-1")
+
+        assert manager._socket_args(("send-keys", "-t", "proj:0.1", "C-m")) == []
+        assert manager._socket_args(("send-keys", "-t", "proj:2.3", "C-m")) == [
+            "-L",
+            "multi-agent-mcp-shard-1",
+        ]
+        # セッション単位のターゲットは既定サーバー
+        assert manager._socket_args(("has-session", "-t", "proj")) == []
+
+    def test_window_name_target_routes_to_shard(self):
+        """ウィンドウ名のターゲットもインデックスに変換して対応するサーバーへ向く。"""
+        manager = TmuxManager(Settings(tmux_server_count=2))
+        manager.register_window_socket("proj", 2, "multi-agent-mcp-shard-1")
+
+        assert manager._socket_args(("send-keys", "-t", "proj:main.1", "C-c")) == []
+        # 追加ウィンドウ（index 2）は workers-3 という名前で作成される
+        assert manager._socket_args(("send-keys", "-t", "proj:workers-3.0", "C-c")) == [
+            "-L",
+            "multi-agent-mcp-shard-1",
+        ]
+        assert manager._socket_args(("send-keys", "-t", "proj:unknown.0", "C-c")) == []
+
+    def test_registered_socket_takes_precedence(self):
+        """Agent に記録されたソケットが設定からの算出より優先される。"""
+        manager = TmuxManager(Settings(tmux_server_count=1))
+        manager.register_window_socket("proj", 1, "legacy-shard")
+
+        assert manager._socket_args(("capture-pane", "-t", "proj:1.0", "-p")) == [
+            "-L",
+            "legacy-shard",
+        ]
+        assert manager.assign_window_socket("proj", 1) == "legacy-shard"
+
+    def test_server_count_change_does_not_move_windows(self):
+        """tmux_server_count を後から変えても、既存ウィンドウの接続先は変わらない。"""
+        settings = Settings(tmux_server_count=1)
+        manager = TmuxManager(settings)
+        manager.register_window_socket("proj", 1, None)
+        settings.tmux_server_count = 3
+
+        assert manager._socket_args(("send-keys", "-t", "proj:1.0", "C-m")) == []
+        assert manager.assign_window_socket("proj", 1) is None
+        # 新規ウィンドウは現在の設定に従って配置する
+        assert manager.assign_window_socket("proj", 2) == "multi-agent-mcp-shard-2"
+        # 未登録のウィンドウは算出値に向けず既定サーバーのまま
+        assert manager.get_window_socket("proj", 2) is None
+
+    def test_context_override(self):
+        """use_tmux_socket 内ではセッション単位のコマンドも指定サーバーへ向く。"""
+        manager = TmuxManager(Settings())
+        with use_tmux_socket("/tmp/shard.sock"):
+            assert manager._socket_args(("has-session", "-t", "proj")) == [
+                "-S",
+                "/tmp/shard.sock",
+            ]
+
+
+class TestShardedWindowLifecycle:
+    """別サーバー上の追加ウィンドウ作成・削除テスト。"""
+
+    @pytest.mark.asyncio
+    async def test_add_window_creates_session_on_shard(self):
+        """シャード上にセッションが無ければ作成し、ウィンドウ番号を揃える。"""
+        manager = TmuxManager(Settings(tmux_server_count=2))
+        manager.session_exists = AsyncMock(return_value=False)
+        manager._split_into_grid = AsyncMock(return_value=True)
+        manager._run = AsyncMock(return_value=(0, "", ""))
+
+        ok = await manager.add_extra_worker_window("proj", 1, 2, 5, working_dir="/repo")
+
+        assert ok is True
+        commands = [c.args for c in manager._run.await_args_list]
+        assert ("new-session", "-d", "-s", "proj", "-n", "workers-2", "-c", "/repo") in commands
+        assert ("move-window", "-s", "proj:workers-2", "-t", "proj:1") in commands
+        assert manager.get_window_socket("proj", 1) == "multi-agent-mcp-shard-1"
+
+    @pytest.mark.asyncio
+    async def test_kill_session_also_kills_shards(self):
+        """kill_session は追加サーバー上の同名セッションも終了する。"""
+        manager = TmuxManager(Settings(tmux_server_count=3))
+        sockets_seen: list[list[str]] = []
+
+        async def _fake_run(*args):
+            sockets_seen.append(manager._socket_args(args))
+            return (0, "", "")
+
+        manager._run = _fake_run
+
+        assert await manager.kill_session("proj") is True
+        assert sockets_seen == [
+            [],
+            ["-L", "multi-agent-mcp-shard-1"],
+            ["-L", "multi-agent-mcp-shard-2"],
+        ]
+
+
+class TestShardedRecovery:
+    """追加サーバー上のエージェントの復旧テスト。"""
+
+    @pytest.fixture
+    def sharded_worker(self):
+        return Agent(
+            id="worker-7",
+            role=AgentRole.WORKER,
+            status=AgentStatus.BUSY,
+            tmux_session="proj:1.0",
+            session_name="proj",
+            window_index=1,
+            pane_index=0,
+            tmux_socket="legacy-shard",
+            working_dir="/repo",
+            created_at=datetime.now(),
+            last_activity=datetime.now(),
+        )
+
+    @pytest.mark.asyncio
+    async def test_recovery_targets_agent_socket(self, sharded_worker):
+        """強制復旧の割り込みとセッション再作成はエージェントのサーバーへ送る。"""
+        manager = TmuxManager(Settings(tmux_server_count=1))
+        sent: list[tuple[list[str], tuple[str, ...]]] = []
+
+        async def _fake_run(*args):
+            sent.append((manager._socket_args(args), args))
+            return (0, "", "")
+
+        manager._run = _fake_run
+        healthcheck = HealthcheckManager(manager, {sharded_worker.id: sharded_worker})
+        healthcheck.check_agent = AsyncMock(
+            return_value=SimpleNamespace(is_healthy=False)
+        )
+
+        ok, _ = await healthcheck.attempt_recovery(sharded_worker.id, force=True)
+        assert ok is True
+        ok, _ = await healthcheck.attempt_recovery(sharded_worker.id)
+        assert ok is True
+
+        assert sent == [
+            (["-L", "legacy-shard"], ("send-keys", "-t", "proj:1.0", "C-c")),
+            (["-L", "legacy-shard"], ("new-session", "-d", "-s", "proj", "-c", "/repo")),
+        ]
@@ -4,7 +4,14 @@ import re
 
 import pytest
 
-from src.managers.tmux_shared import get_legacy_project_name, get_project_name
+from src.managers.tmux_shared import (
+    current_tmux_socket,
+    get_legacy_project_name,
+    get_project_name,
+    resolve_worker_socket,
+    tmux_socket_args,
+    use_tmux_socket,
+)
 
 
 class TestGetProjectName:
@@ -32,3 +39,37 @@ class TestGetProjectName:
         """enable_git=True で non-git を指定した場合は例外。"""
         with pytest.raises(ValueError):
             get_project_name(str(temp_dir), enable_git=True)
+
+
+class TestWorkerSocket:
+    """tmux サーバー分散（ソケット）ユーティリティのテスト。"""
+
+    def test_single_server_returns_none(self):
+        """サーバー数 1 の場合は常に既定サーバー。"""
+        assert resolve_worker_socket(3, 1) is None
+
+    def test_main_window_stays_on_default_server(self):
+        """メインウィンドウは分散対象外。"""
+        assert resolve_worker_socket(0, 4) is None
+
+    def test_extra_windows_round_robin(self):
+        """追加ウィンドウは追加サーバーへラウンドロビンで割り当てる。"""
+        sockets = [resolve_worker_socket(w, 3) for w in (1, 2, 3, 4)]
+        assert sockets == [
+            "multi-agent-mcp-shard-1",
+            "multi-agent-mcp-shard-2",
+            "multi-agent-mcp-shard-1",
+            "multi-agent-mcp-shard-2",
+        ]
+
+    def test_socket_args(self):
+        """ソケット名は -L、パスは -S になる。"""
+        assert tmux_socket_args(None) == []
+        assert tmux_socket_args("shard-1") == ["-L", "shard-1"]
+        assert tmux_socket_args("/tmp/tmux.sock") == ["-S", "/tmp/tmux.sock"]
+
+    def test_use_tmux_socket_is_scoped(self):
+        """use_tmux_socket はコンテキスト内でのみ有効。"""
+        with use_tmux_socket("shard-1"):
+            assert current_tmux_socket() == "shard-1"
+        assert current_tmux_socket() is None
@@ -10,6 +10,7 @@ from src.config.settings import AICli
 from src.context import AppContext
 from src.managers.ai_cli_manager import AiCliManager
 from src.managers.dashboard_manager import DashboardManager
+from src.managers.healthcheck_daemon import stop_healthcheck_daemon
 from src.managers.ipc_manager import IPCManager
 from src.managers.memory_manager import MemoryManager
 from src.managers.persona_manager import PersonaManager
@@ -19,7 +20,7 @@ from src.models.agent import Agent, AgentRole, AgentStatus
 
 
 @pytest.fixture
-def tool_test_ctx(git_repo, settings):
+async def tool_test_ctx(git_repo, settings):
     """ツールテスト用のAppContextを作成する（git リポジトリを使用）。"""
     # モック tmux マネージャー
     mock_tmux = MagicMock(spec=TmuxManager)
@@ -80,7 +81,8 @@ def tool_test_ctx(git_repo, settings):
 
     yield ctx
 
-    # クリーンアップ
+    # クリーンアップ（Worker 作成で起動した healthcheck daemon を停止する）
+    await stop_healthcheck_daemon(ctx)
     ipc.cleanup()
     dashboard.cleanup()
 
@@ -555,6 +555,125 @@ class TestGetOutput:
         assert result["success"] is True
         assert result["lines"] == 100
 
+    @pytest.mark.asyncio
+    async def test_get_output_reads_pane_log(self, command_mock_ctx, git_repo, temp_dir):
+        """ペインログがある場合は capture-pane を使わずログから取得する。"""
+        from mcp.server.fastmcp import FastMCP
+
+        from src.tools.command import register_tools
+
+        mcp = FastMCP("test")
+        register_tools(mcp)
+
+        get_output = None
+        for tool in mcp._tool_manager._tools.values():
+            if tool.name == "get_output":
+                get_output = tool.fn
+                break
+
+        log_path = temp_dir / "worker-001.log"
+        log_path.write_text("old\nlogged output\n")
+
+        app_ctx = command_mock_ctx.request_context.lifespan_context
+        now = datetime.now()
+        app_ctx.agents["owner-001"] = Agent(
+            id="owner-001",
+            role=AgentRole.OWNER,
+            status=AgentStatus.IDLE,
+            tmux_session=None,
+            working_dir=str(git_repo),
+            created_at=now,
+            last_activity=now,
+        )
+        app_ctx.agents["worker-001"] = Agent(
+            id="worker-001",
+            role=AgentRole.WORKER,
+            status=AgentStatus.BUSY,
+            tmux_session="test:0.1",
+            session_name="test",
+            window_index=0,
+            pane_index=1,
+            working_dir=str(git_repo),
+            pane_log_path=str(log_path),
+            created_at=now,
+            last_activity=now,
+        )
+        app_ctx.tmux.capture_pane_by_index.reset_mock()
+
+        result = await get_output(
+            agent_id="worker-001",
+            lines=1,
+            caller_agent_id="owner-001",
+            ctx=command_mock_ctx,
+        )
+
+        assert result["success"] is True
+        assert result["source"] == "pane_log"
+        assert result["output"] == "logged output"
+        app_ctx.tmux.capture_pane_by_index.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_output_captures_full_screen_tui(
+        self, command_mock_ctx, git_repo, temp_dir
+    ):
+        """全画面 TUI の CLI はペインログがあっても capture-pane で取得する。"""
+        from mcp.server.fastmcp import FastMCP
+
+        from src.config.settings import AICli
+        from src.tools.command import register_tools
+
+        mcp = FastMCP("test")
+        register_tools(mcp)
+
+        get_output = None
+        for tool in mcp._tool_manager._tools.values():
+            if tool.name == "get_output":
+                get_output = tool.fn
+                break
+
+        log_path = temp_dir / "admin-001.log"
+        log_path.write_text("raw stream\n")
+
+        app_ctx = command_mock_ctx.request_context.lifespan_context
+        now = datetime.now()
+        app_ctx.agents["owner-001"] = Agent(
+            id="owner-001",
+            role=AgentRole.OWNER,
+            status=AgentStatus.IDLE,
+            tmux_session=None,
+            working_dir=str(git_repo),
+            created_at=now,
+            last_activity=now,
+        )
+        app_ctx.agents["admin-001"] = Agent(
+            id="admin-001",
+            role=AgentRole.ADMIN,
+            status=AgentStatus.BUSY,
+            tmux_session="test:0.0",
+            session_name="test",
+            window_index=0,
+            pane_index=0,
+            working_dir=str(git_repo),
+            ai_cli=AICli.CODEX,
+            pane_log_path=str(log_path),
+            created_at=now,
+            last_activity=now,
+        )
+        app_ctx.tmux.capture_pane_by_index.reset_mock()
+        app_ctx.tmux.capture_pane_by_index.return_value = "rendered screen"
+
+        result = await get_output(
+            agent_id="admin-001",
+            lines=10,
+            caller_agent_id="owner-001",
+            ctx=command_mock_ctx,
+        )
+
+        assert result["success"] is True
+        assert result["source"] == "tmux"
+        assert result["output"] == "rendered screen"
+        app_ctx.tmux.capture_pane_by_index.assert_called_once_with("test", 0, 0, 10)
+
     @pytest.mark.asyncio
     async def test_worker_get_output_allows_self(self, command_mock_ctx, git_repo):
         """Worker は自身の get_output を実行できる。"""
@@ -1829,3 +1829,85 @@ class TestCostTools:
         assert "estimated_cost_usd" in result["summary"]
         assert "by_cli" in result["summary"]
         assert result["summary"]["by_cli"]["cursor"] == 0
+
+
+class TestEventAutoAssign:
+    """タスク終了を契機とした自動割り当てのテスト。"""
+
+    @pytest.mark.asyncio
+    async def test_completion_assigns_next_queued_task(self, dashboard_mock_ctx, git_repo):
+        """update_task_status で完了にすると、空いた Worker にキューの次タスクが割り当てられる。"""
+        import asyncio
+
+        from mcp.server.fastmcp import FastMCP
+
+        from src.managers.scheduler_manager import TaskPriority
+        from src.models.message import MessageType
+        from src.tools.dashboard import register_tools
+        from src.tools.helpers_managers import ensure_background_supervisor
+        from tests.conftest import get_tool_fn
+
+        mcp = FastMCP("test")
+        register_tools(mcp)
+        update_task_status = get_tool_fn(mcp, "update_task_status")
+
+        app_ctx = dashboard_mock_ctx.request_context.lifespan_context
+        app_ctx.settings.scheduler_event_auto_assign_enabled = True
+        now = datetime.now()
+        for agent_id, role in (("admin-001", AgentRole.ADMIN), ("worker-001", AgentRole.WORKER)):
+            app_ctx.agents[agent_id] = Agent(
+                id=agent_id,
+                role=role,
+                status=AgentStatus.BUSY,
+                working_dir=str(git_repo),
+                created_at=now,
+                last_activity=now,
+            )
+        dashboard = app_ctx.dashboard_manager
+        first = dashboard.create_task("first")
+        second = dashboard.create_task("second")
+        dashboard.assign_task(first.id, "worker-001")
+        app_ctx.agents["worker-001"].current_task = first.id
+        scheduler = SchedulerManager(dashboard, app_ctx.agents)
+        app_ctx.scheduler_manager = scheduler
+        scheduler.enqueue_task(second.id, TaskPriority.HIGH)
+
+        supervisor = ensure_background_supervisor(app_ctx)
+        await supervisor.start()
+        try:
+            result = await update_task_status(
+                task_id=first.id,
+                status="completed",
+                caller_agent_id="admin-001",
+                ctx=dashboard_mock_ctx,
+            )
+            assert result["success"] is True
+            for _ in range(200):
+                if app_ctx.agents["worker-001"].current_task == second.id:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await supervisor.stop()
+
+        assert app_ctx.agents["worker-001"].current_task == second.id
+        assert dashboard.get_task(second.id).assigned_agent_id == "worker-001"
+        assert scheduler.get_queue_status()["event_auto_assign"]["assignments"] == 1
+        messages = app_ctx.ipc_manager.read_messages("admin-001")
+        assert [m.message_type for m in messages] == [MessageType.TASK_ASSIGN]
+        assert messages[0].metadata["assignments"] == [
+            {"task_id": second.id, "worker_id": "worker-001"}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, dashboard_mock_ctx):
+        """設定が無効な場合も完了は反映するが、自動割り当ては要求しない。"""
+        from src.managers.background_jobs import notify_task_terminal
+
+        app_ctx = dashboard_mock_ctx.request_context.lifespan_context
+        scheduler = app_ctx.scheduler_manager
+        scheduler.enqueue_task("task-2", dependencies=["task-1"])
+        app_ctx.background_supervisor = MagicMock()
+
+        assert notify_task_terminal(app_ctx, "task-1", "worker-001") is False
+        assert scheduler.get_queue_status()["pending_tasks"][0]["dependencies_satisfied"] is True
+        app_ctx.background_supervisor.trigger.assert_not_called()
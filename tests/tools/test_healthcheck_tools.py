@@ -478,7 +478,7 @@ class TestFullRecovery:
         result = await execute_full_recovery(app_ctx, worker.id)
 
         assert result["success"] is True
-        expected_target = "test:window-0.1"
+        expected_target = "test:0.1"
         expected_command = f"cd {shlex.quote(special_path)}"
         app_ctx.tmux._run.assert_any_await(
             "send-keys", "-t", expected_target, expected_command, "Enter"
@@ -705,3 +705,169 @@ class TestHealthcheckAiCliCommands:
 
         assert recovery_reason is None
         assert force_recovery is False
+
+
+class TestGetHealthcheckSchedule:
+    """get_healthcheck_schedule ツールのテスト。"""
+
+    @pytest.mark.asyncio
+    async def test_returns_schedule_snapshot(self, healthcheck_mock_ctx, git_repo):
+        """スケジューラの内容を次回確認が近い順に返す。"""
+        from mcp.server.fastmcp import FastMCP
+
+        from src.tools.healthcheck import register_tools
+        from src.tools.helpers_managers import ensure_healthcheck_scheduler
+        from tests.conftest import get_tool_fn
+
+        mcp = FastMCP("test")
+        register_tools(mcp)
+        get_schedule = get_tool_fn(mcp, "get_healthcheck_schedule")
+
+        app_ctx = healthcheck_mock_ctx.request_context.lifespan_context
+        now = datetime.now()
+        app_ctx.agents["admin-001"] = Agent(
+            id="admin-001",
+            role=AgentRole.ADMIN,
+            status=AgentStatus.IDLE,
+            tmux_session=None,
+            working_dir=str(git_repo),
+            created_at=now,
+            last_activity=now,
+        )
+
+        empty = await get_schedule(caller_agent_id="admin-001", ctx=healthcheck_mock_ctx)
+        assert empty["success"] is True
+        assert empty["schedule"] == []
+        assert empty["daemon_running"] is False
+
+        scheduler = ensure_healthcheck_scheduler(app_ctx)
+        scheduler.sync_agents(["worker-001"])
+        scheduler.mark_urgent("worker-002", "dispatched")
+
+        result = await get_schedule(caller_agent_id="admin-001", ctx=healthcheck_mock_ctx)
+        assert [e["agent_id"] for e in result["schedule"]] == ["worker-001", "worker-002"]
+        assert result["schedule"][1]["reason"] == "dispatched"
+
+
+class TestGetHealthcheckMetrics:
+    """get_healthcheck_metrics ツールのテスト。"""
+
+    @pytest.mark.asyncio
+    async def test_returns_metrics_snapshot(self, healthcheck_mock_ctx, git_repo):
+        """監視サイクルの計測値を返す。"""
+        from mcp.server.fastmcp import FastMCP
+
+        from src.tools.healthcheck import register_tools
+        from src.tools.helpers_managers import ensure_healthcheck_manager
+        from tests.conftest import get_tool_fn
+
+        mcp = FastMCP("test")
+        register_tools(mcp)
+        get_metrics = get_tool_fn(mcp, "get_healthcheck_metrics")
+
+        app_ctx = healthcheck_mock_ctx.request_context.lifespan_context
+        now = datetime.now()
+        app_ctx.agents["admin-001"] = Agent(
+            id="admin-001",
+            role=AgentRole.ADMIN,
+            status=AgentStatus.IDLE,
+            tmux_session=None,
+            working_dir=str(git_repo),
+            created_at=now,
+            last_activity=now,
+        )
+
+        ensure_healthcheck_manager(app_ctx).metrics.record_cycle(
+            120.0, 60, {"recovered": [{"agent_id": "worker-001"}]}
+        )
+
+        result = await get_metrics(caller_agent_id="admin-001", ctx=healthcheck_mock_ctx)
+        assert result["success"] is True
+        assert result["daemon_running"] is False
+        assert result["metrics"]["cycles"] == 1
+        assert result["metrics"]["overruns"] == 1
+        assert result["metrics"]["recovery_outcomes"] == {"recovered": 1}
+        assert result["prometheus_file"] is None
+        assert result["source"] == "this_process"
+
+    @pytest.mark.asyncio
+    async def test_reads_snapshot_saved_by_daemon_process(self, healthcheck_mock_ctx, git_repo):
+        """このプロセスで daemon が動いていない場合は保存済みスナップショットを返す。"""
+        from unittest.mock import patch
+
+        from mcp.server.fastmcp import FastMCP
+
+        from src.managers.healthcheck_metrics import HealthcheckMetrics
+        from src.tools.healthcheck import register_tools
+        from src.tools.helpers_managers import ensure_healthcheck_manager
+        from tests.conftest import get_tool_fn
+
+        mcp = FastMCP("test")
+        register_tools(mcp)
+        get_metrics = get_tool_fn(mcp, "get_healthcheck_metrics")
+
+        app_ctx = healthcheck_mock_ctx.request_context.lifespan_context
+        now = datetime.now()
+        app_ctx.agents["owner-001"] = Agent(
+            id="owner-001",
+            role=AgentRole.OWNER,
+            status=AgentStatus.IDLE,
+            tmux_session=None,
+            working_dir=str(git_repo),
+            created_at=now,
+            last_activity=now,
+        )
+        snapshot_file = git_repo / "healthcheck_metrics.json"
+        ensure_healthcheck_manager(app_ctx).metrics_snapshot_file = snapshot_file
+        daemon_metrics = HealthcheckMetrics()
+        daemon_metrics.record_cycle(0.5, 60, {"escalated": [{"agent_id": "worker-001"}]})
+        with patch("src.managers.healthcheck_metrics.os.getpid", return_value=4321):
+            daemon_metrics.write_snapshot_file(snapshot_file)
+
+        result = await get_metrics(caller_agent_id="owner-001", ctx=healthcheck_mock_ctx)
+        assert result["source"] == "snapshot_file"
+        assert result["pid"] == 4321
+        assert result["saved_at"] is not None
+        assert result["metrics"]["cycles"] == 1
+        assert result["metrics"]["recovery_outcomes"] == {"escalated": 1}
+
+
+class TestGetBackgroundJobs:
+    """get_background_jobs ツールのテスト。"""
+
+    @pytest.mark.asyncio
+    async def test_returns_registered_jobs(self, healthcheck_mock_ctx, git_repo):
+        """登録済みジョブの状態を返す（未初期化時は空）。"""
+        from mcp.server.fastmcp import FastMCP
+
+        from src.tools.healthcheck import register_tools
+        from src.tools.helpers_managers import ensure_background_supervisor
+        from tests.conftest import get_tool_fn
+
+        mcp = FastMCP("test")
+        register_tools(mcp)
+        get_jobs = get_tool_fn(mcp, "get_background_jobs")
+
+        app_ctx = healthcheck_mock_ctx.request_context.lifespan_context
+        now = datetime.now()
+        app_ctx.agents["owner-001"] = Agent(
+            id="owner-001",
+            role=AgentRole.OWNER,
+            status=AgentStatus.IDLE,
+            tmux_session=None,
+            working_dir=str(git_repo),
+            created_at=now,
+            last_activity=now,
+        )
+
+        empty = await get_jobs(caller_agent_id="owner-001", ctx=healthcheck_mock_ctx)
+        assert empty == {"success": True, "running": False, "jobs": []}
+
+        ensure_background_supervisor(app_ctx)
+        result = await get_jobs(caller_agent_id="owner-001", ctx=healthcheck_mock_ctx)
+        assert [job["name"] for job in result["jobs"]] == [
+            "scheduler_auto_assign",
+            "memory_prune",
+            "registry_gc",
+        ]
+        assert result["jobs"][0]["state"] == "pending"
@@ -213,6 +213,47 @@ class TestEnqueueTask:
         assert result["success"] is False
         assert "既にキューに存在" in result["error"]
 
+    @pytest.mark.asyncio
+    async def test_enqueue_task_rejects_dependency_cycle(self, scheduler_mock_ctx, git_repo):
+        """依存関係が循環するタスクはエラーになることをテスト。"""
+        from mcp.server.fastmcp import FastMCP
+
+        from src.tools.scheduler import register_tools
+        from tests.conftest import get_tool_fn
+
+        mcp = FastMCP("test")
+        register_tools(mcp)
+        enqueue_task = get_tool_fn(mcp, "enqueue_task")
+
+        app_ctx = scheduler_mock_ctx.request_context.lifespan_context
+        now = datetime.now()
+        app_ctx.agents["admin-001"] = Agent(
+            id="admin-001",
+            role=AgentRole.ADMIN,
+            status=AgentStatus.IDLE,
+            tmux_session="test:0.0",
+            working_dir=str(git_repo),
+            created_at=now,
+            last_activity=now,
+        )
+
+        first = await enqueue_task(
+            task_id="task-a",
+            dependencies=["task-b"],
+            caller_agent_id="admin-001",
+            ctx=scheduler_mock_ctx,
+        )
+        second = await enqueue_task(
+            task_id="task-b",
+            dependencies=["task-a"],
+            caller_agent_id="admin-001",
+            ctx=scheduler_mock_ctx,
+        )
+
+        assert first["success"] is True
+        assert second["success"] is False
+        assert "循環" in second["error"]
+
     @pytest.mark.asyncio
     async def test_enqueue_task_owner_allowed(self, scheduler_mock_ctx, git_repo):
         """Ownerによるキュー追加が許可されることをテスト。
@@ -390,3 +431,40 @@ class TestGetTaskQueue:
 
         assert result["success"] is True
         assert "queue" in result
+
+    @pytest.mark.asyncio
+    async def test_get_task_queue_reflects_other_process(self, scheduler_mock_ctx, git_repo):
+        """別プロセスがセッションのキューに追加したタスクも表示される。"""
+        from mcp.server.fastmcp import FastMCP
+
+        from src.managers.scheduler_manager import SCHEDULER_STATE_FILE_NAME
+        from src.tools.helpers import ensure_scheduler_manager
+        from src.tools.scheduler import register_tools
+
+        mcp = FastMCP("test")
+        register_tools(mcp)
+        get_task_queue = mcp._tool_manager._tools["get_task_queue"].fn
+
+        app_ctx = scheduler_mock_ctx.request_context.lifespan_context
+        now = datetime.now()
+        app_ctx.agents["owner-001"] = Agent(
+            id="owner-001",
+            role=AgentRole.OWNER,
+            status=AgentStatus.IDLE,
+            tmux_session=None,
+            working_dir=str(git_repo),
+            created_at=now,
+            last_activity=now,
+        )
+        scheduler = ensure_scheduler_manager(app_ctx)
+        assert scheduler.state_file.name == SCHEDULER_STATE_FILE_NAME
+
+        # Admin プロセス相当の別インスタンスから同じファイルに追加する
+        other = SchedulerManager(scheduler.dashboard_manager, {}, state_file=scheduler.state_file)
+        other.enqueue_task("task-from-admin")
+
+        result = await get_task_queue(caller_agent_id="owner-001", ctx=scheduler_mock_ctx)
+
+        assert result["success"] is True
+        pending = result["queue"]["pending_tasks"]
+        assert [t["task_id"] for t in pending] == ["task-from-admin"]